@@ -31,6 +31,7 @@ try:
     from autoprojectmanagement.main_modules.progress_reporting.progress_report import ProgressReport
     from autoprojectmanagement.main_modules.progress_reporting.dashboards_reports import DashboardReports
     from autoprojectmanagement.api.realtime_service import EventService, EventType, Connection, event_service
+    from autoprojectmanagement.main_modules.task_workflow_management.do_important_tasks import ImportantTaskManager
 except ImportError:
     # Handle import for development
     import sys
@@ -39,6 +40,7 @@ except ImportError:
     from autoprojectmanagement.main_modules.progress_reporting.progress_report import ProgressReport
     from autoprojectmanagement.main_modules.progress_reporting.dashboards_reports import DashboardReports
     from autoprojectmanagement.api.realtime_service import EventService, EventType, Connection, event_service
+    from autoprojectmanagement.main_modules.task_workflow_management.do_important_tasks import ImportantTaskManager
 
 # Create router
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
@@ -47,6 +49,10 @@ router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 project_service = ProjectService()
 progress_reporter = ProgressReport()
 dashboard_reporter = DashboardReports()
+# Created on first use; keeps the prioritized important tasks in memory
+important_task_manager: Optional[ImportantTaskManager] = None
+# Makes concurrent first requests wait for one manager instead of each creating one
+_important_task_manager_lock: Optional[asyncio.Lock] = None
 
 # Layout configuration directory
 LAYOUTS_DIR = Path("JSonDataBase/OutPuts/dashboard_layouts")
@@ -54,7 +60,7 @@ LAYOUTS_DIR.mkdir(parents=True, exist_ok=True)
 
 # Available widgets
 AVAILABLE_WIDGETS = [
-    "health", "progress", "risks", "team", "quality", "alerts"
+    "health", "progress", "risks", "team", "quality", "alerts", "next_tasks"
 ]
 
 # Pydantic models for dashboard requests/responses
@@ -339,6 +345,33 @@ def get_performance_data(project_id: str) -> Dict[str, Any]:
     }
 
 
+async def get_important_task_manager() -> ImportantTaskManager:
+    """Get the shared important task manager, creating and initializing it once."""
+    global important_task_manager, _important_task_manager_lock
+    if important_task_manager is None:
+        # Created inside a running loop, so it is bound to the server's loop
+        if _important_task_manager_lock is None:
+            _important_task_manager_lock = asyncio.Lock()
+        async with _important_task_manager_lock:
+            if important_task_manager is None:
+                manager = ImportantTaskManager()
+                await manager.initialize()
+                important_task_manager = manager
+    return important_task_manager
+
+
+async def get_next_tasks(limit: int) -> List[Dict[str, Any]]:
+    """
+    Get the highest-priority important tasks from the in-memory priority queue.
+
+    The manager reloads its tasks when the storage file was changed by
+    another process since it last read or wrote it.
+    """
+    manager = await get_important_task_manager()
+    tasks = await manager.get_prioritized_tasks(limit)
+    return [task.to_dict() for task in tasks]
+
+
 # Layout configuration functions
 def save_layout_config(layout_config: Dict[str, Any]) -> Dict[str, Any]:
     """Save layout configuration to JSON file."""
@@ -564,6 +597,22 @@ async def get_team_performance_metrics(
         logger.error(f"Error getting team performance: {e}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+@router.get("/next-tasks", response_model=List[Dict[str, Any]])
+async def get_dashboard_next_tasks(
+    limit: int = Query(5, ge=1, le=100, description="Number of tasks to return")
+) -> List[Dict[str, Any]]:
+    """
+    Get the next tasks to work on for the dashboard.
+    
+    Highest-priority important tasks, served from memory without reading storage.
+    """
+    try:
+        return await get_next_tasks(limit)
+        
+    except Exception as e:
+        logger.error(f"Error getting next tasks: {e}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
 @router.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """
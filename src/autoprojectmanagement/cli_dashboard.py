@@ -747,7 +747,7 @@ class DashboardCLI:
                 return response.json()
             return []
         except:
-            return ["health", "progress", "risks", "team", "quality", "alerts"]
+            return ["health", "progress", "risks", "team", "quality", "alerts", "next_tasks"]
 
     def _validate_cron_expression(self, cron_expr: str) -> bool:
         """Validate cron expression format."""
@@ -12,7 +12,6 @@ Description: Communication management module within the AutoProjectManagement sy
 
 import logging
 from typing import Dict, Any, Optional, List, Union
-import os
 import sys
 from datetime import datetime
 
@@ -42,36 +41,30 @@ __license__ = "MIT"
 
 import json
 import logging
-import os
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
+from autoprojectmanagement.main_modules.utility_modules.base_management import (
+    BaseManagement as SharedBaseManagement
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Constants
-DEFAULT_ENCODING = 'utf-8'
-DEFAULT_INDENT = 2
 MAX_LINE_LENGTH = 79
 DEFAULT_COMMUNICATION_PLAN_PATH = 'project_inputs/PM_JSON/user_inputs/communication_plan.json'
 DEFAULT_COMMUNICATION_LOGS_PATH = 'project_inputs/PM_JSON/user_inputs/communication_logs.json'
 DEFAULT_OUTPUT_PATH = 'project_inputs/PM_JSON/system_outputs/communication_management.json'
 
 
-class BaseManagement:
+class BaseManagement(SharedBaseManagement):
     """
     Base management class for handling file-based operations.
-    
-    Provides common functionality for loading JSON inputs, processing data,
-    and saving outputs. Designed to be subclassed for specific management
-    tasks.
-    
-    Attributes:
-        input_paths: Dictionary mapping input names to file paths
-        output_path: Path where output will be saved
-        inputs: Loaded input data
-        output: Processed output data
+
+    Adds input validation and logging of I/O errors to the shared
+    load/analyze/save workflow.
     """
 
     def __init__(self, input_paths: Dict[str, str], output_path: str) -> None:
@@ -89,11 +82,7 @@ class BaseManagement:
             raise ValueError("input_paths must be a dictionary")
         if not output_path or not isinstance(output_path, str):
             raise ValueError("output_path must be a non-empty string")
-            
-        self.input_paths: Dict[str, str] = input_paths
-        self.output_path: str = output_path
-        self.inputs: Dict[str, Any] = {}
-        self.output: Dict[str, Any] = {}
+        super().__init__(input_paths, output_path)
 
     def load_json(self, path: str) -> Optional[Dict[str, Any]]:
         """
@@ -109,19 +98,17 @@ class BaseManagement:
             json.JSONDecodeError: If the file contains invalid JSON
             OSError: If there's an error reading the file
         """
-        if not os.path.exists(path):
-            logger.warning(f"File not found: {path}")
-            return None
-            
         try:
-            with open(path, 'r', encoding=DEFAULT_ENCODING) as file:
-                return json.load(file)
+            data = super().load_json(path)
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in {path}: {e}")
             raise
         except OSError as e:
             logger.error(f"Error reading file {path}: {e}")
             raise
+        if data is None:
+            logger.warning(f"File not found: {path}")
+        return data
 
     def save_json(self, data: Dict[str, Any], path: str) -> None:
         """
@@ -136,11 +123,7 @@ class BaseManagement:
             TypeError: If data is not JSON serializable
         """
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            
-            with open(path, 'w', encoding=DEFAULT_ENCODING) as file:
-                json.dump(data, file, indent=DEFAULT_INDENT, ensure_ascii=False)
+            super().save_json(data, path)
         except TypeError as e:
             logger.error(f"Data not JSON serializable: {e}")
             raise
@@ -158,18 +141,6 @@ class BaseManagement:
                 logger.error(f"Failed to load input {key}: {e}")
                 self.inputs[key] = {}
 
-    def analyze(self) -> None:
-        """
-        Analyze the loaded data.
-        
-        This method must be implemented by subclasses to provide specific
-        analysis logic for the management task.
-        
-        Raises:
-            NotImplementedError: If not implemented by subclass
-        """
-        raise NotImplementedError("Subclasses must implement analyze()")
-
     def run(self) -> None:
         """
         Execute the complete management workflow.
@@ -177,10 +148,7 @@ class BaseManagement:
         Loads inputs, performs analysis, and saves output.
         """
         try:
-            self.load_inputs()
-            self.analyze()
-            self.save_json(self.output, self.output_path)
-            logger.info(f"{self.__class__.__name__} output saved to {self.output_path}")
+            super().run()
         except Exception as e:
             logger.error(f"Error in {self.__class__.__name__}: {e}")
             raise
@@ -0,0 +1,519 @@
+"""
+Baseline Store Module - Content-addressed storage for scope baselines
+
+Every WBS node is stored once as a blob named by the hash of its fields and
+of its children's hashes (a Merkle tree). A baseline is a small manifest
+pointing at its root hash, so baselines share every unchanged node and
+creating a new baseline writes only the nodes that changed.
+
+Layout, for an index file ``scope_baselines.json``::
+
+    scope_baselines.json                  index: baseline metadata
+    scope_baselines_store/objects/ab/...  node and scope-change blobs
+    scope_baselines_store/manifests/...   task id -> node hash per baseline
+    scope_baselines_store/lock            held while baselines are written
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from autoprojectmanagement.main_modules.utility_modules.data_store import atomic_write_text
+
+STORE_FORMAT_VERSION = 1
+ENCODING = 'utf-8'
+
+# Number of decoded blobs kept in memory by each store
+BLOB_CACHE_SIZE = 4096
+
+# Store lock: polling interval, how long to wait for it and when a lock
+# left behind by a crashed process is broken (seconds)
+LOCK_POLL_INTERVAL = 0.05
+LOCK_TIMEOUT = 30.0
+LOCK_STALE_AFTER = 300.0
+
+
+def canonical_json(data: Any) -> str:
+    """Serialize data deterministically, so equal content gets an equal hash."""
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+def node_fields(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Get a WBS node's own fields, without its subtasks."""
+    return {key: value for key, value in node.items() if key != 'subtasks'}
+
+
+class WBSHashTree:
+    """
+    Merkle hashes of a WBS tree, computed in one post-order pass.
+
+    A node's hash covers its own fields and, through its children's
+    hashes, its whole subtree: two subtrees are identical exactly when
+    their hashes are equal.
+
+    Attributes:
+        root_hash: Hash of the root node, None for an empty tree
+        blobs: Blob content per node hash
+        task_hashes: Node hash per task ID (first occurrence in pre-order)
+        task_parents: Parent task ID per task ID, None under an ID-less node
+    """
+
+    def __init__(self, root: Optional[Dict[str, Any]]):
+        self.root_hash: Optional[str] = None
+        self.blobs: Dict[str, Dict[str, Any]] = {}
+        self.task_hashes: Dict[Any, str] = {}
+        self.task_parents: Dict[Any, Any] = {}
+        if root:
+            self._hash_tree(root)
+
+    def get_blob(self, digest: str) -> Dict[str, Any]:
+        """Get the blob of a node by its hash."""
+        return self.blobs[digest]
+
+    def _hash_tree(self, root: Dict[str, Any]) -> None:
+        hashes: Dict[int, str] = {}
+        parents: Dict[int, Any] = {id(root): None}
+        preorder = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            preorder.append(node)
+            for child in reversed(node.get('subtasks') or []):
+                if isinstance(child, dict):
+                    parents[id(child)] = node.get('id')
+                    stack.append(child)
+
+        for node in reversed(preorder):
+            subtasks = node.get('subtasks')
+            # None keeps "no subtasks key" apart from an empty subtask list
+            children = None if not isinstance(subtasks, list) else [
+                hashes[id(child)] for child in subtasks if isinstance(child, dict)]
+            blob = {'fields': node_fields(node), 'children': children}
+            digest = hashlib.sha256(canonical_json(blob).encode(ENCODING)).hexdigest()
+            hashes[id(node)] = digest
+            self.blobs[digest] = blob
+
+        for node in preorder:
+            task_id = node.get('id')
+            if task_id is not None and task_id not in self.task_hashes:
+                self.task_hashes[task_id] = hashes[id(node)]
+                self.task_parents[task_id] = parents[id(node)]
+        self.root_hash = hashes[id(root)]
+
+
+class StoredWBSHashTree:
+    """
+    Merkle hashes of a stored baseline, read from its manifest.
+
+    Offers the same attributes as WBSHashTree, but node blobs are only read
+    from the store when ``get_blob`` asks for them.
+    """
+
+    def __init__(self, store: 'BaselineStore', manifest: Dict[str, Any]):
+        self.store = store
+        self.root_hash: Optional[str] = manifest.get('root')
+        self.task_hashes: Dict[Any, str] = manifest.get('tasks', {})
+        self.task_parents: Dict[Any, Any] = manifest.get('parents', {})
+
+    def get_blob(self, digest: str) -> Dict[str, Any]:
+        """Get the blob of a node by its hash, reading it from the store."""
+        return self.store.get_blob(digest)
+
+
+class BaselineStore:
+    """
+    Content-addressed, deduplicating store of WBS baselines.
+
+    Blobs are written once and never modified, and the index and manifests
+    are replaced atomically, so baselines can be read while they are being
+    written. Writers (create, delete, garbage collection) hold a lock file,
+    so garbage collection never sees blobs whose baseline is not indexed
+    yet. Decoded blobs are cached, and trees are loaded lazily:
+    ``get_task`` and ``iter_children`` read only the blobs they need.
+
+    Index files written by the previous format (a full ``wbs_snapshot`` per
+    baseline) are migrated into the store on the first write.
+    """
+
+    def __init__(self, index_path: Path):
+        """
+        Initialize the store
+
+        Args:
+            index_path: Path of the baseline index JSON file
+        """
+        self.index_path = Path(index_path)
+        self.store_dir = self.index_path.with_name(f"{self.index_path.stem}_store")
+        self.objects_dir = self.store_dir / 'objects'
+        self.manifests_dir = self.store_dir / 'manifests'
+        self.lock_path = self.store_dir / 'lock'
+        self.gc_marker_path = self.store_dir / 'gc_marker'
+        self._known_blobs: Optional[Set[str]] = None
+        self._known_gc_signature: Optional[Tuple[int, int]] = None
+        self._blob_cache: 'OrderedDict[str, Any]' = OrderedDict()
+
+    # Low-level file handling
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest[2:]}.json"
+
+    def _manifest_path(self, name: str) -> Path:
+        safe_name = hashlib.sha256(name.encode(ENCODING)).hexdigest()[:32]
+        return self.manifests_dir / f"{safe_name}.json"
+
+    def _gc_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.gc_marker_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """
+        Hold the store lock, a file created exclusively.
+
+        Blobs listed before another store collected garbage may be gone, so
+        the blob listing is dropped when the garbage collection marker
+        changed since it was taken.
+
+        Raises:
+            TimeoutError: If the lock is not released within LOCK_TIMEOUT
+        """
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while True:
+            try:
+                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - self.lock_path.stat().st_mtime > LOCK_STALE_AFTER:
+                        self.lock_path.unlink()
+                        continue
+                except OSError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Baseline store {self.store_dir} is locked")
+                time.sleep(LOCK_POLL_INTERVAL)
+        try:
+            os.write(fd, str(os.getpid()).encode(ENCODING))
+            os.close(fd)
+            if self._known_blobs is not None and self._gc_signature() != self._known_gc_signature:
+                self._known_blobs = None
+            yield
+        finally:
+            try:
+                self.lock_path.unlink()
+            except OSError:
+                pass
+
+    def known_blobs(self) -> Set[str]:
+        """Get the hashes of all stored blobs, listing the store once."""
+        if self._known_blobs is None:
+            self._known_gc_signature = self._gc_signature()
+            self._known_blobs = set()
+            if self.objects_dir.exists():
+                for prefix in os.scandir(self.objects_dir):
+                    if prefix.is_dir():
+                        for entry in os.scandir(prefix.path):
+                            if entry.name.endswith('.json'):
+                                self._known_blobs.add(prefix.name + entry.name[:-5])
+        return self._known_blobs
+
+    def put_blob(self, digest: str, blob: Any) -> bool:
+        """
+        Store a blob unless it already exists.
+
+        Returns:
+            True if the blob was written, False if it was already stored
+        """
+        known = self.known_blobs()
+        if digest in known:
+            return False
+        atomic_write_text(self._blob_path(digest), canonical_json(blob))
+        known.add(digest)
+        return True
+
+    def get_blob(self, digest: str) -> Any:
+        """
+        Read a blob, using the in-memory cache when possible.
+
+        Raises:
+            KeyError: If the blob is not stored
+        """
+        blob = self._blob_cache.get(digest)
+        if blob is not None:
+            self._blob_cache.move_to_end(digest)
+            return blob
+        try:
+            with open(self._blob_path(digest), 'r', encoding=ENCODING) as f:
+                blob = json.load(f)
+        except OSError:
+            raise KeyError(f"Blob {digest} not found in baseline store")
+        self._blob_cache[digest] = blob
+        if len(self._blob_cache) > BLOB_CACHE_SIZE:
+            self._blob_cache.popitem(last=False)
+        return blob
+
+    # Index handling
+
+    def load_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the metadata of all baselines.
+
+        Returns:
+            Baseline metadata by name. Entries in the previous format still
+            carry their full 'wbs_snapshot'.
+        """
+        try:
+            with open(self.index_path, 'r', encoding=ENCODING) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        if data.get('store_version') == STORE_FORMAT_VERSION:
+            return data.get('baselines', {})
+        # Previous format: one full snapshot per baseline
+        return data
+
+    def save_index(self, baselines: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically replace the index, migrating snapshot entries into the store."""
+        for name, entry in baselines.items():
+            if 'wbs_snapshot' in entry:
+                baselines[name] = self._store_snapshot(name, entry)
+        atomic_write_text(self.index_path, json.dumps(
+            {'store_version': STORE_FORMAT_VERSION, 'baselines': baselines},
+            indent=2, ensure_ascii=False))
+
+    def _store_snapshot(self, name: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Write a baseline's WBS and scope changes as blobs and return its metadata."""
+        tree = WBSHashTree(entry.get('wbs_snapshot') or {})
+        written = sum(self.put_blob(digest, blob) for digest, blob in tree.blobs.items())
+        changes = entry.get('scope_changes_snapshot') or []
+        changes_hash = hashlib.sha256(canonical_json(changes).encode(ENCODING)).hexdigest()
+        self.put_blob(changes_hash, changes)
+        atomic_write_text(self._manifest_path(name), json.dumps(
+            # Rows rather than an object, so integer task IDs survive JSON
+            {'root': tree.root_hash,
+             'tasks': [[task_id, digest, tree.task_parents[task_id]]
+                       for task_id, digest in tree.task_hashes.items()]},
+            ensure_ascii=False))
+
+        metadata = {key: value for key, value in entry.items()
+                    if key not in ('wbs_snapshot', 'scope_changes_snapshot')}
+        metadata.update({
+            'root_hash': tree.root_hash,
+            'scope_changes_hash': changes_hash,
+            'node_count': len(tree.task_hashes),
+            'new_blobs': written,
+        })
+        return metadata
+
+    # Baseline operations
+
+    def create(self, name: str, description: str, wbs: Dict[str, Any],
+               scope_changes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Store a new baseline (or replace one with the same name).
+
+        Only nodes that are not already stored are written. Replacing a
+        baseline removes the blobs only the replaced one used.
+
+        Returns:
+            The baseline's metadata
+        """
+        with self._locked():
+            baselines = self.load_index()
+            replaced = name in baselines
+            entry = self._store_snapshot(name, {
+                'name': name,
+                'description': description,
+                'created_at': datetime.now().isoformat(),
+                'wbs_snapshot': wbs,
+                'scope_changes_snapshot': scope_changes,
+                'version': max((other.get('version', 0) for other in baselines.values()), default=0) + 1,
+            })
+            baselines[name] = entry
+            self.save_index(baselines)
+            if replaced:
+                self._collect_garbage(baselines)
+        return entry
+
+    def delete(self, name: str) -> bool:
+        """
+        Delete a baseline and the blobs no other baseline uses.
+
+        Returns:
+            True if the baseline existed
+        """
+        with self._locked():
+            baselines = self.load_index()
+            if name not in baselines:
+                return False
+            del baselines[name]
+            self.save_index(baselines)
+            manifest_path = self._manifest_path(name)
+            if manifest_path.exists():
+                manifest_path.unlink()
+            self._collect_garbage(baselines)
+        return True
+
+    def collect_garbage(self) -> int:
+        """
+        Remove blobs that no baseline refers to.
+
+        Returns:
+            Number of blobs removed
+        """
+        with self._locked():
+            return self._collect_garbage(self.load_index())
+
+    def _collect_garbage(self, baselines: Dict[str, Dict[str, Any]]) -> int:
+        """Remove blobs the given baselines do not refer to; the store lock must be held."""
+        live: Set[str] = set()
+        for name, entry in baselines.items():
+            live.add(entry.get('scope_changes_hash'))
+            live.update(self.load_manifest(name).get('tasks', {}).values())
+            # Nodes without an id are only reachable through the tree
+            stack = [entry.get('root_hash')] if entry.get('root_hash') else []
+            while stack:
+                digest = stack.pop()
+                blob = self.get_blob(digest)
+                live.add(digest)
+                stack.extend(child for child in blob['children'] or [] if child not in live)
+
+        removed = 0
+        for digest in list(self.known_blobs() - live):
+            try:
+                self._blob_path(digest).unlink()
+                removed += 1
+            except OSError:
+                pass
+            self.known_blobs().discard(digest)
+            self._blob_cache.pop(digest, None)
+        if removed:
+            # Tells other stores that their blob listings may be stale
+            atomic_write_text(self.gc_marker_path, str(time.time_ns()))
+            self._known_gc_signature = self._gc_signature()
+        return removed
+
+    def load_manifest(self, name: str) -> Dict[str, Any]:
+        """Get a baseline's root hash and its node hash and parent ID per task ID."""
+        try:
+            with open(self._manifest_path(name), 'r', encoding=ENCODING) as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return {}
+        rows = manifest.get('tasks', [])
+        manifest['tasks'] = {row[0]: row[1] for row in rows}
+        if all(len(row) > 2 for row in rows):
+            manifest['parents'] = {row[0]: row[2] for row in rows}
+        else:
+            # Manifests written before parents were stored: walk the blobs
+            manifest['parents'] = self._task_parents(manifest.get('root'))
+        return manifest
+
+    def _task_parents(self, root_hash: Optional[str]) -> Dict[Any, Any]:
+        """Get the parent task ID per task ID from a stored tree, like WBSHashTree."""
+        parents: Dict[Any, Any] = {}
+        stack = [(root_hash, None)] if root_hash else []
+        while stack:
+            digest, parent_id = stack.pop()
+            blob = self.get_blob(digest)
+            task_id = blob['fields'].get('id')
+            if task_id is not None and task_id not in parents:
+                parents[task_id] = parent_id
+            stack.extend((child, task_id) for child in reversed(blob['children'] or []))
+        return parents
+
+    def get_entry(self, name: str) -> Dict[str, Any]:
+        """
+        Get a baseline's metadata.
+
+        Raises:
+            KeyError: If the baseline does not exist
+        """
+        baselines = self.load_index()
+        if name not in baselines:
+            raise KeyError(f"Baseline {name} not found")
+        return baselines[name]
+
+    def build_tree(self, digest: Optional[str]) -> Dict[str, Any]:
+        """
+        Rebuild a WBS subtree from its blobs as fresh dictionaries.
+
+        Args:
+            digest: Hash of the subtree's root node
+
+        Returns:
+            The subtree, sharing nothing with the store's cache
+        """
+        if not digest:
+            return {}
+        root: Dict[str, Any] = {}
+        stack = [(digest, root)]
+        while stack:
+            current, node = stack.pop()
+            blob = self.get_blob(current)
+            node.update(json.loads(canonical_json(blob['fields'])))
+            if blob['children'] is not None:
+                node['subtasks'] = [{} for _ in blob['children']]
+                stack.extend(zip(blob['children'], node['subtasks']))
+        return root
+
+    def load(self, name: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Load a baseline's WBS and scope changes.
+
+        Returns:
+            Tuple of the WBS and the scope change list, as fresh objects
+
+        Raises:
+            KeyError: If the baseline does not exist
+        """
+        entry = self.get_entry(name)
+        if 'wbs_snapshot' in entry:
+            snapshot = json.loads(canonical_json(entry['wbs_snapshot']))
+            return snapshot, json.loads(canonical_json(entry.get('scope_changes_snapshot') or []))
+        changes = self.get_blob(entry['scope_changes_hash']) if entry.get('scope_changes_hash') else []
+        return self.build_tree(entry.get('root_hash')), json.loads(canonical_json(changes))
+
+    def hash_tree(self, name: str) -> Union[WBSHashTree, StoredWBSHashTree]:
+        """
+        Get the Merkle hashes of a baseline without loading its nodes.
+
+        Raises:
+            KeyError: If the baseline does not exist
+        """
+        entry = self.get_entry(name)
+        if 'wbs_snapshot' in entry:
+            return WBSHashTree(entry['wbs_snapshot'])
+        return StoredWBSHashTree(self, self.load_manifest(name))
+
+    def get_task(self, name: str, task_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Load one task and its subtree from a baseline without reading the rest.
+
+        Returns:
+            The task subtree, or None if the task is not in the baseline
+        """
+        digest = self.load_manifest(name).get('tasks', {}).get(task_id)
+        return self.build_tree(digest) if digest else None
+
+    def iter_children(self, digest: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Iterate over a node's children as (hash, fields) pairs, loading only them.
+
+        Args:
+            digest: Hash of the parent node
+        """
+        for child in self.get_blob(digest)['children'] or []:
+            yield child, self.get_blob(child)['fields']
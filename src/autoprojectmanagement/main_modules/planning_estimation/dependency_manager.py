@@ -2,8 +2,49 @@
 Dependency Manager Module - Handles task dependencies and validation
 """
 
-from typing import Dict, List, Set, Any
+from collections import deque, namedtuple
+from typing import Dict, List, Set, Any, Optional
 import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# WBS fields that carry a task duration, in order of preference
+DURATION_FIELDS = ('duration_days', 'duration', 'estimated_duration')
+
+# Tolerance used when deciding whether a task has zero float
+FLOAT_TOLERANCE = 1e-9
+
+# Summary tasks enter the CPM network as zero-length start and finish milestones
+START = 0
+FINISH = 1
+SummaryEvent = namedtuple('SummaryEvent', ['task_id', 'kind'])
+
+
+def _task_of(node: Any) -> Any:
+    return node.task_id if type(node) is SummaryEvent else node
+
+
+def _kahn_order(nodes: Dict[Any, None], predecessors: Dict[Any, List[Any]],
+                successors: Dict[Any, List[Any]]) -> List[Any]:
+    """Order nodes so that each comes after all its predecessors; raises ValueError on cycles."""
+    in_degree = {node: len(predecessors.get(node, [])) for node in nodes}
+    queue = deque(node for node, degree in in_degree.items() if degree == 0)
+    order = []
+    
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for successor in successors.get(node, []):
+            in_degree[successor] -= 1
+            if in_degree[successor] == 0:
+                queue.append(successor)
+    
+    if len(order) < len(nodes):
+        blocked = list(dict.fromkeys(_task_of(node) for node, degree in in_degree.items() if degree > 0))
+        raise ValueError(f"Circular dependencies detected among tasks: {blocked}")
+    
+    return order
 
 class DependencyManager:
     """
@@ -14,6 +55,10 @@ class DependencyManager:
     def __init__(self):
         self.task_dependencies: Dict[str, List[str]] = {}
         self.task_reverse_dependencies: Dict[str, List[str]] = {}
+        self.task_durations: Dict[str, float] = {}
+        self.task_children: Dict[str, List[str]] = {}
+        self.known_tasks: Set[str] = set()
+        self.schedule: Dict[str, Any] = {}
         
     def load_dependencies_from_wbs(self, wbs_data: Dict[str, Any]) -> None:
         """
@@ -26,22 +71,37 @@ class DependencyManager:
         
     def _extract_dependencies(self, task: Dict[str, Any]) -> None:
         """
-        Recursively extract dependencies from WBS tasks.
-        """
-        task_id = task.get('id')
-        dependencies = task.get('dependencies', [])
+        Extract dependencies from WBS tasks.
         
-        if task_id and dependencies:
-            self.task_dependencies[task_id] = dependencies
-            # Build reverse dependency mapping
-            for dep_id in dependencies:
-                if dep_id not in self.task_reverse_dependencies:
-                    self.task_reverse_dependencies[dep_id] = []
-                self.task_reverse_dependencies[dep_id].append(task_id)
-        
-        # Process subtasks recursively
-        for subtask in task.get('subtasks', []):
-            self._extract_dependencies(subtask)
+        Walks the tree iteratively so that very deep WBS structures do not
+        hit Python's recursion limit.
+        """
+        stack = [task]
+        while stack:
+            current = stack.pop()
+            task_id = current.get('id')
+            dependencies = current.get('dependencies', [])
+            
+            if task_id:
+                self.known_tasks.add(task_id)
+                self.task_children[task_id] = [subtask.get('id') for subtask in current.get('subtasks', [])
+                                               if subtask.get('id')]
+                for field in DURATION_FIELDS:
+                    duration = current.get(field)
+                    if isinstance(duration, (int, float)) and not isinstance(duration, bool):
+                        self.task_durations[task_id] = duration
+                        break
+            
+            if task_id and dependencies:
+                self.task_dependencies[task_id] = dependencies
+                # Build reverse dependency mapping
+                for dep_id in dependencies:
+                    if dep_id not in self.task_reverse_dependencies:
+                        self.task_reverse_dependencies[dep_id] = []
+                    self.task_reverse_dependencies[dep_id].append(task_id)
+            
+            # Process subtasks in document order
+            stack.extend(reversed(current.get('subtasks', [])))
     
     def validate_dependencies(self) -> List[str]:
         """
@@ -52,10 +112,16 @@ class DependencyManager:
         """
         errors = []
         
-        # Check for missing dependency targets
+        # Check for missing dependency targets. Tasks are only known once a
+        # WBS has been loaded; otherwise any task referenced in the
+        # dependency maps is accepted.
         for task_id, dependencies in self.task_dependencies.items():
             for dep_id in dependencies:
-                if dep_id not in self.task_dependencies and dep_id not in self.task_reverse_dependencies:
+                if self.known_tasks:
+                    exists = dep_id in self.known_tasks
+                else:
+                    exists = dep_id in self.task_dependencies or dep_id in self.task_reverse_dependencies
+                if not exists:
                     errors.append(f"Task '{task_id}' depends on non-existent task '{dep_id}'")
         
         # Check for circular dependencies
@@ -65,47 +131,89 @@ class DependencyManager:
             
         return errors
     
-    def detect_circular_dependencies(self) -> List[List[str]]:
+    def find_strongly_connected_components(self) -> List[List[str]]:
         """
-        Detect circular dependencies using DFS.
+        Find the strongly connected components of the dependency graph.
+        
+        Uses an iterative version of Tarjan's algorithm, so it runs in a
+        single O(V+E) pass and does not recurse on long dependency chains.
+        Every task is covered, including tasks without dependencies of
+        their own.
         
         Returns:
-            List of circular dependency chains
-        """
-        visited: Set[str] = set()
-        recursion_stack: Set[str] = set()
-        circular_chains: List[List[str]] = []
-        
-        def dfs(current_task: str, path: List[str]) -> None:
-            if current_task in recursion_stack:
-                # Found a cycle
-                cycle_start = path.index(current_task)
-                circular_chains.append(path[cycle_start:] + [current_task])
-                return
-                
-            if current_task in visited:
-                return
+            List of components, each a list of task IDs in discovery order
+        """
+        nodes: Dict[str, None] = dict.fromkeys(self.task_dependencies)
+        for dependencies in self.task_dependencies.values():
+            nodes.update(dict.fromkeys(dependencies))
+        nodes.update(dict.fromkeys(self.known_tasks))
+        
+        no_links: List[str] = []
+        index_of: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        component_stack: List[str] = []
+        components: List[List[str]] = []
+        
+        for root in nodes:
+            if root in index_of:
+                continue
+            
+            index_of[root] = lowlink[root] = len(index_of)
+            component_stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.task_dependencies.get(root, no_links)))]
+            
+            while work:
+                current, successors = work[-1]
+                descended = False
+                for dep_id in successors:
+                    if dep_id not in index_of:
+                        index_of[dep_id] = lowlink[dep_id] = len(index_of)
+                        component_stack.append(dep_id)
+                        on_stack.add(dep_id)
+                        work.append((dep_id, iter(self.task_dependencies.get(dep_id, no_links))))
+                        descended = True
+                        break
+                    if dep_id in on_stack and index_of[dep_id] < lowlink[current]:
+                        lowlink[current] = index_of[dep_id]
+                if descended:
+                    continue
                 
-            visited.add(current_task)
-            recursion_stack.add(current_task)
-            path.append(current_task)
-            
-            # Check all dependencies of current task
-            for dep_id in self.task_dependencies.get(current_task, []):
-                if dep_id in self.task_dependencies:  # Only follow if it's a task that has dependencies
-                    dfs(dep_id, path.copy())
-                elif dep_id in self.task_reverse_dependencies:  # Task exists but has no dependencies
-                    pass  # No circular dependency from leaf nodes
-            
-            recursion_stack.remove(current_task)
-            path.pop()
-        
-        # Start DFS from all tasks that have dependencies
-        for task_id in list(self.task_dependencies.keys()):
-            if task_id not in visited:
-                dfs(task_id, [])
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[current] < lowlink[parent]:
+                        lowlink[parent] = lowlink[current]
                 
-        return circular_chains
+                if lowlink[current] == index_of[current]:
+                    component = []
+                    while True:
+                        member = component_stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == current:
+                            break
+                    component.reverse()
+                    components.append(component)
+        
+        return components
+    
+    def detect_circular_dependencies(self) -> List[List[str]]:
+        """
+        Detect circular dependencies as strongly connected components.
+        
+        Every group of tasks that depend on each other, directly or
+        transitively, is reported once, as are tasks that depend on
+        themselves.
+        
+        Returns:
+            List of circular dependency groups, each a list of task IDs
+        """
+        return [
+            component for component in self.find_strongly_connected_components()
+            if len(component) > 1 or component[0] in self.task_dependencies.get(component[0], [])
+        ]
     
     def get_task_predecessors(self, task_id: str) -> List[str]:
         """
@@ -160,31 +268,248 @@ class DependencyManager:
         predecessors = self.get_task_predecessors(task_id)
         return any(predecessor not in completed_tasks for predecessor in predecessors)
     
-    def get_critical_path(self, task_durations: Dict[str, int]) -> List[str]:
+    def topological_order(self, task_ids: Optional[List[str]] = None) -> List[str]:
+        """
+        Order tasks so that every task comes after all of its predecessors.
+        
+        Uses Kahn's algorithm, which runs in O(V+E).
+        
+        Args:
+            task_ids: Additional task IDs to include besides those that appear
+                in dependency relationships
+            
+        Returns:
+            List of task IDs in topological order
+            
+        Raises:
+            ValueError: If the dependency graph contains a cycle
+        """
+        return _kahn_order(self._scheduled_tasks(task_ids), self.task_dependencies,
+                           self.task_reverse_dependencies)
+    
+    def _scheduled_tasks(self, task_ids: Optional[List[str]] = None) -> Dict[str, None]:
+        """Get the given task IDs and every task in a dependency relationship, in order."""
+        nodes: Dict[str, None] = dict.fromkeys(task_ids or [])
+        for task_id, dependencies in self.task_dependencies.items():
+            nodes.setdefault(task_id)
+            for dep_id in dependencies:
+                nodes.setdefault(dep_id)
+        return nodes
+    
+    def schedule_network(self, task_ids: Optional[List[str]] = None):
         """
-        Calculate critical path using topological sort and longest path algorithm.
+        Get the CPM network of the given tasks in topological order.
+        
+        Nodes are task IDs, except that each task with subtasks is replaced
+        by a pair of zero-length ``SummaryEvent`` milestones (START and
+        FINISH) wrapped around its subtasks.
+        
+        Args:
+            task_ids: Task IDs to schedule besides those with dependencies
+            
+        Returns:
+            Tuple of the ordered nodes and the predecessors and successors
+            of every node
+            
+        Raises:
+            ValueError: If the dependency graph contains a cycle
+        """
+        tasks = self._scheduled_tasks(task_ids)
+        summaries = {task_id for task_id, children in self.task_children.items() if children}
+        if summaries.isdisjoint(tasks):
+            predecessors, successors = self.task_dependencies, self.task_reverse_dependencies
+        else:
+            predecessors, successors = self._summary_network(tasks, summaries)
+            tasks = dict.fromkeys(predecessors)
+        return _kahn_order(tasks, predecessors, successors), predecessors, successors
+    
+    def _summary_network(self, tasks: Dict[str, None], summaries: Set[str]):
+        """
+        Build the CPM network with summary tasks replaced by milestones.
+        
+        A summary's start milestone follows its own dependencies and
+        precedes its subtasks; its finish milestone follows its subtasks
+        and is what tasks depending on the summary wait for. Subtasks of a
+        scheduled summary are scheduled too. A dependency between a task
+        and its ancestor or descendant contradicts the milestones and is
+        ignored with a warning.
+        
+        Returns:
+            Tuple of the predecessors and successors of every node
+        """
+        stack = [task_id for task_id in tasks if task_id in summaries]
+        while stack:
+            for child_id in self.task_children.get(stack.pop(), []):
+                if child_id not in tasks:
+                    tasks[child_id] = None
+                    if child_id in summaries:
+                        stack.append(child_id)
+        
+        def start(task_id):
+            return SummaryEvent(task_id, START) if task_id in summaries else task_id
+        
+        def finish(task_id):
+            return SummaryEvent(task_id, FINISH) if task_id in summaries else task_id
+        
+        predecessors: Dict[Any, List[Any]] = {}
+        successors: Dict[Any, List[Any]] = {}
+        for task_id in tasks:
+            predecessors.setdefault(start(task_id), [])
+            predecessors.setdefault(finish(task_id), [])
+        
+        def link(source, target):
+            predecessors[target].append(source)
+            successors.setdefault(source, []).append(target)
+        
+        parents = {child_id: parent_id for parent_id, children in self.task_children.items()
+                   for child_id in children}
+        
+        def is_ancestor(ancestor_id, task_id):
+            parent_id = parents.get(task_id)
+            while parent_id is not None:
+                if parent_id == ancestor_id:
+                    return True
+                parent_id = parents.get(parent_id)
+            return False
+        
+        for task_id in tasks:
+            for dep_id in self.task_dependencies.get(task_id, []):
+                if is_ancestor(dep_id, task_id) or is_ancestor(task_id, dep_id):
+                    logger.warning(f"Ignoring dependency of task {task_id!r} on {dep_id!r}: "
+                                   f"one contains the other")
+                    continue
+                link(finish(dep_id), start(task_id))
+            if task_id in summaries:
+                link(start(task_id), finish(task_id))
+                for child_id in self.task_children[task_id]:
+                    link(start(task_id), start(child_id))
+                    link(finish(child_id), finish(task_id))
+        return predecessors, successors
+    
+    def calculate_schedule(self, task_durations: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Run the critical path method (CPM) forward and backward passes.
+        
+        Computes earliest/latest start and finish, total float and free float
+        for every task in O(V+E). Tasks without a known duration are treated
+        as zero-length milestones. Tasks with subtasks take no duration of
+        their own: they span from their earliest subtask start to their
+        latest subtask finish, and their float is that of their subtasks.
         
         Args:
             task_durations: Dictionary mapping task IDs to durations
+                (defaults to durations loaded from the WBS)
             
         Returns:
-            List of task IDs in the critical path
+            Dictionary with 'project_duration', 'critical_path' (the driving
+            chain of task IDs, in order), 'critical_tasks' (all zero-float
+            task IDs) and 'tasks' (per-task schedule values)
+            
+        Raises:
+            ValueError: If the dependency graph contains a cycle
         """
-        # This is a simplified implementation
-        # In a real system, you'd use topological sort and dynamic programming
+        durations = self.task_durations if task_durations is None else task_durations
+        order, predecessors, successors = self.schedule_network(list(durations))
+        no_links: List[Any] = []
         
-        # For now, return tasks with the longest duration as a placeholder
-        critical_tasks = []
-        max_duration = 0
+        def duration_of(node):
+            return 0 if type(node) is SummaryEvent else durations.get(node, 0)
+        
+        # Forward pass
+        earliest_start: Dict[Any, float] = {}
+        earliest_finish: Dict[Any, float] = {}
+        for node in order:
+            start = max(map(earliest_finish.__getitem__, predecessors.get(node, no_links)), default=0)
+            earliest_start[node] = start
+            earliest_finish[node] = start + duration_of(node)
+        
+        project_duration = max(earliest_finish.values(), default=0)
         
-        for task_id, duration in task_durations.items():
-            if duration > max_duration:
-                max_duration = duration
-                critical_tasks = [task_id]
-            elif duration == max_duration:
+        # Backward pass
+        latest_start: Dict[Any, float] = {}
+        latest_finish: Dict[Any, float] = {}
+        for node in reversed(order):
+            finish = min(map(latest_start.__getitem__, successors.get(node, no_links)),
+                         default=project_duration)
+            latest_finish[node] = finish
+            latest_start[node] = finish - duration_of(node)
+        
+        def next_start(node):
+            return min(map(earliest_start.__getitem__, successors.get(node, no_links)),
+                       default=project_duration)
+        
+        # Summary tasks span their milestones: start to finish
+        schedule_tasks: Dict[str, Dict[str, Any]] = {}
+        critical_tasks = []
+        for node in order:
+            if type(node) is SummaryEvent:
+                if node.kind == FINISH:
+                    continue
+                task_id, last = node.task_id, SummaryEvent(node.task_id, FINISH)
+                total_float = min(latest_start[node] - earliest_start[node],
+                                  latest_finish[last] - earliest_finish[last])
+                duration = earliest_finish[last] - earliest_start[node]
+            else:
+                task_id, last = node, node
+                total_float = latest_start[node] - earliest_start[node]
+                duration = durations.get(task_id, 0)
+            is_critical = abs(total_float) <= FLOAT_TOLERANCE
+            schedule_tasks[task_id] = {
+                'duration': duration,
+                'earliest_start': earliest_start[node],
+                'earliest_finish': earliest_finish[last],
+                'latest_start': latest_start[node],
+                'latest_finish': latest_finish[last],
+                'total_float': total_float,
+                'free_float': next_start(last) - earliest_finish[last],
+                'is_critical': is_critical,
+            }
+            if is_critical:
                 critical_tasks.append(task_id)
-                
-        return critical_tasks
+        
+        self.schedule = {
+            'project_duration': project_duration,
+            'critical_path': self._trace_critical_path(order, predecessors, successors,
+                                                       earliest_start, earliest_finish, latest_start),
+            'critical_tasks': critical_tasks,
+            'tasks': schedule_tasks,
+        }
+        return self.schedule
+    
+    def _trace_critical_path(self, order: List[Any], predecessors: Dict[Any, List[Any]],
+                             successors: Dict[Any, List[Any]], earliest_start: Dict[Any, float],
+                             earliest_finish: Dict[Any, float], latest_start: Dict[Any, float]) -> List[str]:
+        """
+        Follow one driving chain of zero-float tasks from project start to finish.
+        
+        Summary milestones are passed through but not listed.
+        """
+        def is_critical(node):
+            return abs(latest_start[node] - earliest_start[node]) <= FLOAT_TOLERANCE
+        
+        current = next((node for node in order if is_critical(node) and not predecessors.get(node)), None)
+        path = []
+        while current is not None:
+            if type(current) is not SummaryEvent:
+                path.append(current)
+            finish = earliest_finish[current]
+            current = next((succ for succ in successors.get(current, [])
+                            if is_critical(succ)
+                            and abs(earliest_start[succ] - finish) <= FLOAT_TOLERANCE), None)
+        return path
+    
+    def get_critical_path(self, task_durations: Optional[Dict[str, float]] = None) -> List[str]:
+        """
+        Calculate the critical path using topological sort and a CPM pass.
+        
+        Args:
+            task_durations: Dictionary mapping task IDs to durations
+                (defaults to durations loaded from the WBS)
+            
+        Returns:
+            List of task IDs in the critical path, in execution order
+        """
+        return self.calculate_schedule(task_durations)['critical_path']
 
 # Example usage
 if __name__ == "__main__":
@@ -227,7 +552,7 @@ if __name__ == "__main__":
     circular_deps = manager.detect_circular_dependencies()
     if circular_deps:
         print("Circular dependencies found:")
-        for chain in circular_deps:
-            print(f"  - {' -> '.join(chain)}")
+        for group in circular_deps:
+            print(f"  - {', '.join(group)}")
     else:
         print("No circular dependencies found")
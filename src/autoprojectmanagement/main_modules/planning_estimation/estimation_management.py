@@ -7,6 +7,7 @@ This module provides comprehensive project estimation capabilities including:
 - Task cost estimation based on resources and duration
 - Project-level duration and cost aggregation
 - Multiple estimation methodologies (parametric, COCOMO II, Agile)
+- Vectorized batch estimation over the full WBS hierarchy
 - JSON-based input/output handling
 
 Usage:
@@ -26,6 +27,13 @@ Usage:
         output_path='custom/path/output.json'
     )
     ```
+    
+    What-if re-estimation of a whole WBS:
+    ```python
+    batch = WBSEstimationBatch.from_wbs(detailed_wbs)
+    duration, cost = batch.parametric(cost_per_resource=120.0)
+    project_cost = batch.rollup(cost)[batch.top_level].sum()
+    ```
 
 Author: AutoProjectManagement Team
 Date: 2024
@@ -34,9 +42,13 @@ Version: 2.0.0
 
 import json
 import logging
-import os
-from typing import Dict, Any, Optional, Union
-from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+import numpy as np
+
+from autoprojectmanagement.main_modules.utility_modules.base_management import (
+    BaseManagement as SharedBaseManagement
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -50,9 +62,31 @@ DEFAULT_COMPLEXITY_MAPPING = {
     "high": 5.0,
     "extreme": 8.0
 }
+DEFAULT_COMPLEXITY = "medium"
+# Story points and size (KLOC) assumed for tasks that do not specify them
+DEFAULT_STORY_POINTS = {
+    "low": 2.0,
+    "medium": 5.0,
+    "high": 8.0,
+    "extreme": 13.0
+}
+DEFAULT_SIZE_KLOC = {
+    "low": 0.5,
+    "medium": 1.5,
+    "high": 3.0,
+    "extreme": 6.0
+}
+DEFAULT_VELOCITY = 20.0  # Story points per sprint
+DEFAULT_SPRINT_LENGTH_DAYS = 10.0
+
+# COCOMO II.2000 post-architecture calibration
+COCOMO_A = 2.94
+COCOMO_B = 0.91
+COCOMO_C = 3.67
+COCOMO_D = 0.28
+COCOMO_NOMINAL_SCALE_FACTORS = 18.97  # Sum of the five nominal scale factors
+
 MAX_LINE_LENGTH = 79
-DEFAULT_ENCODING = 'utf-8'
-JSON_INDENT = 2
 
 # Estimation method constants
 ESTIMATION_METHODS = {
@@ -67,13 +101,15 @@ ERROR_INVALID_PROJECT = "Project must be a non-empty dictionary"
 ERROR_INVALID_RESOURCES = "Resources must be a positive number"
 
 
-class BaseManagement:
+class BaseManagement(SharedBaseManagement):
     """
     Base class for management operations with JSON I/O capabilities.
     
-    Provides common functionality for loading inputs from JSON files,
-    processing data, and saving outputs to JSON files.
+    Adds input validation, sorted output keys and logging to the shared
+    load/analyze/save workflow.
     """
+
+    sort_keys = True
     
     def __init__(self, input_paths: Dict[str, str], output_path: str) -> None:
         """
@@ -87,19 +123,12 @@ class BaseManagement:
             raise ValueError("input_paths cannot be empty")
         if not output_path:
             raise ValueError("output_path cannot be empty")
-            
-        self.input_paths = input_paths
-        self.output_path = output_path
-        self.inputs = {}
-        self.output = {}
+        super().__init__(input_paths, output_path)
         
     def load_json(self, path: str) -> Optional[Dict[str, Any]]:
         """Load JSON data from file with error handling."""
         try:
-            if os.path.exists(path):
-                with open(path, 'r', encoding='utf-8') as file:
-                    return json.load(file)
-            return None
+            return super().load_json(path)
         except json.JSONDecodeError:
             logger.error(f"Invalid JSON format in file: {path}")
             raise
@@ -110,15 +139,7 @@ class BaseManagement:
     def save_json(self, data: Dict[str, Any], path: str) -> None:
         """Save data to JSON file with proper formatting."""
         try:
-            Path(path).parent.mkdir(parents=True, exist_ok=True)
-            with open(path, 'w', encoding='utf-8') as file:
-                json.dump(
-                    data, 
-                    file, 
-                    indent=2, 
-                    ensure_ascii=False,
-                    sort_keys=True
-                )
+            super().save_json(data, path)
         except IOError as e:
             logger.error(f"Error saving file {path}: {str(e)}")
             raise
@@ -129,10 +150,6 @@ class BaseManagement:
             self.inputs[key] = self.load_json(path) or {}
             logger.info(f"Loaded input: {key} from {path}")
             
-    def analyze(self) -> None:
-        """Abstract method for data analysis."""
-        raise NotImplementedError("Subclasses must implement analyze() method")
-        
     def validate_inputs(self) -> bool:
         """Validate loaded inputs before analysis."""
         return all(self.inputs.values())
@@ -140,18 +157,7 @@ class BaseManagement:
     def run(self) -> None:
         """Execute the complete management workflow."""
         logger.info(f"Starting {self.__class__.__name__}")
-        
-        self.load_inputs()
-        
-        if not self.validate_inputs():
-            raise ValueError("Invalid inputs provided")
-            
-        self.analyze()
-        
-        self.save_json(self.output, self.output_path)
-        logger.info(
-            f"{self.__class__.__name__} output saved to {self.output_path}"
-        )
+        super().run()
 
 
 def estimate_task_duration(task: Dict[str, Any]) -> float:
@@ -199,6 +205,253 @@ def estimate_project_cost(project: Dict[str, Any]) -> float:
     return sum(estimate_task_cost(task) for task in tasks)
 
 
+def _as_float(value: Any, default: float) -> float:
+    """Convert a task field to float, falling back to a default."""
+    if isinstance(value, bool):
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class WBSEstimationBatch:
+    """
+    Columnar view of a full WBS for vectorized estimation.
+
+    The WBS is flattened once, in pre-order, into NumPy arrays. Estimation
+    methods then work on whole columns, so re-estimating with different
+    parameters costs a few array operations regardless of the task count.
+
+    Only leaf tasks (work packages) carry their own estimates; summary tasks
+    get theirs by rolling up their subtree with ``rollup``.
+
+    Attributes:
+        ids: Task IDs in pre-order
+        names: Task names in pre-order
+        parent: Index of each task's parent, -1 for top-level tasks
+        depth: Depth of each task, 0 for top-level tasks
+        is_leaf: True for tasks without subtasks
+        complexity_levels: Complexity names: the known ones, then any other
+            name a task uses
+        complexity_code: Index into ``complexity_levels`` (-1 for values
+            that cannot be a name)
+        resources: Resource units per task
+        story_points: Story points per task, NaN where not specified
+        size_kloc: Size in KLOC per task, NaN where not specified
+    """
+
+    def __init__(self, tasks: List[Dict[str, Any]], parent: List[int], depth: List[int],
+                 complexity_levels: Optional[List[str]] = None) -> None:
+        """
+        Build the columns from tasks already flattened in pre-order.
+
+        Use ``from_wbs`` to flatten a WBS tree.
+
+        Args:
+            tasks: Task dictionaries in pre-order
+            parent: Parent index per task, -1 for top-level tasks
+            depth: Depth per task
+            complexity_levels: Known complexity names, defaults to the keys
+                of DEFAULT_COMPLEXITY_MAPPING. Other names used by tasks are
+                added, so custom mappings can give them their own values.
+        """
+        self.complexity_levels = list(complexity_levels or DEFAULT_COMPLEXITY_MAPPING)
+        level_codes = {level: code for code, level in enumerate(self.complexity_levels)}
+
+        def level_code(level: Any) -> int:
+            try:
+                code = level_codes.get(level)
+            except TypeError:
+                return -1
+            if code is None:
+                code = level_codes[level] = len(self.complexity_levels)
+                self.complexity_levels.append(level)
+            return code
+
+        self.tasks = tasks
+        self.ids = [task.get('id') for task in tasks]
+        self.names = [task.get('name') for task in tasks]
+        self.parent = np.asarray(parent, dtype=np.int64)
+        self.depth = np.asarray(depth, dtype=np.int64)
+        self.is_leaf = np.fromiter((not task.get('subtasks') for task in tasks), dtype=bool, count=len(tasks))
+        self.complexity_code = np.fromiter(
+            (level_code(task.get('complexity', DEFAULT_COMPLEXITY)) for task in tasks),
+            dtype=np.int64, count=len(tasks))
+        self.resources = np.fromiter(
+            (_as_float(task.get('resources', 1), 1.0) for task in tasks), dtype=float, count=len(tasks))
+        self.story_points = np.fromiter(
+            (_as_float(task.get('story_points'), np.nan) for task in tasks), dtype=float, count=len(tasks))
+        self.size_kloc = np.fromiter(
+            (_as_float(task.get('size_kloc'), np.nan) for task in tasks), dtype=float, count=len(tasks))
+
+        self.top_level = np.flatnonzero(self.depth == 0)
+        # Task indices grouped by depth, deepest level first, for rollups
+        order = np.argsort(-self.depth, kind='stable')
+        boundaries = np.flatnonzero(np.diff(self.depth[order])) + 1
+        self._levels = [level for level in np.split(order, boundaries) if len(level)]
+
+    @classmethod
+    def from_wbs(cls, wbs: Dict[str, Any], complexity_levels: Optional[List[str]] = None) -> 'WBSEstimationBatch':
+        """
+        Flatten a WBS tree, including all nested subtasks.
+
+        Top-level tasks are read from the WBS 'tasks' list and/or its
+        'subtasks' list; the WBS root itself is not a task.
+
+        Args:
+            wbs: WBS root dictionary
+            complexity_levels: Known complexity names
+
+        Returns:
+            Batch over every task in the WBS
+        """
+        top_level = list(wbs.get('tasks') or []) + list(wbs.get('subtasks') or [])
+        tasks, parent, depth = [], [], []
+        stack = [(task, -1, 0) for task in reversed(top_level)]
+        while stack:
+            task, parent_index, task_depth = stack.pop()
+            if not isinstance(task, dict):
+                continue
+            index = len(tasks)
+            tasks.append(task)
+            parent.append(parent_index)
+            depth.append(task_depth)
+            for subtask in reversed(task.get('subtasks') or []):
+                stack.append((subtask, index, task_depth + 1))
+        return cls(tasks, parent, depth, complexity_levels)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _lookup(self, mapping: Dict[str, float], default: float) -> np.ndarray:
+        """Map complexity codes to values, using a default for unknown levels."""
+        table = np.array([mapping.get(level, default) for level in self.complexity_levels] + [default],
+                         dtype=float)
+        return table[self.complexity_code]
+
+    def rollup(self, values: np.ndarray) -> np.ndarray:
+        """
+        Sum per-task values up the hierarchy.
+
+        Summary tasks' own values are ignored; each gets the total of its
+        leaf descendants.
+
+        Args:
+            values: One value per task
+
+        Returns:
+            Subtree totals per task
+        """
+        totals = np.where(self.is_leaf, values, 0.0)
+        for level in self._levels:
+            parents = self.parent[level]
+            has_parent = parents >= 0
+            if has_parent.any():
+                totals += np.bincount(parents[has_parent], weights=totals[level[has_parent]],
+                                      minlength=len(totals))
+        return totals
+
+    def parametric(self, complexity_mapping: Optional[Dict[str, float]] = None,
+                   cost_per_resource: float = DEFAULT_COST_PER_RESOURCE,
+                   resource_scale: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Parametric duration and cost per task.
+
+        Matches ``estimate_task_duration`` and ``estimate_task_cost`` for
+        leaf tasks; summary tasks get zero until rolled up.
+
+        Args:
+            complexity_mapping: Duration per complexity level
+            cost_per_resource: Cost of one resource unit per duration unit
+            resource_scale: Multiplier applied to every task's resources
+
+        Returns:
+            Tuple of duration and cost arrays
+        """
+        duration = self._lookup(complexity_mapping or DEFAULT_COMPLEXITY_MAPPING,
+                                DEFAULT_COMPLEXITY_MAPPING[DEFAULT_COMPLEXITY])
+        duration = np.where(self.is_leaf, duration, 0.0)
+        cost = duration * self.resources * resource_scale * cost_per_resource
+        return duration, cost
+
+    def agile(self, velocity: float = DEFAULT_VELOCITY,
+              sprint_length_days: float = DEFAULT_SPRINT_LENGTH_DAYS,
+              points_mapping: Optional[Dict[str, float]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Story points and the duration they take at a given velocity.
+
+        Args:
+            velocity: Story points the team completes per sprint
+            sprint_length_days: Working days per sprint
+            points_mapping: Story points per complexity level for tasks
+                without 'story_points'
+
+        Returns:
+            Tuple of story point and duration-in-days arrays
+        """
+        if velocity <= 0:
+            raise ValueError("Velocity must be a positive number")
+        default_points = self._lookup(points_mapping or DEFAULT_STORY_POINTS,
+                                      DEFAULT_STORY_POINTS[DEFAULT_COMPLEXITY])
+        points = np.where(np.isnan(self.story_points), default_points, self.story_points)
+        points = np.where(self.is_leaf, points, 0.0)
+        return points, points / velocity * sprint_length_days
+
+    def cocomo_ii(self, scale_factor_sum: float = COCOMO_NOMINAL_SCALE_FACTORS,
+                  effort_multiplier: float = 1.0,
+                  size_mapping: Optional[Dict[str, float]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        COCOMO II effort and schedule for every subtree.
+
+        COCOMO II is not additive, so the model is applied to each task's
+        rolled-up size rather than summing per-task efforts.
+
+        Args:
+            scale_factor_sum: Sum of the five COCOMO II scale factors
+            effort_multiplier: Product of the effort multipliers (EAF)
+            size_mapping: Size in KLOC per complexity level for tasks
+                without 'size_kloc'
+
+        Returns:
+            Tuple of effort (person-months) and schedule (months) arrays
+        """
+        return self._cocomo(self._rolled_size(size_mapping), scale_factor_sum, effort_multiplier)
+
+    def cocomo_ii_project(self, scale_factor_sum: float = COCOMO_NOMINAL_SCALE_FACTORS,
+                          effort_multiplier: float = 1.0,
+                          size_mapping: Optional[Dict[str, float]] = None) -> Tuple[float, float]:
+        """
+        COCOMO II effort and schedule for the whole project.
+
+        Args:
+            scale_factor_sum: Sum of the five COCOMO II scale factors
+            effort_multiplier: Product of the effort multipliers (EAF)
+            size_mapping: Size in KLOC per complexity level for tasks
+                without 'size_kloc'
+
+        Returns:
+            Tuple of effort (person-months) and schedule (months)
+        """
+        size = self._rolled_size(size_mapping)[self.top_level].sum()
+        effort, schedule = self._cocomo(np.array([size]), scale_factor_sum, effort_multiplier)
+        return float(effort[0]), float(schedule[0])
+
+    def _rolled_size(self, size_mapping: Optional[Dict[str, float]]) -> np.ndarray:
+        """Subtree size in KLOC per task."""
+        default_size = self._lookup(size_mapping or DEFAULT_SIZE_KLOC, DEFAULT_SIZE_KLOC[DEFAULT_COMPLEXITY])
+        return self.rollup(np.where(np.isnan(self.size_kloc), default_size, self.size_kloc))
+
+    @staticmethod
+    def _cocomo(size: np.ndarray, scale_factor_sum: float,
+                effort_multiplier: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Apply the COCOMO II effort and schedule equations to sizes in KLOC."""
+        exponent = COCOMO_B + 0.01 * scale_factor_sum
+        effort = COCOMO_A * np.power(size, exponent) * effort_multiplier
+        schedule = COCOMO_C * np.power(effort, COCOMO_D + 0.2 * (exponent - COCOMO_B))
+        return effort, schedule
+
+
 class EstimationManagement(BaseManagement):
     """
     Project estimation management class with advanced estimation capabilities.
@@ -223,27 +476,45 @@ class EstimationManagement(BaseManagement):
             }
             return
             
-        tasks = detailed_wbs.get('tasks', [])
-        task_estimates = []
+        batch = WBSEstimationBatch.from_wbs(detailed_wbs)
+        duration, cost = batch.parametric()
+        duration_totals = batch.rollup(duration)
+        cost_totals = batch.rollup(cost)
+        points, agile_days = batch.agile()
+        points_totals = batch.rollup(points)
+        effort, _ = batch.cocomo_ii()
+        project_effort, project_schedule = batch.cocomo_ii_project()
         
-        for task in tasks:
-            task_estimate = {
-                'id': task.get('id'),
-                'name': task.get('name'),
-                'duration': estimate_task_duration(task),
-                'cost': estimate_task_cost(task),
-                'complexity': task.get('complexity', 'medium')
-            }
-            task_estimates.append(task_estimate)
-        
-        total_duration = sum(te['duration'] for te in task_estimates)
-        total_cost = sum(te['cost'] for te in task_estimates)
+        task_estimates = []
+        for i, task in enumerate(batch.tasks):
+            parent_index = batch.parent[i]
+            task_estimates.append({
+                'id': batch.ids[i],
+                'name': batch.names[i],
+                'parent_id': batch.ids[parent_index] if parent_index >= 0 else None,
+                'level': int(batch.depth[i]),
+                'is_summary': not batch.is_leaf[i],
+                'duration': float(duration_totals[i]),
+                'cost': float(cost_totals[i]),
+                'story_points': float(points_totals[i]),
+                'cocomo_effort_person_months': float(effort[i]),
+                'complexity': task.get('complexity', DEFAULT_COMPLEXITY)
+            })
         
         self.output = {
             'summary': {
                 'total_tasks': len(task_estimates),
-                'total_duration': total_duration,
-                'total_cost': total_cost
+                'total_work_packages': int(batch.is_leaf.sum()),
+                'total_duration': float(duration.sum()),
+                'total_cost': float(cost.sum()),
+                'cocomo_ii': {
+                    'effort_person_months': project_effort,
+                    'schedule_months': project_schedule
+                },
+                'agile': {
+                    'story_points': float(points.sum()),
+                    'duration_days': float(agile_days.sum())
+                }
             },
             'details': {
                 'task_estimates': task_estimates
@@ -1,21 +1,47 @@
 import os
 import json
 import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
+
+from autoprojectmanagement.main_modules.planning_estimation.dependency_manager import DependencyManager
+from autoprojectmanagement.main_modules.planning_estimation.gantt_scheduler import GanttScheduler
+from autoprojectmanagement.main_modules.utility_modules.working_calendar import WorkCalendar
 
 class GanttChartData:
-    def __init__(self, input_dir: str = 'project_inputs/PM_JSON/user_inputs'):
+    def __init__(self, input_dir: str = 'project_inputs/PM_JSON/user_inputs',
+                 project_start: Optional[datetime.date] = None,
+                 calendars: Optional[Dict[str, WorkCalendar]] = None):
         self.input_dir = input_dir
         self.tasks = []
+        # Unconstrained tasks start here; defaults to today when scheduling
+        self.project_start = project_start
+        self.calendars = calendars
+        self.scheduler: Optional[GanttScheduler] = None
+        # Durations changed through update_duration, by task ID
+        self.duration_overrides: Dict[Any, Union[int, float]] = {}
+        self._critical_path: Optional[Dict[str, Any]] = None
+        # The task lists the scheduler and the critical path were computed for
+        self._scheduled_tasks: Optional[List[Dict[str, Any]]] = None
+        self._analyzed_tasks: Optional[List[Dict[str, Any]]] = None
 
     def load_tasks(self):
         path = os.path.join(self.input_dir, 'detailed_wbs.json')
         try:
             with open(path, 'r', encoding='utf-8') as f:
                 self.tasks = json.load(f)
+            if isinstance(self.tasks, dict):
+                # A WBS root rather than a list of top-level tasks
+                self.tasks = [self.tasks]
         except Exception as e:
             print(f"Error loading tasks for Gantt chart: {e}")
             self.tasks = []
+        self.duration_overrides = {}
+        self.invalidate()
+
+    def invalidate(self):
+        """Drop the cached schedule and critical path, e.g. after editing ``tasks`` in place."""
+        self.scheduler = None
+        self._critical_path = None
 
     def parse_date(self, date_str: Optional[str]) -> Optional[datetime.date]:
         if not date_str:
@@ -25,46 +51,109 @@ class GanttChartData:
         except Exception:
             return None
 
-    def build_gantt_data(self) -> List[Dict[str, Any]]:
+    def get_duration_days(self, task: Dict[str, Any]) -> int:
+        if task.get('id') in self.duration_overrides:
+            return self.duration_overrides[task['id']]
+        return task.get('duration_days') or task.get('duration') or 1
+
+    def calculate_critical_path(self) -> Dict[str, Any]:
+        """
+        Run a CPM pass over the loaded tasks, using the same durations the
+        chart is drawn with.
+        """
+        manager = DependencyManager()
+        durations = {}
+        stack = list(self.tasks)
+        while stack:
+            task = stack.pop()
+            if task.get('id') is not None:
+                durations[task['id']] = self.get_duration_days(task)
+            stack.extend(task.get('subtasks', []))
+        for task in self.tasks:
+            manager.load_dependencies_from_wbs(task)
+        return manager.calculate_schedule(durations)
+
+    def get_critical_path(self) -> Dict[str, Any]:
+        """Get the CPM result, computed once until the tasks or a duration change."""
+        if self._critical_path is None or self._analyzed_tasks is not self.tasks:
+            self._critical_path = self.calculate_critical_path()
+            self._analyzed_tasks = self.tasks
+        return self._critical_path
+
+    def build_scheduler(self) -> GanttScheduler:
+        """
+        Schedule the loaded tasks from their dependencies and keep the
+        scheduler, so later changes can be applied incrementally.
+        """
+        self.scheduler = GanttScheduler(self.tasks, project_start=self.project_start,
+                                        calendars=self.calendars,
+                                        duration_overrides=self.duration_overrides)
+        self._scheduled_tasks = self.tasks
+        return self.scheduler
+
+    def get_scheduler(self) -> GanttScheduler:
+        """Get the kept scheduler, building it if the tasks were replaced or invalidated."""
+        if self.scheduler is None or self._scheduled_tasks is not self.tasks:
+            self.build_scheduler()
+        return self.scheduler
+
+    def update_duration(self, task_id: Any, duration: Union[int, float]) -> List[Any]:
+        """
+        Change a task's duration without editing the loaded WBS.
+
+        Dates are rescheduled incrementally; the critical path is
+        recomputed on its next use.
+
+        Returns:
+            IDs of the tasks whose start or end date changed
+
+        Raises:
+            KeyError: If the task is unknown
+            ValueError: If the tasks cannot be scheduled
+        """
+        changed = self.get_scheduler().update_duration(task_id, duration)
+        self.duration_overrides[task_id] = duration
+        self._critical_path = None
+        return changed
+
+    def build_gantt_data(self, offset: int = 0, limit: Optional[int] = None,
+                         window_start: Optional[str] = None,
+                         window_end: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Build Gantt chart data from tasks.
         Each task dict should include:
             - id
             - name
-            - start_date
-            - end_date (calculated from start_date + duration)
+            - start_date (from dependencies, parent start and start_date
+              constraints, on working days)
+            - end_date (start_date + duration in working days)
             - dependencies (list of task ids)
             - progress (0-100)
-        """
-        gantt_data = []
-
-        def process_task(task, parent_start: Optional[datetime.date] = None):
-            task_id = task.get('id')
-            name = task.get('name') or task.get('title') or f"Task {task_id}"
-            start_date_str = task.get('start_date')
-            duration_days = task.get('duration_days') or task.get('duration') or 1
-            dependencies = task.get('dependencies', [])
-
-            start_date = self.parse_date(start_date_str) or parent_start or datetime.date.today()
-            end_date = start_date + datetime.timedelta(days=duration_days)
+            - is_critical / total_float (from the critical path analysis)
 
-            progress = task.get('progress', 0) * 100 if isinstance(task.get('progress'), float) else task.get('progress', 0)
-
-            gantt_data.append({
-                'id': task_id,
-                'name': name,
-                'start_date': start_date.isoformat(),
-                'end_date': end_date.isoformat(),
-                'dependencies': dependencies,
-                'progress': progress,
-            })
-
-            for subtask in task.get('subtasks', []):
-                process_task(subtask, start_date)
+        offset/limit and window_start/window_end select a page of rows or
+        the rows overlapping a date window, in WBS order. The schedule and
+        the critical path are kept between calls, so further pages are
+        served without recomputing them.
+        """
+        try:
+            critical_path_tasks = self.get_critical_path()['tasks']
+        except ValueError as e:
+            print(f"Skipping critical path analysis for Gantt chart: {e}")
+            critical_path_tasks = {}
 
-        for task in self.tasks:
-            process_task(task)
+        try:
+            scheduler = self.get_scheduler()
+        except ValueError as e:
+            print(f"Cannot schedule Gantt chart: {e}")
+            return []
 
+        gantt_data = []
+        rows = scheduler.get_window(offset, limit, window_start, window_end)['tasks']
+        for row in rows:
+            cpm = critical_path_tasks.get(row['id'], {})
+            gantt_data.append(dict(row, is_critical=cpm.get('is_critical', False),
+                                   total_float=cpm.get('total_float')))
         return gantt_data
 
 def generate_gantt_chart(tasks):
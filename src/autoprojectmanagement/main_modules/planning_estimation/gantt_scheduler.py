@@ -0,0 +1,340 @@
+"""
+Gantt Scheduler Module - Dependency-driven task dates on working-day calendars
+"""
+
+import datetime
+import heapq
+import logging
+import math
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from autoprojectmanagement.main_modules.utility_modules.working_calendar import (
+    DateLike, WorkCalendar, to_day
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CALENDAR = 'standard'
+
+# Each task is scheduled as two events: its start and its finish
+START = 0
+FINISH = 1
+
+
+class GanttScheduler:
+    """
+    Schedules a WBS from its dependency graph and keeps the dates cached.
+
+    Every task has a start and a finish event. Dates are computed in one
+    topological pass over these events:
+
+    - a task starts on its first working day on or after its parent's
+      start, its own 'start_date' (a start-no-earlier-than constraint) and
+      the finish of each task it depends on
+    - a task finishes after its duration in working days; a summary task
+      finishes no earlier than its last subtask
+
+    Tasks without any of those constraints start on the project start.
+    A dependency between a task and one of its ancestors or descendants
+    would contradict the hierarchy; it is ignored with a warning and
+    listed in ``ignored_dependencies``.
+    Each task uses the calendar named by its 'calendar' field, or the
+    default calendar.
+
+    Computed dates are cached per task. ``update_duration`` only revisits
+    events downstream of the changed task, and stops wherever a date does
+    not move. The WBS passed in is never modified; changed durations are
+    kept in ``duration_overrides``.
+    """
+
+    def __init__(self, tasks: List[Dict[str, Any]], project_start: Optional[DateLike] = None,
+                 calendars: Optional[Dict[str, WorkCalendar]] = None,
+                 default_calendar: str = DEFAULT_CALENDAR,
+                 duration_overrides: Optional[Dict[Any, Union[int, float]]] = None):
+        """
+        Initialize the scheduler and compute all dates
+
+        Args:
+            tasks: Top-level WBS tasks, with nested 'subtasks'
+            project_start: Start of unconstrained tasks (defaults to today)
+            calendars: Calendars by name
+            default_calendar: Name of the calendar for tasks without one
+            duration_overrides: Durations in working days that replace the
+                tasks' own, by task ID
+
+        Raises:
+            ValueError: If the dependencies and hierarchy contain a cycle
+        """
+        self.project_start = to_day(project_start or datetime.date.today())
+        self.calendars = dict(calendars or {})
+        self.calendars.setdefault(default_calendar, WorkCalendar())
+        self.default_calendar = default_calendar
+        self.duration_overrides: Dict[Any, Union[int, float]] = dict(duration_overrides or {})
+
+        self.tasks: Dict[Any, Dict[str, Any]] = {}
+        self.order: List[Any] = []  # WBS pre-order, used for output
+        self.parents: Dict[Any, Any] = {}
+        self.levels: Dict[Any, int] = {}
+        self.children: Dict[Any, List[Any]] = {}
+        self.durations: Dict[Any, int] = {}
+        self.start_constraints: Dict[Any, np.datetime64] = {}
+        self._index_tasks(tasks)
+
+        self._predecessors: Dict[Tuple[Any, int], List[Tuple[Any, int]]] = {}
+        self._successors: Dict[Tuple[Any, int], List[Tuple[Any, int]]] = {}
+        self.ignored_dependencies: List[Tuple[Any, Any]] = []
+        self._build_event_graph()
+        self._topo_index: Dict[Tuple[Any, int], int] = {}
+        self.dates: Dict[Tuple[Any, int], np.datetime64] = {}
+        self._row_cache: Dict[Any, Dict[str, Any]] = {}
+        self.schedule()
+
+    @staticmethod
+    def duration_of(task: Dict[str, Any]) -> int:
+        """Get a task's duration in whole working days (at least 0)."""
+        return GanttScheduler._whole_days(task.get('duration_days') or task.get('duration') or 1)
+
+    @staticmethod
+    def _whole_days(duration: Any) -> int:
+        if not isinstance(duration, (int, float)) or isinstance(duration, bool):
+            duration = 1
+        return max(0, math.ceil(duration))
+
+    def _index_tasks(self, tasks: List[Dict[str, Any]]) -> None:
+        """Record tasks, hierarchy, durations and start constraints in pre-order."""
+        stack = [(task, None, 0) for task in reversed(tasks or [])]
+        while stack:
+            task, parent_id, level = stack.pop()
+            if not isinstance(task, dict) or task.get('id') is None or task['id'] in self.tasks:
+                continue
+            task_id = task['id']
+            self.tasks[task_id] = task
+            self.order.append(task_id)
+            self.parents[task_id] = parent_id
+            self.levels[task_id] = level
+            self.children[task_id] = []
+            if parent_id is not None:
+                self.children[parent_id].append(task_id)
+            if task_id in self.duration_overrides:
+                self.durations[task_id] = self._whole_days(self.duration_overrides[task_id])
+            else:
+                self.durations[task_id] = self.duration_of(task)
+            constraint = task.get('start_date')
+            if constraint:
+                try:
+                    self.start_constraints[task_id] = to_day(constraint)
+                except ValueError:
+                    pass
+            for subtask in reversed(task.get('subtasks') or []):
+                stack.append((subtask, task_id, level + 1))
+
+    def _build_event_graph(self) -> None:
+        """Link start and finish events through durations, hierarchy and dependencies."""
+        for task_id in self.order:
+            self._predecessors.setdefault((task_id, START), [])
+            self._predecessors.setdefault((task_id, FINISH), [])
+        for task_id in self.order:
+            self._link((task_id, START), (task_id, FINISH))
+            parent_id = self.parents[task_id]
+            if parent_id is not None:
+                self._link((parent_id, START), (task_id, START))
+                self._link((task_id, FINISH), (parent_id, FINISH))
+            for dep_id in self.tasks[task_id].get('dependencies') or []:
+                if dep_id not in self.tasks or dep_id == task_id:
+                    continue
+                if self._is_ancestor(dep_id, task_id) or self._is_ancestor(task_id, dep_id):
+                    logger.warning(f"Ignoring dependency of task {task_id!r} on {dep_id!r}: "
+                                   f"one contains the other")
+                    self.ignored_dependencies.append((task_id, dep_id))
+                    continue
+                self._link((dep_id, FINISH), (task_id, START))
+
+    def _is_ancestor(self, ancestor_id: Any, task_id: Any) -> bool:
+        parent_id = self.parents[task_id]
+        while parent_id is not None:
+            if parent_id == ancestor_id:
+                return True
+            parent_id = self.parents[parent_id]
+        return False
+
+    def _link(self, source: Tuple[Any, int], target: Tuple[Any, int]) -> None:
+        self._successors.setdefault(source, []).append(target)
+        self._predecessors[target].append(source)
+
+    def calendar_for(self, task_id: Any) -> WorkCalendar:
+        """Get the calendar a task is scheduled on."""
+        name = self.tasks[task_id].get('calendar', self.default_calendar)
+        return self.calendars.get(name, self.calendars[self.default_calendar])
+
+    def _compute(self, event: Tuple[Any, int]) -> np.datetime64:
+        """Compute an event's date from the cached dates of its predecessors."""
+        task_id, kind = event
+        calendar = self.calendar_for(task_id)
+        if kind == START:
+            bounds = [self.dates[pred] for pred in self._predecessors[event]]
+            if task_id in self.start_constraints:
+                bounds.append(self.start_constraints[task_id])
+            return calendar.roll_forward(max(bounds) if bounds else self.project_start)
+
+        own_finish = calendar.add_working_days(self.dates[(task_id, START)], self.durations[task_id])
+        return max([own_finish] + [self.dates[pred] for pred in self._predecessors[event]
+                                   if pred[0] != task_id])
+
+    def schedule(self) -> None:
+        """
+        Compute every task's dates from scratch.
+
+        Raises:
+            ValueError: If the dependencies and hierarchy contain a cycle
+        """
+        in_degree = {event: len(preds) for event, preds in self._predecessors.items()}
+        queue = deque(event for event, degree in in_degree.items() if degree == 0)
+        topo_order = []
+        while queue:
+            event = queue.popleft()
+            topo_order.append(event)
+            for successor in self._successors.get(event, []):
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    queue.append(successor)
+        if len(topo_order) < len(in_degree):
+            blocked = sorted({str(event[0]) for event, degree in in_degree.items() if degree > 0})
+            raise ValueError(f"Circular dependencies detected among tasks: {blocked}")
+
+        self._topo_index = {event: i for i, event in enumerate(topo_order)}
+        self.dates = {}
+        for event in topo_order:
+            self.dates[event] = self._compute(event)
+        self._row_cache = {}
+
+    def update_duration(self, task_id: Any, duration: Union[int, float]) -> List[Any]:
+        """
+        Change a task's duration and reschedule only what it affects.
+
+        Events are revisited in topological order starting from the task's
+        finish; propagation stops at events whose date does not change. The
+        new duration is kept in ``duration_overrides``; the task itself is
+        left as it was.
+
+        Args:
+            task_id: The task ID
+            duration: New duration in working days
+
+        Returns:
+            IDs of the tasks whose start or end date changed
+
+        Raises:
+            KeyError: If the task is unknown
+        """
+        if task_id not in self.tasks:
+            raise KeyError(f"Unknown task: {task_id}")
+        self.duration_overrides[task_id] = duration
+        self.durations[task_id] = self._whole_days(duration)
+
+        # The duration shows in the row even if no date moves
+        self._row_cache.pop(task_id, None)
+        first_event = (task_id, FINISH)
+        heap = [(self._topo_index[first_event], first_event)]
+        queued = {first_event}
+        changed = []
+        while heap:
+            _, event = heapq.heappop(heap)
+            queued.discard(event)
+            new_date = self._compute(event)
+            if new_date == self.dates[event]:
+                continue
+            self.dates[event] = new_date
+            if event[0] not in changed:
+                changed.append(event[0])
+                self._row_cache.pop(event[0], None)
+            for successor in self._successors.get(event, []):
+                if successor not in queued:
+                    queued.add(successor)
+                    heapq.heappush(heap, (self._topo_index[successor], successor))
+        return changed
+
+    def get_dates(self, task_id: Any) -> Tuple[datetime.date, datetime.date]:
+        """
+        Get a task's scheduled start and end dates.
+
+        Args:
+            task_id: The task ID
+
+        Returns:
+            Tuple of start date and end date; the end date is the working
+            day after the task's last day, where successors may start
+        """
+        return (self.dates[(task_id, START)].astype(datetime.date),
+                self.dates[(task_id, FINISH)].astype(datetime.date))
+
+    def get_row(self, task_id: Any) -> Dict[str, Any]:
+        """
+        Get the Gantt row of a task, cached until its dates change.
+
+        Args:
+            task_id: The task ID
+
+        Returns:
+            Row with id, name, dates, hierarchy, dependencies and progress
+        """
+        row = self._row_cache.get(task_id)
+        if row is None:
+            task = self.tasks[task_id]
+            start, end = self.get_dates(task_id)
+            duration = self.durations[task_id]
+            if self.children[task_id]:
+                duration = self.calendar_for(task_id).working_days_between(start, end)
+            progress = task.get('progress', 0)
+            row = {
+                'id': task_id,
+                'name': task.get('name') or task.get('title') or f"Task {task_id}",
+                'start_date': start.isoformat(),
+                'end_date': end.isoformat(),
+                'duration_days': duration,
+                'parent_id': self.parents[task_id],
+                'level': self.levels[task_id],
+                'is_summary': bool(self.children[task_id]),
+                'dependencies': task.get('dependencies', []),
+                'progress': progress * 100 if isinstance(progress, float) else progress,
+            }
+            self._row_cache[task_id] = row
+        return row
+
+    def get_window(self, offset: int = 0, limit: Optional[int] = None,
+                   window_start: Optional[DateLike] = None,
+                   window_end: Optional[DateLike] = None) -> Dict[str, Any]:
+        """
+        Get a page of Gantt rows, optionally limited to a date window.
+
+        Rows keep WBS order. A task is inside the window when its bar
+        overlaps [window_start, window_end).
+
+        Args:
+            offset: Number of matching rows to skip
+            limit: Maximum number of rows to return (all when None)
+            window_start: First day of the visible window
+            window_end: Day after the last day of the visible window
+
+        Returns:
+            Dictionary with 'total' (matching rows), 'offset', 'limit' and
+            'tasks' (the rows of this page)
+        """
+        first = to_day(window_start) if window_start is not None else None
+        last = to_day(window_end) if window_end is not None else None
+        if first is None and last is None:
+            matching = self.order
+        else:
+            matching = [task_id for task_id in self.order
+                        if (last is None or self.dates[(task_id, START)] < last)
+                        and (first is None or self.dates[(task_id, FINISH)] > first
+                             or self.dates[(task_id, START)] >= first)]
+        page = matching[offset:offset + limit if limit is not None else None]
+        return {
+            'total': len(matching),
+            'offset': offset,
+            'limit': limit,
+            'tasks': [self.get_row(task_id) for task_id in page],
+        }
@@ -0,0 +1,329 @@
+"""
+Schedule Risk Simulation Module - Monte Carlo simulation of the project schedule
+"""
+
+import math
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from autoprojectmanagement.main_modules.planning_estimation.dependency_manager import (
+    DURATION_FIELDS, FINISH, FLOAT_TOLERANCE, DependencyManager, SummaryEvent
+)
+from autoprojectmanagement.main_modules.planning_estimation.estimation_management import estimate_task_duration
+
+# WBS fields holding a three-point duration estimate
+OPTIMISTIC_FIELD = 'optimistic_duration'
+MOST_LIKELY_FIELD = 'most_likely_duration'
+PESSIMISTIC_FIELD = 'pessimistic_duration'
+
+# Spread applied to the most likely duration when a task has no three-point estimate
+DEFAULT_OPTIMISTIC_FACTOR = 0.75
+DEFAULT_PESSIMISTIC_FACTOR = 1.5
+
+DEFAULT_ITERATIONS = 10000
+DEFAULT_PERCENTILES = (50, 80, 95)
+DISTRIBUTIONS = ('pert', 'triangular')
+
+# Upper bound on tasks x iterations held in one batch matrix (8 bytes per cell)
+MAX_BATCH_CELLS = 2_000_000
+
+
+class ScheduleRiskSimulator:
+    """
+    Monte Carlo schedule risk analysis over the task dependency graph.
+
+    Every task gets a three-point duration estimate (optimistic, most likely,
+    pessimistic). Each iteration samples a duration for every task and runs
+    a CPM forward and backward pass. Iterations are processed in batches:
+    durations and dates are (tasks x iterations) matrices, and tasks are
+    handled one topological level at a time, so a pass costs a few NumPy
+    operations per level instead of Python work per task and iteration.
+
+    Three-point estimates are read from the 'optimistic_duration',
+    'most_likely_duration' and 'pessimistic_duration' task fields. Tasks
+    without them use their deterministic duration (or, for work packages
+    without one, ``estimate_task_duration``) as the most likely value and
+    the default spread factors for the other two. Summary tasks take no
+    sampled duration: like in ``DependencyManager.calculate_schedule`` they
+    span their subtasks, and are critical when their subtasks are.
+
+    Attributes:
+        task_ids: Simulated task IDs in topological order
+        optimistic: Optimistic duration per task
+        most_likely: Most likely duration per task
+        pessimistic: Pessimistic duration per task
+    """
+
+    def __init__(self, wbs_data: Dict[str, Any], dependency_manager: Optional[DependencyManager] = None,
+                 distribution: str = 'pert', seed: Optional[int] = None):
+        """
+        Initialize the simulator
+
+        Args:
+            wbs_data: The WBS structure
+            dependency_manager: Manager with dependencies already loaded;
+                one is built from the WBS when omitted
+            distribution: 'pert' (beta-PERT) or 'triangular'
+            seed: Seed for reproducible simulations
+
+        Raises:
+            ValueError: If the distribution is unknown, an estimate is
+                inconsistent, or the dependency graph has a cycle
+        """
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution '{distribution}'. Expected one of: {', '.join(DISTRIBUTIONS)}")
+        self.distribution = distribution
+        self.rng = np.random.default_rng(seed)
+
+        if dependency_manager is None:
+            dependency_manager = DependencyManager()
+            dependency_manager.load_dependencies_from_wbs(wbs_data)
+        self.dependency_manager = dependency_manager
+
+        estimates = self._collect_estimates(wbs_data)
+        nodes, predecessors, _ = dependency_manager.schedule_network(list(estimates))
+        self.task_ids: List[str] = [node.task_id if type(node) is SummaryEvent else node for node in nodes
+                                    if type(node) is not SummaryEvent or node.kind != FINISH]
+        # Tasks only referenced as dependencies are zero-length
+        three_point = np.array([estimates.get(task_id, (0.0, 0.0, 0.0)) for task_id in self.task_ids],
+                               dtype=float).reshape(-1, 3)
+        self.optimistic = three_point[:, 0]
+        self.most_likely = three_point[:, 1]
+        self.pessimistic = three_point[:, 2]
+        self._build_levels(nodes, predecessors)
+
+    def _collect_estimates(self, wbs_data: Dict[str, Any]) -> Dict[str, Tuple[float, float, float]]:
+        """Read the three-point estimate of every task in the WBS."""
+        deterministic = self.dependency_manager.task_durations
+        estimates = {}
+        stack = [wbs_data]
+        while stack:
+            task = stack.pop()
+            if not isinstance(task, dict):
+                continue
+            subtasks = task.get('subtasks') or []
+            stack.extend(subtasks)
+            task_id = task.get('id')
+            if not task_id:
+                continue
+
+            if all(_is_number(task.get(field)) for field in (OPTIMISTIC_FIELD, MOST_LIKELY_FIELD, PESSIMISTIC_FIELD)):
+                estimate = (float(task[OPTIMISTIC_FIELD]), float(task[MOST_LIKELY_FIELD]),
+                            float(task[PESSIMISTIC_FIELD]))
+                if not 0 <= estimate[0] <= estimate[1] <= estimate[2]:
+                    raise ValueError(f"Task '{task_id}' needs 0 <= optimistic <= most likely <= pessimistic, "
+                                     f"got {estimate}")
+            else:
+                if task_id in deterministic:
+                    likely = float(deterministic[task_id])
+                elif any(_is_number(task.get(field)) for field in DURATION_FIELDS):
+                    likely = float(next(task[field] for field in DURATION_FIELDS if _is_number(task.get(field))))
+                elif not subtasks:
+                    likely = estimate_task_duration(task)
+                else:
+                    likely = 0.0
+                estimate = (likely * DEFAULT_OPTIMISTIC_FACTOR, likely, likely * DEFAULT_PESSIMISTIC_FACTOR)
+            estimates[task_id] = estimate
+        return estimates
+
+    def _build_levels(self, nodes: List[Any], node_predecessors: Dict[Any, List[Any]]) -> None:
+        """
+        Group network nodes by topological level and flatten their links per level.
+
+        A node's level is one more than the highest level among its
+        predecessors, so all predecessors of a level are finished before
+        it starts and a whole level can be scheduled at once. Nodes are the
+        simulated tasks, plus a start and a finish milestone per summary
+        task; ``_node_rows`` maps each node to its task row when there are
+        summaries.
+        """
+        position = {node: i for i, node in enumerate(nodes)}
+        predecessors = [[position[dep] for dep in node_predecessors.get(node, []) if dep in position]
+                        for node in nodes]
+        level = [0] * len(nodes)
+        for i, preds in enumerate(predecessors):
+            if preds:
+                level[i] = 1 + max(level[p] for p in preds)
+
+        self._node_rows: Optional[np.ndarray] = None
+        self._is_event: Optional[np.ndarray] = None
+        if len(nodes) != len(self.task_ids):
+            row = {task_id: i for i, task_id in enumerate(self.task_ids)}
+            self._node_rows = np.array([row[node.task_id if type(node) is SummaryEvent else node]
+                                        for node in nodes], dtype=np.int64)
+            self._is_event = np.array([type(node) is SummaryEvent for node in nodes])
+
+        successors: List[List[int]] = [[] for _ in nodes]
+        for i, preds in enumerate(predecessors):
+            for p in preds:
+                successors[p].append(i)
+
+        levels: Dict[int, List[int]] = {}
+        for i, task_level in enumerate(level):
+            levels.setdefault(task_level, []).append(i)
+
+        self._levels = []
+        for task_level in sorted(levels):
+            tasks = np.array(levels[task_level], dtype=np.int64)
+            self._levels.append({
+                'tasks': tasks,
+                'forward': self._links(tasks, predecessors),
+                'backward': self._links(tasks, successors),
+            })
+
+    @staticmethod
+    def _links(tasks: np.ndarray, links: List[List[int]]) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Flatten the links of a level's tasks for ``reduceat``.
+
+        Returns the tasks that have links, the linked task indices grouped
+        per task, and the offset where each task's group starts.
+        """
+        linked = [t for t in tasks.tolist() if links[t]]
+        if not linked:
+            return None
+        flat = [other for t in linked for other in links[t]]
+        starts = np.cumsum([0] + [len(links[t]) for t in linked[:-1]])
+        return np.array(linked, dtype=np.int64), np.array(flat, dtype=np.int64), starts.astype(np.int64)
+
+    def sample_durations(self, iterations: int) -> np.ndarray:
+        """
+        Sample task durations
+
+        Args:
+            iterations: Number of samples per task
+
+        Returns:
+            Matrix of durations, one row per task and one column per iteration
+        """
+        low = self.optimistic[:, None]
+        mode = self.most_likely[:, None]
+        spread = (self.pessimistic - self.optimistic)[:, None]
+        varies = spread > 0
+        safe_spread = np.where(varies, spread, 1.0)
+        shape = (len(self.task_ids), iterations)
+
+        if self.distribution == 'pert':
+            alpha = 1 + 4 * (mode - low) / safe_spread
+            beta = 1 + 4 * (low + safe_spread - mode) / safe_spread
+            samples = self.rng.beta(np.broadcast_to(alpha, shape), np.broadcast_to(beta, shape))
+        else:
+            u = self.rng.random(shape)
+            peak = (mode - low) / safe_spread
+            samples = np.where(u < peak,
+                               np.sqrt(u * peak),
+                               1 - np.sqrt((1 - u) * (1 - peak)))
+        return np.where(varies, low + samples * safe_spread, mode)
+
+    def run_passes(self, durations: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Run CPM forward and backward passes for a batch of iterations
+
+        Args:
+            durations: Task durations, one column per iteration
+
+        Returns:
+            Tuple of the project duration per iteration and a boolean matrix
+            marking the tasks with zero total float in each iteration
+        """
+        task_durations = durations
+        if self._node_rows is not None:
+            durations = np.where(self._is_event[:, None], 0.0, task_durations[self._node_rows])
+        earliest_start = np.zeros_like(durations)
+        earliest_finish = np.empty_like(durations)
+        for level in self._levels:
+            if level['forward'] is not None:
+                linked, flat, starts = level['forward']
+                earliest_start[linked] = np.maximum.reduceat(earliest_finish[flat], starts, axis=0)
+            tasks = level['tasks']
+            earliest_finish[tasks] = earliest_start[tasks] + durations[tasks]
+
+        project_duration = earliest_finish.max(axis=0) if len(durations) else np.zeros(durations.shape[1])
+        latest_start = np.empty_like(durations)
+        for level in reversed(self._levels):
+            tasks = level['tasks']
+            latest_finish = np.broadcast_to(project_duration, (len(tasks), durations.shape[1])).copy()
+            if level['backward'] is not None:
+                linked, flat, starts = level['backward']
+                rows = np.searchsorted(tasks, linked)
+                latest_finish[rows] = np.minimum.reduceat(latest_start[flat], starts, axis=0)
+            latest_start[tasks] = latest_finish - durations[tasks]
+
+        tolerance = FLOAT_TOLERANCE * np.maximum(1.0, project_duration)
+        critical = np.abs(latest_start - earliest_start) <= tolerance
+        if self._node_rows is not None:
+            # A summary task is critical when its start or finish milestone is
+            node_critical, critical = critical, np.zeros(task_durations.shape, dtype=bool)
+            np.logical_or.at(critical, self._node_rows, node_critical)
+        return project_duration, critical
+
+    def simulate(self, iterations: int = DEFAULT_ITERATIONS,
+                 percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+                 start_date: Optional[Union[str, date]] = None,
+                 holidays: Optional[List[Union[str, date]]] = None,
+                 batch_size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Run the Monte Carlo simulation
+
+        Args:
+            iterations: Number of simulated schedules
+            percentiles: Completion percentiles to report
+            start_date: Project start; when given, completion dates are
+                reported by counting durations as working days
+            holidays: Non-working dates skipped when computing dates
+            batch_size: Iterations per batch; derived from MAX_BATCH_CELLS
+                when omitted
+
+        Returns:
+            Dictionary with the deterministic (most likely) duration, mean and
+            standard deviation of the project duration, the requested
+            percentiles (with dates when a start date is given), the
+            probability of finishing within the deterministic duration, and
+            each task's criticality index (share of iterations in which the
+            task had zero total float)
+        """
+        if iterations <= 0:
+            raise ValueError("Iterations must be a positive number")
+        if batch_size is None:
+            batch_size = max(1, MAX_BATCH_CELLS // max(1, len(self.task_ids)))
+
+        deterministic, _ = self.run_passes(self.most_likely[:, None])
+        project_durations = np.empty(iterations)
+        critical_counts = np.zeros(len(self.task_ids), dtype=np.int64)
+        for offset in range(0, iterations, batch_size):
+            batch = min(batch_size, iterations - offset)
+            project, critical = self.run_passes(self.sample_durations(batch))
+            project_durations[offset:offset + batch] = project
+            critical_counts += critical.sum(axis=1)
+
+        values = np.percentile(project_durations, list(percentiles))
+        result = {
+            'iterations': iterations,
+            'distribution': self.distribution,
+            'deterministic_duration': float(deterministic[0]),
+            'mean_duration': float(project_durations.mean()),
+            'std_duration': float(project_durations.std()),
+            'probability_on_time': float(np.mean(project_durations <= deterministic[0] + FLOAT_TOLERANCE)),
+            'percentiles': {f"P{_format_percentile(p)}": {'duration': float(v)}
+                            for p, v in zip(percentiles, values)},
+            'criticality_index': dict(zip(self.task_ids, (critical_counts / iterations).tolist())),
+        }
+
+        if start_date is not None:
+            start = np.datetime64(str(start_date), 'D')
+            busday_holidays = [np.datetime64(str(day), 'D') for day in holidays or []]
+            for key, value in zip(result['percentiles'], values):
+                finish = np.busday_offset(start, math.ceil(value - FLOAT_TOLERANCE), roll='forward',
+                                          holidays=busday_holidays)
+                result['percentiles'][key]['completion_date'] = str(finish)
+        return result
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _format_percentile(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else str(value)
@@ -1,36 +1,341 @@
-import schedule
-import time
+"""
+Scheduler Module - Event-driven job scheduler with a timer heap and thread pool
+
+The scheduler thread sleeps until the earliest due job instead of polling
+every second. Due jobs run on a bounded thread pool, so a slow or failing
+job neither blocks nor kills the others. Next-run times can be persisted,
+so a restart continues the schedule instead of starting it over.
+
+Example usage:
+
+    from autoprojectmanagement.main_modules.planning_estimation.scheduler import Scheduler
+
+    scheduler = Scheduler(state_path='data/scheduler_state.json')
+    scheduler.schedule_hourly(update_dashboards)
+    scheduler.schedule_daily(update_reports)
+    scheduler.start()
+"""
+
+import datetime
+import heapq
+import json
+import logging
 import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from autoprojectmanagement.main_modules.utility_modules.data_store import atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+# What happens when a job is due while its previous run is still going
+OVERLAP_SKIP = 'skip'      # drop this run
+OVERLAP_QUEUE = 'queue'    # run once more as soon as the current run ends
+OVERLAP_ALLOW = 'allow'    # run concurrently
+OVERLAP_POLICIES = (OVERLAP_SKIP, OVERLAP_QUEUE, OVERLAP_ALLOW)
+
+
+class ScheduledJob:
+    """
+    A job and its trigger: a fixed interval or a daily time of day.
+
+    Attributes:
+        name: Unique job name, used as the key for persisted state
+        func: Callable run with no arguments
+        interval: Seconds between runs, for interval jobs
+        at: (hour, minute) of daily jobs, in local time
+        overlap: One of OVERLAP_POLICIES
+        coalesce: Run missed occurrences once instead of once each
+        next_run: Epoch seconds of the next run
+        running: Number of runs in progress
+        queued: Whether a run is waiting for the current one to end
+        last_run / last_error / run_count / skip_count: Run history
+    """
+
+    def __init__(self, name: str, func: Callable[[], Any], interval: Optional[float] = None,
+                 at: Optional[Tuple[int, int]] = None, overlap: str = OVERLAP_SKIP,
+                 coalesce: bool = True):
+        if (interval is None) == (at is None):
+            raise ValueError("A job needs exactly one of interval or at")
+        if interval is not None and interval <= 0:
+            raise ValueError("Job interval must be positive")
+        if overlap not in OVERLAP_POLICIES:
+            raise ValueError(f"Unknown overlap policy '{overlap}'. "
+                             f"Expected one of: {', '.join(OVERLAP_POLICIES)}")
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.at = at
+        self.overlap = overlap
+        self.coalesce = coalesce
+        self.next_run: float = 0.0
+        self.running = 0
+        self.queued = False
+        self.last_run: Optional[float] = None
+        self.last_error: Optional[BaseException] = None
+        self.run_count = 0
+        self.skip_count = 0
+
+    def next_after(self, moment: float) -> float:
+        """Get the first trigger time strictly after a moment."""
+        if self.interval is not None:
+            return moment + self.interval
+        current = datetime.datetime.fromtimestamp(moment)
+        candidate = current.replace(hour=self.at[0], minute=self.at[1], second=0, microsecond=0)
+        if candidate <= current:
+            candidate += datetime.timedelta(days=1)
+        return candidate.timestamp()
+
+    def advance(self, now: float) -> None:
+        """Move ``next_run`` past the occurrence being dispatched."""
+        if not self.coalesce:
+            self.next_run = self.next_after(self.next_run)
+        elif self.interval is not None:
+            # Skip every missed interval at once, keeping the original phase
+            missed = int((now - self.next_run) // self.interval) + 1
+            self.next_run += max(missed, 1) * self.interval
+        else:
+            self.next_run = self.next_after(max(now, self.next_run))
+
 
 class Scheduler:
-    def __init__(self):
-        self.jobs = []
-
-    def start(self):
-        def run_scheduler():
-            while True:
-                schedule.run_pending()
-                time.sleep(1)
-
-        thread = threading.Thread(target=run_scheduler, daemon=True)
-        thread.start()
-
-    def schedule_hourly(self, job_func):
-        job = schedule.every(1).hours.do(job_func)
-        self.jobs.append(job)
-
-    def schedule_daily(self, job_func):
-        job = schedule.every().day.at("00:00").do(job_func)
-        self.jobs.append(job)
-
-# Example usage:
-# from dashboards_reports import update_dashboards
-# from reporting import update_reports
-#
-# scheduler = Scheduler()
-# scheduler.schedule_hourly(update_dashboards)
-# scheduler.schedule_daily(update_reports)
-# scheduler.start()
-#
-# while True:
-#     time.sleep(10)
+    """
+    Runs jobs at intervals or daily times on a bounded thread pool.
+
+    Jobs are kept in a heap ordered by next run time. The scheduler thread
+    waits on a condition variable until the earliest job is due, or until a
+    job is added or the scheduler is stopped.
+
+    Attributes:
+        jobs: Scheduled jobs, in the order they were added
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS,
+                 state_path: Optional[Union[str, Path]] = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Initialize the scheduler
+
+        Args:
+            max_workers: Size of the thread pool running the jobs
+            state_path: JSON file persisting each job's next run time
+            clock: Returns the current time in epoch seconds
+        """
+        self.jobs: List[ScheduledJob] = []
+        self.max_workers = max_workers
+        self.state_path = Path(state_path) if state_path else None
+        self.clock = clock
+        self._heap: List[Tuple[float, int, ScheduledJob]] = []
+        self._sequence = 0
+        self._condition = threading.Condition()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._saved_state = self._load_state()
+
+    # Scheduling
+
+    def add_job(self, func: Callable[[], Any], interval: Optional[float] = None,
+                at: Optional[str] = None, name: Optional[str] = None,
+                overlap: str = OVERLAP_SKIP, coalesce: bool = True) -> ScheduledJob:
+        """
+        Schedule a job
+
+        Args:
+            func: Callable run with no arguments
+            interval: Seconds between runs
+            at: Daily run time as 'HH:MM'; give either interval or at
+            name: Unique job name, defaults to the function's qualified name
+            overlap: One of OVERLAP_POLICIES
+            coalesce: Run missed occurrences once instead of once each
+
+        Returns:
+            The scheduled job
+
+        Raises:
+            ValueError: If the trigger, policy or name is invalid
+        """
+        name = name or getattr(func, '__qualname__', None) or repr(func)
+        daily = None
+        if at is not None:
+            hour, minute = (int(part) for part in at.split(':'))
+            if not (0 <= hour < 24 and 0 <= minute < 60):
+                raise ValueError(f"Invalid daily time '{at}'")
+            daily = (hour, minute)
+        job = ScheduledJob(name, func, interval=interval, at=daily, overlap=overlap, coalesce=coalesce)
+
+        with self._condition:
+            if any(existing.name == name for existing in self.jobs):
+                raise ValueError(f"A job named '{name}' is already scheduled")
+            saved = self._saved_state.get(name, {})
+            job.next_run = saved.get('next_run') or job.next_after(self.clock())
+            job.last_run = saved.get('last_run')
+            self.jobs.append(job)
+            self._push(job)
+            self._condition.notify()
+        return job
+
+    def schedule_hourly(self, job_func: Callable[[], Any], **options: Any) -> ScheduledJob:
+        """Schedule a job every hour. Options are passed to ``add_job``."""
+        return self.add_job(job_func, interval=3600, **options)
+
+    def schedule_daily(self, job_func: Callable[[], Any], at: str = "00:00", **options: Any) -> ScheduledJob:
+        """Schedule a job every day at a local time. Options are passed to ``add_job``."""
+        return self.add_job(job_func, at=at, **options)
+
+    def _push(self, job: ScheduledJob) -> None:
+        self._sequence += 1
+        heapq.heappush(self._heap, (job.next_run, self._sequence, job))
+
+    def next_run_time(self) -> Optional[float]:
+        """Get the epoch time of the earliest scheduled run, if any."""
+        with self._condition:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def _drop_stale(self) -> None:
+        """Pop heap entries of jobs that were rescheduled since they were pushed."""
+        while self._heap and self._heap[0][0] != self._heap[0][2].next_run:
+            heapq.heappop(self._heap)
+
+    # Running
+
+    def start(self) -> None:
+        """Start the scheduler thread and the worker pool."""
+        with self._condition:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped = False
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix='scheduler-job')
+            self._thread = threading.Thread(target=self._run_loop, name='scheduler', daemon=True)
+            self._thread.start()
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        Stop scheduling new runs.
+
+        Args:
+            wait: Wait for runs in progress to finish
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def _run_loop(self) -> None:
+        with self._condition:
+            while not self._stopped:
+                self._drop_stale()
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                delay = self._heap[0][0] - self.clock()
+                if delay > 0:
+                    self._condition.wait(timeout=delay)
+                    continue
+                self._dispatch_due(self.clock())
+
+    def run_pending(self) -> List[str]:
+        """
+        Dispatch every job that is due now.
+
+        Without a running scheduler thread, jobs run synchronously in the
+        calling thread.
+
+        Returns:
+            Names of the jobs that were started
+        """
+        with self._condition:
+            return self._dispatch_due(self.clock())
+
+    def _dispatch_due(self, now: float) -> List[str]:
+        """Start or skip every due job and persist the new run times. Holds the lock."""
+        started = []
+        while self._heap and self._heap[0][0] <= now:
+            scheduled_at, _, job = heapq.heappop(self._heap)
+            if scheduled_at != job.next_run:
+                continue
+            job.advance(now)
+            self._push(job)
+
+            if job.running and job.overlap == OVERLAP_SKIP:
+                job.skip_count += 1
+                logger.info(f"Skipped job {job.name}: previous run still in progress")
+            elif job.running and job.overlap == OVERLAP_QUEUE:
+                job.queued = True
+            else:
+                self._submit(job, now)
+                started.append(job.name)
+
+        self._save_state()
+        return started
+
+    def _submit(self, job: ScheduledJob, now: float) -> None:
+        """Start a run of a job. Holds the lock."""
+        job.running += 1
+        job.last_run = now
+        if self._executor is None:
+            self._condition.release()
+            try:
+                self._execute(job)
+            finally:
+                self._condition.acquire()
+            self._finish(job)
+            return
+        future: Future = self._executor.submit(self._execute, job)
+        future.add_done_callback(lambda _: self._on_done(job))
+
+    def _execute(self, job: ScheduledJob) -> None:
+        """Run a job, isolating its failures from the scheduler and other jobs."""
+        try:
+            job.func()
+            job.last_error = None
+        except Exception as e:
+            job.last_error = e
+            logger.error(f"Scheduled job {job.name} failed: {e}")
+
+    def _on_done(self, job: ScheduledJob) -> None:
+        with self._condition:
+            self._finish(job)
+
+    def _finish(self, job: ScheduledJob) -> None:
+        """Record the end of a run and start a queued one. Holds the lock."""
+        job.running -= 1
+        job.run_count += 1
+        if job.queued and not job.running and not self._stopped:
+            job.queued = False
+            self._submit(job, self.clock())
+
+    # Persistence
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        if self.state_path is None or not self.state_path.exists():
+            return {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('jobs', {})
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable scheduler state {self.state_path}: {e}")
+            return {}
+
+    def _save_state(self) -> None:
+        if self.state_path is None:
+            return
+        # Keep the state of jobs that are not scheduled (yet) in this process
+        state = dict(self._saved_state)
+        state.update((job.name, {'next_run': job.next_run, 'last_run': job.last_run}) for job in self.jobs)
+        self._saved_state = state
+        try:
+            atomic_write_text(self.state_path, json.dumps({'jobs': state}, indent=2))
+        except OSError as e:
+            logger.error(f"Cannot save scheduler state to {self.state_path}: {e}")
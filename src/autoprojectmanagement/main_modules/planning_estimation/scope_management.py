@@ -15,14 +15,24 @@ import logging
 import os
 import sys
 import requests
+import shutil
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 # Add the services directory to the path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / 'services'))
 
 from autoprojectmanagement.services.notification_service import NotificationService
+from autoprojectmanagement.main_modules.planning_estimation.wbs_index import WBSIndex
+from autoprojectmanagement.main_modules.planning_estimation.baseline_store import (
+    BaselineStore, WBSHashTree
+)
+from autoprojectmanagement.main_modules.planning_estimation.wbs_merge_engine import copy_wbs_tree
+from autoprojectmanagement.main_modules.planning_estimation.wbs_diff import (
+    diff_wbs, iter_wbs_diff, summarize_diff, write_wbs_diff
+)
 
 # Configure logging
 logging.basicConfig(
@@ -91,6 +101,38 @@ GITHUB_ISSUE_TEMPLATE = """
 """
 
 
+def _stage_text(path: Path, text: str) -> str:
+    """Write text to a temporary file next to ``path`` and return its path."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, staged_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding=ENCODING) as f:
+            f.write(text)
+    except BaseException:
+        _remove_quietly(staged_path)
+        raise
+    return staged_path
+
+
+def _stage_copy(path: Path) -> str:
+    """Copy a file to a temporary file next to it and return the copy's path."""
+    fd, copy_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix='.bak')
+    os.close(fd)
+    try:
+        shutil.copyfile(path, copy_path)
+    except BaseException:
+        _remove_quietly(copy_path)
+        raise
+    return copy_path
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
 class ScopeManagementError(Exception):
     """Base exception for scope management errors."""
     pass
@@ -154,6 +196,9 @@ class ScopeManagement:
         self.output_path = Path(output_path)
         
         self.detailed_wbs: Dict[str, Any] = {}
+        self._wbs_index: Optional[WBSIndex] = None
+        # (root, dependencies, reverse dependencies) of the last built graph
+        self._dependency_graph: Optional[Tuple[Dict[str, Any], Dict[str, List[str]], Dict[str, List[str]]]] = None
         self.scope_changes: List[Dict[str, Any]] = []
         self.scope_status: Dict[str, List[str]] = {
             'added_tasks': [],
@@ -163,11 +208,44 @@ class ScopeManagement:
         }
         self.baseline_path = Path(DEFAULT_BASELINE_PATH)
         self.baselines: Dict[str, Any] = {}
+        self._baseline_store: Optional[BaselineStore] = None
         
         # Initialize notification service
         self.notification_service = notification_service or NotificationService()
         self.notification_recipients = ['project_manager@example.com', 'team@example.com']
     
+    @property
+    def wbs_index(self) -> WBSIndex:
+        """
+        Index over the current detailed WBS.
+
+        The index is rebuilt lazily whenever ``detailed_wbs`` is replaced, and
+        kept in sync by the add/remove/modify change handlers.
+        """
+        if self._wbs_index is None or self._wbs_index.root is not self.detailed_wbs:
+            self._wbs_index = WBSIndex(self.detailed_wbs)
+        return self._wbs_index
+
+    def invalidate_wbs_index(self) -> None:
+        """Force the WBS index to be rebuilt after direct edits to ``detailed_wbs``."""
+        self._wbs_index = None
+        self.invalidate_dependency_graph()
+
+    def invalidate_dependency_graph(self) -> None:
+        """Force the dependency maps to be rebuilt on their next use."""
+        self._dependency_graph = None
+
+    @property
+    def baseline_store(self) -> BaselineStore:
+        """
+        Content-addressed store behind ``baseline_path``.
+
+        The store is recreated whenever ``baseline_path`` is changed.
+        """
+        if self._baseline_store is None or self._baseline_store.index_path != Path(self.baseline_path):
+            self._baseline_store = BaselineStore(Path(self.baseline_path))
+        return self._baseline_store
+
     def load_json(self, path: Path) -> Optional[Union[Dict[str, Any], List[Any]]]:
         """
         Load JSON data from file with error handling.
@@ -251,12 +329,19 @@ class ScopeManagement:
         
         return True
     
-    def apply_scope_changes(self) -> None:
+    def apply_scope_changes(self,
+                            wbs_output_path: Optional[Union[str, Path]] = None,
+                            change_log_path: Optional[Union[str, Path]] = None) -> None:
         """
         Apply validated scope changes to the detailed WBS.
         
-        This method processes all scope changes and applies them to the WBS
-        structure while maintaining data integrity and generating audit trails.
+        All of ``scope_changes`` are applied as one transaction: if any change
+        is invalid, or the results cannot be written, none of them is applied
+        and the reason is recorded in ``scope_status['errors']``.
+        
+        Args:
+            wbs_output_path: Where to write the resulting WBS; not written if None
+            change_log_path: JSON change log to append to; not written if None
         """
         logger.info("Applying scope changes...")
         
@@ -267,61 +352,211 @@ class ScopeManagement:
             'errors': []
         }
         
-        for change in self.scope_changes:
-            try:
-                self.validate_scope_change(change)
-                self._process_single_change(change)
-            except Exception as e:
-                error_msg = f"Error processing change {change}: {e}"
-                logger.error(error_msg)
-                self.scope_status['errors'].append(error_msg)
+        try:
+            self.apply_scope_changes_transaction(self.scope_changes, wbs_output_path, change_log_path)
+        except ScopeManagementError as e:
+            logger.error(f"Scope changes were not applied: {e}")
     
-    def _process_single_change(self, change: Dict[str, Any]) -> None:
-        """Process a single validated scope change."""
+    def apply_scope_changes_transaction(self,
+                                        changes: Optional[List[Dict[str, Any]]] = None,
+                                        wbs_output_path: Optional[Union[str, Path]] = None,
+                                        change_log_path: Optional[Union[str, Path]] = None) -> Dict[str, List[str]]:
+        """
+        Apply a batch of scope changes as one all-or-nothing transaction.
+        
+        Each change is validated against the WBS index as left by the changes
+        before it, then applied in memory with an undo record. If any change
+        is invalid, or writing the results fails, every applied change is
+        undone and the WBS is left exactly as it was.
+        
+        On success the WBS and the change log are each written once, through
+        a temporary file and an atomic rename. Applied changes are appended
+        to the change log with an 'applied_at' timestamp.
+        
+        Args:
+            changes: Changes to apply, defaults to ``scope_changes``
+            wbs_output_path: Where to write the resulting WBS; not written if None
+            change_log_path: JSON change log to append to; not written if None
+            
+        Returns:
+            The scope status with the added, removed and modified task IDs
+            
+        Raises:
+            InvalidScopeChangeError: If a change is invalid; nothing is applied
+            ScopeManagementError: If the results cannot be written; nothing is applied
+        """
+        changes = self.scope_changes if changes is None else changes
+        status: Dict[str, List[str]] = {
+            'added_tasks': [],
+            'removed_tasks': [],
+            'modified_tasks': [],
+            'errors': []
+        }
+        undo_log: List[Tuple[str, Any, Any, Any]] = []
+        
+        try:
+            for position, change in enumerate(changes):
+                try:
+                    self.validate_scope_change(change)
+                    undo_log.append(self._apply_change_with_undo(change, status))
+                except InvalidScopeChangeError as e:
+                    raise InvalidScopeChangeError(f"Change {position} ({change.get('task_id')}): {e}")
+            
+            if wbs_output_path is not None or change_log_path is not None:
+                self._write_transaction(changes, wbs_output_path, change_log_path)
+        except Exception as e:
+            self._rollback(undo_log)
+            self.scope_status['errors'].append(f"Scope change transaction rolled back: {e}")
+            logger.error(f"Scope change transaction rolled back after {len(undo_log)} changes: {e}")
+            raise
+        
+        self.invalidate_dependency_graph()
+        for key in ('added_tasks', 'removed_tasks', 'modified_tasks'):
+            self.scope_status[key].extend(status[key])
+        logger.info(f"Applied {len(changes)} scope changes in one transaction")
+        return status
+    
+    def _apply_change_with_undo(self, change: Dict[str, Any],
+                                status: Dict[str, List[str]]) -> Tuple[str, Any, Any, Any]:
+        """
+        Validate one change against the index, apply it and return its undo record.
+        
+        Raises:
+            InvalidScopeChangeError: If the change does not fit the current WBS
+        """
+        index = self.wbs_index
         task_id = change['task_id']
         change_type = change['change_type']
-        details = change['details']
+        details = change['details'] or {}
         
         if change_type == CHANGE_TYPE_ADD:
-            self._process_add_change(task_id, details)
-        elif change_type == CHANGE_TYPE_REMOVE:
-            self._process_remove_change(task_id)
-        elif change_type == CHANGE_TYPE_MODIFY:
-            self._process_modify_change(task_id, details)
-    
-    def _process_add_change(self, task_id: str, details: Dict[str, Any]) -> None:
-        """Process an 'add' type scope change."""
-        parent_id = details.get('parent_id')
-        new_task = details.get('task')
-        
-        if parent_id and new_task:
-            parent_task = self.find_task_by_id(parent_id)
-            if parent_task is not None:
-                if 'subtasks' not in parent_task:
-                    parent_task['subtasks'] = []
-                parent_task['subtasks'].append(new_task)
-                self.scope_status['added_tasks'].append(new_task.get('id', ''))
-                logger.info(f"Added task {new_task.get('id')} under parent {parent_id}")
+            parent_id = details.get('parent_id')
+            new_task = details.get('task')
+            if parent_id not in index:
+                raise InvalidScopeChangeError(f"Parent task {parent_id} not found")
+            if not isinstance(new_task, dict):
+                raise InvalidScopeChangeError("Added task must be a dictionary")
+            new_task = copy_wbs_tree(new_task)
+            parent = index.get(parent_id)
+            # add_task creates the subtask list when the parent has none
+            original_subtasks = parent['subtasks'] if isinstance(parent.get('subtasks'), list) \
+                else ('subtasks' in parent, parent.get('subtasks'))
+            try:
+                index.add_task(parent_id, new_task)
+            except ValueError as e:
+                raise InvalidScopeChangeError(str(e)) from e
+            status['added_tasks'].append(new_task.get('id', ''))
+            return (CHANGE_TYPE_ADD, parent, new_task, original_subtasks)
+        
+        if change_type == CHANGE_TYPE_REMOVE:
+            parent = index.get_parent(task_id)
+            if task_id not in index or parent is None:
+                raise InvalidScopeChangeError(f"Task {task_id} not found or is the root")
+            node = index.get(task_id)
+            position = next(i for i, subtask in enumerate(parent['subtasks']) if subtask is node)
+            index.remove_task(task_id)
+            status['removed_tasks'].append(task_id)
+            return (CHANGE_TYPE_REMOVE, parent, node, position)
+        
+        # CHANGE_TYPE_MODIFY
+        node = index.get(task_id)
+        if node is None:
+            raise InvalidScopeChangeError(f"Task {task_id} not found")
+        new_id = details.get('id', task_id)
+        if new_id != task_id and new_id in index:
+            raise InvalidScopeChangeError(f"Task ID {new_id} already exists")
+        previous = {key: node[key] for key in details if key in node}
+        missing = [key for key in details if key not in node]
+        index.modify_task(task_id, details)
+        status['modified_tasks'].append(task_id)
+        return (CHANGE_TYPE_MODIFY, node, previous, missing)
     
-    def _process_remove_change(self, task_id: str) -> None:
-        """Process a 'remove' type scope change."""
-        removed = self.remove_task_by_id(task_id)
-        if removed:
-            self.scope_status['removed_tasks'].append(task_id)
-            logger.info(f"Removed task {task_id}")
+    def _rollback(self, undo_log: List[Tuple[str, Any, Any, Any]]) -> None:
+        """Undo applied changes in reverse order and drop the now stale indexes."""
+        for change_type, target, value, extra in reversed(undo_log):
+            if change_type == CHANGE_TYPE_ADD:
+                subtasks = target['subtasks']
+                for i in range(len(subtasks) - 1, -1, -1):
+                    if subtasks[i] is value:
+                        del subtasks[i]
+                        break
+                if isinstance(extra, tuple):
+                    had_key, original = extra
+                    if had_key:
+                        target['subtasks'] = original
+                    else:
+                        del target['subtasks']
+            elif change_type == CHANGE_TYPE_REMOVE:
+                target['subtasks'].insert(extra, value)
+            else:
+                target.update(value)
+                for key in extra:
+                    target.pop(key, None)
+        if undo_log:
+            self.invalidate_wbs_index()
     
-    def _process_modify_change(self, task_id: str, details: Dict[str, Any]) -> None:
-        """Process a 'modify' type scope change."""
-        task = self.find_task_by_id(task_id)
-        if task:
-            task.update(details)
-            self.scope_status['modified_tasks'].append(task_id)
-            logger.info(f"Modified task {task_id}")
+    def _write_transaction(self, changes: List[Dict[str, Any]],
+                           wbs_output_path: Optional[Union[str, Path]],
+                           change_log_path: Optional[Union[str, Path]]) -> None:
+        """
+        Serialize the WBS and change log, stage both, then rename them into place.
+        
+        Both files are fully written to temporary files before either is
+        replaced. The previous WBS is kept until the change log is in place
+        and is put back if that last rename fails, so either both files
+        change or neither does.
+        
+        Raises:
+            ScopeManagementError: If serializing or writing fails
+        """
+        staged: List[Tuple[Path, str]] = []
+        # (path, copy of its previous content or None if it did not exist)
+        replaced: List[Tuple[Path, Optional[str]]] = []
+        try:
+            writes = []
+            if wbs_output_path is not None:
+                writes.append((Path(wbs_output_path),
+                               json.dumps(self.detailed_wbs, indent=JSON_INDENT, ensure_ascii=False)))
+            if change_log_path is not None:
+                change_log_path = Path(change_log_path)
+                change_log = self.load_json(change_log_path) or []
+                applied_at = datetime.now().isoformat()
+                change_log.extend({**change, 'applied_at': applied_at} for change in changes)
+                writes.append((change_log_path,
+                               json.dumps(change_log, indent=JSON_INDENT, ensure_ascii=False)))
+            for path, text in writes:
+                staged.append((path, _stage_text(path, text)))
+            while staged:
+                path, staged_path = staged[0]
+                previous = None
+                if len(staged) > 1 and path.exists():
+                    previous = _stage_copy(path)
+                if len(staged) > 1:
+                    replaced.append((path, previous))
+                os.replace(staged_path, path)
+                staged.pop(0)
+        except Exception as e:
+            for _, staged_path in staged:
+                _remove_quietly(staged_path)
+            for path, previous in reversed(replaced):
+                try:
+                    if previous is None:
+                        os.unlink(path)
+                    else:
+                        os.replace(previous, path)
+                except OSError as restore_error:
+                    logger.error(f"Cannot restore {path} after a failed transaction: {restore_error}")
+            if isinstance(e, ScopeManagementError):
+                raise
+            raise ScopeManagementError(f"Cannot write scope change transaction: {e}")
+        for _, previous in replaced:
+            if previous is not None:
+                _remove_quietly(previous)
     
     def find_task_by_id(self, task_id: Union[str, int], node: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
-        """Recursively find a task by its ID."""
+        """Find a task by its ID, using the WBS index unless a subtree is given."""
         if node is None:
-            node = self.detailed_wbs
+            return self.wbs_index.get(task_id)
         if not node:
             return None
         if node.get('id') == task_id:
@@ -333,14 +568,15 @@ class ScopeManagement:
         return None
     
     def remove_task_by_id(self, task_id: Union[str, int], node: Optional[Dict[str, Any]] = None) -> bool:
-        """Recursively remove a task by its ID."""
+        """Remove a task by its ID, using the WBS index unless a subtree is given."""
         if node is None:
-            node = self.detailed_wbs
+            return self.wbs_index.remove_task(task_id) is not None
         if not node or 'subtasks' not in node:
             return False
         for i, subtask in enumerate(node['subtasks']):
             if subtask.get('id') == task_id:
                 del node['subtasks'][i]
+                self.invalidate_wbs_index()
                 return True
             if self.remove_task_by_id(task_id, subtask):
                 return True
@@ -411,6 +647,21 @@ class ScopeManagement:
         
         return impact_analysis
     
+    def analyze_scope_changes(self, changes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Analyze the impact of a queue of scope changes.
+        
+        All changes are analyzed against the current WBS, sharing one build
+        of the dependency maps.
+        
+        Args:
+            changes: Scope change dictionaries
+            
+        Returns:
+            One impact analysis per change, in the order given
+        """
+        return [self.analyze_scope_change_impact(change) for change in changes]
+    
     def _find_affected_tasks(self, task_id: str) -> List[str]:
         """Find tasks that depend on or are affected by the given task."""
         affected_tasks = []
@@ -430,46 +681,50 @@ class ScopeManagement:
         # Remove duplicates and return
         return list(set(affected_tasks))
     
-    def _build_dependency_mapping(self) -> Dict[str, List[str]]:
-        """Build a mapping of task dependencies from the WBS structure."""
-        dependencies = {}
+    def _dependency_maps(self) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """
+        Get the dependency and reverse dependency maps of the current WBS.
         
-        def process_node(node: Dict[str, Any], parent_id: Optional[str] = None):
-            if 'id' in node:
-                task_id = node['id']
-                
-                # Add dependency on parent if exists
-                if parent_id:
-                    if task_id not in dependencies:
-                        dependencies[task_id] = []
-                    dependencies[task_id].append(parent_id)
+        The maps are built in one walk of the tree and cached until
+        ``apply_scope_changes`` runs or ``detailed_wbs`` is replaced. Callers
+        must not modify them.
+        """
+        graph = self._dependency_graph
+        if graph is None or graph[0] is not self.detailed_wbs:
+            dependencies: Dict[str, List[str]] = {}
+            stack: List[Tuple[Dict[str, Any], Optional[str]]] = [(self.detailed_wbs, None)]
+            while stack:
+                node, parent_id = stack.pop()
+                if 'id' in node:
+                    task_id = node['id']
+                    
+                    # Add dependency on parent if exists
+                    if parent_id:
+                        dependencies.setdefault(task_id, []).append(parent_id)
+                    
+                    # Process dependencies from task metadata
+                    if isinstance(node.get('dependencies'), list):
+                        dependencies.setdefault(task_id, []).extend(node['dependencies'])
                 
-                # Process dependencies from task metadata
-                if 'dependencies' in node and isinstance(node['dependencies'], list):
-                    if task_id not in dependencies:
-                        dependencies[task_id] = []
-                    dependencies[task_id].extend(node['dependencies'])
-            
-            # Process subtasks recursively
-            if 'subtasks' in node and isinstance(node['subtasks'], list):
-                for subtask in node['subtasks']:
-                    process_node(subtask, node.get('id'))
-        
-        process_node(self.detailed_wbs)
-        return dependencies
+                if isinstance(node.get('subtasks'), list):
+                    stack.extend((subtask, node.get('id')) for subtask in reversed(node['subtasks']))
+            
+            reverse_deps: Dict[str, List[str]] = {}
+            for task_id, deps in dependencies.items():
+                for dep in deps:
+                    reverse_deps.setdefault(dep, []).append(task_id)
+            
+            graph = (self.detailed_wbs, dependencies, reverse_deps)
+            self._dependency_graph = graph
+        return graph[1], graph[2]
+    
+    def _build_dependency_mapping(self) -> Dict[str, List[str]]:
+        """Get the mapping of task dependencies from the WBS structure."""
+        return self._dependency_maps()[0]
     
     def _build_reverse_dependency_mapping(self) -> Dict[str, List[str]]:
-        """Build reverse dependency mapping (which tasks depend on each task)."""
-        dependencies = self._build_dependency_mapping()
-        reverse_deps = {}
-        
-        for task_id, deps in dependencies.items():
-            for dep in deps:
-                if dep not in reverse_deps:
-                    reverse_deps[dep] = []
-                reverse_deps[dep].append(task_id)
-        
-        return reverse_deps
+        """Get the reverse dependency mapping (which tasks depend on each task)."""
+        return self._dependency_maps()[1]
     
     def _calculate_schedule_impact(self, task_id: str, change_type: str, details: Dict[str, Any]) -> int:
         """Calculate the schedule impact of a scope change with real dependency analysis."""
@@ -510,14 +765,12 @@ class ScopeManagement:
         reverse_deps = self._build_reverse_dependency_mapping()
         impacted_tasks = set()
         
-        def find_dependent_tasks(current_task_id: str):
-            if current_task_id in reverse_deps:
-                for dependent_task_id in reverse_deps[current_task_id]:
-                    if dependent_task_id not in impacted_tasks:
-                        impacted_tasks.add(dependent_task_id)
-                        find_dependent_tasks(dependent_task_id)
-        
-        find_dependent_tasks(task_id)
+        pending = [task_id]
+        while pending:
+            for dependent_task_id in reverse_deps.get(pending.pop(), []):
+                if dependent_task_id not in impacted_tasks:
+                    impacted_tasks.add(dependent_task_id)
+                    pending.append(dependent_task_id)
         
         # Calculate total impact from all dependent tasks
         total_impact = 0
@@ -950,26 +1203,13 @@ class ScopeManagement:
                 logger.error("Baseline name cannot be empty")
                 return False
             
-            # Load existing baselines
-            self.baselines = self.load_json(self.baseline_path) or {}
-            
-            # Create baseline snapshot
-            baseline_data = {
-                'name': baseline_name,
-                'description': description,
-                'created_at': datetime.now().isoformat(),
-                'wbs_snapshot': self.detailed_wbs.copy(),
-                'scope_changes_snapshot': self.scope_changes.copy(),
-                'version': len(self.baselines) + 1
-            }
-            
-            # Add to baselines
-            self.baselines[baseline_name] = baseline_data
+            # Store the snapshot; only nodes not already stored are written
+            baseline_data = self.baseline_store.create(
+                baseline_name, description, self.detailed_wbs, self.scope_changes)
+            self.baselines = self.baseline_store.load_index()
             
-            # Save baselines
-            self.save_json(self.baselines, self.baseline_path)
-            
-            logger.info(f"Created scope baseline: {baseline_name}")
+            logger.info(f"Created scope baseline: {baseline_name} "
+                        f"({baseline_data['new_blobs']} of {baseline_data['node_count']} nodes written)")
             return True
             
         except Exception as e:
@@ -987,18 +1227,15 @@ class ScopeManagement:
             True if baseline restored successfully, False otherwise
         """
         try:
-            # Load baselines
-            self.baselines = self.load_json(self.baseline_path) or {}
+            self.baselines = self.baseline_store.load_index()
             
             if baseline_name not in self.baselines:
                 logger.error(f"Baseline {baseline_name} not found")
                 return False
             
-            baseline = self.baselines[baseline_name]
-            
-            # Restore WBS and scope changes
-            self.detailed_wbs = baseline['wbs_snapshot'].copy()
-            self.scope_changes = baseline['scope_changes_snapshot'].copy()
+            # Restore WBS and scope changes as fresh copies, so later edits
+            # never reach back into the stored baseline
+            self.detailed_wbs, self.scope_changes = self.baseline_store.load(baseline_name)
             
             logger.info(f"Restored scope baseline: {baseline_name}")
             return True
@@ -1024,34 +1261,21 @@ class ScopeManagement:
                 'tasks_added': 0,
                 'tasks_removed': 0,
                 'tasks_modified': 0,
+                'tasks_moved': 0,
                 'changes_applied': 0
             }
         }
         
         try:
-            # Load baselines
-            self.baselines = self.load_json(self.baseline_path) or {}
+            self.baselines = self.baseline_store.load_index()
             
             if baseline_name not in self.baselines:
                 logger.error(f"Baseline {baseline_name} not found")
                 return comparison
             
-            baseline = self.baselines[baseline_name]
-            baseline_wbs = baseline['wbs_snapshot']
-            
-            # Compare WBS structures
-            differences = self._compare_wbs_structures(self.detailed_wbs, baseline_wbs)
+            differences = list(self.iter_baseline_differences(baseline_name))
             comparison['differences'] = differences
-            
-            # Update summary
-            for diff in differences:
-                if diff['type'] == 'added':
-                    comparison['summary']['tasks_added'] += 1
-                elif diff['type'] == 'removed':
-                    comparison['summary']['tasks_removed'] += 1
-                elif diff['type'] == 'modified':
-                    comparison['summary']['tasks_modified'] += 1
-            
+            comparison['summary'].update(summarize_diff(differences))
             comparison['summary']['changes_applied'] = len(self.scope_changes)
             
             return comparison
@@ -1060,82 +1284,46 @@ class ScopeManagement:
             logger.error(f"Error comparing with baseline {baseline_name}: {e}")
             return comparison
 
+    def iter_baseline_differences(self, baseline_name: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the differences between the current WBS and a baseline.
+
+        Subtrees that are unchanged since the baseline are skipped by hash
+        and never read from the baseline store.
+
+        Args:
+            baseline_name: Name of the baseline to compare with
+
+        Raises:
+            KeyError: If the baseline does not exist
+        """
+        baseline = self.baseline_store.hash_tree(baseline_name)
+        return iter_wbs_diff(WBSHashTree(self.detailed_wbs), baseline)
+
+    def export_baseline_comparison(self, baseline_name: str, output_path: Union[str, Path]) -> Dict[str, int]:
+        """
+        Stream the differences with a baseline to a JSON Lines file.
+
+        Intended for very large comparisons: differences are written as they
+        are found instead of being collected in memory.
+
+        Args:
+            baseline_name: Name of the baseline to compare with
+            output_path: Path of the JSON Lines output file
+
+        Returns:
+            Counts of the written differences by type
+
+        Raises:
+            KeyError: If the baseline does not exist
+        """
+        return write_wbs_diff(self.iter_baseline_differences(baseline_name), output_path)
+
     def _compare_wbs_structures(self, current_wbs: Dict[str, Any], baseline_wbs: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Compare two WBS structures recursively."""
-        differences = []
-        
-        def compare_nodes(current_node: Dict[str, Any], baseline_node: Dict[str, Any], path: str = ""):
-            current_id = current_node.get('id')
-            baseline_id = baseline_node.get('id')
-            
-            if current_id != baseline_id:
-                differences.append({
-                    'type': 'modified',
-                    'path': path,
-                    'field': 'id',
-                    'current_value': current_id,
-                    'baseline_value': baseline_id
-                })
-            
-            # Compare other fields
-            for field in ['name', 'description', 'estimated_duration', 'resource_cost']:
-                current_val = current_node.get(field)
-                baseline_val = baseline_node.get(field)
-                
-                if current_val != baseline_val:
-                    differences.append({
-                        'type': 'modified',
-                        'path': f"{path}.{field}" if path else field,
-                        'field': field,
-                        'current_value': current_val,
-                        'baseline_value': baseline_val
-                    })
-            
-            # Compare subtasks
-            current_subtasks = current_node.get('subtasks', [])
-            baseline_subtasks = baseline_node.get('subtasks', [])
-            
-            # Find added tasks
-            current_ids = {task.get('id') for task in current_subtasks}
-            baseline_ids = {task.get('id') for task in baseline_subtasks}
-            
-            added_ids = current_ids - baseline_ids
-            removed_ids = baseline_ids - current_ids
-            
-            for task_id in added_ids:
-                task = next((t for t in current_subtasks if t.get('id') == task_id), None)
-                if task:
-                    differences.append({
-                        'type': 'added',
-                        'path': f"{path}.subtasks" if path else 'subtasks',
-                        'task_id': task_id,
-                        'task_name': task.get('name', '')
-                    })
-            
-            for task_id in removed_ids:
-                task = next((t for t in baseline_subtasks if t.get('id') == task_id), None)
-                if task:
-                    differences.append({
-                        'type': 'removed',
-                        'path': f"{path}.subtasks" if path else 'subtasks',
-                        'task_id': task_id,
-                        'task_name': task.get('name', '')
-                    })
-            
-            # Compare common subtasks
-            common_ids = current_ids & baseline_ids
-            for task_id in common_ids:
-                current_task = next((t for t in current_subtasks if t.get('id') == task_id), None)
-                baseline_task = next((t for t in baseline_subtasks if t.get('id') == task_id), None)
-                
-                if current_task and baseline_task:
-                    new_path = f"{path}.subtasks[{task_id}]" if path else f"subtasks[{task_id}]"
-                    compare_nodes(current_task, baseline_task, new_path)
-        
-        if current_wbs and baseline_wbs:
-            compare_nodes(current_wbs, baseline_wbs, "root")
-        
-        return differences
+        """Compare two WBS structures, skipping identical subtrees by hash."""
+        if not current_wbs or not baseline_wbs:
+            return []
+        return diff_wbs(current_wbs, baseline_wbs)
 
     def get_baseline_list(self) -> List[Dict[str, Any]]:
         """
@@ -1145,7 +1333,7 @@ class ScopeManagement:
             List of baseline information
         """
         try:
-            self.baselines = self.load_json(self.baseline_path) or {}
+            self.baselines = self.baseline_store.load_index()
             baseline_list = []
             
             for name, data in self.baselines.items():
@@ -1173,14 +1361,11 @@ class ScopeManagement:
             True if baseline deleted successfully, False otherwise
         """
         try:
-            self.baselines = self.load_json(self.baseline_path) or {}
-            
-            if baseline_name not in self.baselines:
+            # Also removes the node blobs no remaining baseline shares
+            if not self.baseline_store.delete(baseline_name):
                 logger.error(f"Baseline {baseline_name} not found")
                 return False
-            
-            del self.baselines[baseline_name]
-            self.save_json(self.baselines, self.baseline_path)
+            self.baselines = self.baseline_store.load_index()
             
             logger.info(f"Deleted scope baseline: {baseline_name}")
             return True
@@ -1,10 +1,45 @@
 import os
 import json
 
+from autoprojectmanagement.main_modules.planning_estimation.wbs_part_loader import format_timings, load_parts
+from autoprojectmanagement.main_modules.planning_estimation.wbs_part_manifest import WBSPartManifest, manifest_path_for
+
 class WBSAggregator:
-    def __init__(self, parts_dir='SystemInputs/user_inputs/wbs_parts', output_file='SystemInputs/user_inputs/detailed_wbs.json'):
+    def __init__(self, parts_dir='SystemInputs/user_inputs/wbs_parts', output_file='SystemInputs/user_inputs/detailed_wbs.json',
+                 incremental=False, workers=1):
         self.parts_dir = parts_dir
         self.output_file = output_file
+        self.incremental = incremental
+        # Number of processes used to parse parts; 1 parses in-process
+        self.workers = workers
+        self.manifest = WBSPartManifest(manifest_path_for(output_file))
+        # Aggregated tree from the previous incremental run, kept in memory
+        # so a long-running process does not have to re-read the output file
+        self._cached_root = None
+        self.last_run_stats = {}
+        self.parse_timings = {}
+        self.content_hashes = {}
+
+    def load_parts(self, rel_paths, known_hashes=None):
+        """
+        Parse the given parts, using the configured number of workers.
+
+        Returns the parsed parts in the given order and records the parse
+        time of each part in ``parse_timings`` and the content hash of each
+        part read in ``content_hashes``. Parts whose content still matches
+        their entry in ``known_hashes`` are not parsed and come back as None.
+        """
+        results = load_parts([os.path.join(self.parts_dir, rel_path) for rel_path in rel_paths],
+                             self.workers, known_hashes)
+        parts = []
+        for rel_path, result in zip(rel_paths, results):
+            if result['error'] is not None:
+                raise result['error']
+            self.content_hashes[rel_path] = result['sha256']
+            if not result['unchanged']:
+                self.parse_timings[rel_path] = result['parse_seconds']
+            parts.append(result['data'])
+        return parts
 
     def load_part(self, filename):
         path = os.path.join(self.parts_dir, filename)
@@ -38,15 +73,32 @@ class WBSAggregator:
             self.assign_hierarchical_numbers(subtask, number)
 
     def find_wbs_parts(self, directory):
-        """Recursively find all WBS part JSON files in the directory."""
+        """Recursively find all WBS part JSON files in the directory, in a stable order."""
         wbs_parts = []
         for root_dir, dirs, files in os.walk(directory):
-            for file in files:
+            dirs.sort()
+            for file in sorted(files):
                 if file.endswith('.json'):
                     wbs_parts.append(os.path.join(root_dir, file))
         return wbs_parts
 
+    def new_root(self):
+        return {
+            "id": "WBS-ROOT",
+            "name": "Software Project",
+            "level": 0,
+            "subtasks": []
+        }
+
+    def write_output(self, root):
+        with open(self.output_file, 'w', encoding='utf-8') as f:
+            json.dump(root, f, indent=2, ensure_ascii=False)
+        print(f"Aggregated WBS written to {self.output_file}")
+
     def aggregate(self):
+        if self.incremental:
+            return self.aggregate_incremental()
+
         # Recursively find all WBS part files
         parts_files = self.find_wbs_parts(self.parts_dir)
         if not parts_files:
@@ -54,19 +106,14 @@ class WBSAggregator:
             return
 
         # Create root with level 0
-        root = {
-            "id": "WBS-ROOT",
-            "name": "Software Project",
-            "level": 0,
-            "subtasks": []
-        }
+        root = self.new_root()
 
-        for file_path in parts_files:
-            # Get relative path for loading
-            rel_path = os.path.relpath(file_path, self.parts_dir)
-            part = self.load_part(rel_path)
-            # Add the entire part as a subtask to preserve hierarchy
-            root["subtasks"].append(part)
+        # Get relative paths for loading
+        order = [os.path.relpath(file_path, self.parts_dir) for file_path in parts_files]
+        self.parse_timings = {}
+        self.content_hashes = {}
+        # Add each entire part as a subtask to preserve hierarchy
+        root["subtasks"].extend(self.load_parts(order))
 
         # Validate WBS levels before proceeding
         self.validate_wbs_levels(root)
@@ -75,9 +122,110 @@ class WBSAggregator:
         self.assign_hierarchical_numbers(root, '')
 
         # Write aggregated WBS to output file
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            json.dump(root, f, indent=2, ensure_ascii=False)
-        print(f"Aggregated WBS written to {self.output_file}")
+        self.write_output(root)
+        return root
+
+    def load_cached_root(self):
+        """
+        Get the aggregated tree from the previous run, matching the manifest.
+
+        Returns None if there is no usable cache, which forces every part to
+        be parsed.
+        """
+        if not self.manifest.load() or not self.manifest.output_matches(self.output_file):
+            self._cached_root = None
+            return None
+        if self._cached_root is None:
+            try:
+                with open(self.output_file, 'r', encoding='utf-8') as f:
+                    self._cached_root = json.load(f)
+            except (OSError, ValueError):
+                return None
+        if len(self._cached_root.get('subtasks', [])) != len(self.manifest.order):
+            return None
+        return self._cached_root
+
+    def aggregate_incremental(self):
+        """
+        Aggregate WBS parts, re-parsing only the parts that changed.
+
+        Unchanged parts are taken from the cached aggregated tree. Only the
+        subtrees of changed parts, and of parts whose position shifted
+        because parts were added or removed, are renumbered. The output file
+        is not rewritten when nothing changed.
+        """
+        parts_files = self.find_wbs_parts(self.parts_dir)
+        if not parts_files:
+            print("No WBS parts found in directory.")
+            return
+
+        cached_root = self.load_cached_root()
+        cached_parts = {}
+        if cached_root is not None:
+            cached_parts = dict(zip(self.manifest.order, cached_root['subtasks']))
+        previous_order = self.manifest.order if cached_root is not None else []
+
+        order = []
+        entries = {}
+        to_read = []
+        for file_path in parts_files:
+            rel_path = os.path.relpath(file_path, self.parts_dir)
+            entry, stale = self.manifest.detect_change(rel_path, file_path)
+            if stale or rel_path not in cached_parts:
+                to_read.append(rel_path)
+            order.append(rel_path)
+            entries[rel_path] = entry
+
+        # Parts are read once: hashed and, unless only touched, parsed
+        self.parse_timings = {}
+        self.content_hashes = {}
+        known_hashes = [self.manifest.known_hash(rel_path) if rel_path in cached_parts else None
+                        for rel_path in to_read]
+        fresh_parts = {}
+        parts = self.load_parts(to_read, known_hashes)
+        for rel_path, known_hash, part in zip(to_read, known_hashes, parts):
+            entries[rel_path] = dict(entries[rel_path], sha256=self.content_hashes[rel_path])
+            if self.content_hashes[rel_path] != known_hash:
+                fresh_parts[rel_path] = part
+        parsed = list(fresh_parts)
+        for part in fresh_parts.values():
+            self.validate_wbs_levels(part, 1)
+        subtasks = [fresh_parts[rel_path] if rel_path in fresh_parts else cached_parts[rel_path]
+                    for rel_path in order]
+
+        # Parts after the first added/removed one move to a new position
+        first_shift = next((i for i, rel_path in enumerate(order)
+                            if i >= len(previous_order) or previous_order[i] != rel_path),
+                           len(order))
+        changed = set(parsed)
+        renumbered = 0
+        for index, (rel_path, part) in enumerate(zip(order, subtasks), start=1):
+            if rel_path in changed or index - 1 >= first_shift:
+                self.assign_hierarchical_numbers(part, str(index))
+                renumbered += 1
+
+        root = cached_root if cached_root is not None else self.new_root()
+        root['subtasks'] = subtasks
+        self._cached_root = root
+        self.last_run_stats = {
+            'total_parts': len(order),
+            'parsed_parts': parsed,
+            'renumbered_parts': renumbered,
+            'parse_timings': dict(self.parse_timings),
+        }
+
+        if cached_root is not None and not parsed and order == previous_order:
+            if entries != self.manifest.entries:
+                # Parts were touched without changing content
+                self.manifest.update(order, entries, self.output_file)
+                self.manifest.save()
+            print("WBS parts unchanged; aggregated WBS is up to date.")
+            return root
+
+        self.write_output(root)
+        self.manifest.update(order, entries, self.output_file)
+        self.manifest.save()
+        return root
 
 if __name__ == "__main__":
     import argparse
@@ -87,8 +235,17 @@ if __name__ == "__main__":
                        help='Directory containing WBS parts (default: SystemInputs/user_inputs/wbs_parts)')
     parser.add_argument('--output_file', default='SystemInputs/user_inputs/detailed_wbs.json',
                        help='Output file for aggregated WBS (default: SystemInputs/user_inputs/detailed_wbs.json)')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Only re-parse WBS parts that changed since the last run')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Number of processes used to parse WBS parts (default: 1)')
+    parser.add_argument('--timings', action='store_true',
+                       help='Print the parse time of each WBS part, slowest first')
     
     args = parser.parse_args()
     
-    aggregator = WBSAggregator(parts_dir=args.parts_dir, output_file=args.output_file)
+    aggregator = WBSAggregator(parts_dir=args.parts_dir, output_file=args.output_file,
+                               incremental=args.incremental, workers=args.workers)
     aggregator.aggregate()
+    if args.timings:
+        print(format_timings(aggregator.parse_timings))
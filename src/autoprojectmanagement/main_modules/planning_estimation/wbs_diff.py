@@ -0,0 +1,204 @@
+"""
+WBS Diff Module - Structural diff of WBS trees using Merkle subtree hashes
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+from autoprojectmanagement.main_modules.planning_estimation.baseline_store import WBSHashTree
+
+# Diff entry types
+ADDED = 'added'
+REMOVED = 'removed'
+MODIFIED = 'modified'
+MOVED = 'moved'
+
+
+def _child_path(path: str, key: Any) -> str:
+    return f"{path}.subtasks[{key}]"
+
+
+def iter_wbs_diff(current: Any, baseline: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the differences between two WBS trees, one entry at a time.
+
+    Both trees are given as Merkle hash trees (``WBSHashTree`` or a stored
+    baseline's ``StoredWBSHashTree``). Tasks are matched by ID anywhere in
+    the tree; subtrees whose hashes are equal are skipped without being
+    read, so the work done is proportional to the size of the change.
+
+    Entry types:
+
+    - ``modified``: one entry per changed field of a matched task
+    - ``moved``: the task has a different parent than in the baseline
+    - ``added`` / ``removed``: the topmost task of a subtree that exists
+      on only one side
+
+    Tasks without an ID are matched by position among their ID-less
+    siblings.
+
+    Args:
+        current: Hash tree of the current WBS
+        baseline: Hash tree of the baseline WBS
+
+    Yields:
+        Difference dictionaries with 'type', 'path' and 'task_id'
+    """
+    if current.root_hash == baseline.root_hash:
+        return
+    if current.root_hash is None or baseline.root_hash is None:
+        side, tree = (ADDED, current) if current.root_hash else (REMOVED, baseline)
+        fields = tree.get_blob(tree.root_hash)['fields']
+        yield {'type': side, 'path': 'root', 'task_id': fields.get('id'), 'task_name': fields.get('name', '')}
+        return
+
+    # ('pair', current hash, baseline hash, path) or ('added', current hash, path);
+    # an 'added' item only looks for tasks moved into a new subtree
+    stack: List[tuple] = [('pair', current.root_hash, baseline.root_hash, 'root')]
+    while stack:
+        item = stack.pop()
+        if item[0] == 'added':
+            _, current_hash, path = item
+            for child_hash in current.get_blob(current_hash)['children'] or []:
+                fields = current.get_blob(child_hash)['fields']
+                task_id = fields.get('id')
+                child_path = _child_path(path, task_id)
+                if task_id is not None and task_id in baseline.task_hashes:
+                    yield _moved_entry(current, baseline, task_id, fields, child_path)
+                    stack.append(('pair', child_hash, baseline.task_hashes[task_id], child_path))
+                else:
+                    stack.append(('added', child_hash, child_path))
+            continue
+
+        _, current_hash, baseline_hash, path = item
+        if current_hash == baseline_hash:
+            continue
+        current_blob = current.get_blob(current_hash)
+        baseline_blob = baseline.get_blob(baseline_hash)
+        current_fields = current_blob['fields']
+        baseline_fields = baseline_blob['fields']
+        node_id = current_fields.get('id')
+
+        for field in sorted(set(current_fields) | set(baseline_fields)):
+            current_value = current_fields.get(field)
+            baseline_value = baseline_fields.get(field)
+            if current_value != baseline_value:
+                yield {
+                    'type': MODIFIED,
+                    'path': f"{path}.{field}",
+                    'task_id': node_id,
+                    'field': field,
+                    'current_value': current_value,
+                    'baseline_value': baseline_value,
+                }
+
+        baseline_idless = [child for child in baseline_blob['children'] or []
+                           if baseline.get_blob(child)['fields'].get('id') is None]
+        position = 0
+        pending = []
+        for child_hash in current_blob['children'] or []:
+            fields = current.get_blob(child_hash)['fields']
+            task_id = fields.get('id')
+            if task_id is None:
+                child_path = _child_path(path, position)
+                if position < len(baseline_idless):
+                    pending.append(('pair', child_hash, baseline_idless[position], child_path))
+                else:
+                    yield {'type': ADDED, 'path': f"{path}.subtasks", 'task_id': None,
+                           'task_name': fields.get('name', '')}
+                    pending.append(('added', child_hash, child_path))
+                position += 1
+                continue
+
+            child_path = _child_path(path, task_id)
+            if task_id in baseline.task_hashes:
+                if baseline.task_parents.get(task_id) != node_id:
+                    yield _moved_entry(current, baseline, task_id, fields, child_path)
+                pending.append(('pair', child_hash, baseline.task_hashes[task_id], child_path))
+            else:
+                yield {'type': ADDED, 'path': f"{path}.subtasks", 'task_id': task_id,
+                       'task_name': fields.get('name', '')}
+                pending.append(('added', child_hash, child_path))
+
+        for child_hash in baseline_idless[position:]:
+            yield {'type': REMOVED, 'path': f"{path}.subtasks", 'task_id': None,
+                   'task_name': baseline.get_blob(child_hash)['fields'].get('name', '')}
+        stack.extend(reversed(pending))
+
+    # Tasks missing from the current tree; only the topmost of each removed subtree
+    removed = set(baseline.task_hashes) - set(current.task_hashes)
+    for task_id in baseline.task_hashes:
+        if task_id in removed and baseline.task_parents.get(task_id) not in removed:
+            fields = baseline.get_blob(baseline.task_hashes[task_id])['fields']
+            yield {'type': REMOVED, 'path': f"{_task_path(baseline, baseline.task_parents.get(task_id))}.subtasks",
+                   'task_id': task_id, 'task_name': fields.get('name', '')}
+
+
+def _task_path(tree: Any, task_id: Any) -> str:
+    """Build the path of a task from its parent chain, without reading blobs."""
+    chain = []
+    current = task_id
+    while (current is not None and current in tree.task_hashes
+           and tree.task_hashes[current] != tree.root_hash and len(chain) <= len(tree.task_hashes)):
+        chain.append(current)
+        current = tree.task_parents.get(current)
+    return 'root' + ''.join(f".subtasks[{key}]" for key in reversed(chain))
+
+
+def _moved_entry(current: Any, baseline: Any, task_id: Any, fields: Dict[str, Any], path: str) -> Dict[str, Any]:
+    return {
+        'type': MOVED,
+        'path': path,
+        'baseline_path': _task_path(baseline, task_id),
+        'task_id': task_id,
+        'task_name': fields.get('name', ''),
+        'from_parent': baseline.task_parents.get(task_id),
+        'to_parent': current.task_parents.get(task_id),
+    }
+
+
+def diff_wbs(current_wbs: Dict[str, Any], baseline_wbs: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Compare two in-memory WBS trees.
+
+    Args:
+        current_wbs: Current WBS
+        baseline_wbs: Baseline WBS
+
+    Returns:
+        List of differences, as yielded by ``iter_wbs_diff``
+    """
+    return list(iter_wbs_diff(WBSHashTree(current_wbs), WBSHashTree(baseline_wbs)))
+
+
+def summarize_diff(differences: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """Count differences by type."""
+    summary = {'tasks_added': 0, 'tasks_removed': 0, 'tasks_modified': 0, 'tasks_moved': 0}
+    for diff in differences:
+        key = f"tasks_{diff['type']}"
+        if key in summary:
+            summary[key] += 1
+    return summary
+
+
+def write_wbs_diff(differences: Iterable[Dict[str, Any]], output: Union[str, Path]) -> Dict[str, int]:
+    """
+    Stream differences to a JSON Lines file, one difference per line.
+
+    Args:
+        differences: Differences, typically from ``iter_wbs_diff``
+        output: Path of the output file
+
+    Returns:
+        Counts of the written differences by type
+    """
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        def written() -> Iterator[Dict[str, Any]]:
+            for diff in differences:
+                f.write(json.dumps(diff, ensure_ascii=False, default=str))
+                f.write('\n')
+                yield diff
+        return summarize_diff(written())
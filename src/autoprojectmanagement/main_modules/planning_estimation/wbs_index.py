@@ -0,0 +1,293 @@
+"""
+WBS Index Module - Indexed in-memory view of a WBS tree for O(1) task lookup
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+TaskId = Union[str, int]
+
+
+class WBSIndex:
+    """
+    Keeps id-based lookup tables over a parsed WBS tree.
+
+    The index is built once from the root node and then kept in sync through
+    ``add_task``, ``remove_task`` and ``modify_task`` so callers never have to
+    rescan the tree. It holds references to the live task dictionaries, so
+    changes made through the index are visible in the underlying tree.
+
+    Attributes:
+        root: The WBS root node the index was built from
+        nodes: Mapping of task id to task dictionary
+        parents: Mapping of task id to parent task id (None for the root)
+        depths: Mapping of task id to depth below the root (root is 0)
+        children: Mapping of task id to the ordered list of child task ids
+    """
+
+    def __init__(self, root: Optional[Dict[str, Any]] = None):
+        self.root: Dict[str, Any] = {}
+        self.nodes: Dict[TaskId, Dict[str, Any]] = {}
+        self.parents: Dict[TaskId, Optional[TaskId]] = {}
+        self.depths: Dict[TaskId, int] = {}
+        self.children: Dict[TaskId, List[TaskId]] = {}
+        self._parent_nodes: Dict[TaskId, Optional[Dict[str, Any]]] = {}
+        if root is not None:
+            self.build(root)
+
+    def build(self, root: Dict[str, Any]) -> None:
+        """
+        (Re)build the index from a WBS root node.
+
+        Args:
+            root: The WBS root node
+        """
+        self.root = root if isinstance(root, dict) else {}
+        self.nodes = {}
+        self.parents = {}
+        self.depths = {}
+        self.children = {}
+        self._parent_nodes = {}
+        if self.root:
+            self._index_subtree(self.root, None, None, 0)
+
+    def _index_subtree(self, node: Dict[str, Any], parent_id: Optional[TaskId],
+                       parent_node: Optional[Dict[str, Any]], depth: int) -> None:
+        """
+        Index a node and all of its descendants iteratively in pre-order.
+
+        When an id occurs more than once, the first occurrence in pre-order
+        wins, which matches the behaviour of a recursive depth-first search.
+        """
+        stack = [(node, parent_id, parent_node, depth)]
+        while stack:
+            current, current_parent, current_parent_node, current_depth = stack.pop()
+            task_id = current.get('id')
+            if task_id is not None and task_id not in self.nodes:
+                self.nodes[task_id] = current
+                self.parents[task_id] = current_parent
+                self._parent_nodes[task_id] = current_parent_node
+                self.depths[task_id] = current_depth
+                self.children[task_id] = []
+                if current_parent is not None and current_parent in self.children:
+                    self.children[current_parent].append(task_id)
+
+            for subtask in reversed(current.get('subtasks') or []):
+                if isinstance(subtask, dict):
+                    stack.append((subtask, task_id, current, current_depth + 1))
+
+    def _unindex_subtree(self, task_id: TaskId) -> None:
+        """Drop a task and all of its indexed descendants from the lookup tables."""
+        stack = [task_id]
+        while stack:
+            current = stack.pop()
+            stack.extend(self.children.get(current, []))
+            self.nodes.pop(current, None)
+            self.parents.pop(current, None)
+            self.depths.pop(current, None)
+            self.children.pop(current, None)
+            self._parent_nodes.pop(current, None)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self.nodes
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def get(self, task_id: TaskId) -> Optional[Dict[str, Any]]:
+        """
+        Get a task by its ID.
+
+        Args:
+            task_id: The task ID
+
+        Returns:
+            The task dictionary if indexed, None otherwise
+        """
+        return self.nodes.get(task_id)
+
+    def get_parent(self, task_id: TaskId) -> Optional[Dict[str, Any]]:
+        """
+        Get the parent task of a task.
+
+        Args:
+            task_id: The task ID
+
+        Returns:
+            The parent task dictionary, or None for the root or unknown tasks
+        """
+        return self._parent_nodes.get(task_id)
+
+    def get_depth(self, task_id: TaskId) -> Optional[int]:
+        """
+        Get the depth of a task below the root.
+
+        Args:
+            task_id: The task ID
+
+        Returns:
+            Depth of the task, or None if the task is not indexed
+        """
+        return self.depths.get(task_id)
+
+    def get_children(self, task_id: TaskId) -> List[TaskId]:
+        """
+        Get the ordered child IDs of a task.
+
+        Args:
+            task_id: The task ID
+
+        Returns:
+            List of child task IDs
+        """
+        return list(self.children.get(task_id, []))
+
+    def get_ancestors(self, task_id: TaskId) -> List[TaskId]:
+        """
+        Get the ancestor IDs of a task, nearest first.
+
+        Args:
+            task_id: The task ID
+
+        Returns:
+            List of ancestor task IDs from the parent up to the root
+        """
+        ancestors = []
+        parent_id = self.parents.get(task_id)
+        while parent_id is not None:
+            ancestors.append(parent_id)
+            parent_id = self.parents.get(parent_id)
+        return ancestors
+
+    def iter_subtree(self, task_id: TaskId) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a task and its indexed descendants in pre-order.
+
+        Args:
+            task_id: The task ID
+
+        Yields:
+            Task dictionaries
+        """
+        if task_id not in self.nodes:
+            return
+        stack = [task_id]
+        while stack:
+            current = stack.pop()
+            yield self.nodes[current]
+            stack.extend(reversed(self.children.get(current, [])))
+
+    def add_task(self, parent_id: TaskId, task: Dict[str, Any]) -> bool:
+        """
+        Append a task under a parent and index its subtree.
+
+        Args:
+            parent_id: ID of the parent task
+            task: Task dictionary to add
+
+        Returns:
+            True if the task was added, False if the parent is unknown
+
+        Raises:
+            ValueError: If an ID in the task's subtree is already indexed or
+                occurs more than once in the subtree
+        """
+        parent = self.nodes.get(parent_id)
+        if parent is None:
+            return False
+        duplicates = self._duplicate_ids(task)
+        if duplicates:
+            raise ValueError(f"Task IDs already exist in the WBS: {duplicates}")
+        if 'subtasks' not in parent or parent['subtasks'] is None:
+            parent['subtasks'] = []
+        parent['subtasks'].append(task)
+        self._index_subtree(task, parent_id, parent, self.depths[parent_id] + 1)
+        return True
+
+    def _duplicate_ids(self, task: Dict[str, Any]) -> List[TaskId]:
+        """Get the IDs in a subtree that are indexed already or repeated within it."""
+        seen = set()
+        duplicates = []
+        stack = [task]
+        while stack:
+            current = stack.pop()
+            task_id = current.get('id')
+            if task_id is not None:
+                if task_id in self.nodes or task_id in seen:
+                    duplicates.append(task_id)
+                seen.add(task_id)
+            stack.extend(subtask for subtask in current.get('subtasks') or [] if isinstance(subtask, dict))
+        return duplicates
+
+    def remove_task(self, task_id: TaskId) -> Optional[Dict[str, Any]]:
+        """
+        Detach a task from its parent and drop its subtree from the index.
+
+        The root cannot be removed.
+
+        Args:
+            task_id: ID of the task to remove
+
+        Returns:
+            The removed task dictionary, or None if nothing was removed
+        """
+        node = self.nodes.get(task_id)
+        parent = self.get_parent(task_id)
+        if node is None or parent is None:
+            return None
+
+        subtasks = parent.get('subtasks') or []
+        for i, subtask in enumerate(subtasks):
+            if subtask is node:
+                del subtasks[i]
+                break
+
+        parent_children = self.children.get(self.parents[task_id])
+        if parent_children is not None and task_id in parent_children:
+            parent_children.remove(task_id)
+        self._unindex_subtree(task_id)
+        return node
+
+    def modify_task(self, task_id: TaskId, details: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Update a task's fields in place and keep the index in sync.
+
+        If the update changes the task's ID or replaces its subtasks, the
+        affected subtree is re-indexed.
+
+        Args:
+            task_id: ID of the task to modify
+            details: Fields to update
+
+        Returns:
+            The modified task dictionary, or None if the task is unknown
+        """
+        node = self.nodes.get(task_id)
+        if node is None:
+            return None
+
+        structural = 'subtasks' in details or details.get('id', task_id) != task_id
+        if not structural:
+            node.update(details)
+            return node
+
+        parent_id = self.parents[task_id]
+        parent_node = self._parent_nodes[task_id]
+        depth = self.depths[task_id]
+        parent_children = self.children.get(parent_id) if parent_id is not None else None
+        position = parent_children.index(task_id) if parent_children is not None else None
+
+        self._unindex_subtree(task_id)
+        if parent_children is not None:
+            parent_children.remove(task_id)
+        node.update(details)
+        if parent_node is None:
+            self.build(self.root)
+            return node
+
+        self._index_subtree(node, parent_id, parent_node, depth)
+        new_id = node.get('id')
+        if parent_children is not None and new_id in self.nodes and self.parents.get(new_id) == parent_id:
+            # Keep the sibling order the tree actually has
+            parent_children.remove(new_id)
+            parent_children.insert(position, new_id)
+        return node
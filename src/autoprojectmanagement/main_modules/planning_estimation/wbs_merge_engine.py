@@ -0,0 +1,208 @@
+"""
+WBS Merge Engine Module - Merges WBS trees by task id with conflict policies
+"""
+
+from typing import Any, Dict, List, Optional
+
+LAST_WINS = 'last_wins'
+FIRST_WINS = 'first_wins'
+FIELD_MERGE = 'field_merge'
+CONFLICT_POLICIES = (LAST_WINS, FIRST_WINS, FIELD_MERGE)
+
+
+def copy_wbs_tree(node: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy the task dictionaries and subtask lists of a WBS tree
+
+    Args:
+        node: Root of the tree to copy
+
+    Returns:
+        Copy of the tree that shares only field values with the original
+    """
+    root = dict(node)
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        if isinstance(current.get('subtasks'), list):
+            current['subtasks'] = [dict(task) if isinstance(task, dict) else task
+                                   for task in current['subtasks']]
+            stack.extend(task for task in current['subtasks'] if isinstance(task, dict))
+    return root
+
+
+class WBSMergeEngine:
+    """
+    Merges WBS parts into one tree, matching tasks by id among siblings.
+
+    The engine owns the merged tree. Parts are copied as they are merged in,
+    so neither the parts nor earlier merge results are ever modified. Each
+    merged task's children are indexed by id the first time a part reaches
+    that task, and the index is kept up to date afterwards, so merging is
+    linear in the total number of tasks across all parts.
+
+    When the same task appears in several parts, its fields are resolved
+    with the conflict policy:
+
+    - ``last_wins``: later parts overwrite earlier values
+    - ``first_wins``: earlier values are kept; later parts only add fields
+    - ``field_merge``: lists are combined without duplicates, dictionaries
+      are merged key by key, and other values follow ``last_wins``
+
+    Attributes:
+        root: The merged WBS tree
+        report: Counts of parts merged, tasks added (including their
+            descendants) and tasks matched, and the list of field conflicts
+    """
+
+    def __init__(self, conflict_policy: str = LAST_WINS, root: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the merge engine
+
+        Args:
+            conflict_policy: One of CONFLICT_POLICIES
+            root: Tree to merge into; it is copied, not modified
+
+        Raises:
+            ValueError: If the conflict policy is unknown
+        """
+        if conflict_policy not in CONFLICT_POLICIES:
+            raise ValueError(f"Unknown conflict policy '{conflict_policy}'. "
+                             f"Expected one of: {', '.join(CONFLICT_POLICIES)}")
+        self.conflict_policy = conflict_policy
+        self.root = copy_wbs_tree(root) if root is not None else {'subtasks': []}
+        self.root.setdefault('subtasks', [])
+        # Child index per merged task, keyed by id() of the task dictionary
+        self._child_index: Dict[int, Dict[Any, Dict[str, Any]]] = {}
+        self.report: Dict[str, Any] = {
+            'conflict_policy': conflict_policy,
+            'parts_merged': 0,
+            'tasks_added': 0,
+            'tasks_merged': 0,
+            'conflicts': [],
+        }
+
+    def _children_of(self, node: Dict[str, Any]) -> Dict[Any, Dict[str, Any]]:
+        """Get the id index of a merged task's children, building it on first use."""
+        index = self._child_index.get(id(node))
+        if index is None:
+            index = {}
+            for child in node.get('subtasks') or []:
+                if isinstance(child, dict) and child.get('id') is not None:
+                    index.setdefault(child['id'], child)
+            self._child_index[id(node)] = index
+        return index
+
+    def merge_part(self, part: Dict[str, Any], source: Optional[str] = None) -> None:
+        """
+        Merge a WBS part's subtasks into the merged tree
+
+        Args:
+            part: WBS part whose 'subtasks' are merged under the root
+            source: Name of the part, used in the conflict report
+        """
+        if not isinstance(part, dict):
+            raise ValueError("WBS part must be a dictionary")
+        self.merge_subtasks(self.root, part.get('subtasks') or [], source)
+        self.report['parts_merged'] += 1
+
+    def merge_subtasks(self, target: Dict[str, Any], subtasks: List[Dict[str, Any]],
+                       source: Optional[str] = None) -> None:
+        """
+        Merge a list of subtasks under a task of the merged tree
+
+        Args:
+            target: Task of the merged tree to merge into
+            subtasks: Subtasks to merge; they are not modified
+            source: Name of the part, used in the conflict report
+        """
+        stack = [(target, subtasks)]
+        while stack:
+            node, additional = stack.pop()
+            if not isinstance(node.get('subtasks'), list):
+                node['subtasks'] = []
+            children = self._children_of(node)
+            for task in additional:
+                if not isinstance(task, dict):
+                    raise ValueError(f"Subtask must be a dictionary, got {type(task).__name__}")
+                task_id = task.get('id')
+                existing = children.get(task_id) if task_id is not None else None
+                if existing is None:
+                    added = copy_wbs_tree(task)
+                    node['subtasks'].append(added)
+                    if task_id is not None:
+                        children[task_id] = added
+                    self.report['tasks_added'] += self._count_tasks(added)
+                    continue
+
+                self._merge_fields(existing, task, source)
+                self.report['tasks_merged'] += 1
+                if task.get('subtasks'):
+                    stack.append((existing, task['subtasks']))
+
+    @staticmethod
+    def _count_tasks(node: Dict[str, Any]) -> int:
+        """Count a task and all of its descendants."""
+        count = 0
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            count += 1
+            stack.extend(task for task in current.get('subtasks') or [] if isinstance(task, dict))
+        return count
+
+    def _merge_fields(self, existing: Dict[str, Any], task: Dict[str, Any], source: Optional[str]) -> None:
+        """Resolve the fields of a task that is already in the merged tree."""
+        for field, value in task.items():
+            if field in ('id', 'subtasks'):
+                continue
+            if field not in existing:
+                existing[field] = value
+                continue
+            current = existing[field]
+            if current == value:
+                continue
+
+            if self.conflict_policy == FIRST_WINS:
+                resolution = 'kept_existing'
+            elif self.conflict_policy == FIELD_MERGE and isinstance(current, list) and isinstance(value, list):
+                existing[field] = self._merge_lists(current, value)
+                resolution = 'merged'
+            elif self.conflict_policy == FIELD_MERGE and isinstance(current, dict) and isinstance(value, dict):
+                existing[field] = {**current, **value}
+                resolution = 'merged'
+            else:
+                existing[field] = value
+                resolution = 'replaced'
+
+            self.report['conflicts'].append({
+                'task_id': existing.get('id'),
+                'field': field,
+                'existing': current,
+                'incoming': value,
+                'resolution': resolution,
+                'source': source,
+            })
+
+    @staticmethod
+    def _merge_lists(current: List[Any], incoming: List[Any]) -> List[Any]:
+        """Combine two lists, keeping order and dropping duplicates."""
+        merged = list(current)
+        seen = set()
+        unhashable = []
+        for item in merged:
+            try:
+                seen.add(item)
+            except TypeError:
+                unhashable.append(item)
+        for item in incoming:
+            try:
+                if item in seen:
+                    continue
+                seen.add(item)
+            except TypeError:
+                if item in unhashable:
+                    continue
+                unhashable.append(item)
+            merged.append(item)
+        return merged
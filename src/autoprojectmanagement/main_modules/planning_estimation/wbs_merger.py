@@ -4,7 +4,13 @@ WBS Merger Module - Merges multiple WBS parts into a single detailed WBS
 
 import os
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+from autoprojectmanagement.main_modules.planning_estimation.wbs_merge_engine import (
+    CONFLICT_POLICIES, LAST_WINS, WBSMergeEngine
+)
+from autoprojectmanagement.main_modules.planning_estimation.wbs_part_loader import format_timings, load_parts
+from autoprojectmanagement.main_modules.planning_estimation.wbs_part_manifest import WBSPartManifest, manifest_path_for
 
 
 class WBSMerger:
@@ -14,16 +20,39 @@ class WBSMerger:
     """
     
     def __init__(self, parts_dir: str = 'SystemInputs/user_inputs/wbs_parts', 
-                 output_file: str = 'SystemInputs/system_generated/detailed_wbs.json'):
+                 output_file: str = 'SystemInputs/system_generated/detailed_wbs.json',
+                 incremental: bool = False, workers: Optional[int] = 1,
+                 conflict_policy: str = LAST_WINS):
         """
         Initialize WBS Merger with directory paths
         
         Args:
             parts_dir: Directory containing WBS parts
             output_file: Output file for merged WBS
+            incremental: Only re-parse parts that changed since the last merge
+            workers: Number of processes used to parse parts; 1 parses in-process
+            conflict_policy: How fields of a task found in several parts are
+                resolved: 'last_wins', 'first_wins' or 'field_merge'
+        
+        Raises:
+            ValueError: If the conflict policy is unknown
         """
+        if conflict_policy not in CONFLICT_POLICIES:
+            raise ValueError(f"Unknown conflict policy '{conflict_policy}'. "
+                             f"Expected one of: {', '.join(CONFLICT_POLICIES)}")
         self.parts_dir = parts_dir
         self.output_file = output_file
+        self.incremental = incremental
+        self.workers = workers
+        self.conflict_policy = conflict_policy
+        self.parse_timings: Dict[str, float] = {}
+        self.content_hashes: Dict[str, str] = {}
+        # Report of the last merge: counts and per-field conflicts
+        self.last_merge_report: Dict[str, Any] = {}
+        self.manifest = WBSPartManifest(manifest_path_for(output_file))
+        # Parsed parts and merged result of the previous incremental run
+        self._parsed_parts: Dict[str, Dict[str, Any]] = {}
+        self._merged_wbs: Optional[Dict[str, Any]] = None
         
     def load_part(self, filename: str) -> Dict[str, Any]:
         """
@@ -44,10 +73,45 @@ class WBSMerger:
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in file {filepath}: {e}")
     
+    def load_parts(self, filenames: List[str],
+                   known_hashes: Optional[List[Optional[str]]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse several WBS parts using the configured number of workers
+        
+        Parts that fail to load are reported and left out. The parse time
+        of each part is recorded in ``parse_timings``, and the content hash
+        of each part read in ``content_hashes``.
+        
+        Args:
+            filenames: Part file names in merge order
+            known_hashes: Previous content hash per part, or None; parts
+                still matching it are read and hashed but not parsed, and
+                left out
+            
+        Returns:
+            Parsed parts keyed by file name, in the given order
+        """
+        results = load_parts([os.path.join(self.parts_dir, filename) for filename in filenames],
+                             self.workers, known_hashes)
+        parts = {}
+        for filename, result in zip(filenames, results):
+            if result['error'] is not None:
+                self.parse_timings[filename] = result['parse_seconds']
+                print(f"Error processing {filename}: {result['error']}")
+                continue
+            self.content_hashes[filename] = result['sha256']
+            if not result['unchanged']:
+                self.parse_timings[filename] = result['parse_seconds']
+                parts[filename] = result['data']
+        return parts
+    
     def merge_subtasks(self, base_subtasks: List[Dict], additional_subtasks: List[Dict]) -> List[Dict]:
         """
         Merge subtasks from additional subtasks into base subtasks
         
+        Tasks are matched by id among siblings and their fields resolved with
+        the configured conflict policy. Neither input list is modified.
+        
         Args:
             base_subtasks: Base subtasks to merge into
             additional_subtasks: Additional subtasks to merge
@@ -55,29 +119,9 @@ class WBSMerger:
         Returns:
             Merged list of subtasks
         """
-        merged = base_subtasks.copy()
-        
-        # Create a lookup dictionary for existing tasks
-        task_lookup = {task['id']: task for task in merged}
-        
-        for additional_task in additional_subtasks:
-            task_id = additional_task['id']
-            
-            if task_id in task_lookup:
-                # Update existing task
-                existing_task = task_lookup[task_id]
-                existing_task.update(additional_task)
-                
-                # Merge subtasks recursively
-                if 'subtasks' in additional_task:
-                    existing_subtasks = existing_task.get('subtasks', [])
-                    additional_subtasks_list = additional_task.get('subtasks', [])
-                    existing_task['subtasks'] = self.merge_subtasks(existing_subtasks, additional_subtasks_list)
-            else:
-                # Add new task
-                merged.append(additional_task)
-        
-        return merged
+        engine = WBSMergeEngine(self.conflict_policy, {'subtasks': base_subtasks})
+        engine.merge_subtasks(engine.root, additional_subtasks)
+        return engine.root['subtasks']
     
     def merge_all_parts(self) -> Dict[str, Any]:
         """
@@ -97,24 +141,35 @@ class WBSMerger:
         if not os.path.exists(self.parts_dir):
             raise FileNotFoundError(f"WBS parts directory not found: {self.parts_dir}")
         
-        wbs_files = [f for f in os.listdir(self.parts_dir) if f.endswith('.json')]
+        wbs_files = sorted(f for f in os.listdir(self.parts_dir) if f.endswith('.json'))
         
         if not wbs_files:
             print("No WBS parts found in directory.")
             return merged_wbs
         
-        # Load and merge all parts
-        for filename in wbs_files:
+        self.parse_timings = {}
+        self.content_hashes = {}
+        if self.incremental:
+            parts = self._load_parts_incremental(wbs_files)
+            if parts is None:
+                print(f"WBS parts unchanged; {self.output_file} is up to date.")
+                return self._merged_wbs
+        else:
+            parts = self.load_parts(wbs_files)
+        
+        # Merge all parts; the engine copies what it merges, so the parsed
+        # parts stay untouched and can be reused by incremental runs
+        engine = WBSMergeEngine(self.conflict_policy, merged_wbs)
+        for filename, part in parts.items():
             try:
-                part = self.load_part(filename)
-                if 'subtasks' in part:
-                    merged_wbs['subtasks'] = self.merge_subtasks(
-                        merged_wbs['subtasks'], 
-                        part.get('subtasks', [])
-                    )
+                engine.merge_part(part, filename)
             except Exception as e:
                 print(f"Error processing {filename}: {e}")
                 continue
+        merged_wbs = engine.root
+        self.last_merge_report = engine.report
+        if engine.report['conflicts']:
+            print(f"Resolved {len(engine.report['conflicts'])} field conflicts using '{self.conflict_policy}'")
         
         # Save merged WBS
         os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
@@ -122,4 +177,98 @@ class WBSMerger:
             json.dump(merged_wbs, f, indent=2, ensure_ascii=False)
         
         print(f"Merged detailed WBS saved to {self.output_file}")
+        if self.incremental:
+            self.manifest.update(self.manifest.order, self.manifest.entries, self.output_file)
+            self.manifest.save()
+            self._merged_wbs = merged_wbs
         return merged_wbs
+    
+    def _load_parts_incremental(self, wbs_files: List[str]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Load WBS parts, re-parsing only those that changed since the last merge
+        
+        Args:
+            wbs_files: Part file names in merge order
+            
+        Returns:
+            Parsed parts keyed by file name, or None if nothing changed and
+            the previous merge result can be reused
+        """
+        has_manifest = self.manifest.load() and self.manifest.output_matches(self.output_file)
+        if not has_manifest:
+            self.manifest.entries = {}
+            self._merged_wbs = None
+        
+        entries = {}
+        to_read = []
+        stale_files = set()
+        for filename in wbs_files:
+            filepath = os.path.join(self.parts_dir, filename)
+            try:
+                entry, stale = self.manifest.detect_change(filename, filepath)
+            except Exception as e:
+                print(f"Error processing {filename}: {e}")
+                continue
+            if stale or filename not in self._parsed_parts:
+                to_read.append(filename)
+            if stale:
+                stale_files.add(filename)
+            entries[filename] = entry
+        
+        # Parts are read once: hashed and, unless only touched, parsed
+        known_hashes = [self.manifest.known_hash(filename) if filename in self._parsed_parts else None
+                        for filename in to_read]
+        fresh_parts = self.load_parts(to_read, known_hashes)
+        parsed_any = any(self.content_hashes.get(filename) != self.manifest.known_hash(filename)
+                         for filename in stale_files if filename in fresh_parts)
+        parts = {}
+        for filename in list(entries):
+            if filename in fresh_parts:
+                parts[filename] = fresh_parts[filename]
+            elif filename in to_read and filename not in self.content_hashes:
+                # Leave failed parts out of the manifest so they are retried
+                del entries[filename]
+                continue
+            else:
+                parts[filename] = self._parsed_parts[filename]
+            if filename in self.content_hashes:
+                entries[filename] = dict(entries[filename], sha256=self.content_hashes[filename])
+        
+        unchanged = (has_manifest and not parsed_any and list(entries) == self.manifest.order)
+        self._parsed_parts = parts
+        self.manifest.order = list(entries)
+        self.manifest.entries = entries
+        
+        if unchanged:
+            if self._merged_wbs is None:
+                with open(self.output_file, 'r', encoding='utf-8') as f:
+                    self._merged_wbs = json.load(f)
+            return None
+        return parts
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Merge WBS parts into a single detailed WBS')
+    parser.add_argument('--parts_dir', default='SystemInputs/user_inputs/wbs_parts',
+                       help='Directory containing WBS parts (default: SystemInputs/user_inputs/wbs_parts)')
+    parser.add_argument('--output_file', default='SystemInputs/system_generated/detailed_wbs.json',
+                       help='Output file for merged WBS (default: SystemInputs/system_generated/detailed_wbs.json)')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Only re-parse WBS parts that changed since the last run')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Number of processes used to parse WBS parts (default: 1)')
+    parser.add_argument('--timings', action='store_true',
+                       help='Print the parse time of each WBS part, slowest first')
+    parser.add_argument('--conflict_policy', choices=CONFLICT_POLICIES, default=LAST_WINS,
+                       help='How fields of a task found in several parts are resolved (default: last_wins)')
+    
+    args = parser.parse_args()
+    
+    merger = WBSMerger(parts_dir=args.parts_dir, output_file=args.output_file,
+                       incremental=args.incremental, workers=args.workers,
+                       conflict_policy=args.conflict_policy)
+    merger.merge_all_parts()
+    if args.timings:
+        print(format_timings(merger.parse_timings))
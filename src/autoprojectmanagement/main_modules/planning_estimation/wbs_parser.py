@@ -3,8 +3,14 @@ WBS Parser Module - Parses different WBS formats into structured data
 """
 
 import json
+import os
 import re
-from typing import Dict, List, Any, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Union
+
+ROOT_TASK_ID = 1
+
+# A text WBS source: path of an outline file, or an iterable of its lines
+TextSource = Union[str, os.PathLike, Iterable[str]]
 
 
 class WBSParser:
@@ -38,9 +44,111 @@ class WBSParser:
         Returns:
             Parsed WBS structure
         """
-        lines = text.strip().split('\n')
+        lines = text.splitlines()
         return self._parse_text_lines(lines)
     
+    def iter_text_wbs(self, source: TextSource, tab_size: int = 4) -> Iterator[Dict[str, Any]]:
+        """
+        Parse a text outline lazily, yielding one task per non-empty line
+        
+        Each line's indentation decides its parent: a line belongs to the
+        nearest preceding line that is indented less. Only the chain of open
+        ancestors is kept in memory, so arbitrarily long outlines are parsed
+        in constant memory.
+        
+        Task IDs are assigned sequentially in document order, starting after
+        the root ID, so they are unique and the same input always gets the
+        same IDs.
+        
+        Args:
+            source: Path of an outline file, or an iterable of lines
+            tab_size: Number of columns a tab counts as
+            
+        Yields:
+            Task dictionaries with 'id', 'name', 'level' and 'parent_id'.
+            Top-level tasks have level 1 and the root ID as parent.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'r', encoding='utf-8') as f:
+                yield from self.iter_text_wbs(f, tab_size)
+            return
+        
+        # (indentation, task id) of the open ancestors; the root is never popped
+        stack = [(-1, ROOT_TASK_ID)]
+        next_id = ROOT_TASK_ID + 1
+        for line in source:
+            line = line.rstrip('\r\n')
+            name = line.strip()
+            if not name:
+                continue
+            
+            stripped = line.lstrip()
+            indent = len(line[:len(line) - len(stripped)].expandtabs(tab_size))
+            while stack[-1][0] >= indent:
+                stack.pop()
+            
+            task = {
+                "id": next_id,
+                "name": name,
+                "level": len(stack),
+                "parent_id": stack[-1][1]
+            }
+            stack.append((indent, next_id))
+            next_id += 1
+            yield task
+    
+    def stream_text_wbs(self, source: TextSource, callback: Callable[[Dict[str, Any]], None],
+                        tab_size: int = 4) -> int:
+        """
+        Parse a text outline and pass each task to a callback as it is read
+        
+        Args:
+            source: Path of an outline file, or an iterable of lines
+            callback: Called with each task dictionary from ``iter_text_wbs``
+            tab_size: Number of columns a tab counts as
+            
+        Returns:
+            Number of tasks parsed
+        """
+        count = 0
+        for task in self.iter_text_wbs(source, tab_size):
+            callback(task)
+            count += 1
+        return count
+    
+    def write_text_wbs_json(self, source: TextSource, output: TextIO, tab_size: int = 4) -> int:
+        """
+        Convert a text outline to nested WBS JSON, writing it as it is parsed
+        
+        The output is the same tree ``parse_text_wbs`` would build, but it is
+        never held in memory as a whole.
+        
+        Args:
+            source: Path of an outline file, or an iterable of lines
+            output: Text stream the JSON is written to
+            tab_size: Number of columns a tab counts as
+            
+        Returns:
+            Number of tasks written, not counting the root
+        """
+        output.write('{"id": %d, "name": "Project", "level": 0, "subtasks": [' % ROOT_TASK_ID)
+        # One entry per open task: whether a subtask has been written yet
+        has_children = [False]
+        count = 0
+        for task in self.iter_text_wbs(source, tab_size):
+            while len(has_children) > task["level"]:
+                has_children.pop()
+                output.write(']}')
+            if has_children[-1]:
+                output.write(', ')
+            has_children[-1] = True
+            output.write('{"id": %d, "name": %s, "level": %d, "subtasks": [' % (
+                task["id"], json.dumps(task["name"], ensure_ascii=False), task["level"]))
+            has_children.append(False)
+            count += 1
+        output.write(']}' * len(has_children))
+        return count
+    
     def _validate_wbs_structure(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate and normalize WBS structure
@@ -69,48 +177,29 @@ class WBSParser:
         
         return data
     
-    def _parse_text_lines(self, lines: List[str]) -> Dict[str, Any]:
+    def _parse_text_lines(self, lines: Iterable[str]) -> Dict[str, Any]:
         """
         Parse text lines into WBS structure
         
         Args:
-            lines: List of text lines
+            lines: Text lines, indented to show the hierarchy
             
         Returns:
             Parsed WBS structure
         """
-        if not lines:
-            return {"id": 1, "name": "Project", "level": 0, "subtasks": []}
-        
-        root = {"id": 1, "name": "Project", "level": 0, "subtasks": []}
+        root = {"id": ROOT_TASK_ID, "name": "Project", "level": 0, "subtasks": []}
+        # Open ancestors of the next task, indexed by level
         stack = [root]
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Determine level based on indentation
-            level = len(line) - len(line.lstrip())
-            name = line.strip()
-            
-            # Create task
+        for parsed in self.iter_text_wbs(lines):
             task = {
-                "id": len(stack) + 1,
-                "name": name,
-                "level": level // 2,  # Assuming 2 spaces per level
+                "id": parsed["id"],
+                "name": parsed["name"],
+                "level": parsed["level"],
                 "subtasks": []
             }
-            
-            # Find parent
-            while stack and stack[-1]["level"] >= task["level"]:
-                stack.pop()
-            
-            if stack:
-                stack[-1]["subtasks"].append(task)
-            else:
-                root["subtasks"].append(task)
-            
+            del stack[task["level"]:]
+            stack[-1]["subtasks"].append(task)
             stack.append(task)
         
         return root
@@ -0,0 +1,100 @@
+"""
+WBS Part Loader Module - Parses WBS part files, optionally in a process pool
+"""
+
+import hashlib
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+
+def parse_part_file(file_path: str, known_sha256: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Read, hash and parse a single WBS part file.
+
+    The file is read once; its content hash is taken from the same bytes
+    that are parsed. This is a module-level function so it can be sent to
+    worker processes.
+
+    Args:
+        file_path: Full path of the part file
+        known_sha256: Content hash of a previous read; a file still
+            matching it is not parsed again
+
+    Returns:
+        Dictionary with 'path', 'data', 'error', 'sha256', 'unchanged' and
+        'parse_seconds'. 'error' is None on success; on failure 'data' is
+        None and 'error' holds the exception. 'unchanged' is True, and
+        'data' None, when the content matches ``known_sha256``.
+    """
+    start = time.perf_counter()
+    sha256 = None
+    unchanged = False
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        sha256 = hashlib.sha256(raw).hexdigest()
+        unchanged = sha256 == known_sha256
+        data = None if unchanged else json.loads(raw.decode('utf-8'))
+        error = None
+    except FileNotFoundError:
+        data, error = None, FileNotFoundError(f"WBS part file not found: {file_path}")
+    except json.JSONDecodeError as e:
+        data, error = None, ValueError(f"Invalid JSON in file {file_path}: {e}")
+    except Exception as e:
+        data, error = None, e
+    return {
+        'path': file_path,
+        'data': data,
+        'error': error,
+        'sha256': sha256,
+        'unchanged': unchanged,
+        'parse_seconds': time.perf_counter() - start,
+    }
+
+
+def load_parts(file_paths: List[str], workers: Optional[int] = 1,
+               known_hashes: Optional[List[Optional[str]]] = None) -> List[Dict[str, Any]]:
+    """
+    Parse WBS part files, in parallel when more than one worker is requested.
+
+    Results are returned in the order of ``file_paths`` regardless of which
+    worker finishes first, so aggregation output stays deterministic.
+
+    Args:
+        file_paths: Full paths of the part files
+        workers: Number of worker processes; 1 or less parses in-process,
+            None lets the executor pick one per CPU
+        known_hashes: Previous content hash per file, or None, for files
+            that need not be parsed while their content is the same
+
+    Returns:
+        One result dictionary per file, as returned by ``parse_part_file``
+    """
+    if known_hashes is None:
+        known_hashes = [None] * len(file_paths)
+    if workers is not None and (workers <= 1 or len(file_paths) <= 1):
+        return [parse_part_file(path, known) for path, known in zip(file_paths, known_hashes)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_part_file, file_paths, known_hashes, chunksize=1))
+
+
+def format_timings(timings: Dict[str, float], limit: Optional[int] = None) -> str:
+    """
+    Format per-part parse timings, slowest first.
+
+    Args:
+        timings: Parse time in seconds per part path
+        limit: Show at most this many parts
+
+    Returns:
+        Multi-line report text
+    """
+    ranked = sorted(timings.items(), key=lambda item: (-item[1], item[0]))
+    if limit is not None:
+        ranked = ranked[:limit]
+    lines = [f"Parsed {len(timings)} WBS parts, {sum(timings.values()):.3f}s total parse time"]
+    lines.extend(f"  {seconds * 1000:10.1f} ms  {path}" for path, seconds in ranked)
+    return "\n".join(lines)
@@ -0,0 +1,146 @@
+"""
+WBS Part Manifest Module - Tracks WBS part files between aggregation runs
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from autoprojectmanagement.main_modules.utility_modules.data_store import atomic_write_text
+
+MANIFEST_VERSION = 1
+
+
+def manifest_path_for(output_file: str) -> str:
+    """
+    Get the manifest path that belongs to an aggregated WBS output file.
+
+    Args:
+        output_file: Path of the aggregated/merged WBS file
+
+    Returns:
+        Path of the manifest file stored next to it
+    """
+    base, _ = os.path.splitext(output_file)
+    return f"{base}_manifest.json"
+
+
+class WBSPartManifest:
+    """
+    Records the modification time, size and content hash of every WBS part
+    that went into an aggregated WBS, so later runs can tell which parts
+    actually changed.
+
+    A part is considered unchanged when its mtime and size match the
+    manifest. If they differ, the content hash decides, so touching a file
+    without editing it does not force a re-parse. The hash is taken by the
+    part loader from the bytes it reads for parsing, so each changed part
+    is read once.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the manifest
+
+        Args:
+            path: Location of the manifest JSON file
+        """
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.order: List[str] = []
+        self.output: Dict[str, Any] = {}
+
+    def load(self) -> bool:
+        """
+        Load the manifest from disk.
+
+        Returns:
+            True if a valid manifest was loaded, False otherwise
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(data, dict) or data.get('version') != MANIFEST_VERSION:
+            return False
+        self.entries = data.get('parts', {})
+        self.order = data.get('order', [])
+        self.output = data.get('output', {})
+        return True
+
+    def save(self) -> None:
+        """Write the manifest to disk, replacing the previous one atomically."""
+        atomic_write_text(self.path, json.dumps({'version': MANIFEST_VERSION, 'output': self.output,
+                                                 'order': self.order, 'parts': self.entries}, indent=2))
+
+    @staticmethod
+    def stat_entry(file_path: str) -> Dict[str, Any]:
+        """
+        Build a manifest entry from file metadata only.
+
+        Entries without a content hash are trusted while mtime and size
+        match, and treated as changed otherwise.
+
+        Args:
+            file_path: Full path of the file
+
+        Returns:
+            Manifest entry with 'mtime_ns' and 'size'
+        """
+        stat = os.stat(file_path)
+        return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+    def output_matches(self, output_file: str) -> bool:
+        """
+        Check that the output file is still the one written with this manifest.
+
+        Args:
+            output_file: Path of the aggregated/merged WBS file
+
+        Returns:
+            True if the output file exists and was not modified since
+        """
+        try:
+            return bool(self.output) and self.stat_entry(output_file) == self.output
+        except OSError:
+            return False
+
+    def detect_change(self, rel_path: str, file_path: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        Check whether a part may differ from its manifest entry, from file metadata.
+
+        Args:
+            rel_path: Part path relative to the parts directory (manifest key)
+            file_path: Full path of the part file
+
+        Returns:
+            Tuple of the up-to-date manifest entry and whether the part needs
+            to be read. A part to read gets the 'sha256' of its content set
+            in the entry once it was read, and is unchanged if that equals
+            ``known_hash(rel_path)``.
+        """
+        entry = self.stat_entry(file_path)
+        previous = self.entries.get(rel_path)
+        if previous and previous.get('mtime_ns') == entry['mtime_ns'] and previous.get('size') == entry['size']:
+            return previous, False
+        return entry, True
+
+    def known_hash(self, rel_path: str) -> Optional[str]:
+        """Get the content hash recorded for a part, if any."""
+        return self.entries.get(rel_path, {}).get('sha256')
+
+    def update(self, order: List[str], entries: Dict[str, Dict[str, Any]], output_file: str) -> None:
+        """
+        Replace the manifest contents with the state of the current run.
+
+        Call this after the output file has been written.
+
+        Args:
+            order: Part paths in aggregation order
+            entries: Manifest entry per part path
+            output_file: Path of the aggregated/merged WBS file
+        """
+        self.order = list(order)
+        self.entries = dict(entries)
+        self.output = self.stat_entry(output_file)
@@ -2,12 +2,30 @@ import os
 import json
 import datetime
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from collections import defaultdict
 
+from autoprojectmanagement.main_modules.task_workflow_management.urgency_index import DeadlineScore, UrgencyIndex
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+IMPORTANCE_WINDOW_SECONDS = 7 * 24 * 3600
+URGENCY_WINDOW_SECONDS = 3 * 24 * 3600
+
+def _deadline_timestamp(task: dict) -> Optional[float]:
+    """Epoch seconds of a task's ISO deadline, None if it has no usable one."""
+    deadline_str = task.get('deadline')
+    if not deadline_str:
+        return None
+    try:
+        deadline = datetime.datetime.fromisoformat(deadline_str)
+        if deadline.tzinfo is not None:
+            return None
+        return deadline.timestamp()
+    except Exception:
+        return None
+
 class ProgressCalculator:
     def __init__(self, input_dir: str = 'project_inputs/PM_JSON/user_inputs'):
         self.input_dir = input_dir
@@ -60,16 +78,17 @@ class ProgressCalculator:
                 combined = min(combined, 0.5)
         return combined
 
-    def calculate_dynamic_importance(self, task: dict) -> float:
+    def calculate_dynamic_importance(self, task: dict, now: Optional[datetime.datetime] = None) -> float:
         """
         Calculate dynamic importance score based on:
         - Time factor: proximity to deadline (normalized over 7 days)
         - Dependency factor: number of dependencies normalized
         - Priority factor: normalized priority value
         Weights: 0.5, 0.3, 0.2 respectively
+        now: time deadlines are measured from, by default the current time
         """
         w1, w2, w3 = 0.5, 0.3, 0.2
-        now = datetime.datetime.now()
+        now = now or datetime.datetime.now()
         deadline_str = task.get('deadline')
         if deadline_str:
             try:
@@ -88,16 +107,17 @@ class ProgressCalculator:
         importance = w1 * time_factor + w2 * dependency_factor + w3 * priority_factor
         return importance
 
-    def calculate_dynamic_urgency(self, task: dict) -> float:
+    def calculate_dynamic_urgency(self, task: dict, now: Optional[datetime.datetime] = None) -> float:
         """
         Calculate dynamic urgency score based on:
         - Time factor: proximity to deadline (normalized over 3 days)
         - Status factor: task status (pending, in progress, etc.)
         - Resource availability factor: whether task is assigned
         Weights: 0.6, 0.3, 0.1 respectively
+        now: time deadlines are measured from, by default the current time
         """
         w1, w2, w3 = 0.6, 0.3, 0.1
-        now = datetime.datetime.now()
+        now = now or datetime.datetime.now()
         deadline_str = task.get('deadline')
         if deadline_str:
             try:
@@ -116,6 +136,39 @@ class ProgressCalculator:
         urgency = w1 * time_factor + w2 * status_factor + w3 * resource_availability_factor
         return urgency
 
+    def dynamic_importance_score(self, task: dict) -> DeadlineScore:
+        """Dynamic importance of a task as a function of time, for an UrgencyIndex."""
+        dependency_factor = min(1, len(task.get('dependencies', [])) / 10)
+        priority_factor = min(1, task.get('priority', 0) / 10)
+        return DeadlineScore.ramp(_deadline_timestamp(task), IMPORTANCE_WINDOW_SECONDS, 0.5,
+                                  base=0.3 * dependency_factor + 0.2 * priority_factor)
+
+    def dynamic_urgency_score(self, task: dict) -> DeadlineScore:
+        """Dynamic urgency of a task as a function of time, for an UrgencyIndex."""
+        status_factor = 1 if task.get('status', '').lower() in ['pending', 'not started', 'in progress'] else 0
+        resource_availability_factor = 1 if not task.get('assigned_to', []) else 0
+        return DeadlineScore.ramp(_deadline_timestamp(task), URGENCY_WINDOW_SECONDS, 0.6,
+                                  base=0.3 * status_factor + 0.1 * resource_availability_factor)
+
+    def build_urgency_index(self, importance_threshold: float = 0.7, urgency_threshold: float = 0.7) -> UrgencyIndex:
+        """
+        Index the dynamic importance and urgency of the loaded tasks.
+
+        The index knows when each task crosses a threshold, so it stays
+        current without recalculating every task; rebuild it when tasks
+        change.
+
+        Args:
+            importance_threshold: Dynamic importance (0-1) from which a task is important
+            urgency_threshold: Dynamic urgency (0-1) from which a task is urgent
+        """
+        index = UrgencyIndex(importance_threshold, urgency_threshold)
+        for task in self.tasks:
+            task_id = task.get('id')
+            if task_id:
+                index.set(task_id, self.dynamic_importance_score(task), self.dynamic_urgency_score(task))
+        return index
+
     def enrich_tasks_with_progress(self):
         """Calculate and enrich tasks with importance, urgency, score, and progress."""
         self.importance_cache = {}
@@ -12,7 +12,6 @@ Description: General reporting functionality within the AutoProjectManagement sy
 
 import logging
 from typing import Dict, Any, Optional, List, Union
-import os
 import sys
 from datetime import datetime
 
@@ -41,10 +40,13 @@ __license__ = "MIT"
 
 
 import json
-import os
 from typing import Dict, Any, Optional, Union
 from pathlib import Path
 
+from autoprojectmanagement.main_modules.utility_modules.base_management import (
+    BaseManagement as SharedBaseManagement
+)
+
 # Constants for default paths and configuration
 DEFAULT_DETAILED_WBS_PATH = 'project_inputs/PM_JSON/user_inputs/detailed_wbs.json'
 DEFAULT_RESOURCE_ALLOCATION_PATH = 'project_inputs/PM_JSON/system_outputs/resource_allocation_summary.json'
@@ -52,16 +54,14 @@ DEFAULT_TIME_MANAGEMENT_PATH = 'project_inputs/PM_JSON/system_outputs/time_manag
 DEFAULT_RISK_MANAGEMENT_PATH = 'project_inputs/PM_JSON/system_outputs/risk_management.json'
 DEFAULT_QUALITY_MANAGEMENT_PATH = 'project_inputs/PM_JSON/system_outputs/quality_management.json'
 DEFAULT_OUTPUT_PATH = 'project_inputs/PM_JSON/system_outputs/project_reports.json'
-JSON_INDENT = 2
-ENCODING = 'utf-8'
 
 
-class BaseManagement:
+class BaseManagement(SharedBaseManagement):
     """
     Base class for management operations with JSON I/O capabilities.
     
-    Provides common functionality for loading, processing, and saving JSON data
-    with proper error handling and resource management.
+    Wraps I/O errors with the failing path and reports progress on the
+    console around the shared load/analyze/save workflow.
     
     Attributes:
         input_paths: Dictionary mapping input names to file paths
@@ -70,23 +70,6 @@ class BaseManagement:
         output: Dictionary storing processed output data
     """
 
-    def __init__(self, input_paths: Dict[str, str], output_path: str) -> None:
-        """
-        Initialize BaseManagement with input and output paths.
-        
-        Args:
-            input_paths: Dictionary mapping input names to file paths
-            output_path: Output file path for saving results
-            
-        Example:
-            >>> paths = {'data': 'input.json'}
-            >>> manager = BaseManagement(paths, 'output.json')
-        """
-        self.input_paths: Dict[str, str] = input_paths
-        self.output_path: str = output_path
-        self.inputs: Dict[str, Dict[str, Any]] = {}
-        self.output: Dict[str, Any] = {}
-
     def load_json(self, path: Union[str, Path]) -> Optional[Dict[str, Any]]:
         """
         Load JSON data from file with error handling.
@@ -107,10 +90,7 @@ class BaseManagement:
             ...     print("Successfully loaded data")
         """
         try:
-            if os.path.exists(path):
-                with open(path, 'r', encoding=ENCODING) as file:
-                    return json.load(file)
-            return None
+            return super().load_json(path)
         except json.JSONDecodeError as e:
             raise json.JSONDecodeError(f"Invalid JSON in {path}: {e}", e.doc, e.pos)
         except PermissionError as e:
@@ -135,11 +115,7 @@ class BaseManagement:
             >>> manager.save_json(data, 'output.json')
         """
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            
-            with open(path, 'w', encoding=ENCODING) as file:
-                json.dump(data, file, indent=JSON_INDENT, ensure_ascii=False)
+            super().save_json(data, path)
         except PermissionError as e:
             raise PermissionError(f"Cannot write to file {path}: {e}")
         except OSError as e:
@@ -167,23 +143,6 @@ class BaseManagement:
                 print(f"Warning: Could not load {path}: {e}")
                 self.inputs[key] = {}
 
-    def analyze(self) -> None:
-        """
-        Abstract method to be implemented by subclasses for data analysis.
-        
-        This method should process loaded inputs and populate self.output
-        with the analysis results.
-        
-        Raises:
-            NotImplementedError: Must be implemented by subclasses
-            
-        Example:
-            >>> class MyManager(BaseManagement):
-            ...     def analyze(self):
-            ...         self.output = {'result': 'analysis complete'}
-        """
-        raise NotImplementedError("Subclasses must implement analyze() method")
-
     def run(self) -> None:
         """
         Execute the complete management workflow.
@@ -201,9 +160,7 @@ class BaseManagement:
             Reporting output saved to project_reports.json
         """
         try:
-            self.load_inputs()
-            self.analyze()
-            self.save_json(self.output, self.output_path)
+            super().run()
             print(f"{self.__class__.__name__} output saved to {self.output_path}")
         except Exception as e:
             print(f"Error in {self.__class__.__name__}: {e}")
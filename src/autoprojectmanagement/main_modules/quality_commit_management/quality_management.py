@@ -12,7 +12,6 @@ Description: Quality management system within the AutoProjectManagement system
 
 import logging
 from typing import Dict, Any, Optional, List, Union
-import os
 import sys
 from datetime import datetime
 
@@ -41,35 +40,36 @@ __license__ = "MIT"
 
 
 import json
-import os
 import logging
 from typing import Dict, Any, Optional, List
-from pathlib import Path
-from datetime import datetime
+
+from autoprojectmanagement.main_modules.utility_modules.base_management import (
+    BaseManagement as SharedBaseManagement
+)
 
 # Constants for quality thresholds and standards
 QUALITY_THRESHOLD_HIGH = 90
 QUALITY_THRESHOLD_MEDIUM = 75
 QUALITY_THRESHOLD_LOW = 50
-DEFAULT_ENCODING = 'utf-8'
-JSON_INDENT = 2
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class BaseManagement:
+class BaseManagement(SharedBaseManagement):
     """
     Base management class for handling JSON-based data processing workflows.
     
-    This class provides foundational functionality for loading, processing, and saving
-    JSON data files with proper error handling and logging.
+    Adds input validation, sorted output keys and logging to the shared
+    load/analyze/save workflow.
     
     Example:
         >>> manager = BaseManagement({'input': 'data.json'}, 'output.json')
         >>> manager.run()
     """
+
+    sort_keys = True
     
     def __init__(self, input_paths: Dict[str, str], output_path: str) -> None:
         """
@@ -86,11 +86,7 @@ class BaseManagement:
             raise ValueError("input_paths cannot be empty")
         if not output_path:
             raise ValueError("output_path cannot be empty")
-            
-        self.input_paths: Dict[str, str] = input_paths
-        self.output_path: str = output_path
-        self.inputs: Dict[str, Any] = {}
-        self.output: Dict[str, Any] = {}
+        super().__init__(input_paths, output_path)
         
     def load_json(self, path: str) -> Optional[Dict[str, Any]]:
         """
@@ -105,19 +101,17 @@ class BaseManagement:
         Raises:
             json.JSONDecodeError: If the file contains invalid JSON
         """
-        if not os.path.exists(path):
-            logger.warning(f"File not found: {path}")
-            return None
-            
         try:
-            with open(path, 'r', encoding=DEFAULT_ENCODING) as file_handle:
-                return json.load(file_handle)
+            data = super().load_json(path)
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in {path}: {e}")
             raise
         except Exception as e:
             logger.error(f"Error reading {path}: {e}")
             raise
+        if data is None:
+            logger.warning(f"File not found: {path}")
+        return data
             
     def save_json(self, data: Dict[str, Any], path: str) -> None:
         """
@@ -131,12 +125,7 @@ class BaseManagement:
             IOError: If unable to write to the specified path
         """
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            
-            with open(path, 'w', encoding=DEFAULT_ENCODING) as file_handle:
-                json.dump(data, file_handle, indent=JSON_INDENT, 
-                         ensure_ascii=False, sort_keys=True)
+            super().save_json(data, path)
             logger.info(f"Successfully saved data to {path}")
         except Exception as e:
             logger.error(f"Error saving to {path}: {e}")
@@ -174,18 +163,6 @@ class BaseManagement:
             return False
             
         return True
-            
-    def analyze(self) -> None:
-        """
-        Abstract method to be implemented by subclasses.
-        
-        This method should contain the main analysis logic for the specific
-        management system being implemented.
-        
-        Raises:
-            NotImplementedError: Must be implemented by subclasses
-        """
-        raise NotImplementedError("Subclasses must implement analyze()")
         
     def run(self) -> None:
         """
@@ -196,15 +173,7 @@ class BaseManagement:
         """
         try:
             logger.info(f"Starting {self.__class__.__name__}...")
-            self.load_inputs()
-            
-            if not self.validate_inputs():
-                raise ValueError("Invalid inputs detected")
-                
-            self.analyze()
-            self.save_json(self.output, self.output_path)
-            logger.info(f"{self.__class__.__name__} completed successfully")
-            
+            super().run()
         except Exception as e:
             logger.error(f"Error in {self.__class__.__name__}: {e}")
             raise
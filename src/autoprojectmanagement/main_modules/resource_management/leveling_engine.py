@@ -0,0 +1,281 @@
+"""
+Leveling Engine Module - Resource-constrained scheduling with serial and parallel SGS
+
+Tasks are scheduled by a schedule generation scheme (SGS): eligible tasks
+(whose predecessors are scheduled) are kept in a heap ordered by priority,
+and each task is placed at the earliest time at which all of its
+predecessors have finished and every resource it needs has spare capacity.
+
+- serial SGS takes the highest-priority eligible task and places it at its
+  earliest feasible time, which may be before tasks scheduled earlier
+- parallel SGS advances a clock over start/finish events and, at each
+  time, starts the highest-priority tasks that fit
+"""
+
+import heapq
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SERIAL = 'serial'
+PARALLEL = 'parallel'
+SCHEMES = (SERIAL, PARALLEL)
+
+
+class ResourceTimeline:
+    """
+    Usage of one resource over time as a sorted step function.
+
+    ``times[i]`` starts a segment with ``usage[i]`` units in use that lasts
+    until ``times[i + 1]``; the last segment lasts forever. Lookups are
+    binary searches, so finding a free slot only scans the segments inside
+    the candidate window.
+    """
+
+    def __init__(self, capacity: float = 1):
+        if capacity <= 0:
+            raise ValueError("Resource capacity must be positive")
+        self.capacity = capacity
+        self.times: List[float] = [0.0]
+        self.usage: List[float] = [0.0]
+
+    def usage_at(self, moment: float) -> float:
+        """Get the units in use at a moment."""
+        return self.usage[max(bisect_right(self.times, moment) - 1, 0)]
+
+    def earliest_fit(self, start: float, duration: float, units: float = 1) -> float:
+        """
+        Find the earliest time at or after start with ``units`` free for ``duration``.
+
+        Raises:
+            ValueError: If the demand exceeds the resource's capacity
+        """
+        if units > self.capacity:
+            raise ValueError(f"Demand of {units} units exceeds capacity {self.capacity}")
+        limit = self.capacity - units
+        index = max(bisect_right(self.times, start) - 1, 0)
+        candidate = start
+        while True:
+            # Skip segments that are too busy to start in
+            while self.usage[index] > limit:
+                index += 1
+                candidate = max(candidate, self.times[index])
+            # Check the whole window [candidate, candidate + duration)
+            end = candidate + duration
+            probe = index + 1
+            while probe < len(self.times) and self.times[probe] < end and self.usage[probe] <= limit:
+                probe += 1
+            if probe == len(self.times) or self.times[probe] >= end:
+                return candidate
+            index = probe
+
+    def _split(self, moment: float) -> int:
+        """Make sure a segment starts at moment and return its index."""
+        index = bisect_right(self.times, moment) - 1
+        if self.times[index] == moment:
+            return index
+        self.times.insert(index + 1, moment)
+        self.usage.insert(index + 1, self.usage[index])
+        return index + 1
+
+    def reserve(self, start: float, duration: float, units: float = 1) -> None:
+        """Add ``units`` of usage over [start, start + duration)."""
+        if duration <= 0:
+            return
+        first = self._split(start)
+        last = self._split(start + duration)
+        for index in range(first, last):
+            self.usage[index] += units
+
+
+class LevelingTask:
+    """
+    A task to level: its duration, resource demands and priority.
+
+    Attributes:
+        task_id: Task ID
+        duration: Duration in schedule time units
+        demands: Units needed per resource ID for the whole duration
+        priority: Higher runs first among eligible tasks
+        predecessors: IDs of tasks that must finish first
+    """
+
+    __slots__ = ('task_id', 'duration', 'demands', 'priority', 'predecessors')
+
+    def __init__(self, task_id: Any, duration: float, demands: Optional[Dict[str, float]] = None,
+                 priority: float = 0.0, predecessors: Iterable[Any] = ()):
+        self.task_id = task_id
+        self.duration = duration
+        self.demands = demands or {}
+        self.priority = priority
+        self.predecessors = list(predecessors)
+
+
+def level_tasks(tasks: List[LevelingTask], capacities: Optional[Dict[str, float]] = None,
+                default_capacity: float = 1, scheme: str = SERIAL) -> Dict[Any, Tuple[float, float]]:
+    """
+    Schedule tasks under precedence and resource capacity constraints.
+
+    Ties in priority go to the task with less slack in the unconstrained
+    critical-path schedule (the latest start), then to input order.
+
+    Args:
+        tasks: Tasks to schedule; predecessors outside the list are ignored
+        capacities: Units available per resource ID
+        default_capacity: Capacity of resources missing from ``capacities``
+        scheme: SERIAL or PARALLEL
+
+    Returns:
+        (start, finish) per task ID
+
+    Raises:
+        ValueError: If the scheme is unknown, the precedence graph has a
+            cycle, or a task needs more of a resource than it has
+    """
+    if scheme not in SCHEMES:
+        raise ValueError(f"Unknown schedule generation scheme '{scheme}'. Expected one of: {', '.join(SCHEMES)}")
+    by_id = {task.task_id: task for task in tasks}
+    successors: Dict[Any, List[Any]] = {task_id: [] for task_id in by_id}
+    remaining: Dict[Any, int] = {}
+    for task in tasks:
+        predecessors = [pred for pred in dict.fromkeys(task.predecessors) if pred in by_id]
+        task.predecessors = predecessors
+        remaining[task.task_id] = len(predecessors)
+        for pred in predecessors:
+            successors[pred].append(task.task_id)
+
+    latest_start = _latest_starts(tasks, by_id, successors)
+    position = {task.task_id: i for i, task in enumerate(tasks)}
+
+    def key(task_id: Any) -> Tuple[float, float, int]:
+        return (-by_id[task_id].priority, latest_start[task_id], position[task_id])
+
+    capacities = capacities or {}
+    timelines: Dict[str, ResourceTimeline] = {}
+    for task in tasks:
+        for resource_id in task.demands:
+            if resource_id not in timelines:
+                timelines[resource_id] = ResourceTimeline(capacities.get(resource_id, default_capacity))
+
+    eligible = [key(task_id) + (task_id,) for task_id, count in remaining.items() if count == 0]
+    heapq.heapify(eligible)
+    schedule: Dict[Any, Tuple[float, float]] = {}
+    if scheme == SERIAL:
+        _serial(by_id, successors, remaining, timelines, eligible, key, schedule)
+    else:
+        _parallel(by_id, successors, remaining, timelines, eligible, key, schedule)
+
+    if len(schedule) < len(tasks):
+        blocked = [task.task_id for task in tasks if task.task_id not in schedule]
+        raise ValueError(f"Circular dependencies detected among tasks: {blocked}")
+    return schedule
+
+
+def _latest_starts(tasks: List[LevelingTask], by_id: Dict[Any, LevelingTask],
+                   successors: Dict[Any, List[Any]]) -> Dict[Any, float]:
+    """Latest starts of the resource-free critical-path schedule, used to break ties."""
+    remaining = {task.task_id: len(successors[task.task_id]) for task in tasks}
+    ready = [task_id for task_id, count in remaining.items() if count == 0]
+    latest_finish = {task_id: 0.0 for task_id in by_id}
+    latest_start: Dict[Any, float] = {}
+    while ready:
+        task_id = ready.pop()
+        latest_start[task_id] = latest_finish[task_id] - by_id[task_id].duration
+        for pred in by_id[task_id].predecessors:
+            latest_finish[pred] = min(latest_finish[pred], latest_start[task_id])
+            remaining[pred] -= 1
+            if remaining[pred] == 0:
+                ready.append(pred)
+    # Tasks on a cycle are reported by the scheduling pass
+    return {task_id: latest_start.get(task_id, 0.0) for task_id in by_id}
+
+
+def _earliest_feasible(task: LevelingTask, ready: float, timelines: Dict[str, ResourceTimeline]) -> float:
+    """Find the earliest start at or after ready at which every demanded resource fits."""
+    start = ready
+    while True:
+        moved = start
+        for resource_id, units in task.demands.items():
+            moved = max(moved, timelines[resource_id].earliest_fit(moved, task.duration, units))
+        if moved == start:
+            return start
+        start = moved
+
+
+def _place(task: LevelingTask, start: float, timelines: Dict[str, ResourceTimeline],
+           schedule: Dict[Any, Tuple[float, float]]) -> None:
+    for resource_id, units in task.demands.items():
+        timelines[resource_id].reserve(start, task.duration, units)
+    schedule[task.task_id] = (start, start + task.duration)
+
+
+def _release(task_id: Any, successors: Dict[Any, List[Any]], remaining: Dict[Any, int],
+             eligible: List[tuple], key: Any) -> None:
+    for succ in successors[task_id]:
+        remaining[succ] -= 1
+        if remaining[succ] == 0:
+            heapq.heappush(eligible, key(succ) + (succ,))
+
+
+def _serial(by_id, successors, remaining, timelines, eligible, key, schedule) -> None:
+    while eligible:
+        task = by_id[heapq.heappop(eligible)[-1]]
+        ready = max((schedule[pred][1] for pred in task.predecessors), default=0.0)
+        _place(task, _earliest_feasible(task, ready, timelines), timelines, schedule)
+        _release(task.task_id, successors, remaining, eligible, key)
+
+
+def _parallel(by_id, successors, remaining, timelines, eligible, key, schedule) -> None:
+    # Tasks whose predecessors are all scheduled wait in pending until the
+    # last one finishes; tasks that are ready but do not fit wait in
+    # blocked under the resource that stopped them, and are only tried
+    # again once that resource frees some capacity
+    pending: List[Tuple[float, tuple]] = []
+    blocked: Dict[str, List[tuple]] = {}
+    retry: List[tuple] = []
+    finishes: List[Tuple[float, int, Any]] = []
+    sequence = 0
+    now = 0.0
+    while True:
+        while eligible:
+            entry = heapq.heappop(eligible)
+            task = by_id[entry[-1]]
+            ready = max((schedule[pred][1] for pred in task.predecessors), default=0.0)
+            heapq.heappush(pending, (ready, entry))
+
+        # Tasks ready now, by priority
+        startable = retry
+        retry = []
+        while pending and pending[0][0] <= now:
+            startable.append(heapq.heappop(pending)[1])
+        startable.sort()
+        for entry in startable:
+            task = by_id[entry[-1]]
+            full = next((resource_id for resource_id, units in task.demands.items()
+                         if timelines[resource_id].usage_at(now) + units > timelines[resource_id].capacity), None)
+            if full is not None:
+                blocked.setdefault(full, []).append(entry)
+                continue
+            _place(task, now, timelines, schedule)
+            sequence += 1
+            heapq.heappush(finishes, (now + task.duration, sequence, task.task_id))
+
+        # Zero-length tasks finish immediately and may release others now
+        released = False
+        while finishes and finishes[0][0] <= now:
+            task_id = heapq.heappop(finishes)[2]
+            for resource_id in by_id[task_id].demands:
+                retry.extend(blocked.pop(resource_id, ()))
+            _release(task_id, successors, remaining, eligible, key)
+            released = True
+        if released:
+            continue
+
+        # Advance to the next finish or the next task becoming ready
+        upcoming = [time for time in (finishes[0][0] if finishes else None,
+                                      pending[0][0] if pending else None)
+                    if time is not None]
+        if not upcoming:
+            if blocked:
+                raise ValueError("Tasks cannot be started with the available capacity")
+            break
+        now = min(upcoming)
@@ -40,6 +40,7 @@ __author__ = "AutoProjectManagement Team"
 __license__ = "MIT"
 
 
+import heapq
 import json
 import os
 from datetime import datetime, timedelta
@@ -49,6 +50,14 @@ from enum import Enum
 import logging
 from pathlib import Path
 
+import numpy as np
+
+from autoprojectmanagement.main_modules.planning_estimation.wbs_index import WBSIndex
+from autoprojectmanagement.main_modules.resource_management.utilization import (
+    UtilizationMatrix, build_utilization_matrix, find_over_allocations
+)
+from autoprojectmanagement.main_modules.utility_modules.working_calendar import parse_date
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -155,16 +164,29 @@ class ResourceAllocationManager:
         # Initialize data containers
         self.resource_allocations: List[Dict[str, Any]] = []
         self.detailed_wbs: Dict[str, Any] = {}
+        self._wbs_index: Optional[WBSIndex] = None
         self.resource_costs: Dict[str, Any] = {}
         self.resource_constraints: Dict[str, Any] = {}
         self.task_cost_summary: Dict[str, Dict[str, Any]] = {}
         self.allocation_conflicts: List[Dict[str, Any]] = []
+        self.over_allocations: List[Dict[str, Any]] = []
         
         # Performance metrics
         self.total_cost: float = 0.0
         self.resource_utilization: Dict[str, float] = {}
         self.budget_variance: float = 0.0
         
+    @property
+    def wbs_index(self) -> WBSIndex:
+        """Index over the current detailed WBS, rebuilt when ``detailed_wbs`` is replaced."""
+        if self._wbs_index is None or self._wbs_index.root is not self.detailed_wbs:
+            self._wbs_index = WBSIndex(self.detailed_wbs)
+        return self._wbs_index
+
+    def invalidate_wbs_index(self) -> None:
+        """Force the WBS index to be rebuilt after direct edits to ``detailed_wbs``."""
+        self._wbs_index = None
+        
     def load_json(self, path: Path) -> Optional[Dict[str, Any]]:
         """
         Load JSON data from file with error handling.
@@ -235,17 +257,20 @@ class ResourceAllocationManager:
     
     def find_task_by_id(self, task_id: str, node: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """
-        Find a task in the WBS by its ID using recursive search.
+        Find a task in the WBS by its ID.
+        
+        Lookups against the whole WBS are served from the WBS index; a
+        recursive search is only done when a specific subtree is given.
         
         Args:
             task_id: The ID of the task to find
-            node: The current node to search (defaults to root WBS)
+            node: The subtree to search (defaults to root WBS)
             
         Returns:
             The task dictionary if found, None otherwise
         """
         if node is None:
-            node = self.detailed_wbs
+            return self.wbs_index.get(task_id)
             
         if not node:
             return None
@@ -287,16 +312,15 @@ class ResourceAllocationManager:
             return 0.0
         
         # Calculate duration in days
-        try:
-            start_date = datetime.strptime(start_date_str, self.DEFAULT_DATE_FORMAT)
-            end_date = datetime.strptime(end_date_str, self.DEFAULT_DATE_FORMAT)
-            if end_date < start_date:
-                logger.warning(f"End date before start date for allocation {allocation}")
-                return 0.0
-            days = (end_date - start_date).days + 1
-        except (ValueError, TypeError) as e:
-            logger.error(f"Error parsing dates: {e}")
+        start_date = parse_date(start_date_str)
+        end_date = parse_date(end_date_str)
+        if start_date is None or end_date is None:
+            logger.error(f"Error parsing dates: {start_date_str!r}, {end_date_str!r}")
             return 0.0
+        if end_date < start_date:
+            logger.warning(f"End date before start date for allocation {allocation}")
+            return 0.0
+        days = (end_date - start_date).days + 1
         
         # Calculate total hours and cost
         total_hours = days * self.WORKING_HOURS_PER_DAY * allocation_percent
@@ -304,72 +328,197 @@ class ResourceAllocationManager:
         
         return round(cost, 2)
     
+    def calculate_allocation_costs(self, allocations: List[Dict[str, Any]]) -> List[float]:
+        """
+        Calculate the costs of many allocations at once.
+
+        Gives the same costs as ``calculate_task_cost``, with the arithmetic
+        done on arrays and each distinct date string parsed once. Problems
+        are logged once per kind instead of once per allocation.
+
+        Args:
+            allocations: Resource allocation dictionaries
+
+        Returns:
+            Cost of each allocation, in order
+        """
+        count = len(allocations)
+        if not count:
+            return []
+
+        hourly_cost = np.zeros(count)
+        allocation_percent = np.zeros(count)
+        start_days = np.zeros(count, dtype=np.int64)
+        end_days = np.zeros(count, dtype=np.int64)
+        dates_valid = np.zeros(count, dtype=bool)
+        missing_resources = 0
+        for i, allocation in enumerate(allocations):
+            resource = self.resource_costs.get(allocation.get('resource_id'))
+            if resource is None:
+                missing_resources += 1
+            else:
+                hourly_cost[i] = resource.get('hourly_cost', 0.0)
+            allocation_percent[i] = allocation.get('allocation_percent', 0)
+            start_date = parse_date(allocation.get('start_date'))
+            end_date = parse_date(allocation.get('end_date'))
+            if start_date is not None and end_date is not None:
+                start_days[i] = start_date.toordinal()
+                end_days[i] = end_date.toordinal()
+                dates_valid[i] = True
+
+        days = end_days - start_days + 1
+        valid = (hourly_cost > 0) & dates_valid & (days > 0)
+        costs = np.where(valid, days * self.WORKING_HOURS_PER_DAY * (allocation_percent / 100.0) * hourly_cost, 0.0)
+
+        if missing_resources:
+            logger.warning(f"{missing_resources} allocations reference resources not found in costs")
+        invalid_dates = count - int(dates_valid.sum())
+        if invalid_dates:
+            logger.error(f"{invalid_dates} allocations have missing or invalid dates")
+        reversed_dates = int((dates_valid & (days <= 0)).sum())
+        if reversed_dates:
+            logger.warning(f"{reversed_dates} allocations end before they start")
+
+        # Python's round, so costs match calculate_task_cost exactly
+        return [round(cost, 2) for cost in costs.tolist()]
+
     def enrich_wbs_with_resources(self) -> None:
-        """Enrich WBS tasks with resource allocation and cost information."""
+        """
+        Enrich WBS tasks with resource allocation and cost information.
+
+        Allocations are grouped by task ID and costed in one batch, then
+        attached in a single walk of the WBS that also rolls the costs up
+        into ``task_cost_summary`` and ``total_cost``.
+        """
         logger.info("Enriching WBS with resource allocations...")
-        
-        allocation_count = 0
+
+        grouped: Dict[Any, List[Dict[str, Any]]] = {}
         for allocation in self.resource_allocations:
             task_id = allocation.get('task_id')
             if not task_id:
                 logger.warning("Allocation missing task_id, skipping")
                 continue
-                
-            task_node = self.find_task_by_id(task_id)
-            if not task_node:
-                logger.warning(f"Task {task_id} not found in WBS")
-                continue
-                
-            # Initialize resource allocations list if needed
-            if 'resource_allocations' not in task_node:
-                task_node['resource_allocations'] = []
-                
-            # Calculate cost and create enriched allocation
-            cost = self.calculate_task_cost(allocation)
-            allocation_enriched = dict(allocation)
-            allocation_enriched['calculated_cost'] = cost
-            
-            task_node['resource_allocations'].append(allocation_enriched)
-            allocation_count += 1
-            
+            grouped.setdefault(task_id, []).append(allocation)
+
+        allocations = [allocation for group in grouped.values() for allocation in group]
+        costs = iter(self.calculate_allocation_costs(allocations))
+        enriched: Dict[Any, List[Dict[str, Any]]] = {}
+        for task_id, group in grouped.items():
+            enriched[task_id] = []
+            for allocation in group:
+                allocation_enriched = dict(allocation)
+                allocation_enriched['calculated_cost'] = next(costs)
+                enriched[task_id].append(allocation_enriched)
+
+        self.task_cost_summary = {}
+        self.total_cost = self._rollup_costs(self.detailed_wbs, enriched)
+
+        for task_id in enriched:
+            logger.warning(f"Task {task_id} not found in WBS")
+        allocation_count = len(allocations) - sum(len(group) for group in enriched.values())
         logger.info(f"Enriched {allocation_count} resource allocations")
-    
+
     def summarize_costs(self, node: Optional[Dict[str, Any]] = None) -> float:
         """
-        Recursively summarize costs for a task and all subtasks.
-        
+        Summarize costs for a task and all subtasks.
+
         Args:
             node: The task node to summarize (defaults to root WBS)
-            
+
         Returns:
             Total cost for the task and all subtasks
         """
         if node is None:
             node = self.detailed_wbs
-            
+        return self._rollup_costs(node)
+
+    def _rollup_costs(self, node: Dict[str, Any],
+                      attach: Optional[Dict[Any, List[Dict[str, Any]]]] = None) -> float:
+        """
+        Walk a subtree once, summing allocation costs from the leaves up.
+
+        Tasks get their allocations from ``attach`` (popped, so that the
+        first task with an ID wins) when they are entered, and their cost
+        summary when all their subtasks are done, in the same order as a
+        recursive post-order walk.
+
+        Args:
+            node: Root of the subtree
+            attach: Enriched allocations to add, by task ID
+
+        Returns:
+            Total cost of the subtree
+        """
         if not node:
             return 0.0
-            
-        total_cost = 0.0
-        
-        # Sum costs from resource allocations
-        for alloc in node.get('resource_allocations', []):
-            total_cost += alloc.get('calculated_cost', 0.0)
-            
-        # Recursively sum subtask costs
-        for subtask in node.get('subtasks', []):
-            total_cost += self.summarize_costs(subtask)
-            
-        # Store summary for this task
-        task_id = node.get('id')
-        if task_id:
-            self.task_cost_summary[task_id] = {
-                'task_name': node.get('name', 'Unknown'),
-                'total_cost': round(total_cost, 2)
-            }
-            
-        return total_cost
-    
+
+        totals: List[float] = []
+        stack: List[Any] = [(node, False)]
+        while stack:
+            current, done = stack.pop()
+            if not done:
+                task_id = current.get('id')
+                if attach and task_id in attach:
+                    current.setdefault('resource_allocations', []).extend(attach.pop(task_id))
+                total_cost = 0.0
+                for alloc in current.get('resource_allocations', []):
+                    total_cost += alloc.get('calculated_cost', 0.0)
+                totals.append(total_cost)
+                stack.append((current, True))
+                stack.extend((subtask, False) for subtask in reversed(current.get('subtasks', [])))
+                continue
+
+            # The subtasks have added their totals to this task's running total
+            total_cost = totals.pop()
+            if totals:
+                totals[-1] += total_cost
+
+            task_id = current.get('id')
+            if task_id:
+                self.task_cost_summary[task_id] = {
+                    'task_name': current.get('name', 'Unknown'),
+                    'total_cost': round(total_cost, 2)
+                }
+            if not totals:
+                return total_cost
+        return 0.0
+
+    def build_utilization_matrix(self, start_date: Optional[str] = None,
+                                 end_date: Optional[str] = None) -> UtilizationMatrix:
+        """
+        Build the per-resource, per-day utilization of the allocations.
+
+        Args:
+            start_date: First day as 'YYYY-MM-DD', by default the earliest allocation start
+            end_date: Last day as 'YYYY-MM-DD', by default the latest allocation end
+
+        Returns:
+            Matrix of daily loads, 1.0 being one full-time resource
+        """
+        return build_utilization_matrix(self.resource_allocations,
+                                        start_date=parse_date(start_date),
+                                        end_date=parse_date(end_date))
+
+    def resource_capacities(self) -> Dict[str, float]:
+        """
+        Get the capacity of each constrained resource.
+
+        A resource constraint's 'max_allocation_percent' (100 by default)
+        is the load it can carry, 1.0 being full time.
+        """
+        return {resource_id: constraint.get('max_allocation_percent', 100) / 100.0
+                for resource_id, constraint in self.resource_constraints.items()
+                if isinstance(constraint, dict)}
+
+    def find_over_allocations(self) -> List[Dict[str, Any]]:
+        """
+        Find the periods in which resources are allocated beyond their capacity.
+
+        Returns:
+            Over-allocated periods per resource, see utilization.find_over_allocations
+        """
+        return find_over_allocations(self.resource_allocations, capacities=self.resource_capacities())
+
     def generate_resource_utilization_report(self) -> Dict[str, Any]:
         """Generate resource utilization analysis."""
         utilization = {}
@@ -382,6 +531,7 @@ class ResourceAllocationManager:
                 if resource_id not in resource_allocations:
                     resource_allocations[resource_id] = 0
                 resource_allocations[resource_id] += 1
+        daily = self.build_utilization_matrix().summary()
         
         # Calculate utilization rates
         for resource_id, count in resource_allocations.items():
@@ -389,56 +539,70 @@ class ResourceAllocationManager:
                 utilization[resource_id] = {
                     'resource_name': self.resource_costs[resource_id].get('name', resource_id),
                     'allocation_count': count,
-                    'utilization_rate': min(count * 0.1, 1.0)  # Simplified calculation
+                    'utilization_rate': min(count * 0.1, 1.0),  # Simplified calculation
+                    'peak_daily_utilization': daily.get(resource_id, {}).get('peak_daily_utilization', 0.0),
+                    'average_daily_utilization': daily.get(resource_id, {}).get('average_daily_utilization', 0.0)
                 }
         
         return utilization
     
     def validate_allocations(self) -> List[Dict[str, Any]]:
-        """Validate resource allocations for conflicts and issues."""
-        conflicts = []
-        
-        # Check for overlapping allocations
-        resource_time_map = {}
-        
-        for allocation in self.resource_allocations:
+        """
+        Validate resource allocations for conflicts and issues.
+
+        Every pair of overlapping allocations of a resource is reported,
+        the later allocation first, in input order. Each resource's
+        allocations are swept in start order, keeping only those that have
+        not ended yet, instead of comparing every pair.
+        """
+        records: List[Optional[Dict[str, Any]]] = [None] * len(self.resource_allocations)
+        by_resource: Dict[Any, List[int]] = {}
+        found = []
+
+        for index, allocation in enumerate(self.resource_allocations):
             resource_id = allocation.get('resource_id')
             if not resource_id:
                 continue
-                
-            if resource_id not in resource_time_map:
-                resource_time_map[resource_id] = []
-                
-            try:
-                start_date = datetime.strptime(allocation.get('start_date', ''), self.DEFAULT_DATE_FORMAT)
-                end_date = datetime.strptime(allocation.get('end_date', ''), self.DEFAULT_DATE_FORMAT)
-                
-                # Check for overlaps with existing allocations
-                for existing in resource_time_map[resource_id]:
-                    if not (end_date < existing['start_date'] or start_date > existing['end_date']):
-                        conflicts.append({
-                            'type': 'overlap',
-                            'resource_id': resource_id,
-                            'allocation1': allocation,
-                            'allocation2': existing,
-                            'message': f"Resource {resource_id} has overlapping allocations"
-                        })
-                
-                resource_time_map[resource_id].append({
-                    'start_date': start_date,
-                    'end_date': end_date,
-                    'allocation': allocation
-                })
-                
-            except ValueError:
-                conflicts.append({
+            start_date = parse_date(allocation.get('start_date', ''))
+            end_date = parse_date(allocation.get('end_date', ''))
+            if start_date is None or end_date is None:
+                found.append((index, -1, {
                     'type': 'invalid_date',
                     'allocation': allocation,
                     'message': "Invalid date format in allocation"
-                })
-        
-        return conflicts
-    
+                }))
+                continue
+            records[index] = {
+                'start_date': datetime.combine(start_date, datetime.min.time()),
+                'end_date': datetime.combine(end_date, datetime.min.time()),
+                'allocation': allocation
+            }
+            by_resource.setdefault(resource_id, []).append(index)
+
+        for resource_id, indices in by_resource.items():
+            indices.sort(key=lambda index: records[index]['start_date'])
+            active: List[Any] = []
+            for index in indices:
+                record = records[index]
+                while active and active[0][0] < record['start_date']:
+                    heapq.heappop(active)
+                for _, other in active:
+                    existing = records[other]
+                    if record['end_date'] < existing['start_date']:
+                        continue
+                    later, earlier = max(index, other), min(index, other)
+                    found.append((later, earlier, {
+                        'type': 'overlap',
+                        'resource_id': resource_id,
+                        'allocation1': records[later]['allocation'],
+                        'allocation2': records[earlier],
+                        'message': f"Resource {resource_id} has overlapping allocations"
+                    }))
+                heapq.heappush(active, (record['end_date'], index))
+
+        found.sort(key=lambda item: (item[0], item[1]))
+        return [conflict for _, _, conflict in found]
+
     def run(self) -> None:
         """Execute the complete resource allocation process."""
         logger.info("Starting resource allocation process...")
@@ -451,13 +615,13 @@ class ResourceAllocationManager:
             self.allocation_conflicts = self.validate_allocations()
             if self.allocation_conflicts:
                 logger.warning(f"Found {len(self.allocation_conflicts)} allocation conflicts")
+            self.over_allocations = self.find_over_allocations()
+            if self.over_allocations:
+                logger.warning(f"Found {len(self.over_allocations)} over-allocated periods")
             
-            # Enrich WBS with resource information
+            # Enrich WBS with resource information and roll up the costs
             self.enrich_wbs_with_resources()
             
-            # Calculate total costs
-            self.total_cost = self.summarize_costs()
-            
             # Generate utilization report
             self.resource_utilization = self.generate_resource_utilization_report()
             
@@ -471,6 +635,7 @@ class ResourceAllocationManager:
                 'total_cost': self.total_cost,
                 'resource_utilization': self.resource_utilization,
                 'allocation_conflicts': self.allocation_conflicts,
+                'over_allocations': self.over_allocations,
                 'task_count': len(self.task_cost_summary),
                 'resource_count': len(self.resource_costs)
             }
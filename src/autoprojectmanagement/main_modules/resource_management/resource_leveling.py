@@ -45,6 +45,11 @@ import logging
 from collections import defaultdict
 from typing import List, Dict, Any, Optional
 
+from autoprojectmanagement.main_modules.planning_estimation.dependency_manager import DependencyManager
+from autoprojectmanagement.main_modules.resource_management.leveling_engine import (
+    SCHEMES, SERIAL, LevelingTask, level_tasks
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -53,12 +58,17 @@ class ResourceLeveler:
     """
     A class to handle resource leveling for project tasks.
     
-    This class loads task and allocation data, flattens nested task structures,
-    and performs resource leveling to prevent resource conflicts.
+    This class loads task and allocation data, indexes nested task structures,
+    and schedules the tasks so that no resource is used beyond its capacity
+    and no task starts before its predecessors have finished.
     """
 
     def __init__(self, tasks_filepath: str, allocations_filepath: str, 
-                 output_filepath: str, duration_type: str = 'normal') -> None:
+                 output_filepath: str, duration_type: str = 'normal',
+                 scheme: str = SERIAL, capacities: Optional[Dict[str, float]] = None,
+                 default_capacity: float = 1,
+                 dependency_manager: Optional[DependencyManager] = None,
+                 priorities: Optional[Dict[str, float]] = None) -> None:
         """
         Initialize the ResourceLeveler with file paths and configuration.
         
@@ -67,19 +77,37 @@ class ResourceLeveler:
             allocations_filepath: Path to the allocations JSON file
             output_filepath: Path where the leveled schedule will be saved
             duration_type: Type of duration to use ('optimistic', 'normal', 'pessimistic')
+            scheme: Schedule generation scheme, 'serial' or 'parallel'
+            capacities: Units available per resource (role), e.g. team size
+            default_capacity: Units of resources missing from capacities
+            dependency_manager: Source of task dependencies; by default they
+                are loaded from the 'dependencies' fields of the tasks
+            priorities: Importance score per task ID, overriding the tasks'
+                'importance' fields
         """
         if duration_type not in ['optimistic', 'normal', 'pessimistic']:
             raise ValueError("duration_type must be 'optimistic', 'normal', or 'pessimistic'")
+        if scheme not in SCHEMES:
+            raise ValueError(f"scheme must be one of: {', '.join(SCHEMES)}")
             
         self.tasks_filepath = tasks_filepath
         self.allocations_filepath = allocations_filepath
         self.output_filepath = output_filepath
         self.duration_type = duration_type
+        self.scheme = scheme
+        self.capacities = dict(capacities or {})
+        self.default_capacity = default_capacity
+        self.dependency_manager = dependency_manager
+        self.priorities = dict(priorities or {})
         self.tasks: List[Dict[str, Any]] = []
         self.allocations: List[Dict[str, Any]] = []
         self.flat_tasks: List[Dict[str, Any]] = []
         self.task_map: Dict[str, Dict[str, Any]] = {}
+        self.parent_map: Dict[str, Optional[str]] = {}
+        self.children_map: Dict[str, List[str]] = {}
         self.task_schedules: Dict[str, Dict[str, Any]] = {}
+        self.summary_schedules: Dict[str, Dict[str, Any]] = {}
+        self._dependency_sources: List[Dict[str, Any]] = []
 
     def load_json_file(self, filepath: str) -> Dict[str, Any]:
         """Load and return JSON data from the specified file."""
@@ -105,15 +133,18 @@ class ResourceLeveler:
             logger.error(f"Unable to write to file {filepath}: {e}")
             raise
 
-    def flatten_tasks(self, tasks: List[Dict[str, Any]], 
+    def flatten_tasks(self, tasks: List[Dict[str, Any]],
                     parent_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Flatten nested tasks into a list with parent-child relationships.
-        
+
+        The returned tasks are copies; leveling itself works on the index
+        built by ``index_tasks`` and does not copy tasks.
+
         Args:
             tasks: List of task dictionaries
             parent_id: ID of the parent task (None for root tasks)
-            
+
         Returns:
             List of flattened task dictionaries
         """
@@ -126,50 +157,180 @@ class ResourceLeveler:
             flat_list.extend(self.flatten_tasks(subtasks, task_copy['id']))
         return flat_list
 
+    def index_tasks(self, tasks: Union[List[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Index nested tasks by ID without copying them.
+
+        Fills ``task_map`` with the task dictionaries themselves, and
+        ``parent_map`` and ``children_map`` with the hierarchy.
+
+        Args:
+            tasks: Root task or list of root tasks
+
+        Returns:
+            The task map
+        """
+        roots = [tasks] if isinstance(tasks, dict) else list(tasks or [])
+        self.task_map, self.parent_map, self.children_map = {}, {}, {}
+        stack = [(task, None) for task in reversed(roots)]
+        while stack:
+            task, parent_id = stack.pop()
+            if not isinstance(task, dict) or 'id' not in task:
+                continue
+            task_id = task['id']
+            self.task_map[task_id] = task
+            self.parent_map[task_id] = parent_id
+            self.children_map[task_id] = []
+            if parent_id is not None:
+                self.children_map[parent_id].append(task_id)
+            stack.extend((subtask, task_id) for subtask in reversed(task.get('subtasks') or []))
+        self._dependency_sources = roots
+        return self.task_map
+
+    def _index_flat_tasks(self) -> None:
+        """Index tasks already flattened by ``flatten_tasks``, using their parent IDs."""
+        self.task_map = {task['id']: task for task in self.flat_tasks}
+        self.parent_map = {task['id']: task.get('parent_id') for task in self.flat_tasks}
+        self.children_map = {task_id: [] for task_id in self.task_map}
+        for task_id, parent_id in self.parent_map.items():
+            if parent_id in self.children_map:
+                self.children_map[parent_id].append(task_id)
+        self._dependency_sources = list(self.flat_tasks)
+
+    def _task_duration(self, task_id: str) -> float:
+        duration = self.task_map[task_id].get(f'{self.duration_type}_hours', 1)
+        if not isinstance(duration, (int, float)) or isinstance(duration, bool) or duration <= 0:
+            logger.warning(f"Invalid duration {duration} for task {task_id}, using 1 hour")
+            duration = 1
+        return duration
+
+    def _task_importance(self, task_id: str) -> float:
+        importance = self.priorities.get(task_id, self.task_map[task_id].get('importance', 0))
+        if not isinstance(importance, (int, float)) or isinstance(importance, bool):
+            return 0.0
+        return float(importance)
+
+    def _resource_demands(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get the units of each resource every task needs.
+
+        Resources are identified by role, falling back to the resource ID.
+        An allocation needs 'allocation_percent' / 100 units, or its 'units',
+        or one unit. Demands above a resource's capacity are capped at it.
+        """
+        demands: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for alloc in self.allocations:
+            tid = alloc.get('task_id')
+            if tid not in self.task_map:
+                logger.warning(f"Task {tid} not found in task map, skipping")
+                continue
+            resource_id = alloc.get('role') or alloc.get('resource_id') or 'unknown'
+            if 'allocation_percent' in alloc:
+                units = alloc['allocation_percent'] / 100.0
+            else:
+                units = alloc.get('units', 1)
+            if units > 0:
+                demands[tid][resource_id] += units
+
+        for tid, task_demands in demands.items():
+            for resource_id, units in task_demands.items():
+                capacity = self.capacities.get(resource_id, self.default_capacity)
+                if units > capacity:
+                    logger.warning(f"Task {tid} needs {units} units of {resource_id}, "
+                                   f"which has {capacity}; capping the demand")
+                    task_demands[resource_id] = capacity
+        return demands
+
+    def _task_dependencies(self) -> Dict[str, List[str]]:
+        if self.dependency_manager is None:
+            self.dependency_manager = DependencyManager()
+            self.dependency_manager.load_dependencies_from_wbs({'subtasks': self._dependency_sources})
+        return self.dependency_manager.task_dependencies
+
+    def _build_leveling_tasks(self) -> List[LevelingTask]:
+        """
+        Turn the indexed WBS into the precedence network to level.
+
+        Leaf tasks and tasks with allocations are work to schedule. A task
+        with subtasks also gets zero-length start and finish milestones:
+        its subtasks (and its own work) run between them, so dependencies
+        on or of a summary task apply to everything below it.
+        """
+        demands = self._resource_demands()
+        dependencies = self._task_dependencies()
+        summaries = {tid for tid, children in self.children_map.items() if children}
+
+        def start_node(tid):
+            return ('start', tid) if tid in summaries else tid
+
+        def finish_node(tid):
+            return ('finish', tid) if tid in summaries else tid
+
+        nodes: Dict[Any, LevelingTask] = {}
+        for tid in self.task_map:
+            importance = self._task_importance(tid)
+            if tid not in summaries or tid in demands:
+                nodes[tid] = LevelingTask(tid, self._task_duration(tid), dict(demands.get(tid, {})), importance)
+            if tid in summaries:
+                nodes[start_node(tid)] = LevelingTask(start_node(tid), 0, priority=importance)
+                nodes[finish_node(tid)] = LevelingTask(finish_node(tid), 0, priority=importance)
+                if tid in nodes:
+                    nodes[tid].predecessors.append(start_node(tid))
+                    nodes[finish_node(tid)].predecessors.append(tid)
+
+        for tid in self.task_map:
+            for dep_id in dependencies.get(tid, []):
+                if dep_id in self.task_map:
+                    nodes[start_node(tid)].predecessors.append(finish_node(dep_id))
+                else:
+                    logger.warning(f"Task {tid} depends on unknown task {dep_id}, ignoring")
+            parent_id = self.parent_map.get(tid)
+            if parent_id in summaries:
+                nodes[start_node(tid)].predecessors.append(start_node(parent_id))
+                nodes[finish_node(parent_id)].predecessors.append(finish_node(tid))
+        return list(nodes.values())
+
     def resource_leveling(self) -> Dict[str, Dict[str, Any]]:
         """
         Perform resource leveling to prevent resource conflicts.
-        
-        This algorithm ensures that tasks assigned to the same resource
-        do not overlap in time by adjusting their start times.
-        
+
+        Tasks are scheduled by the configured schedule generation scheme:
+        among the tasks whose predecessors are scheduled, the most important
+        one (then the one with the least slack) is placed at the earliest
+        time at which all its resources have spare capacity. Resources are
+        identified by role and have ``capacities`` units each.
+
         Returns:
             Dictionary mapping task IDs to their scheduled times
+
+        Raises:
+            ValueError: If the task dependencies are circular
         """
-        # Map task_id to task details for quick lookup
-        self.task_map = {task['id']: task for task in self.flat_tasks}
+        if not self.task_map:
+            if self.flat_tasks:
+                self._index_flat_tasks()
+            else:
+                self.index_tasks(self.tasks)
 
-        # Map resource_id to list of assigned tasks
-        resource_tasks = defaultdict(list)
-        for alloc in self.allocations:
-            resource_id = alloc.get('role', 'unknown')
-            resource_tasks[resource_id].append(alloc['task_id'])
-
-        # Process each resource's tasks sequentially
-        for resource_id, task_ids in resource_tasks.items():
-            current_time = 0
-            for tid in task_ids:
-                task = self.task_map.get(tid)
-                if not task:
-                    logger.warning(f"Task {tid} not found in task map, skipping")
-                    continue
-                
-                duration = task.get(f'{self.duration_type}_hours', 1)
-                if duration <= 0:
-                    logger.warning(f"Invalid duration {duration} for task {tid}, using 1 hour")
-                    duration = 1
-                
-                start = current_time
-                end = start + duration
-                
-                # Store the schedule for this task
-                self.task_schedules[tid] = {
-                    'resource_id': resource_id,
-                    'start': start,
-                    'end': end
-                }
-                
-                current_time = end
+        leveling_tasks = self._build_leveling_tasks()
+        schedule = level_tasks(leveling_tasks, self.capacities, self.default_capacity, self.scheme)
+
+        self.task_schedules = {}
+        self.summary_schedules = {}
+        for task in leveling_tasks:
+            start, end = schedule[task.task_id]
+            if isinstance(task.task_id, tuple):
+                kind, tid = task.task_id
+                self.summary_schedules.setdefault(tid, {})['start' if kind == 'start' else 'end'] = start
+                continue
+            resources = list(task.demands)
+            # Store the schedule for this task
+            self.task_schedules[task.task_id] = {
+                'resource_id': resources[0] if resources else None,
+                'resources': resources,
+                'start': start,
+                'end': end
+            }
 
         return self.task_schedules
 
@@ -183,8 +344,8 @@ class ResourceLeveler:
             self.allocations = self.load_json_file(self.allocations_filepath)
             
             # Process data
-            self.flat_tasks = self.flatten_tasks(self.tasks)
-            logger.info(f"Flattened {len(self.flat_tasks)} tasks from hierarchy")
+            self.index_tasks(self.tasks)
+            logger.info(f"Indexed {len(self.task_map)} tasks from hierarchy")
             
             leveled_schedule = self.resource_leveling()
             logger.info(f"Generated schedule for {len(leveled_schedule)} tasks")
@@ -1,42 +1,4 @@
-import json
-import os
-
-class BaseManagement:
-    def __init__(self, input_paths: dict, output_path: str):
-        """
-        input_paths: dict of input name to file path
-        output_path: output file path
-        """
-        self.input_paths = input_paths
-        self.output_path = output_path
-        self.inputs = {}
-        self.output = {}
-
-    def load_json(self, path):
-        if os.path.exists(path):
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return None
-
-    def save_json(self, data, path):
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-    def load_inputs(self):
-        for key, path in self.input_paths.items():
-            self.inputs[key] = self.load_json(path) or {}
-
-    def analyze(self):
-        """
-        To be implemented by subclasses.
-        """
-        raise NotImplementedError
-
-    def run(self):
-        self.load_inputs()
-        self.analyze()
-        self.save_json(self.output, self.output_path)
-        print(f"{self.__class__.__name__} output saved to {self.output_path}")
+from autoprojectmanagement.main_modules.utility_modules.base_management import BaseManagement
 
 class ResourceManagement(BaseManagement):
     def __init__(self,
@@ -60,3 +22,4 @@ class ResourceManagement(BaseManagement):
 if __name__ == "__main__":
     manager = ResourceManagement()
     manager.run()
+    print(f"{manager.__class__.__name__} output saved to {manager.output_path}")
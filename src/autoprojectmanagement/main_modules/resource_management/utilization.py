@@ -0,0 +1,241 @@
+"""
+Utilization Module - Per-day resource utilization and over-allocation detection
+
+Both work on allocation intervals ('resource_id', 'allocation_percent',
+'start_date', 'end_date', both dates included) without walking the days
+one by one:
+
+- the utilization matrix adds each allocation's load at its start day and
+  removes it the day after its end in a difference array, then takes a
+  cumulative sum along the days
+- the over-allocation finder sorts the same start/end events per resource
+  and sweeps them once, keeping the running load
+"""
+
+import datetime
+import heapq
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from autoprojectmanagement.main_modules.utility_modules.working_calendar import DATE_FORMAT, parse_date
+
+# Loads within this margin of a capacity are not over-allocations, so that
+# rounding in sums such as 3 x 33.3% does not raise false alarms
+LOAD_TOLERANCE = 1e-6
+
+
+def _allocation_arrays(allocations: Iterable[Dict[str, Any]],
+                       resource_ids: Optional[List[Any]] = None
+                       ) -> Tuple[List[Any], np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[int]]:
+    """
+    Turn allocations into parallel arrays, skipping unusable ones.
+
+    Allocations without a resource, with an invalid date or ending before
+    they start are skipped, as are resources not in ``resource_ids``.
+
+    Returns:
+        Resource IDs, then per kept allocation: resource index, start and
+        end day ordinals, load (allocation_percent / 100), and its position
+        in the input
+    """
+    known = list(resource_ids) if resource_ids is not None else []
+    index = {resource_id: i for i, resource_id in enumerate(known)}
+    rows, starts, ends, loads, positions = [], [], [], [], []
+    for position, allocation in enumerate(allocations):
+        resource_id = allocation.get('resource_id')
+        start = parse_date(allocation.get('start_date'))
+        end = parse_date(allocation.get('end_date'))
+        if not resource_id or start is None or end is None or end < start:
+            continue
+        if resource_id not in index:
+            if resource_ids is not None:
+                continue
+            index[resource_id] = len(known)
+            known.append(resource_id)
+        rows.append(index[resource_id])
+        starts.append(start.toordinal())
+        ends.append(end.toordinal())
+        loads.append(allocation.get('allocation_percent', 0) / 100.0)
+        positions.append(position)
+    return (known, np.array(rows, dtype=np.int64), np.array(starts, dtype=np.int64),
+            np.array(ends, dtype=np.int64), np.array(loads, dtype=np.float64), positions)
+
+
+class UtilizationMatrix:
+    """
+    Load of every resource on every day of a date range.
+
+    Attributes:
+        resource_ids: Resource of each row
+        start_date: Date of the first column
+        values: Array of shape (resources, days); 1.0 is one full-time load
+    """
+
+    def __init__(self, resource_ids: List[Any], start_date: datetime.date, values: np.ndarray):
+        self.resource_ids = resource_ids
+        self.start_date = start_date
+        self.values = values
+        self._rows = {resource_id: i for i, resource_id in enumerate(resource_ids)}
+
+    @property
+    def end_date(self) -> datetime.date:
+        """Date of the last column."""
+        return self.start_date + datetime.timedelta(days=max(self.values.shape[1] - 1, 0))
+
+    @property
+    def dates(self) -> List[datetime.date]:
+        """Date of every column."""
+        return [self.start_date + datetime.timedelta(days=day) for day in range(self.values.shape[1])]
+
+    def series(self, resource_id: Any) -> np.ndarray:
+        """Get the daily loads of a resource, zeros if it has no allocations."""
+        row = self._rows.get(resource_id)
+        if row is None:
+            return np.zeros(self.values.shape[1])
+        return self.values[row]
+
+    def load_on(self, resource_id: Any, day: datetime.date) -> float:
+        """Get the load of a resource on a date, 0.0 outside the range."""
+        column = (day - self.start_date).days
+        if not 0 <= column < self.values.shape[1]:
+            return 0.0
+        return float(self.series(resource_id)[column])
+
+    def summary(self) -> Dict[Any, Dict[str, float]]:
+        """Get the peak and average daily load of every resource."""
+        if not self.values.size:
+            return {resource_id: {'peak_daily_utilization': 0.0, 'average_daily_utilization': 0.0}
+                    for resource_id in self.resource_ids}
+        peaks = self.values.max(axis=1)
+        averages = self.values.mean(axis=1)
+        return {resource_id: {'peak_daily_utilization': round(float(peaks[i]), 4),
+                              'average_daily_utilization': round(float(averages[i]), 4)}
+                for i, resource_id in enumerate(self.resource_ids)}
+
+
+def build_utilization_matrix(allocations: Iterable[Dict[str, Any]],
+                             resource_ids: Optional[List[Any]] = None,
+                             start_date: Optional[datetime.date] = None,
+                             end_date: Optional[datetime.date] = None) -> UtilizationMatrix:
+    """
+    Build the per-resource, per-day utilization matrix of allocations.
+
+    Args:
+        allocations: Allocation dictionaries
+        resource_ids: Rows of the matrix, in order; by default every
+            allocated resource in order of first appearance. Allocations of
+            other resources are ignored.
+        start_date: First day, by default the earliest allocation start
+        end_date: Last day, by default the latest allocation end
+
+    Returns:
+        The utilization matrix; allocations are clipped to the date range
+    """
+    resources, rows, starts, ends, loads, _ = _allocation_arrays(allocations, resource_ids)
+    if start_date is None:
+        start_date = datetime.date.fromordinal(int(starts.min())) if len(starts) else datetime.date.today()
+    if end_date is None:
+        end_date = datetime.date.fromordinal(int(ends.max())) if len(ends) else start_date
+    first, days = start_date.toordinal(), max((end_date - start_date).days + 1, 0)
+
+    # Allocations are added at their first day and removed the day after
+    # their last, clipped to the range; column ``days`` collects the removals
+    # past the end
+    inside = (ends >= first) & (starts < first + days)
+    rows, loads = rows[inside], loads[inside]
+    begin = np.clip(starts[inside] - first, 0, days)
+    stop = np.clip(ends[inside] - first + 1, 0, days)
+    differences = np.zeros((len(resources), days + 1))
+    np.add.at(differences, (rows, begin), loads)
+    np.add.at(differences, (rows, stop), -loads)
+    values = np.cumsum(differences[:, :days], axis=1)
+    return UtilizationMatrix(resources, start_date, values)
+
+
+def find_over_allocations(allocations: List[Dict[str, Any]], capacity: float = 1.0,
+                          capacities: Optional[Dict[Any, float]] = None) -> List[Dict[str, Any]]:
+    """
+    Find the periods in which a resource's allocations add up to more than its capacity.
+
+    The start and end events of all allocations are sorted by resource and
+    day and swept once; consecutive over-allocated days form one period.
+
+    Args:
+        allocations: Allocation dictionaries
+        capacity: Load a resource can carry, 1.0 being full time
+        capacities: Capacity per resource ID, overriding ``capacity``
+
+    Returns:
+        Periods sorted by resource and start date, each with 'resource_id',
+        'start_date', 'end_date', 'peak_load', 'capacity' and the
+        'task_ids' of the allocations overlapping it
+    """
+    resources, rows, starts, ends, loads, positions = _allocation_arrays(allocations)
+    if not len(rows):
+        return []
+    capacities = capacities or {}
+    limits = np.array([capacities.get(resource_id, capacity) for resource_id in resources], dtype=np.float64)
+
+    # Events sorted by resource, then day; the running sum of the deltas,
+    # restarted at each resource so rounding errors of one resource do not
+    # carry over to the next, is the resource's load
+    event_rows = np.concatenate((rows, rows))
+    event_days = np.concatenate((starts, ends + 1))
+    order = np.lexsort((event_days, event_rows))
+    event_rows, event_days = event_rows[order], event_days[order]
+    deltas = np.concatenate((loads, -loads))[order]
+    level = np.cumsum(deltas)
+    resource_starts = np.flatnonzero(np.concatenate(([True], event_rows[1:] != event_rows[:-1])))
+    carried = level[resource_starts] - deltas[resource_starts]
+    level -= np.repeat(carried, np.diff(np.append(resource_starts, len(level))))
+
+    # The load after the last event of a day holds until the next event day
+    last = np.ones(len(event_rows), dtype=bool)
+    last[:-1] = (event_rows[1:] != event_rows[:-1]) | (event_days[1:] != event_days[:-1])
+    event_rows, event_days, level = event_rows[last], event_days[last], level[last]
+    continues = np.zeros(len(event_rows), dtype=bool)
+    continues[:-1] = event_rows[1:] == event_rows[:-1]
+    over = continues & (level > limits[event_rows] + LOAD_TOLERANCE)
+
+    # Allocations of each resource by start, to list the tasks of a period
+    rows_list, starts_list, ends_list = rows.tolist(), starts.tolist(), ends.tolist()
+    by_resource: Dict[int, List[int]] = {}
+    for i in np.lexsort((starts, rows)).tolist():
+        by_resource.setdefault(rows_list[i], []).append(i)
+
+    # Runs of consecutive over-allocated segments of one resource
+    periods: List[List[Any]] = []
+    over_list, event_rows_list = over.tolist(), event_rows.tolist()
+    event_days_list, level_list = event_days.tolist(), level.tolist()
+    for i in np.flatnonzero(over).tolist():
+        row = event_rows_list[i]
+        if i > 0 and over_list[i - 1] and event_rows_list[i - 1] == row:
+            periods[-1][2] = event_days_list[i + 1] - 1
+            periods[-1][3] = max(periods[-1][3], level_list[i])
+        else:
+            periods.append([row, event_days_list[i], event_days_list[i + 1] - 1, level_list[i]])
+
+    # Periods of a resource come in date order, so its allocations are
+    # taken up once, by start, and dropped once they ended before a period
+    result = []
+    current_row, cursor, active = None, 0, []
+    for row, first, last, peak_load in periods:
+        if row != current_row:
+            current_row, cursor, active = row, 0, []
+        candidates = by_resource[row]
+        while cursor < len(candidates) and starts_list[candidates[cursor]] <= last:
+            heapq.heappush(active, (ends_list[candidates[cursor]], candidates[cursor]))
+            cursor += 1
+        while active and active[0][0] < first:
+            heapq.heappop(active)
+        overlapping = sorted(positions[i] for _, i in active)
+        result.append({
+            'resource_id': resources[row],
+            'start_date': datetime.date.fromordinal(first).strftime(DATE_FORMAT),
+            'end_date': datetime.date.fromordinal(last).strftime(DATE_FORMAT),
+            'peak_load': round(peak_load, 4),
+            'capacity': float(limits[row]),
+            'task_ids': list(dict.fromkeys(allocations[position].get('task_id') for position in overlapping))
+        })
+    return result
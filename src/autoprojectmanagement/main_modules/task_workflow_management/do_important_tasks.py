@@ -43,6 +43,7 @@ __license__ = "MIT"
 import json
 import logging
 import asyncio
+import heapq
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass, asdict
@@ -52,6 +53,8 @@ from enum import Enum
 import uuid
 from abc import ABC, abstractmethod
 
+from autoprojectmanagement.main_modules.task_workflow_management.task_priority_queue import TaskPriorityQueue
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -176,6 +179,14 @@ class JsonTaskStorage(TaskStorageInterface):
             self.file_path.parent.mkdir(parents=True, exist_ok=True)
             self.file_path.write_text(json.dumps([]))
     
+    def signature(self) -> Optional[Tuple[int, int]]:
+        """Get the modification time and size of the storage file, None if it is missing"""
+        try:
+            stat = self.file_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
     async def save_task(self, task: ImportantTask) -> bool:
         """Save a single task"""
         try:
@@ -232,6 +243,10 @@ class JsonTaskStorage(TaskStorageInterface):
             return False
 
 # Phase 3: Advanced Features & Optimization
+
+# Whole days left before a deadline at which urgency steps up (30, 7 and 0 days or fewer)
+URGENCY_STEP_DAYS = (31, 8, 1)
+
 class TaskPrioritizer:
     """Advanced task prioritization system - Phase 3"""
     
@@ -244,12 +259,12 @@ class TaskPrioritizer:
             'dependencies': 0.1
         })
     
-    def calculate_priority_score(self, task: ImportantTask) -> float:
+    def calculate_priority_score(self, task: ImportantTask, now: Optional[datetime] = None) -> float:
         """Calculate comprehensive priority score"""
         strategic_score = task.strategic_value / 100.0
         
         # Urgency based on deadline proximity
-        urgency_score = self._calculate_urgency_score(task)
+        urgency_score = self._calculate_urgency_score(task, now)
         
         # Effort consideration (lower effort = higher priority)
         effort_score = 1.0 / max(task.estimated_hours, 0.5)
@@ -267,12 +282,12 @@ class TaskPrioritizer:
         
         return score
     
-    def _calculate_urgency_score(self, task: ImportantTask) -> float:
+    def _calculate_urgency_score(self, task: ImportantTask, now: Optional[datetime] = None) -> float:
         """Calculate urgency score based on deadline"""
         if not task.deadline:
             return 0.5
         
-        days_until_deadline = (task.deadline - datetime.now()).days
+        days_until_deadline = (task.deadline - (now or datetime.now())).days
         if days_until_deadline <= 0:
             return 1.0
         elif days_until_deadline <= 7:
@@ -282,6 +297,22 @@ class TaskPrioritizer:
         else:
             return 0.3
     
+    def next_score_change(self, task: ImportantTask, now: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        Get the moment after which a task's urgency, and so its score, next changes.
+
+        Urgency steps up once fewer than 31, 8 and 1 whole days are left
+        before the deadline; between those moments the score is constant.
+        """
+        if not task.deadline:
+            return None
+        now = now or datetime.now()
+        for days in URGENCY_STEP_DAYS:
+            moment = task.deadline - timedelta(days=days)
+            if moment >= now:
+                return moment
+        return None
+    
     def sort_tasks_by_priority(self, tasks: List[ImportantTask]) -> List[ImportantTask]:
         """Sort tasks by calculated priority score"""
         return sorted(tasks, key=self.calculate_priority_score, reverse=True)
@@ -358,11 +389,18 @@ class ImportantTaskManager:
         )
         self.prioritizer = TaskPrioritizer(self.config)
         self.scheduler = TaskScheduler(self.config)
+        # Tasks by priority score, kept current as tasks change
+        self.priority_queue = TaskPriorityQueue()
+        self._queue_loaded = False
+        # Storage file signature the queue was built from or kept in step with
+        self._storage_signature: Optional[Tuple[int, int]] = None
+        self._score_changes: List[Tuple[datetime, str]] = []
+        self._score_change_at: Dict[str, datetime] = {}
         
     async def initialize(self) -> bool:
         """Initialize the manager"""
         try:
-            await self.storage.load_tasks()
+            await self._reload_tasks()
             self.logger.info("Important task manager initialized successfully")
             return True
         except Exception as e:
@@ -407,7 +445,9 @@ class ImportantTaskManager:
                 tags=tags
             )
             
-            await self.storage.save_task(task)
+            in_step = self._storage_in_step()
+            if await self.storage.save_task(task) and self._queue_loaded:
+                self._queue_stored_task(task, datetime.now(), in_step)
             self.logger.info(f"Created important task: {task.title} (ID: {task.id})")
             return task.id
             
@@ -437,7 +477,9 @@ class ImportantTaskManager:
                 task.completion_percentage = completion_percentage
             task.updated_at = datetime.now()
             
-            await self.storage.update_task(task)
+            in_step = self._storage_in_step()
+            if await self.storage.update_task(task) and self._queue_loaded:
+                self._queue_stored_task(task, task.updated_at, in_step)
             self.logger.info(f"Updated task {task_id} status to {status.value}")
             return True
             
@@ -446,11 +488,19 @@ class ImportantTaskManager:
             return False
     
     async def get_prioritized_tasks(self, limit: Optional[int] = None) -> List[ImportantTask]:
-        """Get tasks sorted by priority"""
+        """
+        Get tasks sorted by priority.
+
+        Served from the in-memory priority queue in O(limit log n); storage
+        is read only the first time, unless the manager was initialized, and
+        again when the storage file was changed by someone else. The
+        returned tasks are the queued ones and should not be modified.
+        """
         try:
-            tasks = await self.storage.load_tasks()
-            sorted_tasks = self.prioritizer.sort_tasks_by_priority(tasks)
-            return sorted_tasks[:limit] if limit else sorted_tasks
+            if not self._queue_loaded or not self._storage_in_step():
+                await self._reload_tasks()
+            self._refresh_scores(datetime.now())
+            return self.priority_queue.top(limit or None)
         except Exception as e:
             self.logger.error(f"Error getting prioritized tasks: {e}")
             return []
@@ -517,7 +567,12 @@ class ImportantTaskManager:
             for task in tasks:
                 if (task.status == TaskStatus.COMPLETED and 
                     task.updated_at < cutoff_date):
+                    in_step = self._storage_in_step()
                     await self.storage.delete_task(task.id)
+                    self.priority_queue.discard(task.id)
+                    self._score_change_at.pop(task.id, None)
+                    if in_step:
+                        self._storage_signature = self.storage.signature()
                     cleaned_count += 1
             
             self.logger.info(f"Cleaned up {cleaned_count} old completed tasks")
@@ -527,6 +582,68 @@ class ImportantTaskManager:
             self.logger.error(f"Error cleaning up tasks: {e}")
             return 0
     
+    async def _reload_tasks(self) -> None:
+        """Rebuild the priority queue from storage and remember the file it was read from"""
+        # Taken before reading, so a change made while reading triggers another reload
+        signature = self.storage.signature()
+        self._index_tasks(await self.storage.load_tasks())
+        self._storage_signature = signature
+    
+    def _storage_in_step(self) -> bool:
+        """Whether the storage file is unchanged since the queue last matched it"""
+        return self._storage_signature is not None and self.storage.signature() == self._storage_signature
+    
+    def _queue_stored_task(self, task: ImportantTask, now: datetime, in_step: bool) -> None:
+        """
+        Queue a task this manager just stored.
+        
+        When the queue matched the storage file before the write, it matches
+        the rewritten file too; otherwise the file also holds changes made by
+        someone else and the next read reloads it.
+        """
+        self._queue_task(task, now)
+        if in_step:
+            self._storage_signature = self.storage.signature()
+    
+    def _index_tasks(self, tasks: List[ImportantTask]) -> None:
+        """Rebuild the priority queue from all stored tasks"""
+        now = datetime.now()
+        tasks_by_id = {task.id: task for task in tasks}
+        self._score_changes = []
+        self._score_change_at = {}
+        self.priority_queue = TaskPriorityQueue(
+            (task.id, self.prioritizer.calculate_priority_score(task, now), task)
+            for task in tasks_by_id.values()
+        )
+        for task in tasks_by_id.values():
+            self._schedule_rescore(task, now)
+        self._queue_loaded = True
+    
+    def _queue_task(self, task: ImportantTask, now: datetime) -> None:
+        """Add a task to the priority queue, or replace its queued version"""
+        self.priority_queue.push(task.id, self.prioritizer.calculate_priority_score(task, now), task)
+        self._schedule_rescore(task, now)
+    
+    def _schedule_rescore(self, task: ImportantTask, now: datetime) -> None:
+        """Remember when a task's score next changes as its deadline approaches"""
+        moment = self.prioritizer.next_score_change(task, now)
+        if moment is None:
+            self._score_change_at.pop(task.id, None)
+            return
+        self._score_change_at[task.id] = moment
+        heapq.heappush(self._score_changes, (moment, task.id))
+    
+    def _refresh_scores(self, now: datetime) -> None:
+        """Rescore only the queued tasks whose urgency stepped up since they were scored"""
+        changes = self._score_changes
+        while changes and changes[0][0] < now:
+            moment, task_id = heapq.heappop(changes)
+            if self._score_change_at.get(task_id) != moment:
+                continue
+            task = self.priority_queue.get(task_id)
+            self.priority_queue.update(task_id, self.prioritizer.calculate_priority_score(task, now))
+            self._schedule_rescore(task, now)
+    
     def _load_config(self, config_path: Optional[str]) -> Dict[str, Any]:
         """Load configuration with defaults"""
         default_config = {
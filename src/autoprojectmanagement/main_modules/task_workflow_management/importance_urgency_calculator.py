@@ -1,12 +1,60 @@
+import datetime
 import json
 import os
 import logging
 
+import numpy as np
+
+from autoprojectmanagement.main_modules.task_workflow_management.urgency_index import DeadlineScore
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+PRIORITY_MAP = {
+    "low": 1,
+    "medium": 5,
+    "high": 10,
+    "بالا": 10,
+    "اهم": 10,
+}
+W_DEP, W_CP, W_COST, W_PRIO = 0.3, 0.3, 0.2, 0.2
+W_TIME, W_RISK, W_PRESSURE = 0.5, 0.3, 0.2
+DEADLINE_WINDOW_SECONDS = 3 * 24 * 3600  # deadlines further away add no urgency
+_EPOCH = datetime.datetime(1, 1, 1)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+def _to_microseconds(moment):
+    """Microseconds from 0001-01-01 to a naive datetime, exact as an integer."""
+    return (moment - _EPOCH) // _MICROSECOND
+
+def _check_number(value, name):
+    if isinstance(value, bool):
+        raise TypeError(f"{name} must not be a boolean")
+    if not isinstance(value, (int, float)):
+        raise TypeError(f"{name} must be a number")
+    return value
+
+def importance_from_inputs(dependency_count, critical_path, cost_impact, priority):
+    """Importance score (0-100) of criteria extracted by _importance_inputs."""
+    importance = (W_DEP * min(1, dependency_count / 10) +
+                  W_CP * (1 if critical_path else 0) +
+                  W_COST * min(1, cost_impact / 100000) +  # assuming cost in currency units
+                  W_PRIO * min(1, priority / 10))
+    return round(importance * 100, 2)
+
+def urgency_from_inputs(deadline, risk_of_delay, stakeholder_pressure, now=None):
+    """Urgency score (0-100) of criteria extracted by _urgency_inputs, as of ``now``."""
+    time_factor = 0
+    if deadline is not None:
+        total_time = (deadline - _to_microseconds(now or datetime.datetime.now())) / 10**6
+        time_factor = 1 - max(0, min(1, total_time / DEADLINE_WINDOW_SECONDS))
+    urgency = (W_TIME * time_factor +
+               W_RISK * min(1, risk_of_delay / 10) +
+               W_PRESSURE * min(1, stakeholder_pressure / 10))
+    return round(urgency * 100, 2)
+
 class ImportanceUrgencyCalculator:
-    def __init__(self, wbs_data):
+    def __init__(self, wbs_data, critical_tasks=None):
         """
         wbs_data: list of dicts representing tasks with hierarchical structure
         Each task dict should have:
@@ -15,41 +63,42 @@ class ImportanceUrgencyCalculator:
             - level: hierarchical level (int)
             - subtasks: list of subtasks (same structure)
             - other metadata as needed
+        critical_tasks: optional collection of task ids on the critical path,
+            e.g. DependencyManager.calculate_schedule()['critical_tasks'].
+            Tasks listed here count as critical path tasks in addition to
+            those flagged with 'critical_path' in the WBS.
         """
         self.wbs_data = wbs_data
         self.task_scores = {}
+        self.critical_tasks = set(critical_tasks or [])
+
+    @classmethod
+    def from_dependency_schedule(cls, wbs_data, dependency_manager):
+        """
+        Create a calculator whose critical path factor comes from a CPM run.
+
+        dependency_manager: a DependencyManager with dependencies loaded
+        """
+        schedule = dependency_manager.schedule or dependency_manager.calculate_schedule()
+        return cls(wbs_data, critical_tasks=schedule.get('critical_tasks', []))
 
     def score_task(self, task):
         """
-        Recursively score a task based on its subtasks or base criteria.
+        Score a task and its subtasks based on defined criteria.
         Importance and urgency are scored 0-100.
         For leaf tasks, score based on defined criteria.
         For parent tasks, average scores of subtasks.
         """
-        if not task.get('subtasks'):
-            importance = self.calculate_importance(task)
-            urgency = self.calculate_urgency(task)
-        else:
-            importance_values = []
-            urgency_values = []
-            for subtask in task['subtasks']:
-                sub_imp, sub_urg = self.score_task(subtask)
-                importance_values.append(sub_imp)
-                urgency_values.append(sub_urg)
-            importance = sum(importance_values) / len(importance_values) if importance_values else 0
-            urgency = sum(urgency_values) / len(urgency_values) if urgency_values else 0
-
-        self.task_scores[task['id']] = {'importance': importance, 'urgency': urgency}
-        return importance, urgency
+        nodes, post_order, importance, urgency = self._score_batch([task])
+        self._record_scores(nodes, post_order, importance, urgency)
+        return importance[0], urgency[0]
 
-    def calculate_importance(self, task):
+    def _importance_inputs(self, task):
         """
-        Calculate importance based on:
-        - Dependency count (normalized)
-        - Critical path involvement (boolean)
-        - Cost impact (normalized)
-        - Stakeholder priority (normalized)
-        Weights can be adjusted as needed.
+        Validate and extract the importance criteria of a task.
+
+        Returns:
+            Dependency count, critical path flag, cost impact and priority (0-10)
         """
         if task is None:
             raise TypeError("Task cannot be None")
@@ -57,17 +106,10 @@ class ImportanceUrgencyCalculator:
             dependencies = task.get('dependencies', [])
             if not isinstance(dependencies, list):
                 raise TypeError("dependencies must be a list")
-            dependency_factor = min(1, len(dependencies) / 10)
 
-            critical_path = task.get('critical_path', False)
-            critical_path_factor = 1 if critical_path else 0
+            critical_path = bool(task.get('critical_path', False) or task.get('id') in self.critical_tasks)
 
-            cost_impact = task.get('cost_impact', 0)
-            if isinstance(cost_impact, bool):
-                raise TypeError("cost_impact must not be a boolean")
-            if not (isinstance(cost_impact, int) or isinstance(cost_impact, float)):
-                raise TypeError("cost_impact must be a number")
-            cost_factor = min(1, cost_impact / 100000)  # assuming cost in currency units
+            cost_impact = _check_number(task.get('cost_impact', 0), "cost_impact")
 
             priority = task.get('priority', 0)
             if priority is None:
@@ -75,98 +117,198 @@ class ImportanceUrgencyCalculator:
             if isinstance(priority, bool):
                 raise TypeError("priority must not be a boolean")
             if isinstance(priority, str):
-                priority_map = {
-                    "low": 1,
-                    "medium": 5,
-                    "high": 10,
-                    "بالا": 10,
-                    "اهم": 10,
-                }
-                priority_factor = priority_map.get(priority.lower(), 0) / 10
-            elif isinstance(priority, (int, float)) and not isinstance(priority, bool):
+                priority = PRIORITY_MAP.get(priority.lower(), 0)
+            elif isinstance(priority, (int, float)):
                 if priority < 0 or priority > 10:
                     raise TypeError("priority numeric value out of range")
-                priority_factor = min(1, priority / 10)
             else:
                 raise TypeError("priority must be a number or recognized string")
-
-            w_dep, w_cp, w_cost, w_prio = 0.3, 0.3, 0.2, 0.2
-
-            importance = (w_dep * dependency_factor +
-                          w_cp * critical_path_factor +
-                          w_cost * cost_factor +
-                          w_prio * priority_factor)
-            importance_score = round(importance * 100, 2)
-            return importance_score
+            return len(dependencies), critical_path, cost_impact, priority
         except Exception as e:
             task_id = task.get('id') if task and isinstance(task, dict) else 'unknown'
             logger.error(f"Error calculating importance for task {task_id}: {e}")
             raise
 
-    def calculate_urgency(self, task):
+    def _urgency_inputs(self, task, deadlines):
         """
-        Calculate urgency based on:
-        - Deadline proximity (normalized)
-        - Risk of delay (normalized)
-        - Stakeholder pressure (normalized)
-        Weights can be adjusted as needed.
+        Validate and extract the urgency criteria of a task.
+
+        Args:
+            deadlines: Cache of parsed deadlines by their text
+
+        Returns:
+            Deadline in microseconds (None without a usable deadline), risk
+            of delay and stakeholder pressure
         """
         if task is None:
             raise TypeError("Task cannot be None")
         try:
-            import datetime
-            now = datetime.datetime.now()
             deadline_str = task.get('deadline', None)
-            if deadline_str is None:
-                # Treat missing or None deadline as no deadline, urgency time factor 0
-                time_factor = 0
-            elif deadline_str:
+            deadline = None
+            if deadline_str:
                 if not isinstance(deadline_str, str):
-                    if isinstance(deadline_str, bool):
-                        raise TypeError("deadline must be a string in ISO format")
-                    if isinstance(deadline_str, float) or isinstance(deadline_str, int):
+                    if isinstance(deadline_str, (bool, int, float)):
                         raise TypeError("deadline must be a string in ISO format")
                     try:
                         deadline_str = str(deadline_str)
                     except Exception:
                         raise TypeError("deadline must be a string in ISO format")
-                try:
-                    deadline = datetime.datetime.fromisoformat(deadline_str)
-                    total_time = (deadline - now).total_seconds()
-                    normalized_time = max(0, min(1, total_time / (3*24*3600)))  # 3 days window
-                    time_factor = 1 - normalized_time
-                except Exception:
-                    time_factor = 0
-
-            risk_of_delay = task.get('risk_of_delay', 0)
-            if isinstance(risk_of_delay, bool):
-                raise TypeError("risk_of_delay must not be a boolean")
-            if not (isinstance(risk_of_delay, int) or isinstance(risk_of_delay, float)):
-                raise TypeError("risk_of_delay must be a number")
-            risk_factor = min(1, risk_of_delay / 10)
-
-            stakeholder_pressure = task.get('stakeholder_pressure', 0)
-            if isinstance(stakeholder_pressure, bool):
-                raise TypeError("stakeholder_pressure must not be a boolean")
-            if not (isinstance(stakeholder_pressure, int) or isinstance(stakeholder_pressure, float)):
-                raise TypeError("stakeholder_pressure must be a number")
-            pressure_factor = min(1, stakeholder_pressure / 10)
-
-            w_time, w_risk, w_pressure = 0.5, 0.3, 0.2
-
-            urgency = (w_time * time_factor +
-                       w_risk * risk_factor +
-                       w_pressure * pressure_factor)
-            urgency_score = round(urgency * 100, 2)
-            return urgency_score
+                if deadline_str in deadlines:
+                    deadline = deadlines[deadline_str]
+                else:
+                    try:
+                        parsed = datetime.datetime.fromisoformat(deadline_str)
+                        # Aware deadlines cannot be compared with the local time
+                        deadline = None if parsed.tzinfo is not None else _to_microseconds(parsed)
+                    except Exception:
+                        deadline = None
+                    deadlines[deadline_str] = deadline
+
+            risk_of_delay = _check_number(task.get('risk_of_delay', 0), "risk_of_delay")
+            stakeholder_pressure = _check_number(task.get('stakeholder_pressure', 0), "stakeholder_pressure")
+            return deadline, risk_of_delay, stakeholder_pressure
         except Exception as e:
             task_id = task.get('id') if task and isinstance(task, dict) else 'unknown'
             logger.error(f"Error calculating urgency for task {task_id}: {e}")
             raise
 
-    def calculate_all(self):
-        for task in self.wbs_data:
-            self.score_task(task)
+    def calculate_importance(self, task):
+        """
+        Calculate importance based on:
+        - Dependency count (normalized)
+        - Critical path involvement (boolean)
+        - Cost impact (normalized)
+        - Stakeholder priority (normalized)
+        Weights can be adjusted as needed.
+        """
+        return importance_from_inputs(*self._importance_inputs(task))
+
+    def calculate_urgency(self, task, now=None):
+        """
+        Calculate urgency based on:
+        - Deadline proximity (normalized)
+        - Risk of delay (normalized)
+        - Stakeholder pressure (normalized)
+        Weights can be adjusted as needed.
+        now: time deadlines are measured from, by default the current time
+        """
+        return urgency_from_inputs(*self._urgency_inputs(task, {}), now=now)
+
+    def urgency_score(self, task):
+        """
+        Urgency (0-100, before rounding) of a leaf task as a function of
+        time, for an UrgencyIndex.
+        """
+        deadline, risk_of_delay, stakeholder_pressure = self._urgency_inputs(task, {})
+        if deadline is not None:
+            deadline = (_EPOCH + datetime.timedelta(microseconds=deadline)).timestamp()
+        base = W_RISK * min(1, risk_of_delay / 10) + W_PRESSURE * min(1, stakeholder_pressure / 10)
+        return DeadlineScore.ramp(deadline, DEADLINE_WINDOW_SECONDS, W_TIME * 100, base=base * 100)
+
+    def _score_batch(self, tasks, now=None):
+        """
+        Score task trees in one batch.
+
+        One pass over the trees validates the leaves and extracts their
+        criteria into arrays; all leaves are then scored together against a
+        single ``now``, and parent averages are rolled up one level at a
+        time, deepest first. Scores equal those of calculate_importance and
+        calculate_urgency.
+
+        Returns:
+            Tasks in pre-order, their positions in post-order, and the
+            importance and urgency of each task in pre-order
+        """
+        nodes, parents, depths, post_order = [], [], [], []
+        leaves, dependency_counts, critical, costs, priorities = [], [], [], [], []
+        deadline_values, risks, pressures = [], [], []
+        deadlines = {}
+
+        stack = [(task, -1, 0) for task in reversed(tasks)]
+        while stack:
+            task, parent, depth = stack.pop()
+            if task is None and depth is None:
+                post_order.append(parent)
+                continue
+            index = len(nodes)
+            subtasks = task.get('subtasks')
+            nodes.append(task)
+            parents.append(parent)
+            depths.append(depth)
+            if subtasks:
+                # Exit marker: the task follows its subtasks in post-order
+                stack.append((None, index, None))
+                stack.extend((subtask, index, depth + 1) for subtask in reversed(list(subtasks)))
+                continue
+            dependency_count, critical_path, cost_impact, priority = self._importance_inputs(task)
+            deadline, risk_of_delay, stakeholder_pressure = self._urgency_inputs(task, deadlines)
+            leaves.append(index)
+            dependency_counts.append(dependency_count)
+            critical.append(critical_path)
+            costs.append(cost_impact)
+            priorities.append(priority)
+            deadline_values.append(deadline)
+            risks.append(risk_of_delay)
+            pressures.append(stakeholder_pressure)
+            post_order.append(index)
+
+        count = len(nodes)
+        importance = np.zeros(count)
+        urgency = np.zeros(count)
+        if leaves:
+            importance_values = (W_DEP * np.minimum(1, np.array(dependency_counts) / 10) +
+                                 W_CP * np.array(critical, dtype=np.float64) +
+                                 W_COST * np.minimum(1, np.array(costs, dtype=np.float64) / 100000) +
+                                 W_PRIO * np.minimum(1, np.array(priorities, dtype=np.float64) / 10))
+
+            now_us = _to_microseconds(now or datetime.datetime.now())
+            has_deadline = np.array([deadline is not None for deadline in deadline_values])
+            deadline_us = np.array([deadline if deadline is not None else now_us for deadline in deadline_values],
+                                   dtype=np.int64)
+            total_time = (deadline_us - now_us) / 10**6
+            time_factor = np.where(has_deadline, 1 - np.clip(total_time / DEADLINE_WINDOW_SECONDS, 0, 1), 0)
+            urgency_values = (W_TIME * time_factor +
+                              W_RISK * np.minimum(1, np.array(risks, dtype=np.float64) / 10) +
+                              W_PRESSURE * np.minimum(1, np.array(pressures, dtype=np.float64) / 10))
+
+            leaf_index = np.array(leaves)
+            importance[leaf_index] = [round(value, 2) for value in (importance_values * 100).tolist()]
+            urgency[leaf_index] = [round(value, 2) for value in (urgency_values * 100).tolist()]
+
+        # Parent averages, a level at a time from the deepest; nodes of a
+        # level stay in pre-order, so siblings are summed in their order
+        depth_array = np.array(depths, dtype=np.int64)
+        parent_array = np.array(parents, dtype=np.int64)
+        by_depth = np.argsort(depth_array, kind='stable')
+        bounds = np.searchsorted(depth_array[by_depth], np.arange(depth_array.max() + 2 if count else 1))
+        position = np.empty(count, dtype=np.int64)
+        for depth in range(len(bounds) - 1):
+            level = by_depth[bounds[depth]:bounds[depth + 1]]
+            position[level] = np.arange(len(level))
+        for depth in range(len(bounds) - 2, 0, -1):
+            level = by_depth[bounds[depth]:bounds[depth + 1]]
+            upper = by_depth[bounds[depth - 1]:bounds[depth]]
+            slots = position[parent_array[level]]
+            sizes = np.bincount(slots, minlength=len(upper))
+            summed = sizes > 0
+            targets = upper[summed]
+            importance[targets] = np.bincount(slots, importance[level], len(upper))[summed] / sizes[summed]
+            urgency[targets] = np.bincount(slots, urgency[level], len(upper))[summed] / sizes[summed]
+
+        return nodes, post_order, importance.tolist(), urgency.tolist()
+
+    def _record_scores(self, nodes, post_order, importance, urgency):
+        for index in post_order:
+            self.task_scores[nodes[index]['id']] = {'importance': importance[index], 'urgency': urgency[index]}
+
+    def calculate_all(self, now=None):
+        """
+        Score every task of the WBS in one batch.
+
+        now: time deadlines are measured from, by default the current time
+        """
+        nodes, post_order, importance, urgency = self._score_batch(self.wbs_data, now)
+        self._record_scores(nodes, post_order, importance, urgency)
         return self.task_scores
 
 def load_wbs_from_file(filepath):
@@ -0,0 +1,263 @@
+"""
+Incremental Scoring Module - Keeps WBS importance and urgency scores current as tasks change
+
+The WBS is scored once in a batch; afterwards an edited task is rescored
+on its own and only its ancestors' averages are recomputed, stopping at
+the first ancestor whose score does not change. Changed scores are
+published as deltas to the real-time task update stream.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from autoprojectmanagement.api.realtime_service import publish_task_update
+from autoprojectmanagement.main_modules.task_workflow_management.importance_urgency_calculator import (
+    ImportanceUrgencyCalculator, importance_from_inputs, urgency_from_inputs
+)
+from autoprojectmanagement.main_modules.utility_modules.data_store import get_data_store
+
+logger = logging.getLogger(__name__)
+
+# Most deltas kept while no event loop is available to publish them
+PENDING_LIMIT = 1000
+
+Publisher = Callable[[Dict[str, Any], Optional[str]], Optional[Awaitable[None]]]
+
+
+class IncrementalScoringService:
+    """
+    Importance and urgency scores of a WBS, updated task by task.
+
+    Leaf criteria and all scores are kept in memory. Urgency depends on the
+    time until deadlines, so scores of untouched tasks keep the time they
+    were computed at; call rescore_all periodically to refresh them.
+
+    Attributes:
+        calculator: Calculator holding the WBS, critical tasks and scores
+        scores: Scores by task ID, as returned by calculate_all
+        project_id: Project the published updates belong to
+        pending: Updates of coroutine publishers waiting for publish_pending
+    """
+
+    def __init__(self, wbs_data: List[Dict[str, Any]], critical_tasks: Optional[Iterable[Any]] = None,
+                 publisher: Optional[Publisher] = publish_task_update, project_id: Optional[str] = None,
+                 loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        Score the WBS and index it for incremental updates.
+
+        Args:
+            wbs_data: Root tasks, each with optional 'subtasks'
+            critical_tasks: IDs of tasks on the critical path
+            publisher: Called with each delta and the project ID; coroutine
+                functions such as publish_task_update are scheduled on
+                ``loop`` or the running loop, otherwise their updates are
+                queued for publish_pending. None disables publishing.
+            project_id: Project the published updates belong to
+            loop: Event loop to publish on from other threads
+        """
+        self.calculator = ImportanceUrgencyCalculator(wbs_data, critical_tasks)
+        self.scores = self.calculator.task_scores
+        self.publisher = publisher
+        self.project_id = project_id
+        self.loop = loop
+        self.pending: Deque[Dict[str, Any]] = deque(maxlen=PENDING_LIMIT)
+        self._tasks: Dict[Any, Dict[str, Any]] = {}
+        self._parents: Dict[Any, Any] = {}
+        self._inputs: Dict[Any, Tuple[tuple, tuple]] = {}
+        self._deadlines: Dict[str, Optional[int]] = {}
+        self.rescore_all()
+
+    def rescore_all(self, now=None) -> Dict[Any, Dict[str, float]]:
+        """
+        Score the whole WBS again and rebuild the index.
+
+        Args:
+            now: Time deadlines are measured from, by default the current time
+
+        Returns:
+            Scores by task ID
+        """
+        self.scores.clear()
+        self._tasks.clear()
+        self._parents.clear()
+        self._inputs.clear()
+        self.calculator.calculate_all(now)
+        for root in self.calculator.wbs_data:
+            self._index(root, None)
+        return self.scores
+
+    def _index(self, root: Dict[str, Any], parent_id: Any) -> List[Any]:
+        """Index a subtree and keep the criteria of its leaves; returns its task IDs."""
+        indexed = []
+        stack = [(root, parent_id)]
+        while stack:
+            task, parent_id = stack.pop()
+            task_id = task['id']
+            self._tasks[task_id] = task
+            self._parents[task_id] = parent_id
+            indexed.append(task_id)
+            subtasks = task.get('subtasks')
+            if subtasks:
+                stack.extend((subtask, task_id) for subtask in subtasks)
+            else:
+                self._inputs[task_id] = self._leaf_inputs(task)
+        return indexed
+
+    def _leaf_inputs(self, task: Dict[str, Any]) -> Tuple[tuple, tuple]:
+        return (self.calculator._importance_inputs(task),
+                self.calculator._urgency_inputs(task, self._deadlines))
+
+    def _forget(self, task_id: Any) -> List[Any]:
+        """Drop a subtree from the index and the scores; returns its task IDs."""
+        removed = []
+        stack = [task_id]
+        while stack:
+            current = stack.pop()
+            task = self._tasks.pop(current, None)
+            if task is None:
+                continue
+            self._parents.pop(current, None)
+            self._inputs.pop(current, None)
+            self.scores.pop(current, None)
+            removed.append(current)
+            stack.extend(subtask['id'] for subtask in task.get('subtasks') or [])
+        return removed
+
+    def update_task(self, task_id: Any, changes: Dict[str, Any], now=None) -> Dict[Any, Optional[Dict[str, float]]]:
+        """
+        Apply changes to a task and rescore it and its ancestors.
+
+        Changes to 'subtasks' replace the task's subtree, which is scored
+        in a batch. Changes that leave a leaf's criteria as they were
+        change no scores.
+
+        Args:
+            task_id: ID of the task to change
+            changes: Task fields to set
+            now: Time deadlines are measured from, by default the current time
+
+        Returns:
+            The new scores of every task whose scores changed, None for
+            removed tasks; also published when not empty
+
+        Raises:
+            KeyError: If the task is unknown
+            ValueError: If the changes modify the task ID
+            TypeError: If the changed task has invalid criteria; the task
+                is left unchanged
+        """
+        task = self._tasks.get(task_id)
+        if task is None:
+            raise KeyError(f"Unknown task {task_id}")
+        if changes.get('id', task_id) != task_id:
+            raise ValueError("Task IDs cannot be changed")
+
+        changed_task = {**task, **changes}
+        deltas: Dict[Any, Optional[Dict[str, float]]] = {}
+        if 'subtasks' in changes:
+            # Score the new subtree before touching the index, so invalid
+            # criteria leave everything as it was
+            scored = self.calculator._score_batch([changed_task], now)
+            parent_id = self._parents[task_id]
+            for removed in self._forget(task_id):
+                deltas[removed] = None
+            task.update(changes)
+            self.calculator._record_scores(*scored)
+            for indexed in self._index(task, parent_id):
+                deltas[indexed] = self.scores[indexed]
+        elif task.get('subtasks'):
+            # A parent's scores are the averages of its subtasks' scores
+            task.update(changes)
+            return {}
+        else:
+            inputs = self._leaf_inputs(changed_task)
+            task.update(changes)
+            if inputs == self._inputs[task_id]:
+                return {}
+            self._inputs[task_id] = inputs
+            new_scores = {'importance': importance_from_inputs(*inputs[0]),
+                          'urgency': urgency_from_inputs(*inputs[1], now=now)}
+            if new_scores == self.scores[task_id]:
+                return {}
+            self.scores[task_id] = new_scores
+            deltas[task_id] = new_scores
+
+        deltas.update(self._propagate(task_id))
+        self._publish(task_id, deltas)
+        return deltas
+
+    def _propagate(self, task_id: Any) -> Dict[Any, Dict[str, float]]:
+        """Recompute the averages of a task's ancestors until one stays the same."""
+        deltas = {}
+        parent_id = self._parents.get(task_id)
+        while parent_id is not None:
+            children = [self.scores[subtask['id']] for subtask in self._tasks[parent_id]['subtasks']]
+            new_scores = {'importance': sum(score['importance'] for score in children) / len(children),
+                          'urgency': sum(score['urgency'] for score in children) / len(children)}
+            if new_scores == self.scores.get(parent_id):
+                break
+            self.scores[parent_id] = new_scores
+            deltas[parent_id] = new_scores
+            parent_id = self._parents.get(parent_id)
+        return deltas
+
+    def _publish(self, task_id: Any, deltas: Dict[Any, Optional[Dict[str, float]]]) -> None:
+        """Send score deltas to the publisher without blocking on the event loop."""
+        if not deltas or self.publisher is None:
+            return
+        task_data = {'event': 'scores_changed', 'task_id': task_id, 'scores': deltas}
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if self.pending and (self.loop or running) is not None:
+            # Queued updates go out first, so later deltas are not overtaken
+            self.pending.append(task_data)
+            self._schedule(self.publish_pending(), running)
+            return
+        try:
+            result = self.publisher(task_data, self.project_id)
+            if not asyncio.iscoroutine(result):
+                return
+            if self.loop is None and running is None:
+                # Never start a loop of our own; whoever owns one drains the queue
+                result.close()
+                self.pending.append(task_data)
+                return
+            self._schedule(result, running)
+        except Exception as e:
+            logger.warning(f"Failed to publish score update for task {task_id}: {e}")
+
+    def _schedule(self, coroutine: Awaitable[Any], running: Optional[asyncio.AbstractEventLoop]) -> None:
+        if self.loop is not None and self.loop is not running:
+            asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        else:
+            (running or self.loop).create_task(coroutine)
+
+    async def publish_pending(self) -> int:
+        """
+        Publish the updates queued while no event loop was available.
+
+        Call this from the loop serving the real-time stream, for example
+        after editing tasks from synchronous code.
+
+        Returns:
+            Number of updates published
+        """
+        published = 0
+        while self.pending:
+            task_data = self.pending.popleft()
+            try:
+                result = self.publisher(task_data, self.project_id)
+                if asyncio.iscoroutine(result):
+                    await result
+                published += 1
+            except Exception as e:
+                logger.warning(f"Failed to publish score update for task {task_data['task_id']}: {e}")
+        return published
+
+    def save_scores(self, path: str) -> None:
+        """Save the scores as JSON, like the calculator's scores file."""
+        get_data_store().save_json(path, self.scores)
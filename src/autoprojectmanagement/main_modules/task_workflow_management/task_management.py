@@ -1,12 +1,41 @@
 import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+from autoprojectmanagement.main_modules.task_workflow_management.task_priority_queue import TaskPriorityQueue
+from autoprojectmanagement.main_modules.task_workflow_management.urgency_index import (
+    DeadlineScore, EISENHOWER_THRESHOLD, UrgencyIndex
+)
+
+# Factors scored 1-10 per task; the importance and urgency of a task are
+# the sums of its factors, clamped to 1-100
+IMPORTANCE_FACTORS = (
+    "dependency", "critical_path", "schedule_impact", "cost_impact", "key_objectives",
+    "risk_complexity", "resource_rarity", "stakeholder_priority", "milestone_role",
+    "quality_impact", "bottleneck_potential", "reuse_frequency",
+)
+URGENCY_FACTORS = (
+    "deadline_proximity", "next_activity_dependency", "high_delay_risk", "immediate_decision",
+    "stakeholder_pressure", "limited_resource_time", "competitive_advantage",
+    "critical_issue_fix", "external_schedule_coordination", "high_compensatory_cost",
+)
+FACTOR_MIN = 1.0
+FACTOR_MAX = 10.0
+NEUTRAL_FACTOR = 5.0
+SCORE_MIN = 1
+SCORE_MAX = 100
+# Deadlines further away than this add the least urgency
+DEADLINE_HORIZON_DAYS = 30
+SECONDS_PER_DAY = 24 * 3600
+# TaskFactorModel methods holding the factor rules; score sums the factors
+# directly only while none of them is overridden
+FACTOR_RULE_METHODS = ("derived_factors", "importance_factors", "urgency_factors")
 
 class Task:
     def __init__(self, id: int, title: str, description: str = "", deadline: Optional[datetime.date] = None,
                  dependencies: Optional[List[int]] = None, assigned_to: Optional[List[str]] = None,
                  status: str = "pending", priority: int = 0, parent_id: Optional[int] = None,
                  urgency: Optional[float] = None, importance: Optional[float] = None,
-                 github_issue_number: Optional[int] = None):
+                 github_issue_number: Optional[int] = None, factors: Optional[Dict[str, float]] = None):
         self.id = id
         self.title = title
         self.description = description
@@ -19,6 +48,8 @@ class Task:
         self.urgency = urgency
         self.importance = importance
         self.github_issue_number = github_issue_number
+        # Known importance/urgency factor values (1-10), used as given
+        self.factors = factors or {}
         # Workflow steps completion status: dict of step name to bool
         self.workflow_steps = {
             "Coding": False,
@@ -41,10 +72,148 @@ class Task:
         completed_steps = sum(1 for completed in self.workflow_steps.values() if completed)
         return (completed_steps / total_steps) * 100 if total_steps > 0 else 0
 
+def _clamp(value: float, low: float, high: float) -> float:
+    return max(low, min(high, value))
+
+class TaskFactorModel:
+    """
+    Deterministic importance and urgency factors of tasks.
+
+    Factors are derived from what a task records: the number of tasks
+    depending on it, its priority and its deadline. Other factors are
+    neutral unless given in ``task.factors``. Subclass and override
+    derived_factors, importance_factors/urgency_factors or score to plug
+    in other rules; score follows overridden factor methods.
+    """
+
+    def __init__(self, today: Optional[datetime.date] = None, neutral: float = NEUTRAL_FACTOR):
+        self.today = today
+        self._neutral_importance = dict.fromkeys(IMPORTANCE_FACTORS, neutral)
+        self._neutral_urgency = dict.fromkeys(URGENCY_FACTORS, neutral)
+        # Sums of the factors that are always neutral without task.factors
+        self._importance_base = neutral * (len(IMPORTANCE_FACTORS) - 3)
+        self._urgency_base = neutral * (len(URGENCY_FACTORS) - 3)
+        self._default_rules = all(getattr(type(self), name) is getattr(TaskFactorModel, name)
+                                  for name in FACTOR_RULE_METHODS)
+
+    def _today(self) -> datetime.date:
+        return self.today or datetime.date.today()
+
+    def derived_factors(self, task: Task, dependents: int = 0) -> Tuple[float, float, float]:
+        """
+        Score the factors derived from what a task records.
+
+        Args:
+            task: Task to score
+            dependents: Number of tasks depending on it
+
+        Returns:
+            Tuple of the linked-task factor (dependency, bottleneck potential
+            and next activity dependency), the priority factor (stakeholder
+            priority and pressure) and the deadline proximity, each 1-10
+        """
+        linked = FACTOR_MIN + dependents
+        if linked > FACTOR_MAX:
+            linked = FACTOR_MAX
+        priority = task.priority or FACTOR_MIN
+        if priority < FACTOR_MIN:
+            priority = FACTOR_MIN
+        elif priority > FACTOR_MAX:
+            priority = FACTOR_MAX
+        proximity = FACTOR_MIN
+        if task.deadline:
+            days_left = (task.deadline - self._today()).days
+            if days_left <= 0:
+                proximity = FACTOR_MAX
+            elif days_left < DEADLINE_HORIZON_DAYS:
+                proximity = FACTOR_MAX - (FACTOR_MAX - FACTOR_MIN) * days_left / DEADLINE_HORIZON_DAYS
+        return linked, priority, proximity
+
+    def importance_factors(self, task: Task, dependents: int = 0) -> Dict[str, float]:
+        """
+        Score the importance factors of a task.
+
+        Args:
+            task: Task to score
+            dependents: Number of tasks depending on it
+        """
+        linked, priority, _ = self.derived_factors(task, dependents)
+        factors = dict(self._neutral_importance)
+        factors["dependency"] = linked
+        factors["bottleneck_potential"] = linked
+        factors["stakeholder_priority"] = priority
+        if task.factors:
+            factors.update((name, value) for name, value in task.factors.items() if name in factors)
+        return factors
+
+    def urgency_factors(self, task: Task, dependents: int = 0) -> Dict[str, float]:
+        """
+        Score the urgency factors of a task.
+
+        Args:
+            task: Task to score
+            dependents: Number of tasks depending on it
+        """
+        linked, priority, proximity = self.derived_factors(task, dependents)
+        factors = dict(self._neutral_urgency)
+        factors["deadline_proximity"] = proximity
+        factors["next_activity_dependency"] = linked
+        factors["stakeholder_pressure"] = priority
+        if task.factors:
+            factors.update((name, value) for name, value in task.factors.items() if name in factors)
+        return factors
+
+    def score(self, task: Task, dependents: int = 0):
+        """
+        Score a task.
+
+        Args:
+            task: Task to score
+            dependents: Number of tasks depending on it
+
+        Returns:
+            Tuple of importance and urgency, each 1-100
+        """
+        if task.factors or not self._default_rules:
+            importance = sum(self.importance_factors(task, dependents).values())
+            urgency = sum(self.urgency_factors(task, dependents).values())
+            return _clamp(importance, SCORE_MIN, SCORE_MAX), _clamp(urgency, SCORE_MIN, SCORE_MAX)
+
+        # The factor sums without building the factors
+        linked, priority, proximity = self.derived_factors(task, dependents)
+        importance = self._importance_base + 2 * linked + priority
+        urgency = self._urgency_base + proximity + linked + priority
+        return _clamp(importance, SCORE_MIN, SCORE_MAX), _clamp(urgency, SCORE_MIN, SCORE_MAX)
+
+    def urgency_score(self, task: Task, dependents: int = 0) -> DeadlineScore:
+        """
+        Urgency of a task as a function of time, for an UrgencyIndex.
+
+        Deadline proximity rises one step a day over the last
+        DEADLINE_HORIZON_DAYS days; the other factors do not change. The
+        urgency is constant for models with a fixed ``today`` and for
+        models overriding score or the factor rules.
+        """
+        if self.today is not None or type(self).score is not TaskFactorModel.score or not self._default_rules:
+            return DeadlineScore(self.score(task, dependents)[1])
+        factors = self.urgency_factors(task, dependents)
+        if "deadline_proximity" in task.factors or not task.deadline:
+            return DeadlineScore(_clamp(sum(factors.values()), SCORE_MIN, SCORE_MAX))
+        base = sum(value for name, value in factors.items() if name != "deadline_proximity") + FACTOR_MIN
+        if base < SCORE_MIN or base + FACTOR_MAX - FACTOR_MIN > SCORE_MAX:
+            # Clamped sums do not rise linearly
+            return DeadlineScore(self.score(task, dependents)[1])
+        deadline = datetime.datetime.combine(task.deadline, datetime.time.min).timestamp()
+        return DeadlineScore.ramp(deadline, DEADLINE_HORIZON_DAYS * SECONDS_PER_DAY, FACTOR_MAX - FACTOR_MIN,
+                                  base=base, step=SECONDS_PER_DAY)
+
 class TaskManagement:
-    def __init__(self):
+    def __init__(self, factor_model: Optional[TaskFactorModel] = None):
         self.tasks: Dict[int, Task] = {}
         self.next_task_id = 1
+        self.factor_model = factor_model or TaskFactorModel()
+        self.urgency_index: Optional[UrgencyIndex] = None
+        self.priority_queue: Optional[TaskPriorityQueue] = None
 
     def update_workflow_steps_from_commit_message(self, commit_message: str):
         """
@@ -109,98 +278,138 @@ class TaskManagement:
             if score:
                 task.importance = score.get('importance', 0)
 
+    def build_hierarchy_index(self):
+        """
+        Index the task hierarchy in one pass over the tasks.
+
+        Returns:
+            Tuple of the child IDs of every task, the root task IDs (tasks
+            without a known parent) and the number of tasks depending on
+            every task
+        """
+        children: Dict[int, List[int]] = {task_id: [] for task_id in self.tasks}
+        dependents: Dict[int, int] = dict.fromkeys(self.tasks, 0)
+        roots = []
+        for task in self.tasks.values():
+            if task.parent_id in children and task.parent_id != task.id:
+                children[task.parent_id].append(task.id)
+            else:
+                roots.append(task.id)
+            for dep_id in task.dependencies:
+                if dep_id in dependents:
+                    dependents[dep_id] += 1
+        return children, roots, dependents
+
     def calculate_urgency_importance(self):
         """
         Calculate urgency and importance for each task at the lowest level,
         then propagate these values up the hierarchy.
         Urgency relates to time and deadlines, importance relates to task significance.
+
+        Leaf tasks are scored by the factor model; every parent gets the sums
+        of its children's values, accumulated bottom-up in one pass.
         """
-        import random
-
-        def calculate_importance_factors(task: Task) -> float:
-            # Simulate importance factors with weighted random values between 1 and 100
-            factors = {
-                "dependency": random.uniform(1, 10),
-                "critical_path": random.uniform(1, 10),
-                "schedule_impact": random.uniform(1, 10),
-                "cost_impact": random.uniform(1, 10),
-                "key_objectives": random.uniform(1, 10),
-                "risk_complexity": random.uniform(1, 10),
-                "resource_rarity": random.uniform(1, 10),
-                "stakeholder_priority": random.uniform(1, 10),
-                "milestone_role": random.uniform(1, 10),
-                "quality_impact": random.uniform(1, 10),
-                "bottleneck_potential": random.uniform(1, 10),
-                "reuse_frequency": random.uniform(1, 10),
-            }
-            importance_score = sum(factors.values())
-            # Scale to 1-100
-            return max(1, min(100, importance_score))
-
-        def calculate_urgency_factors(task: Task) -> float:
-            # Simulate urgency factors with weighted random values between 1 and 100
-            factors = {
-                "deadline_proximity": random.uniform(1, 10),
-                "next_activity_dependency": random.uniform(1, 10),
-                "high_delay_risk": random.uniform(1, 10),
-                "immediate_decision": random.uniform(1, 10),
-                "stakeholder_pressure": random.uniform(1, 10),
-                "limited_resource_time": random.uniform(1, 10),
-                "competitive_advantage": random.uniform(1, 10),
-                "critical_issue_fix": random.uniform(1, 10),
-                "external_schedule_coordination": random.uniform(1, 10),
-                "high_compensatory_cost": random.uniform(1, 10),
-            }
-            urgency_score = sum(factors.values())
-            # Scale to 1-100
-            return max(1, min(100, urgency_score))
+        children, roots, dependents = self.build_hierarchy_index()
+        score = self.factor_model.score
 
         # Calculate urgency and importance for leaf tasks
-        for task in self.tasks.values():
-            if not any(t.parent_id == task.id for t in self.tasks.values()):
-                # Leaf task
-                task.importance = calculate_importance_factors(task)
-                task.urgency = calculate_urgency_factors(task)
-
-        # Propagate urgency and importance up the hierarchy
-        def propagate(task_id):
-            children = [t for t in self.tasks.values() if t.parent_id == task_id]
-            if not children:
-                return self.tasks[task_id].urgency, self.tasks[task_id].importance
-            urgency_sum = 0
-            importance_sum = 0
-            for child in children:
-                u, i = propagate(child.id)
-                urgency_sum += u
-                importance_sum += i
-            # Average or weighted sum can be used; here simple sum
-            self.tasks[task_id].urgency = urgency_sum
-            self.tasks[task_id].importance = importance_sum
-            return urgency_sum, importance_sum
-
-        # Find root tasks (no parent)
-        root_tasks = [t for t in self.tasks.values() if t.parent_id is None]
-        for root in root_tasks:
-            propagate(root.id)
+        for task_id, task in self.tasks.items():
+            if not children[task_id]:
+                task.importance, task.urgency = score(task, dependents[task_id])
+
+        # Propagate urgency and importance up the hierarchy: a task is
+        # summed once all its children have been
+        tasks = self.tasks
+        for root in roots:
+            stack = [(root, False)]
+            while stack:
+                task_id, expanded = stack.pop()
+                child_ids = children[task_id]
+                if not child_ids:
+                    continue
+                if expanded:
+                    task = tasks[task_id]
+                    task.urgency = sum(tasks[child_id].urgency for child_id in child_ids)
+                    task.importance = sum(tasks[child_id].importance for child_id in child_ids)
+                else:
+                    stack.append((task_id, True))
+                    stack.extend((child_id, False) for child_id in child_ids)
+
+    def track_urgency(self, index: Optional[UrgencyIndex] = None) -> UrgencyIndex:
+        """
+        Keep classify_tasks_eisenhower current as deadlines approach.
+
+        Scores the tasks, then indexes every task's urgency over time: leaves
+        from the factor model, parents as the sums of their children. The
+        index knows when each task becomes urgent, so classifying only
+        updates the tasks whose moment has passed. Call it again after tasks
+        are added or changed.
+
+        Args:
+            index: Index to fill, by default a new one with the Eisenhower thresholds
+
+        Returns:
+            The index, also kept as ``urgency_index``
+        """
+        self.calculate_urgency_importance()
+        children, roots, dependents = self.build_hierarchy_index()
+        scores: Dict[int, DeadlineScore] = {}
+        for root in roots:
+            stack = [(root, False)]
+            while stack:
+                task_id, expanded = stack.pop()
+                child_ids = children[task_id]
+                if not child_ids:
+                    scores[task_id] = self.factor_model.urgency_score(self.tasks[task_id], dependents[task_id])
+                elif expanded:
+                    scores[task_id] = DeadlineScore.total(scores[child_id] for child_id in child_ids)
+                else:
+                    stack.append((task_id, True))
+                    stack.extend((child_id, False) for child_id in child_ids)
+
+        index = index or UrgencyIndex()
+        for task_id, score in scores.items():
+            index.set(task_id, self.tasks[task_id].importance, score)
+        index.subscribe(self._update_crossed_urgency)
+        self.urgency_index = index
+        return index
+
+    def _update_crossed_urgency(self, changed: Dict[int, str]):
+        for task_id in changed:
+            if task_id in self.tasks and self.urgency_index is not None and task_id in self.urgency_index:
+                self.tasks[task_id].urgency = self.urgency_index.urgency(task_id)
+                if self.priority_queue is not None and task_id in self.priority_queue:
+                    self.reprioritize_task(task_id)
 
     def classify_tasks_eisenhower(self):
         """
         Classify tasks into Eisenhower matrix quadrants based on importance and urgency.
         Returns a dict with keys: 'do_now', 'schedule', 'delegate', 'eliminate'
+
+        Tasks tracked by ``urgency_index`` are classified as of now, after
+        updating those that became urgent since they were scored.
         """
         do_now = []
         schedule = []
         delegate = []
         eliminate = []
+        quadrants = {"do_now": do_now, "schedule": schedule, "delegate": delegate, "eliminate": eliminate}
+
+        index = self.urgency_index
+        if index is not None:
+            index.advance()
 
         for task in self.tasks.values():
+            if index is not None and task.id in index:
+                quadrants[index.quadrant(task.id)].append(task)
+                continue
             if task.importance is None or task.urgency is None:
                 continue
-            if task.importance >= 70 and task.urgency >= 70:
+            if task.importance >= EISENHOWER_THRESHOLD and task.urgency >= EISENHOWER_THRESHOLD:
                 do_now.append(task)
-            elif task.importance >= 70 and task.urgency < 70:
+            elif task.importance >= EISENHOWER_THRESHOLD and task.urgency < EISENHOWER_THRESHOLD:
                 schedule.append(task)
-            elif task.importance < 70 and task.urgency >= 70:
+            elif task.importance < EISENHOWER_THRESHOLD and task.urgency >= EISENHOWER_THRESHOLD:
                 delegate.append(task)
             else:
                 eliminate.append(task)
@@ -233,18 +442,51 @@ class TaskManagement:
         # Additional factors can be added here
         return base_importance
 
-    def prioritize_tasks(self):
+    @staticmethod
+    def _task_priority(task: Task):
+        # Combine urgency and importance with different weights
+        return (task.importance * 0.7 + task.urgency * 0.3, task.deadline or datetime.date.max)
+
+    def prioritize_tasks(self, limit: Optional[int] = None):
         """
         Prioritize tasks based on calculated urgency and importance.
+
+        Rebuilds ``priority_queue`` from the scored tasks, so top_tasks and
+        reprioritize_task can serve later queries without rescoring.
+
+        Args:
+            limit: Number of tasks to return, by default all of them
         """
         self.calculate_urgency_importance()
+        self.priority_queue = TaskPriorityQueue(
+            (task.id, self._task_priority(task), task) for task in self.tasks.values()
+        )
+        return self.priority_queue.top(limit)
 
-        def task_priority(task: Task):
-            # Combine urgency and importance with different weights
-            return (task.importance * 0.7 + task.urgency * 0.3, task.deadline or datetime.date.max)
+    def top_tasks(self, k: int):
+        """
+        Get the k highest-priority tasks in O(k log n).
+
+        Served from ``priority_queue``; the tasks are scored and queued
+        first if prioritize_tasks has not been called yet.
+        """
+        if self.priority_queue is None:
+            return self.prioritize_tasks(k)
+        return self.priority_queue.top(k)
 
-        sorted_tasks = sorted(self.tasks.values(), key=task_priority, reverse=True)
-        return sorted_tasks
+    def reprioritize_task(self, task_id: int):
+        """
+        Move a task in ``priority_queue`` after its urgency or importance changed.
+
+        Tasks that were removed, or are not scored yet, leave the queue.
+        """
+        if self.priority_queue is None:
+            return
+        task = self.tasks.get(task_id)
+        if task is None or task.importance is None or task.urgency is None:
+            self.priority_queue.discard(task_id)
+        else:
+            self.priority_queue.push(task_id, self._task_priority(task), task)
 
     def schedule_tasks(self):
         """
@@ -0,0 +1,229 @@
+"""
+Task Priority Queue Module - Indexed priority queue of tasks keyed by score
+
+Tasks are kept in a binary max-heap together with a map from task ID to
+heap position, so a task's score can be changed or the task removed in
+O(log n) without rebuilding the queue. The K highest-scoring tasks are
+read in O(K log K) by walking the heap from its root, leaving the queue
+as it was.
+
+Example usage:
+
+    queue = TaskPriorityQueue()
+    queue.push('T1', 0.82, task)
+    queue.update('T1', 0.91)
+    next_tasks = queue.top(5)
+"""
+
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+# Heap entry fields
+SCORE = 0
+SEQUENCE = 1
+KEY = 2
+ITEM = 3
+
+
+def _before(first: list, second: list) -> bool:
+    """Whether an entry ranks ahead of another: higher score, then earlier insertion."""
+    if first[SCORE] == second[SCORE]:
+        return first[SEQUENCE] < second[SEQUENCE]
+    return first[SCORE] > second[SCORE]
+
+
+def _sift_up(heap: List[list], position: int, positions: Optional[Dict[Any, int]] = None) -> None:
+    entry = heap[position]
+    while position > 0:
+        parent = (position - 1) >> 1
+        if not _before(entry, heap[parent]):
+            break
+        heap[position] = heap[parent]
+        if positions is not None:
+            positions[heap[position][KEY]] = position
+        position = parent
+    heap[position] = entry
+    if positions is not None:
+        positions[entry[KEY]] = position
+
+
+def _sift_down(heap: List[list], position: int, positions: Optional[Dict[Any, int]] = None) -> None:
+    size = len(heap)
+    entry = heap[position]
+    while True:
+        child = 2 * position + 1
+        if child >= size:
+            break
+        if child + 1 < size and _before(heap[child + 1], heap[child]):
+            child += 1
+        if not _before(heap[child], entry):
+            break
+        heap[position] = heap[child]
+        if positions is not None:
+            positions[heap[position][KEY]] = position
+        position = child
+    heap[position] = entry
+    if positions is not None:
+        positions[entry[KEY]] = position
+
+
+class TaskPriorityQueue:
+    """
+    Tasks ordered by score, highest first, with update-key support.
+
+    Scores can be any mutually comparable values, such as numbers or
+    tuples of tie-breakers. Tasks with equal scores keep the order in
+    which they were first pushed, like a stable sort.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[Hashable, Any, Any]] = ()):
+        """
+        Build a queue from (key, score, item) entries in O(n).
+
+        Raises:
+            ValueError: If a key appears more than once
+        """
+        self._heap: List[list] = []
+        self._positions: Dict[Any, int] = {}
+        self._sequence = 0
+        for key, score, item in entries:
+            if key in self._positions:
+                raise ValueError(f"Duplicate task key {key!r}")
+            self._positions[key] = len(self._heap)
+            self._heap.append([score, self._next_sequence(), key, item])
+        for position in reversed(range(len(self._heap) // 2)):
+            _sift_down(self._heap, position, self._positions)
+
+    def _next_sequence(self) -> int:
+        self._sequence += 1
+        return self._sequence
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._positions
+
+    def push(self, key: Hashable, score: Any, item: Any = None) -> None:
+        """Add a task, or replace the score and item of a queued one."""
+        position = self._positions.get(key)
+        if position is None:
+            self._positions[key] = len(self._heap)
+            self._heap.append([score, self._next_sequence(), key, item])
+            _sift_up(self._heap, len(self._heap) - 1, self._positions)
+            return
+        self._heap[position][ITEM] = item
+        self._reposition(position, score)
+
+    def update(self, key: Hashable, score: Any) -> None:
+        """
+        Change the score of a queued task.
+
+        Raises:
+            KeyError: If the task is not queued
+        """
+        self._reposition(self._positions[key], score)
+
+    def _reposition(self, position: int, score: Any) -> None:
+        entry = self._heap[position]
+        previous, entry[SCORE] = entry[SCORE], score
+        if score > previous:
+            _sift_up(self._heap, position, self._positions)
+        elif score < previous:
+            _sift_down(self._heap, position, self._positions)
+
+    def remove(self, key: Hashable) -> Any:
+        """
+        Remove a task and return its item.
+
+        Raises:
+            KeyError: If the task is not queued
+        """
+        position = self._positions.pop(key)
+        entry = self._heap[position]
+        last = self._heap.pop()
+        if position < len(self._heap):
+            self._heap[position] = last
+            self._positions[last[KEY]] = position
+            if _before(last, entry):
+                _sift_up(self._heap, position, self._positions)
+            else:
+                _sift_down(self._heap, position, self._positions)
+        return entry[ITEM]
+
+    def discard(self, key: Hashable) -> None:
+        """Remove a task if it is queued."""
+        if key in self._positions:
+            self.remove(key)
+
+    def clear(self) -> None:
+        """Remove all tasks."""
+        self._heap.clear()
+        self._positions.clear()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get the item of a queued task."""
+        position = self._positions.get(key)
+        return default if position is None else self._heap[position][ITEM]
+
+    def score(self, key: Hashable) -> Any:
+        """
+        Get the score of a queued task.
+
+        Raises:
+            KeyError: If the task is not queued
+        """
+        return self._heap[self._positions[key]][SCORE]
+
+    def peek(self) -> Any:
+        """
+        Get the item of the highest-scoring task.
+
+        Raises:
+            IndexError: If the queue is empty
+        """
+        if not self._heap:
+            raise IndexError("peek from an empty task queue")
+        return self._heap[0][ITEM]
+
+    def pop(self) -> Any:
+        """
+        Remove the highest-scoring task and return its item.
+
+        Raises:
+            IndexError: If the queue is empty
+        """
+        if not self._heap:
+            raise IndexError("pop from an empty task queue")
+        return self.remove(self._heap[0][KEY])
+
+    def top(self, k: Optional[int] = None) -> List[Any]:
+        """
+        Get the items of the k highest-scoring tasks, highest first.
+
+        The heap is left untouched: its best entries are expanded one at a
+        time through a second heap of candidates, which never holds more
+        than k + 1 entries.
+
+        Args:
+            k: Number of tasks, by default all of them
+        """
+        heap = self._heap
+        k = len(heap) if k is None else min(k, len(heap))
+        if k <= 0:
+            return []
+        result = []
+        candidates = [heap[0]]
+        positions = self._positions
+        while len(result) < k:
+            best = candidates[0]
+            result.append(best[ITEM])
+            first_child = 2 * positions[best[KEY]] + 1
+            last = candidates.pop()
+            if candidates:
+                candidates[0] = last
+                _sift_down(candidates, 0)
+            for child in (first_child, first_child + 1):
+                if child < len(heap):
+                    candidates.append(heap[child])
+                    _sift_up(candidates, len(candidates) - 1)
+        return result
@@ -0,0 +1,345 @@
+"""
+Urgency Index Module - Time-decay urgency with precomputed Eisenhower threshold crossings
+
+Deadline-based urgency only rises as time passes: it grows linearly, or in
+steps, while a deadline is within a window. A task therefore crosses an
+Eisenhower threshold at most once. The index computes that moment for each
+task when the task is added and keeps the moments in a timer heap. As time
+advances, it updates only the tasks whose moment has come, instead of
+rescoring every task periodically.
+
+Example usage:
+
+    index = UrgencyIndex()
+    index.set('T1', importance=80, urgency=DeadlineScore.ramp(deadline, window=3 * 86400, weight=50, base=30))
+    index.subscribe(lambda changed: print(changed))
+    index.start()
+"""
+
+import bisect
+import heapq
+import logging
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Scores (1-100) from which a task counts as important or urgent
+EISENHOWER_THRESHOLD = 70
+
+DO_NOW = 'do_now'
+SCHEDULE = 'schedule'
+DELEGATE = 'delegate'
+ELIMINATE = 'eliminate'
+QUADRANTS = (DO_NOW, SCHEDULE, DELEGATE, ELIMINATE)
+
+IMPORTANCE = 0
+URGENCY = 1
+
+
+def quadrant(important: bool, urgent: bool) -> str:
+    """Get the Eisenhower quadrant of a task."""
+    if important:
+        return DO_NOW if urgent else SCHEDULE
+    return DELEGATE if urgent else ELIMINATE
+
+
+def _ramp(moment: float, deadline: float, window: float, step: Optional[float]) -> float:
+    remaining = deadline - moment
+    if step:
+        remaining = math.ceil(remaining / step) * step
+    if remaining <= 0:
+        return 1.0
+    if remaining >= window:
+        return 0.0
+    return 1 - remaining / window
+
+
+class DeadlineScore:
+    """
+    A score that rises as deadlines approach.
+
+    The value at a moment is ``base`` plus, for every term, its weight times
+    a ramp. The ramp goes from 0, ``window`` seconds before the deadline,
+    linearly to 1 at the deadline. With a ``step``, the time left is rounded
+    up to whole steps, so the ramp rises in steps, like day-based scores.
+
+    Attributes:
+        base: Value before any deadline is within its window
+        terms: (weight, deadline, window, step) of each ramp; times in epoch seconds
+    """
+
+    __slots__ = ('base', 'terms')
+
+    def __init__(self, base: float = 0.0, terms: Iterable[Tuple[float, float, float, Optional[float]]] = ()):
+        self.base = base
+        self.terms = list(terms)
+        for weight, _, window, step in self.terms:
+            if weight < 0 or window <= 0 or (step is not None and step <= 0):
+                raise ValueError("Deadline terms need a non-negative weight and positive window and step")
+
+    @classmethod
+    def ramp(cls, deadline: Optional[float], window: float, weight: float, base: float = 0.0,
+             step: Optional[float] = None) -> 'DeadlineScore':
+        """Create a score with one deadline term; without a deadline the score is constant."""
+        if deadline is None:
+            return cls(base)
+        return cls(base, [(weight, deadline, window, step)])
+
+    @classmethod
+    def total(cls, scores: Iterable['DeadlineScore'], factor: float = 1.0) -> 'DeadlineScore':
+        """Sum scores, scaled by a non-negative factor (1 / count for an average)."""
+        base, terms = 0.0, []
+        for score in scores:
+            base += score.base
+            terms.extend(score.terms)
+        if factor != 1.0:
+            base *= factor
+            terms = [(weight * factor, deadline, window, step) for weight, deadline, window, step in terms]
+        return cls(base, terms)
+
+    def value(self, moment: float) -> float:
+        """Get the score at an epoch time."""
+        return self.base + sum(weight * _ramp(moment, deadline, window, step)
+                               for weight, deadline, window, step in self.terms)
+
+    def crossing_time(self, threshold: float) -> Optional[float]:
+        """
+        Get the first moment at which the score reaches a threshold.
+
+        Returns:
+            Epoch seconds, -inf if the score is always at or above the
+            threshold, or None if it never reaches it
+        """
+        if self.base >= threshold:
+            return -math.inf
+        if self.base + sum(term[0] for term in self.terms) < threshold:
+            return None
+
+        # Every ramp is flat outside its breakpoints; stepped ramps jump at them
+        breakpoints = set()
+        for _, deadline, window, step in self.terms:
+            if step:
+                breakpoints.update(deadline - k * step for k in range(math.ceil(window / step) + 1))
+            else:
+                breakpoints.update((deadline - window, deadline))
+        points = sorted(breakpoints)
+
+        # The score only rises: find the last breakpoint still below the threshold
+        low, high = 0, len(points)
+        while low < high:
+            middle = (low + high) // 2
+            if self.value(points[middle]) < threshold:
+                low = middle + 1
+            else:
+                high = middle
+        if low == 0:
+            return points[0]
+        if low == len(points):
+            return points[-1]
+
+        start, end = points[low - 1], points[low]
+        slope = sum(weight / window for weight, deadline, window, step in self.terms
+                    if not step and deadline - window <= start < deadline)
+        if slope > 0:
+            moment = start + (threshold - self.value(start)) / slope
+            if moment < end:
+                return moment
+        return end
+
+
+Score = Union[float, DeadlineScore]
+Listener = Callable[[Dict[Any, str]], None]
+
+
+class UrgencyIndex:
+    """
+    Eisenhower quadrants of tasks kept current as deadlines approach.
+
+    Each task's importance and urgency are DeadlineScores (or constants).
+    The moments at which they reach their thresholds are computed once and
+    kept in a heap, and ``advance`` moves tasks to their new quadrant when
+    their moment has come. Deadlines are also kept sorted, for ``due_by``.
+
+    Attributes:
+        importance_threshold: Importance from which a task is important
+        urgency_threshold: Urgency from which a task is urgent
+        clock: Returns the current time in epoch seconds
+        now: Time the quadrants are current for
+    """
+
+    def __init__(self, importance_threshold: float = EISENHOWER_THRESHOLD,
+                 urgency_threshold: float = EISENHOWER_THRESHOLD,
+                 clock: Callable[[], float] = time.time):
+        self.importance_threshold = importance_threshold
+        self.urgency_threshold = urgency_threshold
+        self.clock = clock
+        self.now = clock()
+        self._scores: Dict[Any, Tuple[DeadlineScore, DeadlineScore]] = {}
+        self._flags: Dict[Any, List[bool]] = {}
+        self._versions: Dict[Any, int] = {}
+        self._heap: List[Tuple[float, int, Any, int, int]] = []
+        self._deadlines: List[Tuple[float, int, Any]] = []
+        self._deadline_keys: Dict[Any, Tuple[float, int, Any]] = {}
+        self._sequence = 0
+        self._listeners: List[Listener] = []
+        self._condition = threading.Condition(threading.RLock())
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def set(self, task_id: Any, importance: Score, urgency: Score) -> str:
+        """
+        Add a task, or replace its scores.
+
+        Returns:
+            The task's quadrant now
+        """
+        scores = tuple(score if isinstance(score, DeadlineScore) else DeadlineScore(float(score))
+                       for score in (importance, urgency))
+        with self._condition:
+            self._discard(task_id)
+            version = self._versions.get(task_id, 0) + 1
+            self._versions[task_id] = version
+            self._scores[task_id] = scores
+            flags = [False, False]
+            for kind, threshold in ((IMPORTANCE, self.importance_threshold), (URGENCY, self.urgency_threshold)):
+                moment = scores[kind].crossing_time(threshold)
+                if moment is None:
+                    continue
+                if moment <= self.now:
+                    flags[kind] = True
+                else:
+                    self._sequence += 1
+                    heapq.heappush(self._heap, (moment, self._sequence, task_id, kind, version))
+            self._flags[task_id] = flags
+
+            deadlines = [term[1] for term in scores[URGENCY].terms]
+            if deadlines:
+                self._sequence += 1
+                key = (min(deadlines), self._sequence, task_id)
+                bisect.insort(self._deadlines, key)
+                self._deadline_keys[task_id] = key
+            self._condition.notify()
+            return quadrant(*flags)
+
+    def _discard(self, task_id: Any) -> None:
+        # Heap entries of older versions are skipped when they come up
+        self._scores.pop(task_id, None)
+        self._flags.pop(task_id, None)
+        key = self._deadline_keys.pop(task_id, None)
+        if key is not None:
+            del self._deadlines[bisect.bisect_left(self._deadlines, key)]
+
+    def remove(self, task_id: Any) -> None:
+        """Stop tracking a task."""
+        with self._condition:
+            self._discard(task_id)
+            self._versions[task_id] = self._versions.get(task_id, 0) + 1
+
+    def __contains__(self, task_id: Any) -> bool:
+        return task_id in self._flags
+
+    def __len__(self) -> int:
+        return len(self._flags)
+
+    def subscribe(self, listener: Listener) -> None:
+        """Call a listener with {task ID: new quadrant} whenever tasks change quadrant."""
+        self._listeners.append(listener)
+
+    def advance(self, moment: Optional[float] = None) -> Dict[Any, str]:
+        """
+        Move the index forward to a time, updating the tasks whose thresholds fall due.
+
+        Args:
+            moment: Epoch seconds, by default the clock's current time;
+                times before the index's current time change nothing
+
+        Returns:
+            The new quadrant of every task that changed quadrant
+        """
+        moment = self.clock() if moment is None else moment
+        changed = {}
+        with self._condition:
+            if moment > self.now:
+                self.now = moment
+            while self._heap and self._heap[0][0] <= self.now:
+                _, _, task_id, kind, version = heapq.heappop(self._heap)
+                if self._versions.get(task_id) != version or task_id not in self._flags:
+                    continue
+                self._flags[task_id][kind] = True
+                changed[task_id] = quadrant(*self._flags[task_id])
+        if changed:
+            for listener in list(self._listeners):
+                try:
+                    listener(changed)
+                except Exception as e:
+                    logger.error(f"Urgency index listener failed: {e}")
+        return changed
+
+    def quadrant(self, task_id: Any) -> str:
+        """Get a task's quadrant as of the index's current time."""
+        return quadrant(*self._flags[task_id])
+
+    def quadrants(self, moment: Optional[float] = None) -> Dict[str, List[Any]]:
+        """Advance to a time and get the task IDs in each quadrant."""
+        self.advance(moment)
+        result: Dict[str, List[Any]] = {name: [] for name in QUADRANTS}
+        with self._condition:
+            for task_id, flags in self._flags.items():
+                result[quadrant(*flags)].append(task_id)
+        return result
+
+    def importance(self, task_id: Any, moment: Optional[float] = None) -> float:
+        """Get a task's importance at a time, by default the index's current time."""
+        return self._scores[task_id][IMPORTANCE].value(self.now if moment is None else moment)
+
+    def urgency(self, task_id: Any, moment: Optional[float] = None) -> float:
+        """Get a task's urgency at a time, by default the index's current time."""
+        return self._scores[task_id][URGENCY].value(self.now if moment is None else moment)
+
+    def next_crossing(self) -> Optional[float]:
+        """Get the epoch time of the next threshold crossing, if any."""
+        with self._condition:
+            while self._heap:
+                _, _, task_id, _, version = self._heap[0]
+                if self._versions.get(task_id) == version and task_id in self._flags:
+                    return self._heap[0][0]
+                heapq.heappop(self._heap)
+            return None
+
+    def due_by(self, moment: float) -> List[Any]:
+        """Get the tasks whose earliest urgency deadline is at or before a time, soonest first."""
+        with self._condition:
+            end = bisect.bisect_right(self._deadlines, (moment, math.inf))
+            return [task_id for _, _, task_id in self._deadlines[:end]]
+
+    def start(self) -> None:
+        """Advance the index from a background thread whenever a crossing falls due."""
+        with self._condition:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run_loop, name='urgency-index', daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run_loop(self) -> None:
+        while True:
+            with self._condition:
+                if self._stopped:
+                    return
+                due = self.next_crossing()
+                if due is None or due > self.clock():
+                    self._condition.wait(None if due is None else due - self.clock())
+                    continue
+            self.advance()
@@ -0,0 +1,95 @@
+"""
+Base Management Module - Common load/analyze/save workflow of the management modules
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from autoprojectmanagement.main_modules.utility_modules.data_store import DataStore, get_data_store
+
+logger = logging.getLogger(__name__)
+
+
+class BaseManagement:
+    """
+    Base class for management operations with JSON I/O capabilities.
+
+    Inputs are read through a shared DataStore, so modules reading the same
+    file in one process share one parsed copy; they must not modify
+    ``inputs`` in place.
+
+    Attributes:
+        input_paths: Dictionary mapping input names to file paths
+        output_path: Path where output will be saved
+        inputs: Dictionary storing loaded input data
+        output: Dictionary storing processed output data
+        data_store: Store used to read and write JSON files
+    """
+
+    # Whether saved JSON has its object keys sorted
+    sort_keys = False
+
+    def __init__(self, input_paths: Dict[str, str], output_path: str,
+                 data_store: Optional[DataStore] = None) -> None:
+        """
+        Initialize BaseManagement with input and output paths.
+
+        Args:
+            input_paths: Dictionary mapping input names to file paths
+            output_path: Output file path for saving results
+            data_store: Store to use, by default the process-wide one
+        """
+        self.input_paths = input_paths
+        self.output_path = output_path
+        self.inputs: Dict[str, Any] = {}
+        self.output: Dict[str, Any] = {}
+        self.data_store = data_store or get_data_store()
+
+    def load_json(self, path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+        """
+        Load JSON data from a file.
+
+        Returns:
+            The parsed data, or None if the file does not exist
+
+        Raises:
+            json.JSONDecodeError: If the file contains invalid JSON
+        """
+        return self.data_store.load_json(path)
+
+    def save_json(self, data: Dict[str, Any], path: Union[str, Path]) -> None:
+        """Save data to a JSON file atomically, creating missing directories."""
+        self.data_store.save_json(path, data, sort_keys=self.sort_keys)
+
+    def load_inputs(self) -> None:
+        """Load all input JSON files specified in input_paths."""
+        for key, path in self.input_paths.items():
+            self.inputs[key] = self.load_json(path) or {}
+
+    def validate_inputs(self) -> bool:
+        """Check the loaded inputs before analysis; every input is accepted by default."""
+        return True
+
+    def analyze(self) -> None:
+        """
+        Process the loaded inputs into ``output``.
+
+        Raises:
+            NotImplementedError: Must be implemented by subclasses
+        """
+        raise NotImplementedError("Subclasses must implement analyze() method")
+
+    def run(self) -> None:
+        """
+        Load the inputs, analyze them and save the output.
+
+        Raises:
+            ValueError: If validate_inputs rejects the inputs
+        """
+        self.load_inputs()
+        if not self.validate_inputs():
+            raise ValueError("Invalid inputs provided")
+        self.analyze()
+        self.save_json(self.output, self.output_path)
+        logger.info(f"{self.__class__.__name__} output saved to {self.output_path}")
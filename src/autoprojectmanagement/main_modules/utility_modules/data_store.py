@@ -0,0 +1,220 @@
+"""
+Data Store Module - Shared JSON file access with a validated parse cache
+
+Every management module reads its inputs through one process-wide store,
+so a pipeline run parses each file once: a cached document is reused as
+long as the file's modification time and size are unchanged. Writes are
+atomic, and orjson is used for parsing and formatting when it is
+installed, with the standard json module as fallback.
+"""
+
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+ENCODING = 'utf-8'
+DEFAULT_INDENT = 2
+DEFAULT_MAX_ENTRIES = 256
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """
+    Write a text file through a temporary file and an atomic rename.
+
+    Readers see either the old or the new content, never a partial file.
+
+    Args:
+        path: Destination file path
+        text: File content
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding=ENCODING) as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def loads_json(content: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Documents orjson rejects are parsed again with the json module, which
+    also accepts NaN and Infinity and raises json.JSONDecodeError for
+    invalid documents.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(content, bytes):
+        content = content.decode(ENCODING)
+    return json.loads(content)
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Check whether data holds NaN or infinite floats, which orjson writes as null."""
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def dumps_json(data: Any, indent: Optional[int] = DEFAULT_INDENT, sort_keys: bool = False,
+               default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Format data as JSON text, like ``json.dumps(..., ensure_ascii=False)``.
+
+    orjson is used for the two-space indented format it supports; data it
+    cannot serialize, such as integers beyond 64 bits, or would write
+    differently, such as NaN, is formatted with the json module.
+    """
+    if orjson is not None and indent == DEFAULT_INDENT and not _has_non_finite(data):
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(data, default=default, option=option).decode(ENCODING)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=indent, ensure_ascii=False, sort_keys=sort_keys, default=default)
+
+
+class DataStore:
+    """
+    JSON files with a parse cache validated by modification time and size.
+
+    Loaded documents are shared between all callers of the store and must
+    be treated as read-only; ``load_json(path, copy=True)`` returns a
+    private copy to modify.
+
+    Attributes:
+        max_entries: Number of documents kept, least recently used dropped first
+        hits: Loads served from the cache
+        misses: Loads that parsed the file
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._cache: 'OrderedDict[str, Tuple[Tuple[int, int], Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path: Union[str, Path]) -> str:
+        return os.path.abspath(os.fspath(path))
+
+    def load_json(self, path: Union[str, Path], copy: bool = False) -> Any:
+        """
+        Load a JSON file, parsing it only if it changed since it was cached.
+
+        Args:
+            path: Path to the JSON file
+            copy: Return a freshly parsed document the caller may modify
+
+        Returns:
+            The parsed document, or None if the file does not exist
+
+        Raises:
+            json.JSONDecodeError: If the file contains invalid JSON
+            OSError: If the file cannot be read
+        """
+        key = self._key(path)
+        try:
+            stat = os.stat(key)
+        except FileNotFoundError:
+            self.invalidate(key)
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        if not copy:
+            with self._lock:
+                entry = self._cache.get(key)
+                if entry is not None and entry[0] == signature:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+
+        with open(key, 'rb') as file:
+            stat = os.fstat(file.fileno())
+            content = file.read()
+        data = loads_json(content)
+        if copy:
+            return data
+
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = ((stat.st_mtime_ns, stat.st_size), data)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return data
+
+    def save_json(self, path: Union[str, Path], data: Any, indent: Optional[int] = DEFAULT_INDENT,
+                  sort_keys: bool = False, default: Optional[Callable[[Any], Any]] = None) -> None:
+        """
+        Write data to a JSON file atomically, creating missing directories.
+
+        Args:
+            path: Destination file path
+            data: Data to save
+            indent: Indentation, as for json.dumps
+            sort_keys: Sort object keys
+            default: Conversion for objects JSON cannot represent
+
+        Raises:
+            TypeError: If the data cannot be serialized
+            OSError: If the file cannot be written
+        """
+        text = dumps_json(data, indent=indent, sort_keys=sort_keys, default=default)
+        key = self._key(path)
+        atomic_write_text(Path(key), text)
+        self.invalidate(key)
+
+    def invalidate(self, path: Optional[Union[str, Path]] = None) -> None:
+        """Drop the cached document of a file, or of every file."""
+        with self._lock:
+            if path is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(self._key(path), None)
+
+
+_default_store: Optional[DataStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_data_store() -> DataStore:
+    """Get the data store shared by every module of this process."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = DataStore()
+        return _default_store
@@ -1,18 +1,25 @@
 import json
 import os
-from datetime import datetime, timedelta
+
+from autoprojectmanagement.main_modules.utility_modules.working_calendar import (
+    DATE_FORMAT, ResourceCalendars, parse_date
+)
 
 class TimeManagement:
     def __init__(self,
                  detailed_wbs_path='JSonDataBase/Inputs/UserInputs/detailed_wbs.json',
                  resource_allocation_path='JSonDataBase/OutPuts/resource_allocation_enriched.json',
-                 output_path='JSonDataBase/OutPuts/time_management.json'):
+                 output_path='JSonDataBase/OutPuts/time_management.json',
+                 calendar_path=None,
+                 calendars=None):
         self.detailed_wbs_path = detailed_wbs_path
         self.resource_allocation_path = resource_allocation_path
         self.output_path = output_path
+        self.calendar_path = calendar_path
 
         self.detailed_wbs = {}
         self.resource_allocations = []
+        self.calendars = calendars or ResourceCalendars()
 
         self.task_schedules = {}
 
@@ -29,52 +36,101 @@ class TimeManagement:
     def load_inputs(self):
         self.detailed_wbs = self.load_json(self.detailed_wbs_path) or {}
         self.resource_allocations = self.load_json(self.resource_allocation_path) or {}
+        if self.calendar_path:
+            self.calendars = ResourceCalendars.from_config(self.load_json(self.calendar_path))
+
+    def _allocation_spans(self, task):
+        """
+        Parse the start and end dates of a task's allocations.
+        Date strings are parsed through a shared cache; allocations with a
+        missing or invalid date are skipped.
+        """
+        spans = []
+        for alloc in task.get('resource_allocations', []):
+            try:
+                start = parse_date(alloc.get('start_date'))
+                end = parse_date(alloc.get('end_date'))
+            except AttributeError:
+                continue
+            if start is not None and end is not None:
+                spans.append((alloc.get('resource_id'), start, end))
+        return spans
 
     def calculate_task_duration(self, task):
         """
         Calculate task duration based on resource allocations and working hours.
         For simplicity, assume duration is difference between earliest start and latest end dates.
         """
-        allocations = task.get('resource_allocations', [])
-        if not allocations:
+        spans = self._allocation_spans(task)
+        if not spans:
             return 0
-        start_dates = []
-        end_dates = []
-        for alloc in allocations:
-            try:
-                start_dates.append(datetime.strptime(alloc['start_date'], '%Y-%m-%d'))
-                end_dates.append(datetime.strptime(alloc['end_date'], '%Y-%m-%d'))
-            except Exception:
-                continue
-        if not start_dates or not end_dates:
-            return 0
-        duration = (max(end_dates) - min(start_dates)).days + 1
-        return duration
+        return (max(end for _, _, end in spans) - min(start for _, start, _ in spans)).days + 1
+
+    def calculate_resource_working_days(self, task):
+        """
+        Count the working days each resource is allocated to a task, on that
+        resource's own calendar.
+        """
+        working_days = {}
+        for resource_id, start, end in self._allocation_spans(task):
+            days = self.calendars.for_resource(resource_id).count_working_days(start, end)
+            working_days[resource_id] = working_days.get(resource_id, 0) + days
+        return working_days
 
     def schedule_tasks(self, node=None):
+        """
+        Schedule every task of the WBS from its resource allocations.
+        A task's dates span its own allocations and those of all its
+        subtasks; they are rolled up to the parents in one post-order pass.
+        Working days are counted on the default calendar, per-resource
+        effort on each resource's calendar.
+        """
         if node is None:
             node = self.detailed_wbs
         if not node:
             return
-        task_id = node.get('id')
-        duration = self.calculate_task_duration(node)
-        self.task_schedules[task_id] = {
-            'task_name': node.get('name'),
-            'duration_days': duration,
-            'start_date': None,
-            'end_date': None
-        }
-        allocations = node.get('resource_allocations', [])
-        if allocations:
-            try:
-                start_date = min(datetime.strptime(alloc['start_date'], '%Y-%m-%d') for alloc in allocations)
-                end_date = max(datetime.strptime(alloc['end_date'], '%Y-%m-%d') for alloc in allocations)
-                self.task_schedules[task_id]['start_date'] = start_date.strftime('%Y-%m-%d')
-                self.task_schedules[task_id]['end_date'] = end_date.strftime('%Y-%m-%d')
-            except Exception:
-                pass
-        for subtask in node.get('subtasks', []):
-            self.schedule_tasks(subtask)
+
+        # Pre-order keeps the output order of the tree; children are then
+        # finished before their parents by walking the order backwards
+        order = []
+        children = {}
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            order.append(current)
+            subtasks = [subtask for subtask in current.get('subtasks', []) if isinstance(subtask, dict)]
+            children[id(current)] = subtasks
+            stack.extend(reversed(subtasks))
+
+        for current in order:
+            self.task_schedules[current.get('id')] = {
+                'task_name': current.get('name'),
+                'duration_days': 0,
+                'working_days': 0,
+                'resource_working_days': {},
+                'start_date': None,
+                'end_date': None
+            }
+
+        spans = {}
+        for current in reversed(order):
+            own = self._allocation_spans(current)
+            starts = [start for _, start, _ in own]
+            ends = [end for _, _, end in own]
+            for child in children[id(current)]:
+                if spans.get(id(child)):
+                    starts.append(spans[id(child)][0])
+                    ends.append(spans[id(child)][1])
+
+            schedule = self.task_schedules[current.get('id')]
+            schedule['resource_working_days'] = self.calculate_resource_working_days(current)
+            if starts:
+                start_date, end_date = min(starts), max(ends)
+                spans[id(current)] = (start_date, end_date)
+                schedule['start_date'] = start_date.strftime(DATE_FORMAT)
+                schedule['end_date'] = end_date.strftime(DATE_FORMAT)
+                schedule['duration_days'] = (end_date - start_date).days + 1
+                schedule['working_days'] = self.calendars.default.count_working_days(start_date, end_date)
 
     def run(self):
         self.load_inputs()
@@ -0,0 +1,220 @@
+"""
+Working Calendar Module - Per-resource working calendars with working-day ordinals
+
+A WorkCalendar is a weekly pattern of working days plus holidays. Each
+OrdinalCalendar precomputes, for a range of days, how many working days come
+before every day. Counting or adding working days is then a subtraction
+or a binary search over that table instead of a day-by-day walk.
+"""
+
+import datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Union
+
+import numpy as np
+
+DateLike = Union[str, datetime.date, np.datetime64]
+
+DEFAULT_WEEKMASK = 'Mon Tue Wed Thu Fri'
+DATE_FORMAT = '%Y-%m-%d'
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+# Days added around a requested range when the ordinal table has to grow
+TABLE_MARGIN_DAYS = 366
+
+
+@lru_cache(maxsize=65536)
+def _parse_date_cached(value: str) -> Optional[datetime.date]:
+    try:
+        return datetime.datetime.strptime(value, DATE_FORMAT).date()
+    except ValueError:
+        return None
+
+
+def parse_date(value: Any) -> Optional[datetime.date]:
+    """
+    Parse a 'YYYY-MM-DD' string, caching the result per distinct string.
+
+    Args:
+        value: Date string
+
+    Returns:
+        The date, or None if the value is not a valid date string
+    """
+    if not isinstance(value, str):
+        return None
+    return _parse_date_cached(value)
+
+
+def to_day(value: DateLike) -> np.datetime64:
+    """Convert an ISO date string, date or datetime64 to a datetime64 day."""
+    if isinstance(value, np.datetime64):
+        return value.astype('datetime64[D]')
+    if isinstance(value, datetime.datetime):
+        value = value.date()
+    return np.datetime64(str(value)[:10], 'D')
+
+
+class WorkCalendar:
+    """
+    Working days of a task or resource: a weekly pattern plus holidays.
+
+    Thin wrapper around ``numpy.busdaycalendar`` so date arithmetic in
+    working days is done in C.
+    """
+
+    def __init__(self, weekmask: str = DEFAULT_WEEKMASK, holidays: Optional[Iterable[DateLike]] = None):
+        """
+        Initialize the calendar
+
+        Args:
+            weekmask: Working weekdays, e.g. 'Mon Tue Wed Thu Fri' or '1111100'
+            holidays: Non-working dates
+        """
+        self.weekmask = weekmask
+        self.holidays = sorted({to_day(day) for day in holidays or []})
+        self._busdaycal = np.busdaycalendar(weekmask=weekmask, holidays=self.holidays)
+
+    def roll_forward(self, day: DateLike) -> np.datetime64:
+        """Get the day itself if it is a working day, else the next working day."""
+        return np.busday_offset(to_day(day), 0, roll='forward', busdaycal=self._busdaycal)
+
+    def add_working_days(self, day: DateLike, days: int) -> np.datetime64:
+        """Move a number of working days forward from a date, starting on a working day."""
+        return np.busday_offset(to_day(day), days, roll='forward', busdaycal=self._busdaycal)
+
+    def working_days_between(self, start: DateLike, end: DateLike) -> int:
+        """Count working days in [start, end)."""
+        return int(np.busday_count(to_day(start), to_day(end), busdaycal=self._busdaycal))
+
+    def is_working_day(self, day: DateLike) -> bool:
+        """Check whether a date is a working day."""
+        return bool(np.is_busday(to_day(day), busdaycal=self._busdaycal))
+
+
+class OrdinalCalendar(WorkCalendar):
+    """
+    WorkCalendar with a precomputed table of working-day ordinals.
+
+    ``_cumulative[i]`` is the number of working days in the table before
+    day ``_first + i`` (days are ``date.toordinal()`` values). The table
+    grows on demand to cover any date asked for.
+    """
+
+    def __init__(self, weekmask: str = DEFAULT_WEEKMASK, holidays: Optional[Iterable[DateLike]] = None):
+        super().__init__(weekmask, holidays)
+        self._first = 0
+        self._cumulative = np.zeros(1, dtype=np.int64)
+
+    def _ensure_range(self, first: int, last: int) -> None:
+        """Make sure the table covers the day ordinals first..last inclusive."""
+        table_last = self._first + len(self._cumulative) - 2
+        if len(self._cumulative) > 1 and self._first <= first and last <= table_last:
+            return
+        if len(self._cumulative) > 1:
+            first, last = min(first, self._first), max(last, table_last)
+        first -= TABLE_MARGIN_DAYS
+        last += TABLE_MARGIN_DAYS
+        days = np.arange(first - EPOCH_ORDINAL, last - EPOCH_ORDINAL + 1).astype('datetime64[D]')
+        working = np.is_busday(days, busdaycal=self._busdaycal)
+        self._first = first
+        self._cumulative = np.concatenate(([0], np.cumsum(working, dtype=np.int64)))
+
+    def working_day_ordinal(self, day: datetime.date) -> int:
+        """
+        Get the number of working days before a date, counted from the table start.
+
+        Differences of ordinals are working-day counts; the ordinals
+        themselves are only comparable within one calendar.
+        """
+        ordinal = day.toordinal()
+        self._ensure_range(ordinal, ordinal)
+        return int(self._cumulative[ordinal - self._first])
+
+    def count_working_days(self, start: datetime.date, end: datetime.date) -> int:
+        """
+        Count working days in [start, end], both ends included.
+
+        Returns:
+            Number of working days, 0 if end is before start
+        """
+        if end < start:
+            return 0
+        first, last = start.toordinal(), end.toordinal()
+        self._ensure_range(first, last)
+        return int(self._cumulative[last - self._first + 1] - self._cumulative[first - self._first])
+
+    def shift_working_days(self, day: datetime.date, days: int) -> datetime.date:
+        """
+        Get the working day that is a number of working days after a date.
+
+        The date is first rolled forward to a working day; 0 days returns
+        that working day.
+
+        Raises:
+            ValueError: If days is negative or the calendar has no working days
+        """
+        if days < 0:
+            raise ValueError("Working days to shift must not be negative")
+        if not self._busdaycal.weekmask.any():
+            raise ValueError("Calendar has no working days")
+        ordinal = day.toordinal()
+        self._ensure_range(ordinal, ordinal + days * 2 + 14)
+        # Working days before the date; the date itself or, if it is not a
+        # working day, the next working day has exactly this ordinal
+        target = self._cumulative[ordinal - self._first] + days
+        while target + 1 > self._cumulative[-1]:
+            table_last = self._first + len(self._cumulative) - 2
+            self._ensure_range(table_last, table_last + 2 * TABLE_MARGIN_DAYS)
+        index = int(np.searchsorted(self._cumulative, target + 1, side='left')) - 1
+        return datetime.date.fromordinal(self._first + index)
+
+
+class ResourceCalendars:
+    """
+    Working calendars per resource, with a default for everyone else.
+
+    Attributes:
+        default: Calendar of resources without their own
+        calendars: Calendar per resource ID
+    """
+
+    def __init__(self, default: Optional[OrdinalCalendar] = None,
+                 calendars: Optional[Dict[str, OrdinalCalendar]] = None):
+        self.default = default or OrdinalCalendar()
+        self.calendars = dict(calendars or {})
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> 'ResourceCalendars':
+        """
+        Build calendars from a configuration dictionary.
+
+        The configuration looks like::
+
+            {"default": {"weekmask": "Mon Tue Wed Thu Fri", "holidays": ["2026-12-25"]},
+             "resources": {"alice": {"weekmask": "Mon Tue Wed Thu", "holidays": ["2026-08-03"]}}}
+
+        Resource holidays are added to the default holidays; a resource
+        without a weekmask uses the default one.
+
+        Args:
+            config: Calendar configuration, or None for a Monday-Friday default
+
+        Returns:
+            The resource calendars
+        """
+        config = config or {}
+        default_config = config.get('default') or {}
+        default_weekmask = default_config.get('weekmask', DEFAULT_WEEKMASK)
+        default_holidays = list(default_config.get('holidays') or [])
+        calendars = {
+            resource_id: OrdinalCalendar(
+                resource_config.get('weekmask', default_weekmask),
+                default_holidays + list(resource_config.get('holidays') or []))
+            for resource_id, resource_config in (config.get('resources') or {}).items()
+        }
+        return cls(OrdinalCalendar(default_weekmask, default_holidays), calendars)
+
+    def for_resource(self, resource_id: Optional[str]) -> OrdinalCalendar:
+        """Get the calendar of a resource, or the default calendar."""
+        return self.calendars.get(resource_id, self.default)
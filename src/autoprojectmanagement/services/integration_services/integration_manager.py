@@ -40,9 +40,13 @@ __author__ = "AutoProjectManagement Team"
 __license__ = "MIT"
 
 
+import contextlib
+import io
+import runpy
 import subprocess
 import logging
 import sys
+import traceback
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Callable
 import json
@@ -52,6 +56,8 @@ import threading
 import time
 from flask import Flask, request, jsonify
 
+from autoprojectmanagement.main_modules.utility_modules.data_store import get_data_store
+
 # Configure logging with proper formatting
 logging.basicConfig(
     level=logging.INFO,
@@ -102,6 +108,7 @@ class IntegrationManager:
         webhook_thread (threading.Thread): Thread for running webhook server
         github_integration (GitHubIntegration): GitHub integration instance
         event_handlers (Dict[str, Callable]): Registered event handlers
+        data_store (DataStore): JSON store shared with modules run in process
     """
     
     def __init__(self, config_path: Optional[str] = None):
@@ -113,6 +120,7 @@ class IntegrationManager:
         """
         self.modules = MODULE_EXECUTION_ORDER
         self.execution_results = {}
+        self.data_store = get_data_store()
         self.config = self._load_config(config_path)
         self.start_time = None
         self.end_time = None
@@ -131,16 +139,18 @@ class IntegrationManager:
             "max_retries": MAX_RETRIES,
             "retry_delay": RETRY_DELAY,
             "log_level": "INFO",
-            "modules_path": MODULES_PATH
+            "modules_path": MODULES_PATH,
+            # Run modules in this process, sharing parsed inputs through the
+            # data store; False runs one subprocess per module instead
+            "in_process": True
         }
         
         if config_path and Path(config_path).exists():
             try:
-                with open(config_path, 'r') as f:
-                    user_config = json.load(f)
-                    default_config.update(user_config)
-                    logger.info(f"Configuration loaded from {config_path}")
-            except (FileNotFoundError, json.JSONDecodeError) as e:
+                user_config = self.data_store.load_json(config_path)
+                default_config.update(user_config or {})
+                logger.info(f"Configuration loaded from {config_path}")
+            except (OSError, json.JSONDecodeError) as e:
                 logger.warning(f"Failed to load config from {config_path}: {e}")
         
         return default_config
@@ -170,36 +180,74 @@ class IntegrationManager:
             module_path = self._get_module_path(module_name)
             logger.info(f"Running {module_name} (attempt {retry_count + 1})...")
             
-            env = os.environ.copy()
-            env['PYTHONPATH'] = str(Path.cwd())
-            
-            result = subprocess.run(
-                [sys.executable, str(module_path)],
-                capture_output=True,
-                text=True,
-                timeout=300,
-                env=env
-            )
+            if self.config.get("in_process"):
+                returncode, stdout, stderr = self._run_module_in_process(module_path)
+            else:
+                env = os.environ.copy()
+                env['PYTHONPATH'] = str(Path.cwd())
+                
+                result = subprocess.run(
+                    [sys.executable, str(module_path)],
+                    capture_output=True,
+                    text=True,
+                    timeout=300,
+                    env=env
+                )
+                returncode, stdout, stderr = result.returncode, result.stdout, result.stderr
             
             self.execution_results[module_name] = {
-                'success': result.returncode == SUCCESS_EXIT_CODE,
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'returncode': result.returncode,
+                'success': returncode == SUCCESS_EXIT_CODE,
+                'stdout': stdout,
+                'stderr': stderr,
+                'returncode': returncode,
                 'timestamp': datetime.now().isoformat()
             }
             
-            if result.returncode == SUCCESS_EXIT_CODE:
+            if returncode == SUCCESS_EXIT_CODE:
                 logger.info(f"✅ {module_name} executed successfully")
                 return True
             else:
-                logger.error(f"❌ {module_name} failed with return code {result.returncode}")
+                logger.error(f"❌ {module_name} failed with return code {returncode}")
                 return False
                 
         except Exception as e:
             logger.error(f"💥 Unexpected error running {module_name}: {e}")
             return False
     
+    def _run_module_in_process(self, module_path: Path) -> tuple:
+        """
+        Run a module script as __main__ in this process.
+
+        Modules then read their inputs through the shared data store, so a
+        file written or read by one module is not parsed again by the next.
+        As in a subprocess run, the module sees no command-line arguments
+        and can import from its own directory and the working directory.
+        Unlike subprocess runs, there is no timeout.
+
+        Returns:
+            Tuple of return code, captured stdout and captured stderr
+        """
+        stdout, stderr = io.StringIO(), io.StringIO()
+        returncode = SUCCESS_EXIT_CODE
+        saved_argv, saved_path = sys.argv, sys.path[:]
+        sys.argv = [str(module_path)]
+        sys.path[:0] = [str(module_path.parent), str(Path.cwd())]
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                runpy.run_path(str(module_path), run_name='__main__')
+            except SystemExit as e:
+                if isinstance(e.code, int):
+                    returncode = e.code
+                elif e.code is not None:
+                    print(e.code, file=sys.stderr)
+                    returncode = 1
+            except Exception:
+                traceback.print_exc()
+                returncode = 1
+            finally:
+                sys.argv, sys.path[:] = saved_argv, saved_path
+        return returncode, stdout.getvalue(), stderr.getvalue()
+    
     def run_all(self, continue_on_error: bool = False) -> Dict[str, Any]:
         """Execute all modules in the defined order."""
         self.start_time = datetime.now()
@@ -173,5 +173,53 @@ class TestDashboardEndpoints:
         
         assert response.status_code == 500
 
+    def test_get_next_tasks_success(self):
+        """Test that next tasks are served from the important task manager"""
+        task = Mock()
+        task.to_dict.return_value = {"id": "task-1", "title": "Release"}
+        manager = Mock()
+        manager.get_prioritized_tasks = AsyncMock(return_value=[task])
+
+        with patch('autoprojectmanagement.api.dashboard_endpoints.important_task_manager', manager):
+            response = client.get("/dashboard/next-tasks?limit=3")
+
+        assert response.status_code == 200
+        assert response.json() == [{"id": "task-1", "title": "Release"}]
+        manager.get_prioritized_tasks.assert_awaited_once_with(3)
+
+    def test_next_tasks_manager_created_once(self):
+        """Test that concurrent first requests share one initialized manager"""
+        import asyncio
+        from autoprojectmanagement.api import dashboard_endpoints
+
+        created = []
+
+        class SlowManager:
+            def __init__(self):
+                created.append(self)
+
+            async def initialize(self):
+                await asyncio.sleep(0.01)
+                return True
+
+            async def get_prioritized_tasks(self, limit):
+                return []
+
+        async def first_requests():
+            return await asyncio.gather(*(dashboard_endpoints.get_next_tasks(3) for _ in range(5)))
+
+        with patch.object(dashboard_endpoints, 'important_task_manager', None), \
+                patch.object(dashboard_endpoints, '_important_task_manager_lock', None), \
+                patch.object(dashboard_endpoints, 'ImportantTaskManager', SlowManager):
+            assert asyncio.run(first_requests()) == [[]] * 5
+            assert dashboard_endpoints.important_task_manager is created[0]
+        assert len(created) == 1
+
+    def test_next_tasks_widget_available(self):
+        """Test that the next tasks widget can be used in layouts"""
+        response = client.get("/dashboard/widgets")
+
+        assert "next_tasks" in response.json()
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,221 @@
+"""
+Unit tests for autoprojectmanagement/main_modules/planning_estimation/baseline_store.py
+"""
+
+import json
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add source to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from autoprojectmanagement.main_modules.planning_estimation.baseline_store import BaselineStore, WBSHashTree
+from autoprojectmanagement.main_modules.planning_estimation.scope_management import ScopeManagement
+from autoprojectmanagement.main_modules.planning_estimation.wbs_diff import diff_wbs, iter_wbs_diff
+
+
+def build_wbs():
+    return {
+        "id": 0, "name": "Project", "subtasks": [
+            {"id": 1, "name": "Design", "estimated_duration": 5, "subtasks": [
+                {"id": 3, "name": "Mockups", "estimated_duration": 2},
+            ]},
+            {"id": 2, "name": "Build", "estimated_duration": 10, "subtasks": []},
+        ],
+    }
+
+
+class TestWBSHashTree:
+    """Test class for WBSHashTree"""
+
+    def test_equal_subtrees_have_equal_hashes(self):
+        """Test that identical content hashes identically and edits propagate upward"""
+        first = WBSHashTree(build_wbs())
+        second = WBSHashTree(build_wbs())
+        assert first.root_hash == second.root_hash
+
+        changed = build_wbs()
+        changed["subtasks"][0]["subtasks"][0]["estimated_duration"] = 3
+        third = WBSHashTree(changed)
+        assert third.task_hashes[2] == first.task_hashes[2]
+        assert third.task_hashes[3] != first.task_hashes[3]
+        assert third.task_hashes[1] != first.task_hashes[1]
+        assert third.root_hash != first.root_hash
+
+    def test_empty_tree(self):
+        """Test that an empty tree has no root hash"""
+        assert WBSHashTree({}).root_hash is None
+
+
+class TestBaselineStore:
+    """Test class for BaselineStore"""
+
+    def test_round_trip_is_independent_copy(self, tmp_path):
+        """Test that a loaded baseline equals the original and shares nothing with it"""
+        store = BaselineStore(tmp_path / "baselines.json")
+        wbs = build_wbs()
+        store.create("v1", "first", wbs, [{"task_id": 1, "change_type": "modify"}])
+
+        loaded, changes = store.load("v1")
+        assert loaded == wbs
+        assert changes == [{"task_id": 1, "change_type": "modify"}]
+
+        loaded["subtasks"][0]["subtasks"][0]["name"] = "Changed"
+        again, _ = store.load("v1")
+        assert again["subtasks"][0]["subtasks"][0]["name"] == "Mockups"
+
+    def test_unchanged_nodes_are_not_rewritten(self, tmp_path):
+        """Test that a second baseline writes only the changed node path"""
+        store = BaselineStore(tmp_path / "baselines.json")
+        wbs = build_wbs()
+        first = store.create("v1", "", wbs, [])
+        assert first["new_blobs"] == 4
+
+        wbs["subtasks"][1]["estimated_duration"] = 12
+        second = store.create("v2", "", wbs, [])
+        # Only "Build" and the root changed
+        assert second["new_blobs"] == 2
+        assert second["version"] == 2
+
+    def test_index_holds_metadata_only(self, tmp_path):
+        """Test that the index file does not contain WBS snapshots"""
+        index_path = tmp_path / "baselines.json"
+        BaselineStore(index_path).create("v1", "", build_wbs(), [])
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+        assert "wbs_snapshot" not in index["baselines"]["v1"]
+        assert "Mockups" not in index_path.read_text(encoding="utf-8")
+
+    def test_get_task_loads_subtree(self, tmp_path):
+        """Test lazy loading of a single task subtree"""
+        store = BaselineStore(tmp_path / "baselines.json")
+        store.create("v1", "", build_wbs(), [])
+        fresh = BaselineStore(tmp_path / "baselines.json")
+        assert fresh.get_task("v1", 1) == build_wbs()["subtasks"][0]
+        assert fresh.get_task("v1", 99) is None
+        assert len(fresh._blob_cache) == 2
+
+    def test_delete_collects_unshared_blobs(self, tmp_path):
+        """Test that deleting a baseline removes only blobs no other baseline uses"""
+        store = BaselineStore(tmp_path / "baselines.json")
+        wbs = build_wbs()
+        store.create("v1", "", wbs, [])
+        wbs["subtasks"][1]["name"] = "Construct"
+        store.create("v2", "", wbs, [])
+        blobs_before = len(store.known_blobs())
+
+        assert store.delete("v1") is True
+        assert len(store.known_blobs()) == blobs_before - 2
+        assert store.load("v2")[0] == wbs
+        assert store.delete("v1") is False
+
+    def test_replace_collects_old_blobs(self, tmp_path):
+        """Test that replacing a baseline removes its unshared blobs and gets a new version"""
+        store = BaselineStore(tmp_path / "baselines.json")
+        wbs = build_wbs()
+        store.create("v1", "", wbs, [])
+        store.create("v2", "", wbs, [])
+        blobs_before = set(store.known_blobs())
+
+        wbs["subtasks"][1]["name"] = "Construct"
+        entry = store.create("v1", "", wbs, [])
+        assert entry["version"] == 3
+        assert store.known_blobs() == blobs_before | {WBSHashTree(wbs).root_hash,
+                                                      WBSHashTree(wbs).task_hashes[2]}
+
+        entry = store.create("v2", "", wbs, [])
+        assert entry["version"] == 4
+        assert len(store.known_blobs()) == len(blobs_before)
+        assert store.load("v2")[0] == wbs
+
+    def test_writers_wait_for_lock(self, tmp_path, monkeypatch):
+        """Test that garbage collection waits for the store lock"""
+        from autoprojectmanagement.main_modules.planning_estimation import baseline_store
+
+        monkeypatch.setattr(baseline_store, "LOCK_TIMEOUT", 0.2)
+        store = BaselineStore(tmp_path / "baselines.json")
+        store.create("v1", "", build_wbs(), [])
+        assert not store.lock_path.exists()
+
+        store.lock_path.write_text("1", encoding="utf-8")
+        with pytest.raises(TimeoutError):
+            store.collect_garbage()
+        store.lock_path.unlink()
+        assert store.collect_garbage() == 0
+
+    def test_stale_blob_listing_is_refreshed(self, tmp_path):
+        """Test that a store sees blobs another store collected"""
+        index_path = tmp_path / "baselines.json"
+        wbs = build_wbs()
+        first = BaselineStore(index_path)
+        first.create("v1", "", wbs, [])
+        second = BaselineStore(index_path)
+        second.known_blobs()
+
+        first.delete("v1")
+        second.create("v2", "", wbs, [])
+        assert second.load("v2")[0] == wbs
+
+    def test_reads_previous_format(self, tmp_path):
+        """Test that snapshot-style index files are read and migrated on write"""
+        index_path = tmp_path / "baselines.json"
+        index_path.write_text(json.dumps({"old": {
+            "name": "old", "description": "", "created_at": "2025-01-01T00:00:00",
+            "wbs_snapshot": build_wbs(), "scope_changes_snapshot": [], "version": 1,
+        }}), encoding="utf-8")
+        store = BaselineStore(index_path)
+        assert store.load("old")[0] == build_wbs()
+
+        store.create("new", "", build_wbs(), [])
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+        assert "wbs_snapshot" not in index["baselines"]["old"]
+        assert store.load("old")[0] == build_wbs()
+
+    def test_reads_manifests_without_parents(self, tmp_path):
+        """Test that two-column manifests get their parents from the stored tree"""
+        store = BaselineStore(tmp_path / "baselines.json")
+        store.create("v1", "", build_wbs(), [])
+        manifest_path = store._manifest_path("v1")
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        manifest["tasks"] = [row[:2] for row in manifest["tasks"]]
+        manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+        tree = store.hash_tree("v1")
+        assert tree.task_parents == WBSHashTree(build_wbs()).task_parents
+        current = build_wbs()
+        current["subtasks"][0]["subtasks"][0]["name"] = "Wireframes"
+        assert list(iter_wbs_diff(WBSHashTree(current), tree)) == diff_wbs(current, build_wbs())
+
+
+class TestScopeManagementBaselines:
+    """Test class for ScopeManagement baselines backed by BaselineStore"""
+
+    def build_manager(self, tmp_path):
+        manager = ScopeManagement(notification_service=Mock())
+        manager.baseline_path = tmp_path / "scope_baselines.json"
+        manager.detailed_wbs = build_wbs()
+        return manager
+
+    def test_restore_is_not_affected_by_later_edits(self, tmp_path):
+        """Test that editing the WBS after creating a baseline leaves the baseline intact"""
+        manager = self.build_manager(tmp_path)
+        assert manager.create_baseline("v1") is True
+
+        manager.detailed_wbs["subtasks"][0]["subtasks"][0]["name"] = "Edited"
+        assert manager.restore_baseline("v1") is True
+        assert manager.detailed_wbs == build_wbs()
+
+    def test_list_compare_and_delete(self, tmp_path):
+        """Test listing, comparing and deleting baselines"""
+        manager = self.build_manager(tmp_path)
+        manager.create_baseline("v1", "first")
+        manager.detailed_wbs["subtasks"][1]["name"] = "Construct"
+
+        assert [b["name"] for b in manager.get_baseline_list()] == ["v1"]
+        comparison = manager.compare_with_baseline("v1")
+        assert comparison["summary"]["tasks_modified"] == 1
+
+        assert manager.delete_baseline("v1") is True
+        assert manager.get_baseline_list() == []
+        assert manager.restore_baseline("v1") is False
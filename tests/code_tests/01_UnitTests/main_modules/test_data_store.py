@@ -0,0 +1,148 @@
+"""
+Unit tests for autoprojectmanagement/main_modules/utility_modules/data_store.py
+"""
+
+import json
+import os
+import pytest
+import sys
+from pathlib import Path
+
+# Add source to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from autoprojectmanagement.main_modules.utility_modules.base_management import BaseManagement
+from autoprojectmanagement.main_modules.utility_modules.data_store import DataStore, dumps_json, loads_json
+
+
+def touch_later(path):
+    """Move the modification time forward, as a later write would."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestDataStore:
+    """Test class for DataStore"""
+
+    def test_cache_hit(self, tmp_path):
+        """Test that an unchanged file is parsed once"""
+        path = tmp_path / "tasks.json"
+        path.write_text('{"tasks": [1, 2]}')
+        store = DataStore()
+
+        first = store.load_json(path)
+        second = store.load_json(str(path))
+
+        assert first == {"tasks": [1, 2]}
+        assert second is first
+        assert (store.hits, store.misses) == (1, 1)
+
+    def test_changed_file_is_reloaded(self, tmp_path):
+        """Test that a change of modification time or size invalidates the cache"""
+        path = tmp_path / "tasks.json"
+        path.write_text('{"a": 1}')
+        store = DataStore()
+        store.load_json(path)
+
+        path.write_text('{"a": 2}')
+        touch_later(path)
+        assert store.load_json(path) == {"a": 2}
+
+        path.write_text('{"a": 10}')
+        assert store.load_json(path) == {"a": 10}
+        assert store.misses == 3
+
+    def test_missing_and_invalid_files(self, tmp_path):
+        """Test that a missing file loads as None and invalid JSON raises"""
+        store = DataStore()
+        assert store.load_json(tmp_path / "missing.json") is None
+
+        path = tmp_path / "broken.json"
+        path.write_text("{not json")
+        with pytest.raises(json.JSONDecodeError):
+            store.load_json(path)
+
+    def test_copy(self, tmp_path):
+        """Test that copy=True returns a document private to the caller"""
+        path = tmp_path / "tasks.json"
+        path.write_text('{"tasks": []}')
+        store = DataStore()
+        shared = store.load_json(path)
+
+        private = store.load_json(path, copy=True)
+        private["tasks"].append(1)
+
+        assert private is not shared
+        assert store.load_json(path) == {"tasks": []}
+
+    def test_save(self, tmp_path):
+        """Test that saving writes formatted JSON and refreshes the cache"""
+        path = tmp_path / "out" / "report.json"
+        store = DataStore()
+
+        store.save_json(path, {"b": 1, "a": "é"}, sort_keys=True)
+        assert path.read_text(encoding="utf-8") == json.dumps({"a": "é", "b": 1}, indent=2, ensure_ascii=False)
+        assert store.load_json(path) == {"a": "é", "b": 1}
+
+        store.save_json(path, {"c": 3})
+        assert store.load_json(path) == {"c": 3}
+        assert not list(path.parent.glob("*.tmp"))
+
+    def test_lru_limit(self, tmp_path):
+        """Test that the least recently used document is dropped first"""
+        store = DataStore(max_entries=2)
+        paths = []
+        for name in "abc":
+            path = tmp_path / f"{name}.json"
+            path.write_text("{}")
+            paths.append(path)
+            store.load_json(path)
+
+        store.load_json(paths[0])
+        assert store.misses == 4
+
+
+class TestJsonHelpers:
+    """Test class for loads_json and dumps_json"""
+
+    def test_non_finite_numbers(self):
+        """Test that NaN and Infinity round-trip like with the json module"""
+        text = dumps_json({"value": float("nan"), "limit": float("inf")})
+        assert text == json.dumps({"value": float("nan"), "limit": float("inf")}, indent=2)
+        assert loads_json(text)["limit"] == float("inf")
+
+    def test_matches_json_module(self):
+        """Test that the output matches json.dumps with ensure_ascii=False"""
+        data = {"name": "پروژه", "items": [1, 2.5, None, True], "nested": {"empty": []}, 3: "x"}
+        assert dumps_json(data) == json.dumps(data, indent=2, ensure_ascii=False)
+        assert dumps_json(data, indent=None) == json.dumps(data, ensure_ascii=False)
+
+
+class Summary(BaseManagement):
+    def analyze(self):
+        self.output = {"count": len(self.inputs["tasks"]["tasks"])}
+
+
+class TestSharedBaseManagement:
+    """Test class for BaseManagement"""
+
+    def test_modules_share_parsed_inputs(self, tmp_path):
+        """Test that modules reading the same input parse it once"""
+        path = tmp_path / "tasks.json"
+        path.write_text('{"tasks": [1, 2, 3]}')
+        store = DataStore()
+
+        for name in ("first", "second"):
+            Summary({"tasks": str(path)}, str(tmp_path / f"{name}.json"), data_store=store).run()
+
+        assert store.misses == 1
+        assert json.loads((tmp_path / "second.json").read_text()) == {"count": 3}
+
+    def test_missing_input_and_analyze(self, tmp_path):
+        """Test that missing inputs load as empty and analyze must be implemented"""
+        manager = BaseManagement({"tasks": str(tmp_path / "none.json")}, str(tmp_path / "out.json"),
+                                 data_store=DataStore())
+        manager.load_inputs()
+        assert manager.inputs == {"tasks": {}}
+        with pytest.raises(NotImplementedError):
+            manager.analyze()
@@ -0,0 +1,167 @@
+"""
+Unit tests for autoprojectmanagement/main_modules/planning_estimation/dependency_manager.py
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add source to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from autoprojectmanagement.main_modules.planning_estimation.dependency_manager import DependencyManager
+
+
+def build_manager(subtasks):
+    manager = DependencyManager()
+    manager.load_dependencies_from_wbs({"id": "root", "name": "Project", "subtasks": subtasks})
+    return manager
+
+
+class TestCriticalPath:
+    """Test class for the CPM engine in DependencyManager"""
+
+    def setup_method(self):
+        """Setup for each test method"""
+        self.manager = build_manager([
+            {"id": "a", "duration": 3},
+            {"id": "b", "duration": 2, "dependencies": ["a"]},
+            {"id": "c", "duration": 4, "dependencies": ["a"]},
+            {"id": "d", "duration": 1, "dependencies": ["b", "c"]},
+            {"id": "e", "duration": 2},
+        ])
+
+    def test_durations_loaded_from_wbs(self):
+        """Test that task durations are read while loading the WBS"""
+        assert self.manager.task_durations == {"a": 3, "b": 2, "c": 4, "d": 1, "e": 2}
+
+    def test_forward_and_backward_pass(self):
+        """Test earliest/latest dates and floats"""
+        schedule = self.manager.calculate_schedule()
+        tasks = schedule["tasks"]
+
+        assert schedule["project_duration"] == 8
+        assert tasks["c"]["earliest_start"] == 3
+        assert tasks["d"]["earliest_finish"] == 8
+        assert tasks["b"]["latest_start"] == 5
+        assert tasks["b"]["total_float"] == 2
+        assert tasks["b"]["free_float"] == 2
+        assert tasks["e"]["total_float"] == 6
+        assert schedule["critical_tasks"] == ["a", "c", "d"]
+
+    def test_get_critical_path(self):
+        """Test that the critical path follows the driving chain in order"""
+        assert self.manager.get_critical_path() == ["a", "c", "d"]
+        assert self.manager.get_critical_path({"a": 1, "b": 10, "c": 1, "d": 1}) == ["a", "b", "d"]
+
+    def test_topological_order(self):
+        """Test that predecessors always come first"""
+        order = self.manager.topological_order(["e"])
+        assert order.index("a") < order.index("b") < order.index("d")
+        assert order.index("c") < order.index("d")
+        assert "e" in order
+
+    def test_cycle_raises(self):
+        """Test that CPM refuses to schedule a cyclic graph"""
+        manager = build_manager([
+            {"id": "a", "duration": 1, "dependencies": ["b"]},
+            {"id": "b", "duration": 1, "dependencies": ["a"]},
+        ])
+        with pytest.raises(ValueError):
+            manager.calculate_schedule()
+
+    def test_empty_graph(self):
+        """Test scheduling with no tasks"""
+        schedule = DependencyManager().calculate_schedule({})
+        assert schedule["project_duration"] == 0
+        assert schedule["critical_path"] == []
+
+    def test_summary_tasks_span_subtasks(self):
+        """Test that summary tasks take their dates and float from their subtasks"""
+        manager = build_manager([
+            {"id": "p", "subtasks": [
+                {"id": "a", "duration": 2},
+                {"id": "b", "duration": 3, "dependencies": ["a"]},
+            ]},
+            {"id": "c", "duration": 1, "dependencies": ["p"]},
+            {"id": "e", "duration": 1},
+        ])
+        durations = {"root": 1, "p": 1, "a": 2, "b": 3, "c": 1, "e": 1}
+        schedule = manager.calculate_schedule(durations)
+        tasks = schedule["tasks"]
+
+        assert schedule["project_duration"] == 6
+        assert tasks["root"]["is_critical"] and tasks["root"]["total_float"] == 0
+        assert tasks["root"]["duration"] == 6
+        assert (tasks["p"]["earliest_start"], tasks["p"]["earliest_finish"]) == (0, 5)
+        assert tasks["p"]["is_critical"] and tasks["c"]["earliest_start"] == 5
+        assert tasks["e"]["total_float"] == 5
+        assert schedule["critical_path"] == ["a", "b", "c"]
+        assert schedule["critical_tasks"] == ["root", "p", "a", "b", "c"]
+
+    def test_dependencies_within_a_branch_are_ignored(self):
+        """Test that dependencies between a task and its ancestors or descendants leave no cycle"""
+        manager = build_manager([
+            {"id": "p", "dependencies": ["b"], "subtasks": [
+                {"id": "a", "duration": 2, "dependencies": ["p"]},
+                {"id": "b", "duration": 3, "dependencies": ["a"]},
+            ]},
+        ])
+        schedule = manager.calculate_schedule({"a": 2, "b": 3})
+
+        assert schedule["project_duration"] == 5
+        assert schedule["critical_path"] == ["a", "b"]
+
+
+class TestCircularDependencies:
+    """Test class for SCC-based cycle detection in DependencyManager"""
+
+    def test_no_cycles(self):
+        """Test an acyclic graph reports no cycle groups"""
+        manager = build_manager([
+            {"id": "a"},
+            {"id": "b", "dependencies": ["a"]},
+            {"id": "c", "dependencies": ["a", "b"]},
+        ])
+        assert manager.detect_circular_dependencies() == []
+        assert manager.validate_dependencies() == []
+
+    def test_every_cycle_group_reported(self):
+        """Test that separate cycles and self-loops are each reported once"""
+        manager = build_manager([
+            {"id": "a", "dependencies": ["c"]},
+            {"id": "b", "dependencies": ["a"]},
+            {"id": "c", "dependencies": ["b"]},
+            {"id": "d", "dependencies": ["e", "a"]},
+            {"id": "e", "dependencies": ["d"]},
+            {"id": "f", "dependencies": ["f"]},
+            {"id": "g"},
+        ])
+        groups = sorted(sorted(group) for group in manager.detect_circular_dependencies())
+        assert groups == [["a", "b", "c"], ["d", "e"], ["f"]]
+
+    def test_all_tasks_are_components(self):
+        """Test that tasks without outgoing dependencies are still covered"""
+        manager = build_manager([
+            {"id": "a"},
+            {"id": "b", "dependencies": ["a"]},
+            {"id": "lonely"},
+        ])
+        components = manager.find_strongly_connected_components()
+        assert sorted(task for component in components for task in component) == ["a", "b", "lonely", "root"]
+
+    def test_missing_dependency_reported(self):
+        """Test that references to unknown tasks are reported"""
+        manager = build_manager([{"id": "a", "dependencies": ["ghost"]}])
+        errors = manager.validate_dependencies()
+        assert errors == ["Task 'a' depends on non-existent task 'ghost'"]
+
+    def test_long_chain_does_not_recurse(self):
+        """Test a dependency chain longer than the recursion limit"""
+        length = sys.getrecursionlimit() * 2
+        subtasks = [{"id": "t0", "dependencies": [f"t{length - 1}"]}]
+        subtasks += [{"id": f"t{i}", "dependencies": [f"t{i - 1}"]} for i in range(1, length)]
+        manager = build_manager(subtasks)
+        groups = manager.detect_circular_dependencies()
+        assert len(groups) == 1
+        assert len(groups[0]) == length
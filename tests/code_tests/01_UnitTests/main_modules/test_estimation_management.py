@@ -199,3 +199,83 @@ class TestEstimationManagement:
         """Test EstimationManagement methods"""
         # TODO: Implement method tests
         assert True
+
+
+class TestWBSEstimationBatch:
+    """Test class for WBSEstimationBatch"""
+
+    def setup_method(self):
+        """Setup for each test method"""
+        self.wbs = {
+            "id": "root",
+            "subtasks": [
+                {"id": "a", "subtasks": [
+                    {"id": "a1", "complexity": "low", "resources": 2},
+                    {"id": "a2", "complexity": "high", "story_points": 3, "subtasks": [
+                        {"id": "a2x", "complexity": "extreme"},
+                    ]},
+                ]},
+                {"id": "b", "complexity": "unknown"},
+            ]
+        }
+        self.batch = estimation_management.WBSEstimationBatch.from_wbs(self.wbs)
+
+    def test_flattens_nested_subtasks(self):
+        """Test that every nested task becomes a row in pre-order"""
+        assert self.batch.ids == ["a", "a1", "a2", "a2x", "b"]
+        assert self.batch.parent.tolist() == [-1, 0, 0, 2, -1]
+        assert self.batch.is_leaf.tolist() == [False, True, False, True, True]
+
+    def test_parametric_matches_scalar_estimates(self):
+        """Test that leaf estimates match the per-task functions"""
+        duration, cost = self.batch.parametric()
+        for i, task in enumerate(self.batch.tasks):
+            if self.batch.is_leaf[i]:
+                assert duration[i] == estimation_management.estimate_task_duration(task)
+                assert cost[i] == estimation_management.estimate_task_cost(task)
+
+    def test_custom_mapping_levels(self):
+        """Test that custom complexity levels used by tasks get their mapped values"""
+        duration, _ = self.batch.parametric({"low": 2.0, "unknown": 4.0, "trivial": 0.5})
+        assert duration.tolist() == [0.0, 2.0, 0.0, 3.0, 4.0]
+        assert self.batch.complexity_levels[-1] == "unknown"
+
+    def test_rollup_sums_leaf_descendants(self):
+        """Test that summary tasks get the total of their subtree"""
+        duration, cost = self.batch.parametric()
+        totals = self.batch.rollup(duration)
+        assert totals.tolist() == [9.0, 1.0, 8.0, 8.0, 3.0]
+        assert self.batch.rollup(cost)[0] == 200.0 + 800.0
+
+    def test_agile_and_cocomo(self):
+        """Test story point defaults and COCOMO II on rolled-up size"""
+        points, days = self.batch.agile(velocity=10, sprint_length_days=10)
+        assert points.tolist() == [0.0, 2.0, 0.0, 13.0, 5.0]
+        assert days[3] == 13.0
+
+        effort, schedule = self.batch.cocomo_ii()
+        # a = a1 (0.5 KLOC) + a2x (6 KLOC); effort grows faster than size
+        assert effort[0] > effort[1] + effort[3]
+        project_effort, project_schedule = self.batch.cocomo_ii_project()
+        assert project_effort > effort[0] + effort[4]
+        assert project_schedule > 0
+
+    def test_analyze_includes_nested_tasks(self):
+        """Test that analyze estimates nested subtasks, not only 'tasks'"""
+        manager = estimation_management.EstimationManagement()
+        manager.inputs = {"detailed_wbs": self.wbs}
+        manager.analyze()
+        summary = manager.output["summary"]
+        assert summary["total_tasks"] == 5
+        assert summary["total_work_packages"] == 3
+        assert summary["total_duration"] == 12.0
+        estimates = {e["id"]: e for e in manager.output["details"]["task_estimates"]}
+        assert estimates["a"]["duration"] == 9.0
+        assert estimates["a2x"]["parent_id"] == "a2"
+
+    def test_flat_tasks_list_still_supported(self):
+        """Test the flat 'tasks' input format"""
+        manager = estimation_management.EstimationManagement()
+        manager.inputs = {"detailed_wbs": {"tasks": [{"id": 1, "complexity": "high", "resources": 2}]}}
+        manager.analyze()
+        assert manager.output["summary"]["total_cost"] == 1000.0
@@ -0,0 +1,95 @@
+"""
+Unit tests for autoprojectmanagement/main_modules/planning_estimation/gantt_scheduler.py
+"""
+
+import datetime
+import pytest
+import sys
+from pathlib import Path
+
+# Add source to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from autoprojectmanagement.main_modules.planning_estimation.gantt_scheduler import GanttScheduler
+from autoprojectmanagement.main_modules.utility_modules.working_calendar import WorkCalendar
+
+
+def build_tasks():
+    return [
+        {"id": "p", "name": "Phase", "subtasks": [
+            {"id": "a", "duration": 3},
+            {"id": "b", "duration": 2, "dependencies": ["a"]},
+            {"id": "c", "duration": 4, "dependencies": ["a"], "start_date": "2026-10-26"},
+        ]},
+        {"id": "d", "duration": 1, "dependencies": ["p"]},
+        {"id": "e", "duration": 2},
+    ]
+
+
+def dates(scheduler, task_id):
+    start, end = scheduler.get_dates(task_id)
+    return start.isoformat(), end.isoformat()
+
+
+class TestGanttScheduler:
+    """Test class for GanttScheduler"""
+
+    def setup_method(self):
+        """Setup for each test method"""
+        self.scheduler = GanttScheduler(build_tasks(), project_start=datetime.date(2026, 10, 16))
+
+    def test_dependencies_drive_dates(self):
+        """Test that tasks start after their predecessors on working days"""
+        assert dates(self.scheduler, "a") == ("2026-10-16", "2026-10-21")
+        assert dates(self.scheduler, "b") == ("2026-10-21", "2026-10-23")
+        assert dates(self.scheduler, "c") == ("2026-10-26", "2026-10-30")
+        assert dates(self.scheduler, "p") == ("2026-10-16", "2026-10-30")
+        assert dates(self.scheduler, "d") == ("2026-10-30", "2026-11-02")
+        assert dates(self.scheduler, "e") == ("2026-10-16", "2026-10-20")
+
+    def test_update_duration_recomputes_downstream_only(self):
+        """Test incremental rescheduling matches a full schedule"""
+        changed = self.scheduler.update_duration("a", 5)
+        assert changed == ["a", "b"]
+        tasks = build_tasks()
+        tasks[0]["subtasks"][0]["duration"] = 5
+        full = GanttScheduler(tasks, project_start="2026-10-16")
+        assert full.dates == self.scheduler.dates
+
+        changed = self.scheduler.update_duration("c", 10)
+        assert set(changed) == {"c", "p", "d"}
+        assert self.scheduler.get_row("d")["start_date"] == "2026-11-09"
+
+    def test_update_duration_leaves_tasks_unchanged(self):
+        """Test that changed durations are kept by the scheduler, not written to the WBS"""
+        tasks = build_tasks()
+        tasks[1]["duration_days"] = 1
+        scheduler = GanttScheduler(tasks, project_start="2026-10-16")
+        scheduler.update_duration("d", 3)
+
+        assert tasks[1] == {"id": "d", "duration": 1, "duration_days": 1, "dependencies": ["p"]}
+        assert scheduler.duration_overrides == {"d": 3}
+        assert scheduler.get_row("d")["duration_days"] == 3
+        rebuilt = GanttScheduler(tasks, project_start="2026-10-16", duration_overrides={"d": 3})
+        assert rebuilt.dates == scheduler.dates
+
+    def test_task_calendars(self):
+        """Test that a task can use its own calendar"""
+        tasks = [{"id": "w", "duration": 3, "calendar": "seven_day"}]
+        scheduler = GanttScheduler(tasks, project_start="2026-10-16",
+                                   calendars={"seven_day": WorkCalendar("1111111")})
+        assert dates(scheduler, "w") == ("2026-10-16", "2026-10-19")
+
+    def test_window_and_pagination(self):
+        """Test paginated and date-windowed rows"""
+        page = self.scheduler.get_window(offset=1, limit=2)
+        assert page["total"] == 6
+        assert [row["id"] for row in page["tasks"]] == ["a", "b"]
+
+        window = self.scheduler.get_window(window_start="2026-10-24", window_end="2026-11-01")
+        assert [row["id"] for row in window["tasks"]] == ["p", "c", "d"]
+
+    def test_cycle_raises(self):
+        """Test that cyclic dependencies are rejected"""
+        with pytest.raises(ValueError):
+            GanttScheduler([{"id": "x", "dependencies": ["y"]}, {"id": "y", "dependencies": ["x"]}])
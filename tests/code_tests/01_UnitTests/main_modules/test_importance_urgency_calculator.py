@@ -3,6 +3,7 @@ Auto-generated tests for autoprojectmanagement\main_modules\importance_urgency_c
 Generated by AutoProjectManagement testing framework
 """
 
+import datetime
 import pytest
 from unittest.mock import Mock, patch
 import sys
@@ -126,3 +127,73 @@ class TestImportanceUrgencyCalculator:
         """Test ImportanceUrgencyCalculator methods"""
         # TODO: Implement method tests
         assert True
+
+    def test_critical_tasks_from_dependency_schedule(self):
+        """Test that CPM critical tasks raise the importance score"""
+        from autoprojectmanagement.main_modules.planning_estimation.dependency_manager import DependencyManager
+        wbs = [{"id": "a", "duration": 3}, {"id": "b", "duration": 1}]
+        manager = DependencyManager()
+        for task in wbs:
+            manager.load_dependencies_from_wbs(task)
+        calculator = importance_urgency_calculator.ImportanceUrgencyCalculator.from_dependency_schedule(wbs, manager)
+        scores = calculator.calculate_all()
+        assert scores["a"]["importance"] > scores["b"]["importance"]
+
+
+class TestBatchScoring:
+    """Test class for batch scoring in ImportanceUrgencyCalculator"""
+
+    NOW = datetime.datetime(2025, 1, 1, 12, 0)
+
+    def wbs(self):
+        return [{
+            "id": "root",
+            "subtasks": [
+                {"id": "a", "dependencies": [1, 2], "priority": "high", "cost_impact": 50000,
+                 "deadline": "2025-01-01T00:00:00", "risk_of_delay": 5},
+                {"id": "mid", "subtasks": [
+                    {"id": "b", "critical_path": True, "deadline": "2025-01-03T12:00:00"},
+                    {"id": "c", "priority": 4, "deadline": "not a date", "stakeholder_pressure": 20},
+                ]},
+            ],
+        }, {"id": "solo", "deadline": "2025-01-01T00:00:00+00:00"}]
+
+    def test_scores(self):
+        """Test leaf scores against a single time and parent averages"""
+        scores = importance_urgency_calculator.ImportanceUrgencyCalculator(self.wbs()).calculate_all(now=self.NOW)
+
+        assert list(scores) == ["a", "b", "c", "mid", "root", "solo"]
+        assert scores["a"] == {"importance": 36.0, "urgency": 65.0}
+        assert scores["b"] == {"importance": 30.0, "urgency": pytest.approx(16.67)}
+        assert scores["c"] == {"importance": 8.0, "urgency": 20.0}
+        assert scores["mid"] == {"importance": 19.0, "urgency": (scores["b"]["urgency"] + 20.0) / 2}
+        assert scores["root"]["importance"] == (36.0 + 19.0) / 2
+        assert scores["solo"] == {"importance": 0.0, "urgency": 0.0}
+
+    def test_matches_single_task_scoring(self):
+        """Test that batch scores equal calculate_importance for every leaf"""
+        calculator = importance_urgency_calculator.ImportanceUrgencyCalculator(self.wbs())
+        scores = calculator.calculate_all()
+        leaves = [self.wbs()[0]["subtasks"][0], *self.wbs()[0]["subtasks"][1]["subtasks"]]
+
+        for leaf in leaves:
+            assert scores[leaf["id"]]["importance"] == calculator.calculate_importance(leaf)
+        assert calculator.score_task(self.wbs()[0]) == (scores["root"]["importance"], scores["root"]["urgency"])
+
+    def test_invalid_leaf_raises(self):
+        """Test that a leaf with invalid criteria fails the batch"""
+        wbs = [{"id": "root", "subtasks": [{"id": "x", "priority": True}]}]
+        with pytest.raises(TypeError, match="priority must not be a boolean"):
+            importance_urgency_calculator.ImportanceUrgencyCalculator(wbs).calculate_all()
+        with pytest.raises(TypeError, match="risk_of_delay must be a number"):
+            importance_urgency_calculator.ImportanceUrgencyCalculator([{"id": "y", "risk_of_delay": "5"}]).calculate_all()
+
+    def test_empty_and_deep(self):
+        """Test an empty WBS and a hierarchy deeper than the recursion limit"""
+        assert importance_urgency_calculator.ImportanceUrgencyCalculator([]).calculate_all() == {}
+
+        task = {"id": 0, "priority": 5}
+        for task_id in range(1, 3000):
+            task = {"id": task_id, "subtasks": [task]}
+        scores = importance_urgency_calculator.ImportanceUrgencyCalculator([task]).calculate_all()
+        assert scores[2999]["importance"] == scores[0]["importance"] == 10.0
@@ -0,0 +1,136 @@
+"""
+Unit tests for autoprojectmanagement/main_modules/task_workflow_management/incremental_scoring.py
+"""
+
+import asyncio
+import copy
+import datetime
+import pytest
+import sys
+from pathlib import Path
+
+# Add source to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from autoprojectmanagement.main_modules.task_workflow_management.importance_urgency_calculator import (
+    ImportanceUrgencyCalculator
+)
+from autoprojectmanagement.main_modules.task_workflow_management.incremental_scoring import (
+    IncrementalScoringService
+)
+
+NOW = datetime.datetime(2025, 1, 1, 12, 0)
+
+WBS = [{
+    "id": "root",
+    "subtasks": [
+        {"id": "design", "subtasks": [
+            {"id": "ui", "priority": 5, "deadline": "2025-01-02T12:00:00"},
+            {"id": "api", "dependencies": [1, 2, 3], "cost_impact": 20000},
+        ]},
+        {"id": "release", "priority": "high", "risk_of_delay": 4},
+    ],
+}, {"id": "docs", "stakeholder_pressure": 6}]
+
+
+class RecordingPublisher:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, task_data, project_id=None):
+        self.calls.append((task_data, project_id))
+
+
+def full_scores(wbs):
+    return ImportanceUrgencyCalculator(copy.deepcopy(wbs)).calculate_all(now=NOW)
+
+
+class TestIncrementalScoringService:
+    """Test class for IncrementalScoringService"""
+
+    def setup_method(self):
+        """Setup for each test method"""
+        self.wbs = copy.deepcopy(WBS)
+        self.publisher = RecordingPublisher()
+        self.service = IncrementalScoringService(self.wbs, publisher=self.publisher, project_id="demo")
+        self.service.rescore_all(now=NOW)
+
+    def test_leaf_change_updates_ancestors(self):
+        """Test that a leaf edit rescores the leaf and its ancestor chain only"""
+        deltas = self.service.update_task("api", {"priority": 10}, now=NOW)
+
+        assert list(deltas) == ["api", "design", "root"]
+        assert self.service.scores == full_scores(self.wbs)
+        assert asyncio.run(self.service.publish_pending()) == 1
+        assert self.publisher.calls == [({"event": "scores_changed", "task_id": "api", "scores": deltas}, "demo")]
+
+    def test_unchanged_criteria(self):
+        """Test that edits not affecting the criteria publish nothing"""
+        before = copy.deepcopy(self.service.scores)
+
+        assert self.service.update_task("ui", {"title": "Screens"}, now=NOW) == {}
+        assert self.service.update_task("design", {"priority": 10}, now=NOW) == {}
+        assert self.service.scores == before
+        assert self.wbs[0]["subtasks"][0]["subtasks"][0]["title"] == "Screens"
+        assert self.publisher.calls == []
+
+    def test_invalid_change_is_rejected(self):
+        """Test that invalid criteria raise and leave the task and scores unchanged"""
+        before = copy.deepcopy(self.service.scores)
+
+        with pytest.raises(TypeError):
+            self.service.update_task("release", {"cost_impact": "a lot"}, now=NOW)
+        with pytest.raises(TypeError):
+            self.service.update_task("design", {"subtasks": [{"id": "x", "priority": True}]}, now=NOW)
+        with pytest.raises(KeyError):
+            self.service.update_task("missing", {"priority": 1})
+        with pytest.raises(ValueError):
+            self.service.update_task("docs", {"id": "other"})
+
+        assert "cost_impact" not in self.wbs[0]["subtasks"][1]
+        assert self.service.scores == before
+
+    def test_subtree_replacement(self):
+        """Test that replacing subtasks drops the old subtree and scores the new one"""
+        deltas = self.service.update_task("design", {"subtasks": [{"id": "ui", "priority": 2},
+                                                                  {"id": "db", "critical_path": True}]}, now=NOW)
+
+        assert deltas["api"] is None
+        assert set(deltas) == {"design", "ui", "api", "db", "root"}
+        assert self.service.scores == full_scores(self.wbs)
+
+        # The new subtree is indexed for further edits
+        self.service.update_task("db", {"critical_path": False}, now=NOW)
+        assert self.service.scores == full_scores(self.wbs)
+
+    def test_publish_on_running_loop(self):
+        """Test that deltas are scheduled on the running event loop"""
+        async def edit():
+            self.service.update_task("docs", {"stakeholder_pressure": 1}, now=NOW)
+            assert self.publisher.calls == []
+            await asyncio.sleep(0)
+
+        asyncio.run(edit())
+        assert [call[0]["task_id"] for call in self.publisher.calls] == ["docs"]
+
+    def test_publish_without_loop_is_queued(self):
+        """Test that deltas edited outside a loop wait for it, and go out first"""
+        self.service.update_task("docs", {"stakeholder_pressure": 1}, now=NOW)
+        self.service.update_task("ui", {"priority": 1}, now=NOW)
+        assert self.publisher.calls == []
+        assert [task_data["task_id"] for task_data in self.service.pending] == ["docs", "ui"]
+
+        async def edit():
+            self.service.update_task("docs", {"stakeholder_pressure": 9}, now=NOW)
+            await asyncio.sleep(0)
+
+        asyncio.run(edit())
+        assert [call[0]["task_id"] for call in self.publisher.calls] == ["docs", "ui", "docs"]
+        assert not self.service.pending
+
+    def test_save_scores(self, tmp_path):
+        """Test that scores are saved as the calculator's JSON"""
+        import json
+        path = tmp_path / "wbs_scores.json"
+        self.service.save_scores(str(path))
+        assert json.loads(path.read_text(encoding="utf-8")) == full_scores(self.wbs)
@@ -12,6 +12,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from autoprojectmanagement.main_modules.resource_management.resource_management import ResourceManagement
+from autoprojectmanagement.main_modules.resource_management.leveling_engine import (
+    PARALLEL, SERIAL, LevelingTask, ResourceTimeline, level_tasks
+)
+from autoprojectmanagement.main_modules.resource_management.resource_leveling import ResourceLeveler
 
 class TestResource_leveling:
     """Test class for resource_leveling module"""
@@ -126,3 +130,113 @@ class TestResourceLeveler:
         """Test ResourceLeveler methods"""
         # TODO: Implement method tests
         assert True
+
+
+def make_leveler(tasks, allocations, **options):
+    leveler = ResourceLeveler('tasks.json', 'allocations.json', 'output.json', **options)
+    leveler.tasks = tasks
+    leveler.allocations = allocations
+    return leveler
+
+
+class TestResourceTimeline:
+    """Test class for ResourceTimeline"""
+
+    def test_earliest_fit_skips_busy_windows(self):
+        """Test that a slot is found only where the whole duration fits"""
+        timeline = ResourceTimeline(capacity=1)
+        timeline.reserve(0, 4)
+        timeline.reserve(6, 2)
+        assert timeline.earliest_fit(0, 2) == 4
+        assert timeline.earliest_fit(0, 3) == 8
+        assert timeline.usage_at(5) == 0
+
+    def test_capacity_allows_overlap(self):
+        """Test that units are counted against the capacity"""
+        timeline = ResourceTimeline(capacity=2)
+        timeline.reserve(0, 4)
+        assert timeline.earliest_fit(0, 2) == 0
+        assert timeline.earliest_fit(0, 2, units=2) == 4
+        with pytest.raises(ValueError):
+            timeline.earliest_fit(0, 1, units=3)
+
+
+class TestLevelTasks:
+    """Test class for level_tasks"""
+
+    @pytest.mark.parametrize("scheme", [SERIAL, PARALLEL])
+    def test_importance_orders_competing_tasks(self, scheme):
+        """Test that the more important task gets the shared resource first"""
+        tasks = [LevelingTask('low', 3, {'dev': 1}, priority=0.1),
+                 LevelingTask('high', 2, {'dev': 1}, priority=0.9)]
+        assert level_tasks(tasks, scheme=scheme) == {'high': (0.0, 2.0), 'low': (2.0, 5.0)}
+
+    def test_serial_fills_gaps(self):
+        """Test that the serial scheme places a task before already scheduled ones"""
+        tasks = [LevelingTask('a', 2, {'dev': 1}, priority=3),
+                 LevelingTask('b', 4, {'dev': 1}, priority=2, predecessors=['c']),
+                 LevelingTask('c', 5, {'qa': 1}, priority=1),
+                 LevelingTask('d', 3, {'dev': 1}, priority=0)]
+        schedule = level_tasks(tasks, scheme=SERIAL)
+        assert schedule['b'] == (5.0, 9.0)
+        assert schedule['d'] == (2.0, 5.0)
+
+    def test_circular_dependencies_raise(self):
+        """Test that a precedence cycle is reported"""
+        tasks = [LevelingTask('a', 1, predecessors=['b']), LevelingTask('b', 1, predecessors=['a'])]
+        with pytest.raises(ValueError):
+            level_tasks(tasks)
+
+    def test_unknown_scheme_raises(self):
+        """Test that an unknown scheme is rejected"""
+        with pytest.raises(ValueError):
+            level_tasks([], scheme='random')
+
+
+class TestResourceLevelerScheduling:
+    """Test class for ResourceLeveler.resource_leveling"""
+
+    @pytest.mark.parametrize("scheme", [SERIAL, PARALLEL])
+    def test_dependencies_and_capacities_are_respected(self, scheme):
+        """Test that no task starts early and no role is overbooked"""
+        tasks = [{"id": "P", "subtasks": [
+            {"id": "A", "normal_hours": 4},
+            {"id": "B", "normal_hours": 2, "dependencies": ["A"]},
+            {"id": "C", "normal_hours": 3},
+            {"id": "D", "normal_hours": 1, "importance": 1},
+        ]}]
+        allocations = [{"task_id": tid, "role": "dev"} for tid in "ABCD"]
+        schedules = make_leveler(tasks, allocations, scheme=scheme, capacities={"dev": 2}).resource_leveling()
+
+        assert schedules["D"]["start"] == 0
+        assert schedules["B"]["start"] >= schedules["A"]["end"]
+        events = sorted([(s["start"], 1) for s in schedules.values()] + [(s["end"], -1) for s in schedules.values()])
+        running = 0
+        for _, change in events:
+            running += change
+            assert running <= 2
+
+    def test_summary_dependencies_apply_to_subtasks(self):
+        """Test that depending on a summary task waits for all its subtasks"""
+        tasks = [
+            {"id": "design", "subtasks": [{"id": "d1", "normal_hours": 2}, {"id": "d2", "normal_hours": 5}]},
+            {"id": "build", "dependencies": ["design"], "subtasks": [{"id": "b1", "normal_hours": 1}]},
+        ]
+        leveler = make_leveler(tasks, [{"task_id": "d1", "role": "ux"}, {"task_id": "d2", "role": "pm"}])
+        schedules = leveler.resource_leveling()
+
+        assert schedules["b1"] == {"resource_id": None, "resources": [], "start": 5.0, "end": 6.0}
+        assert leveler.summary_schedules["design"] == {"start": 0.0, "end": 5.0}
+
+    def test_tasks_are_not_copied(self):
+        """Test that the task index holds the input dictionaries"""
+        tasks = [{"id": "P", "subtasks": [{"id": "A", "normal_hours": 1}]}]
+        leveler = make_leveler(tasks, [])
+        leveler.index_tasks(tasks)
+        assert leveler.task_map["A"] is tasks[0]["subtasks"][0]
+        assert leveler.parent_map["A"] == "P"
+
+    def test_invalid_scheme_raises(self):
+        """Test that an unknown scheme is rejected at construction"""
+        with pytest.raises(ValueError):
+            ResourceLeveler('t.json', 'a.json', 'o.json', scheme='random')
@@ -0,0 +1,96 @@
+"""
+Unit tests for autoprojectmanagement/main_modules/planning_estimation/schedule_risk_simulation.py
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add source to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from autoprojectmanagement.main_modules.planning_estimation.dependency_manager import DependencyManager
+from autoprojectmanagement.main_modules.planning_estimation.schedule_risk_simulation import ScheduleRiskSimulator
+
+
+class TestScheduleRiskSimulator:
+    """Test class for ScheduleRiskSimulator"""
+
+    def setup_method(self):
+        """Setup for each test method"""
+        self.wbs = {"id": "root", "subtasks": [
+            {"id": "a", "optimistic_duration": 2, "most_likely_duration": 3, "pessimistic_duration": 6},
+            {"id": "b", "duration": 2, "dependencies": ["a"]},
+            {"id": "c", "duration": 4, "dependencies": ["a"]},
+            {"id": "d", "duration": 1, "dependencies": ["b", "c"]},
+            {"id": "e", "duration": 2},
+        ]}
+
+    def test_passes_match_cpm(self):
+        """Test that batched passes agree with the DependencyManager CPM"""
+        simulator = ScheduleRiskSimulator(self.wbs, seed=7)
+        durations = simulator.sample_durations(20)
+        project, critical = simulator.run_passes(durations)
+        for k in range(20):
+            manager = DependencyManager()
+            manager.load_dependencies_from_wbs(self.wbs)
+            schedule = manager.calculate_schedule(dict(zip(simulator.task_ids, durations[:, k])))
+            assert project[k] == pytest.approx(schedule["project_duration"])
+            flagged = {task_id for task_id, flag in zip(simulator.task_ids, critical[:, k]) if flag}
+            assert flagged == set(schedule["critical_tasks"])
+
+    def test_summary_tasks_match_cpm(self):
+        """Test that summary tasks span their subtasks like in the DependencyManager CPM"""
+        wbs = {"id": "root", "subtasks": [
+            {"id": "p", "subtasks": [
+                {"id": "a", "optimistic_duration": 1, "most_likely_duration": 2, "pessimistic_duration": 5},
+                {"id": "b", "duration": 3, "dependencies": ["a"]},
+            ]},
+            {"id": "c", "duration": 1, "dependencies": ["p"]},
+            {"id": "e", "optimistic_duration": 1, "most_likely_duration": 4, "pessimistic_duration": 9},
+        ]}
+        simulator = ScheduleRiskSimulator(wbs, seed=5)
+        durations = simulator.sample_durations(20)
+        project, critical = simulator.run_passes(durations)
+        assert critical.shape == (len(simulator.task_ids), 20)
+        for k in range(20):
+            manager = DependencyManager()
+            manager.load_dependencies_from_wbs(wbs)
+            schedule = manager.calculate_schedule(dict(zip(simulator.task_ids, durations[:, k])))
+            assert project[k] == pytest.approx(schedule["project_duration"])
+            flagged = {task_id for task_id, flag in zip(simulator.task_ids, critical[:, k]) if flag}
+            assert flagged == set(schedule["critical_tasks"])
+            assert "root" in flagged
+
+    def test_samples_stay_within_estimates(self):
+        """Test both distributions respect the three-point bounds"""
+        for distribution in ("pert", "triangular"):
+            simulator = ScheduleRiskSimulator(self.wbs, distribution=distribution, seed=1)
+            samples = simulator.sample_durations(500)
+            assert (samples >= simulator.optimistic[:, None] - 1e-12).all()
+            assert (samples <= simulator.pessimistic[:, None] + 1e-12).all()
+
+    def test_simulate_percentiles_and_criticality(self):
+        """Test the simulation summary"""
+        result = ScheduleRiskSimulator(self.wbs, seed=3).simulate(
+            iterations=2000, start_date="2026-10-16", batch_size=300)
+        assert result["deterministic_duration"] == 8.0
+        p50, p80, p95 = (result["percentiles"][key]["duration"] for key in ("P50", "P80", "P95"))
+        assert p50 <= p80 <= p95
+        assert result["percentiles"]["P50"]["completion_date"] >= "2026-10-26"
+        criticality = result["criticality_index"]
+        assert criticality["a"] == criticality["c"] == 1.0
+        assert criticality["e"] == 0.0
+
+    def test_seed_makes_runs_reproducible(self):
+        """Test that the same seed gives the same result"""
+        first = ScheduleRiskSimulator(self.wbs, seed=11).simulate(iterations=300)
+        second = ScheduleRiskSimulator(self.wbs, seed=11).simulate(iterations=300)
+        assert first == second
+
+    def test_invalid_estimate(self):
+        """Test that inconsistent three-point estimates are rejected"""
+        wbs = {"id": "root", "subtasks": [
+            {"id": "a", "optimistic_duration": 5, "most_likely_duration": 3, "pessimistic_duration": 6}]}
+        with pytest.raises(ValueError):
+            ScheduleRiskSimulator(wbs)
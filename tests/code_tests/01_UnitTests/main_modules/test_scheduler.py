@@ -96,3 +96,116 @@ class TestScheduler:
         """Test Scheduler methods"""
         # TODO: Implement method tests
         assert True
+
+class FakeClock:
+    """Manually advanced clock for deterministic scheduling tests"""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestEventDrivenScheduler:
+    """Test class for the heap-based Scheduler"""
+
+    def test_interval_jobs_run_when_due(self):
+        """Test that jobs run only once their next run time has passed"""
+        clock = FakeClock()
+        runs = []
+        sched = scheduler.Scheduler(clock=clock)
+        sched.add_job(lambda: runs.append("fast"), interval=10, name="fast")
+        sched.add_job(lambda: runs.append("slow"), interval=30, name="slow")
+
+        assert sched.next_run_time() == clock.now + 10
+        assert sched.run_pending() == []
+        clock.now += 30
+        assert sorted(sched.run_pending()) == ["fast", "slow"]
+        assert sched.next_run_time() == clock.now + 10
+
+    def test_coalesce_skips_missed_runs(self):
+        """Test that missed intervals run once with coalescing and once each without"""
+        clock = FakeClock()
+        runs = []
+        sched = scheduler.Scheduler(clock=clock)
+        sched.add_job(lambda: runs.append("c"), interval=10, name="coalesced")
+        sched.add_job(lambda: runs.append("n"), interval=10, name="catch_up", coalesce=False)
+
+        clock.now += 35
+        sched.run_pending()
+        sched.run_pending()
+        sched.run_pending()
+        assert runs.count("c") == 1
+        assert runs.count("n") == 3
+
+    def test_failing_job_is_isolated(self):
+        """Test that a failing job is recorded and does not stop other jobs"""
+        clock = FakeClock()
+        runs = []
+
+        def broken():
+            raise RuntimeError("boom")
+
+        sched = scheduler.Scheduler(clock=clock)
+        failing = sched.add_job(broken, interval=5, name="broken")
+        sched.add_job(lambda: runs.append(1), interval=5, name="ok")
+        clock.now += 5
+        sched.run_pending()
+        assert runs == [1]
+        assert isinstance(failing.last_error, RuntimeError)
+        assert failing.run_count == 1
+
+    def test_overlap_skip_and_queue(self):
+        """Test that due runs of a busy job are skipped or queued per policy"""
+        clock = FakeClock()
+        sched = scheduler.Scheduler(clock=clock)
+        skip_job = sched.add_job(lambda: None, interval=5, name="skip")
+        queue_job = sched.add_job(lambda: None, interval=5, name="queue", overlap="queue")
+        skip_job.running = 1
+        queue_job.running = 1
+
+        clock.now += 5
+        assert sched.run_pending() == []
+        assert skip_job.skip_count == 1
+        assert queue_job.queued is True
+
+        with sched._condition:
+            sched._finish(queue_job)
+        assert queue_job.queued is False
+        assert queue_job.run_count == 2
+
+    def test_next_run_times_are_persisted(self, tmp_path):
+        """Test that a new scheduler continues from the saved next run times"""
+        state_path = tmp_path / "scheduler_state.json"
+        clock = FakeClock()
+        first = scheduler.Scheduler(clock=clock, state_path=state_path)
+        first.add_job(lambda: None, interval=60, name="report")
+        clock.now += 60
+        first.run_pending()
+
+        clock.now += 10
+        second = scheduler.Scheduler(clock=clock, state_path=state_path)
+        job = second.add_job(lambda: None, interval=60, name="report")
+        assert job.next_run == 1_000_000.0 + 120
+        assert job.last_run == 1_000_000.0 + 60
+
+    def test_daily_trigger(self):
+        """Test that daily jobs run at the next occurrence of their time of day"""
+        start = scheduler.datetime.datetime(2026, 10, 16, 8, 30).timestamp()
+        sched = scheduler.Scheduler(clock=FakeClock(start))
+        job = sched.schedule_daily(lambda: None, at="06:00", name="nightly")
+        assert scheduler.datetime.datetime.fromtimestamp(job.next_run) == \
+            scheduler.datetime.datetime(2026, 10, 17, 6, 0)
+
+    def test_thread_sleeps_until_due(self):
+        """Test that the scheduler thread runs jobs on the pool and stops cleanly"""
+        done = scheduler.threading.Event()
+        sched = scheduler.Scheduler(max_workers=2)
+        sched.add_job(done.set, interval=0.05, name="tick")
+        sched.start()
+        try:
+            assert done.wait(timeout=5)
+        finally:
+            sched.stop()
+        assert sched.jobs[0].run_count >= 1
@@ -141,3 +141,150 @@ class TestScopeManagement:
         """Test ScopeManagement methods"""
         # TODO: Implement method tests
         assert True
+
+class TestScopeDependencyGraph:
+    """Test class for the cached dependency maps of ScopeManagement"""
+
+    def build_manager(self):
+        manager = scope_management.ScopeManagement(notification_service=Mock())
+        manager.detailed_wbs = {
+            "id": 0, "name": "Project", "subtasks": [
+                {"id": 1, "name": "Design", "estimated_duration": 5},
+                {"id": 2, "name": "Build", "estimated_duration": 10, "dependencies": [1]},
+                {"id": 3, "name": "Test", "estimated_duration": 4, "dependencies": [2]},
+            ],
+        }
+        return manager
+
+    def test_maps_are_built_once_per_tree(self):
+        """Test that repeated impact analyses reuse one dependency graph"""
+        manager = self.build_manager()
+        changes = [
+            {"task_id": 1, "change_type": "add", "details": {"task": {"estimated_duration": 2}}},
+            {"task_id": 2, "change_type": "remove", "details": {}},
+        ]
+        results = manager.analyze_scope_changes(changes)
+        graph = manager._dependency_graph
+        assert [r["change_id"] for r in results] == [1, 2]
+        assert sorted(results[0]["affected_tasks"]) == [2]
+        assert graph[0] is manager.detailed_wbs
+
+        manager.analyze_scope_changes(changes)
+        assert manager._dependency_graph is graph
+        assert manager._build_reverse_dependency_mapping() == {1: [2], 2: [3]}
+
+    def test_apply_scope_changes_invalidates_graph(self):
+        """Test that applying scope changes rebuilds the dependency maps"""
+        manager = self.build_manager()
+        assert manager._build_reverse_dependency_mapping() == {1: [2], 2: [3]}
+        manager.scope_changes = [{"task_id": 3, "change_type": "remove", "details": {}}]
+        manager.apply_scope_changes()
+        assert manager._build_reverse_dependency_mapping() == {1: [2]}
+
+class TestScopeChangeTransaction:
+    """Test class for ScopeManagement.apply_scope_changes_transaction"""
+
+    def build_manager(self):
+        manager = scope_management.ScopeManagement(notification_service=Mock())
+        manager.detailed_wbs = {
+            "id": 0, "name": "Project", "subtasks": [
+                {"id": 1, "name": "Design"},
+                {"id": 2, "name": "Build", "subtasks": [{"id": 3, "name": "Backend"}]},
+            ],
+        }
+        return manager
+
+    def test_applies_batch_and_writes_once(self, tmp_path):
+        """Test that a valid batch is applied and both files are written"""
+        manager = self.build_manager()
+        changes = [
+            {"task_id": 4, "change_type": "add", "details": {"parent_id": 1, "task": {"id": 4, "name": "Mockups"}}},
+            {"task_id": 4, "change_type": "modify", "details": {"name": "Wireframes"}},
+            {"task_id": 2, "change_type": "remove", "details": {}},
+        ]
+        status = manager.apply_scope_changes_transaction(
+            changes, tmp_path / "wbs.json", tmp_path / "changes.json")
+
+        assert status["added_tasks"] == [4]
+        assert status["removed_tasks"] == [2]
+        assert manager.find_task_by_id(4)["name"] == "Wireframes"
+        assert changes[0]["details"]["task"]["name"] == "Mockups"
+        written = scope_management.json.loads((tmp_path / "wbs.json").read_text(encoding="utf-8"))
+        assert written == manager.detailed_wbs
+        log = scope_management.json.loads((tmp_path / "changes.json").read_text(encoding="utf-8"))
+        assert [entry["change_type"] for entry in log] == ["add", "modify", "remove"]
+        assert all("applied_at" in entry for entry in log)
+
+    def test_invalid_change_rolls_back_everything(self, tmp_path):
+        """Test that a failing change undoes all earlier changes and writes nothing"""
+        manager = self.build_manager()
+        original = scope_management.json.loads(scope_management.json.dumps(manager.detailed_wbs))
+        changes = [
+            {"task_id": 5, "change_type": "add", "details": {"parent_id": 1, "task": {"id": 5, "name": "New"}}},
+            {"task_id": 3, "change_type": "modify", "details": {"id": 30, "name": "Renamed"}},
+            {"task_id": 2, "change_type": "remove", "details": {}},
+            {"task_id": 99, "change_type": "modify", "details": {"name": "Missing"}},
+        ]
+        with pytest.raises(scope_management.InvalidScopeChangeError, match="Change 3"):
+            manager.apply_scope_changes_transaction(changes, tmp_path / "wbs.json")
+
+        assert manager.detailed_wbs == original
+        assert manager.find_task_by_id(3)["name"] == "Backend"
+        assert manager.find_task_by_id(5) is None
+        assert not (tmp_path / "wbs.json").exists()
+
+    def test_duplicate_task_id_is_rejected(self):
+        """Test that adding a task with an existing ID is rejected"""
+        manager = self.build_manager()
+        changes = [{"task_id": 3, "change_type": "add",
+                    "details": {"parent_id": 1, "task": {"id": 3, "name": "Copy"}}}]
+        with pytest.raises(scope_management.InvalidScopeChangeError, match="already exist"):
+            manager.apply_scope_changes_transaction(changes)
+        assert "subtasks" not in manager.detailed_wbs["subtasks"][0]
+
+    def test_failed_log_write_restores_wbs_file(self, tmp_path, monkeypatch):
+        """Test that a failing second rename puts the previous WBS file back"""
+        manager = self.build_manager()
+        wbs_path = tmp_path / "wbs.json"
+        wbs_path.write_text('{"id": 0}', encoding="utf-8")
+        changes = [{"task_id": 1, "change_type": "modify", "details": {"name": "Discovery"}}]
+        real_replace = scope_management.os.replace
+
+        def failing_replace(source, destination):
+            if Path(destination).name == "changes.json":
+                raise OSError("disk full")
+            return real_replace(source, destination)
+
+        monkeypatch.setattr(scope_management.os, "replace", failing_replace)
+        with pytest.raises(scope_management.ScopeManagementError, match="disk full"):
+            manager.apply_scope_changes_transaction(changes, wbs_path, tmp_path / "changes.json")
+
+        assert wbs_path.read_text(encoding="utf-8") == '{"id": 0}'
+        assert not (tmp_path / "changes.json").exists()
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["wbs.json"]
+        assert manager.find_task_by_id(1)["name"] == "Design"
+
+    def test_run_rolls_back_invalid_batch(self, tmp_path):
+        """Test that run applies none of the approved changes when one is invalid"""
+        wbs_path = tmp_path / "wbs.json"
+        changes_path = tmp_path / "changes.json"
+        output_path = tmp_path / "scope.json"
+        wbs = self.build_manager().detailed_wbs
+        wbs_path.write_text(scope_management.json.dumps(wbs), encoding="utf-8")
+        changes_path.write_text(scope_management.json.dumps([
+            {"task_id": 1, "change_type": "modify", "details": {"name": "Discovery"},
+             "approval_status": {"status": "approved"}},
+            {"task_id": 99, "change_type": "modify", "details": {"name": "Missing"},
+             "approval_status": {"status": "approved"}},
+        ]), encoding="utf-8")
+        manager = scope_management.ScopeManagement(str(wbs_path), str(changes_path), str(output_path),
+                                                   notification_service=Mock())
+        low_risk = {"risk_level": "low", "schedule_impact": 0, "cost_impact": 0, "resource_impact": 0}
+
+        with patch.object(manager, "analyze_scope_change_impact", return_value=low_risk):
+            manager.run()
+
+        output = scope_management.json.loads(output_path.read_text(encoding="utf-8"))
+        assert output["detailed_wbs"] == wbs
+        assert manager.scope_status["modified_tasks"] == []
+        assert "rolled back" in manager.scope_status["errors"][0]
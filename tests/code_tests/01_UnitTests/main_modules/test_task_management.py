@@ -3,6 +3,7 @@ Auto-generated tests for autoprojectmanagement\main_modules\task_management.py
 Generated by AutoProjectManagement testing framework
 """
 
+import datetime
 import pytest
 from unittest.mock import Mock, patch
 import sys
@@ -319,3 +320,99 @@ class TestTaskManagement:
         """Test TaskManagement methods"""
         # TODO: Implement method tests
         assert True
+
+
+class TestUrgencyImportancePropagation:
+    """Test class for TaskManagement.calculate_urgency_importance"""
+
+    def build(self, model=None):
+        tm = task_management.TaskManagement(model or task_management.TaskFactorModel(today=datetime.date(2025, 1, 1)))
+        specs = [
+            (1, None, {}),
+            (2, 1, {"priority": 10, "deadline": datetime.date(2025, 1, 1)}),
+            (3, 1, {"dependencies": [4]}),
+            (4, 3, {"deadline": datetime.date(2025, 1, 16)}),
+            (5, 3, {"deadline": datetime.date(2025, 6, 1), "factors": {"cost_impact": 10}}),
+            (6, 99, {}),
+        ]
+        for task_id, parent_id, extra in specs:
+            tm.tasks[task_id] = task_management.Task(task_id, f"Task {task_id}", parent_id=parent_id, **extra)
+        return tm
+
+    def test_leaf_scores_are_deterministic(self):
+        """Test that leaves are scored from their attributes, identically every run"""
+        tm = self.build()
+        tm.calculate_urgency_importance()
+        first = {task_id: (task.importance, task.urgency) for task_id, task in tm.tasks.items()}
+        tm.calculate_urgency_importance()
+
+        assert {task_id: (task.importance, task.urgency) for task_id, task in tm.tasks.items()} == first
+        # Neutral factors are 5; dependency and bottleneck count dependants,
+        # priority and deadline proximity are clamped to 1-10
+        assert first[2] == (45 + 1 + 1 + 10, 35 + 10 + 1 + 10)
+        assert first[4] == (45 + 2 + 2 + 1, 35 + 5.5 + 2 + 1)
+        assert first[5] == (45 + 1 + 1 + 1 + 5, 35 + 1 + 1 + 1)
+
+    def test_parents_sum_children(self):
+        """Test that every parent gets the sums of its children's values"""
+        tm = self.build()
+        tm.calculate_urgency_importance()
+        tasks = tm.tasks
+
+        assert tasks[3].importance == tasks[4].importance + tasks[5].importance
+        assert tasks[3].urgency == tasks[4].urgency + tasks[5].urgency
+        assert tasks[1].importance == tasks[2].importance + tasks[3].importance
+        # A task whose parent is unknown is a root
+        assert tasks[6].importance == 48
+
+    def test_factor_breakdown_matches_score(self):
+        """Test that the factor breakdown adds up to the score"""
+        model = task_management.TaskFactorModel(today=datetime.date(2025, 1, 1))
+        for task in self.build().tasks.values():
+            importance, urgency = model.score(task, 2)
+            assert importance == pytest.approx(sum(model.importance_factors(task, 2).values()))
+            assert urgency == pytest.approx(sum(model.urgency_factors(task, 2).values()))
+            assert set(model.importance_factors(task)) == set(task_management.IMPORTANCE_FACTORS)
+
+    def test_pluggable_model(self):
+        """Test that a custom factor model scores the leaves"""
+        class PriorityModel(task_management.TaskFactorModel):
+            def score(self, task, dependents=0):
+                return task.priority * 10, 100
+
+        tm = self.build(PriorityModel())
+        prioritized = tm.prioritize_tasks()
+
+        assert tm.tasks[1].importance == 100
+        assert tm.tasks[1].urgency == 300
+        assert prioritized[0].id == 1
+
+    def test_overridden_factor_rules_are_scored(self):
+        """Test that score follows overridden factor methods for tasks without given factors"""
+        class RiskyModel(task_management.TaskFactorModel):
+            def urgency_factors(self, task, dependents=0):
+                factors = super().urgency_factors(task, dependents)
+                factors["high_delay_risk"] = 10
+                return factors
+
+        class FlatModel(task_management.TaskFactorModel):
+            def derived_factors(self, task, dependents=0):
+                return 1.0, 1.0, 1.0
+
+        today = datetime.date(2025, 1, 1)
+        default = task_management.TaskFactorModel(today=today)
+        task = self.build().tasks[4]
+        assert RiskyModel(today=today).score(task, 1) == (default.score(task, 1)[0], default.score(task, 1)[1] + 5)
+        assert FlatModel(today=today).score(task, 1) == (45 + 3, 35 + 3)
+        assert FlatModel(today=today).score(task, 1) == (
+            sum(FlatModel(today=today).importance_factors(task, 1).values()),
+            sum(FlatModel(today=today).urgency_factors(task, 1).values()))
+
+    def test_deep_hierarchy(self):
+        """Test that deep hierarchies propagate without recursion"""
+        tm = task_management.TaskManagement()
+        for task_id in range(1, 5001):
+            tm.tasks[task_id] = task_management.Task(task_id, "t", parent_id=task_id - 1 or None)
+        tm.calculate_urgency_importance()
+
+        assert tm.tasks[1].importance == tm.tasks[5000].importance
@@ -0,0 +1,192 @@
+"""
+Unit tests for autoprojectmanagement/main_modules/task_workflow_management/task_priority_queue.py
+"""
+
+import asyncio
+import datetime
+import random
+import pytest
+import sys
+from pathlib import Path
+
+# Add source to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from autoprojectmanagement.main_modules.task_workflow_management import task_management
+from autoprojectmanagement.main_modules.task_workflow_management.do_important_tasks import (
+    ImportantTask, ImportantTaskManager, TaskPrioritizer, TaskStatus
+)
+from autoprojectmanagement.main_modules.task_workflow_management.task_priority_queue import TaskPriorityQueue
+
+
+def sorted_keys(scores, order):
+    return sorted(scores, key=lambda key: (-scores[key], order.index(key)))
+
+
+class TestTaskPriorityQueue:
+    """Test class for TaskPriorityQueue"""
+
+    def test_top_k(self):
+        """Test that top returns the best tasks in order and leaves the queue intact"""
+        queue = TaskPriorityQueue([("a", 3, "A"), ("b", 7, "B"), ("c", 5, "C"), ("d", 7, "D")])
+
+        assert queue.top(2) == ["B", "D"]
+        assert queue.top() == ["B", "D", "C", "A"]
+        assert queue.top(10) == queue.top()
+        assert queue.top(0) == []
+        assert len(queue) == 4 and queue.peek() == "B"
+
+    def test_update_and_remove(self):
+        """Test that changed scores move tasks and removed tasks leave the queue"""
+        queue = TaskPriorityQueue()
+        for key, score in (("a", 1), ("b", 2), ("c", 3)):
+            queue.push(key, score, key.upper())
+
+        queue.update("a", 10)
+        assert queue.top(1) == ["A"]
+        queue.push("c", 0, "C2")
+        assert queue.top() == ["A", "B", "C2"]
+        assert queue.remove("b") == "B"
+        assert "b" not in queue and queue.score("a") == 10
+        assert [queue.pop(), queue.pop()] == ["A", "C2"]
+
+        with pytest.raises(IndexError):
+            queue.pop()
+        with pytest.raises(KeyError):
+            queue.update("a", 1)
+
+    def test_matches_stable_sort(self):
+        """Test random operations against a stable sort of the same scores"""
+        rng = random.Random(7)
+        queue, scores, order = TaskPriorityQueue(), {}, []
+        for _ in range(2000):
+            key, score = rng.randrange(50), rng.randrange(10)
+            action = rng.random()
+            if action < 0.6:
+                queue.push(key, score, key)
+                if key not in scores:
+                    order.append(key)
+                scores[key] = score
+            elif key in scores:
+                queue.remove(key)
+                del scores[key]
+                order.remove(key)
+            expected = sorted_keys(scores, order)
+            assert queue.top(5) == expected[:5]
+        assert queue.top() == sorted_keys(scores, order)
+
+    def test_duplicate_keys(self):
+        """Test that a queue cannot be built with duplicate keys"""
+        with pytest.raises(ValueError):
+            TaskPriorityQueue([("a", 1, None), ("a", 2, None)])
+
+
+class TestTaskManagementPriorityQueue:
+    """Test class for the priority queue of TaskManagement"""
+
+    def build(self):
+        today = datetime.date.today()
+        tm = task_management.TaskManagement()
+        for task_id in range(1, 41):
+            tm.tasks[task_id] = task_management.Task(task_id, "t", priority=task_id % 4,
+                                                     deadline=today + datetime.timedelta(days=task_id % 5),
+                                                     dependencies=[task_id - 1] if task_id % 3 else [])
+        return tm
+
+    def test_matches_full_sort(self):
+        """Test that the queue orders tasks like the previous full sort"""
+        tm = self.build()
+        prioritized = tm.prioritize_tasks()
+        expected = sorted(tm.tasks.values(), key=lambda task: (task.importance * 0.7 + task.urgency * 0.3,
+                                                               task.deadline), reverse=True)
+
+        assert prioritized == expected
+        assert tm.top_tasks(5) == expected[:5]
+        assert tm.prioritize_tasks(3) == expected[:3]
+
+    def test_reprioritize_task(self):
+        """Test that a rescored task moves without rebuilding the queue"""
+        tm = self.build()
+        tm.prioritize_tasks()
+        task = tm.tasks[40]
+        task.importance = 1000
+
+        tm.reprioritize_task(40)
+        assert tm.top_tasks(1) == [task]
+        del tm.tasks[40]
+        tm.reprioritize_task(40)
+        assert task not in tm.top_tasks(40)
+
+
+class TestImportantTaskManagerPriorityQueue:
+    """Test class for the priority queue of ImportantTaskManager"""
+
+    def test_served_from_memory(self, tmp_path, monkeypatch):
+        """Test that prioritized tasks follow changes without reading storage again"""
+        monkeypatch.chdir(tmp_path)
+        manager = ImportantTaskManager()
+
+        async def scenario():
+            await manager.initialize()
+            low = await manager.create_important_task("Low", "", 3, 8.0, 10.0)
+            high = await manager.create_important_task("High", "", 1, 1.0, 90.0)
+            await manager.update_task_status(low, TaskStatus.IN_PROGRESS, 50.0)
+
+            async def no_reads():
+                raise AssertionError("storage was read")
+            monkeypatch.setattr(manager.storage, "load_tasks", no_reads)
+            return low, high, await manager.get_prioritized_tasks(1), await manager.get_prioritized_tasks()
+
+        low, high, first, prioritized = asyncio.run(scenario())
+
+        assert [task.id for task in first] == [high]
+        assert [task.id for task in prioritized] == [high, low]
+        assert prioritized[1].status == TaskStatus.IN_PROGRESS
+
+    def test_reloads_after_external_change(self, tmp_path, monkeypatch):
+        """Test that tasks stored by another manager are picked up, own writes are not reread"""
+        monkeypatch.chdir(tmp_path)
+        manager = ImportantTaskManager()
+        other = ImportantTaskManager()
+        reloads = []
+        index_tasks = manager._index_tasks
+        monkeypatch.setattr(manager, "_index_tasks", lambda tasks: reloads.append(1) or index_tasks(tasks))
+
+        async def scenario():
+            await manager.initialize()
+            own = await manager.create_important_task("Own", "", 3, 8.0, 10.0)
+            await manager.get_prioritized_tasks()
+            first_reloads = len(reloads)
+            external = await other.create_important_task("External", "", 1, 1.0, 90.0)
+            return own, external, first_reloads, await manager.get_prioritized_tasks()
+
+        own, external, first_reloads, prioritized = asyncio.run(scenario())
+
+        assert first_reloads == 1
+        assert [task.id for task in prioritized] == [external, own]
+        assert len(reloads) == 2
+
+    def test_urgency_steps_rescore(self, tmp_path, monkeypatch):
+        """Test that tasks are rescored once their deadline urgency steps up"""
+        monkeypatch.chdir(tmp_path)
+        prioritizer = TaskPrioritizer({})
+        now = datetime.datetime(2025, 1, 1, 12, 0)
+        manager = ImportantTaskManager()
+        manager._index_tasks([])
+
+        early = ImportantTask("early", "Early", "", 1, 4.0, 50.0, [], deadline=now + datetime.timedelta(days=40))
+        later = ImportantTask("later", "Later", "", 1, 4.0, 55.0, [], deadline=now + datetime.timedelta(days=90))
+        manager._queue_task(later, now)
+        manager._queue_task(early, now)
+        assert manager.priority_queue.top() == [later, early]
+
+        change = prioritizer.next_score_change(early, now)
+        assert change == early.deadline - datetime.timedelta(days=31)
+        manager._refresh_scores(change)
+        assert manager.priority_queue.top() == [later, early]
+
+        moment = change + datetime.timedelta(seconds=1)
+        manager._refresh_scores(moment)
+        assert manager.priority_queue.score("early") == pytest.approx(
+            prioritizer.calculate_priority_score(early, moment))
+        assert manager.priority_queue.top() == [early, later]
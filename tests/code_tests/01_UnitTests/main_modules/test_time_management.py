@@ -126,3 +126,55 @@ class TestTimeManagement:
         """Test TimeManagement methods"""
         # TODO: Implement method tests
         assert True
+
+class TestCalendarAwareScheduling:
+    """Test class for calendar-aware TimeManagement scheduling"""
+
+    def build_manager(self):
+        calendars = time_management.ResourceCalendars.from_config({
+            "default": {"holidays": ["2026-10-19"]},
+            "resources": {"alice": {"weekmask": "Mon Tue Wed"}},
+        })
+        manager = time_management.TimeManagement(calendars=calendars)
+        manager.detailed_wbs = {
+            "id": "root", "name": "Project", "subtasks": [
+                {"id": "a", "name": "A", "resource_allocations": [
+                    {"resource_id": "alice", "start_date": "2026-10-12", "end_date": "2026-10-16"},
+                    {"resource_id": "bob", "start_date": "2026-10-14", "end_date": "2026-10-20"},
+                ]},
+                {"id": "b", "name": "B", "subtasks": [
+                    {"id": "b1", "name": "B1", "resource_allocations": [
+                        {"resource_id": "bob", "start_date": "2026-10-21", "end_date": "bad"},
+                        {"resource_id": "bob", "start_date": "2026-10-22", "end_date": "2026-10-23"},
+                    ]},
+                ]},
+            ],
+        }
+        return manager
+
+    def test_duration_uses_valid_allocations(self):
+        """Test that calendar-day duration skips unparsable allocations"""
+        manager = self.build_manager()
+        assert manager.calculate_task_duration(manager.detailed_wbs["subtasks"][0]) == 9
+        assert manager.calculate_task_duration(manager.detailed_wbs["subtasks"][1]["subtasks"][0]) == 2
+        assert manager.calculate_task_duration({}) == 0
+
+    def test_resource_working_days_use_resource_calendars(self):
+        """Test per-resource working days on each resource's calendar"""
+        manager = self.build_manager()
+        working_days = manager.calculate_resource_working_days(manager.detailed_wbs["subtasks"][0])
+        # alice works Mon-Wed; bob loses the Monday holiday and the weekend
+        assert working_days == {"alice": 3, "bob": 4}
+
+    def test_schedule_rolls_dates_up_to_parents(self):
+        """Test that parents span their subtasks' dates"""
+        manager = self.build_manager()
+        manager.schedule_tasks()
+        schedules = manager.task_schedules
+
+        assert list(schedules) == ["root", "a", "b", "b1"]
+        assert (schedules["b"]["start_date"], schedules["b"]["end_date"]) == ("2026-10-22", "2026-10-23")
+        assert (schedules["root"]["start_date"], schedules["root"]["end_date"]) == ("2026-10-12", "2026-10-23")
+        assert schedules["root"]["duration_days"] == 12
+        assert schedules["root"]["working_days"] == 9
+        assert schedules["a"]["working_days"] == 6
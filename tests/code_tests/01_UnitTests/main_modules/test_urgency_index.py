@@ -0,0 +1,195 @@
+"""
+Unit tests for autoprojectmanagement/main_modules/task_workflow_management/urgency_index.py
+"""
+
+import datetime
+import math
+import threading
+import pytest
+import sys
+from pathlib import Path
+
+# Add source to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from autoprojectmanagement.main_modules.progress_reporting.progress_calculator import ProgressCalculator
+from autoprojectmanagement.main_modules.task_workflow_management import task_management
+from autoprojectmanagement.main_modules.task_workflow_management.importance_urgency_calculator import (
+    ImportanceUrgencyCalculator
+)
+from autoprojectmanagement.main_modules.task_workflow_management.urgency_index import (
+    DeadlineScore, UrgencyIndex
+)
+
+DAY = 86400.0
+
+
+class Clock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestDeadlineScore:
+    """Test class for DeadlineScore"""
+
+    def test_linear_ramp(self):
+        """Test values and the threshold crossing of a linear ramp"""
+        score = DeadlineScore.ramp(10 * DAY, window=4 * DAY, weight=60, base=20)
+
+        assert score.value(0) == 20
+        assert score.value(8 * DAY) == pytest.approx(50)
+        assert score.value(11 * DAY) == 80
+        assert score.crossing_time(70) == pytest.approx(10 * DAY - 4 * DAY / 6)
+        assert score.crossing_time(20) == -math.inf
+        assert score.crossing_time(81) is None
+
+    def test_stepped_ramp(self):
+        """Test that stepped ramps rise once per step, at the step boundary"""
+        score = DeadlineScore.ramp(30 * DAY, window=30 * DAY, weight=9, base=1, step=DAY)
+
+        assert score.value(20 * DAY) == pytest.approx(1 + 9 * 20 / 30)
+        assert score.value(20.5 * DAY) == score.value(20 * DAY)
+        assert score.value(21 * DAY) == pytest.approx(1 + 9 * 21 / 30)
+        crossing = score.crossing_time(7)
+        assert crossing == 20 * DAY
+        assert score.value(crossing) >= 7 > score.value(crossing - 1)
+
+    def test_total(self):
+        """Test that sums and averages cross where their values reach the threshold"""
+        scores = [DeadlineScore.ramp(10 * DAY, 2 * DAY, 40), DeadlineScore.ramp(5 * DAY, DAY, 40, step=DAY / 4),
+                  DeadlineScore(10)]
+        average = DeadlineScore.total(scores, factor=1 / 3)
+
+        assert average.value(20 * DAY) == pytest.approx(30)
+        for threshold in (5, 15, 18, 25, 29.9):
+            crossing = average.crossing_time(threshold)
+            assert average.value(crossing) >= threshold - 1e-9
+            assert average.value(crossing - 1) < threshold
+
+    def test_invalid_terms(self):
+        """Test that falling scores are rejected"""
+        with pytest.raises(ValueError):
+            DeadlineScore.ramp(DAY, window=DAY, weight=-1)
+
+
+class TestUrgencyIndex:
+    """Test class for UrgencyIndex"""
+
+    def setup_method(self):
+        """Setup for each test method"""
+        self.clock = Clock()
+        self.index = UrgencyIndex(clock=self.clock)
+        self.changes = []
+        self.index.subscribe(self.changes.append)
+
+    def test_crossings_fire_in_order(self):
+        """Test that only tasks whose crossing has come change quadrant"""
+        assert self.index.set("a", 80, DeadlineScore.ramp(2 * DAY, DAY, 50, base=30)) == "schedule"
+        assert self.index.set("b", 10, DeadlineScore.ramp(5 * DAY, DAY, 50, base=30)) == "eliminate"
+        assert self.index.set("c", 90, 75) == "do_now"
+        assert self.index.next_crossing() == pytest.approx(2 * DAY - DAY / 5)
+
+        assert self.index.advance(DAY) == {}
+        assert self.index.advance(3 * DAY) == {"a": "do_now"}
+        assert self.index.quadrants(6 * DAY) == {"do_now": ["a", "c"], "schedule": [], "delegate": ["b"],
+                                                 "eliminate": []}
+        assert self.changes == [{"a": "do_now"}, {"b": "delegate"}]
+        assert self.index.next_crossing() is None
+
+    def test_replace_and_remove(self):
+        """Test that replaced and removed tasks drop their pending crossings"""
+        self.index.set("a", 0, DeadlineScore.ramp(2 * DAY, DAY, 50, base=30))
+        self.index.set("a", 0, DeadlineScore.ramp(9 * DAY, DAY, 50, base=30))
+        self.index.set("b", 0, DeadlineScore.ramp(4 * DAY, DAY, 50, base=30))
+        assert self.index.due_by(5 * DAY) == ["b"]
+        self.index.remove("b")
+
+        assert self.index.advance(5 * DAY) == {}
+        assert "b" not in self.index and len(self.index) == 1
+        assert self.index.due_by(10 * DAY) == ["a"]
+        assert self.index.advance(9 * DAY) == {"a": "delegate"}
+
+    def test_background_thread(self):
+        """Test that the background thread advances when a crossing is due"""
+        fired = threading.Event()
+        self.index.subscribe(lambda changed: fired.set())
+        self.clock.now = 100.0
+        self.index.set("a", 0, DeadlineScore.ramp(100.05, 1.0, 50, base=30))
+        self.index.start()
+        try:
+            self.clock.now = 200.0
+            assert fired.wait(2)
+        finally:
+            self.index.stop()
+        assert self.index.quadrant("a") == "delegate"
+
+
+class TestTaskManagementUrgencyTracking:
+    """Test class for TaskManagement.track_urgency"""
+
+    def test_classification_follows_the_clock(self):
+        """Test that classification uses the crossings of approaching deadlines"""
+        today = datetime.date.today()
+        tm = task_management.TaskManagement()
+        factors = {name: 7 for name in task_management.URGENCY_FACTORS if name != "deadline_proximity"}
+        factors.update({name: 9 for name in task_management.IMPORTANCE_FACTORS})
+        tm.tasks[1] = task_management.Task(1, "Release", deadline=today + datetime.timedelta(days=20), factors=factors)
+        tm.tasks[2] = task_management.Task(2, "Docs")
+
+        index = tm.track_urgency()
+        assert [task.id for task in tm.classify_tasks_eisenhower()["schedule"]] == [1]
+
+        midnight = datetime.datetime.combine(today, datetime.time.min).timestamp()
+        crossing = index.next_crossing()
+        # 63 + proximity reaches 70 once proximity reaches 7, 10 days before the deadline
+        assert crossing == midnight + 10 * task_management.SECONDS_PER_DAY
+
+        index.advance(crossing)
+        assert [task.id for task in tm.classify_tasks_eisenhower()["do_now"]] == [1]
+        assert tm.tasks[1].urgency == pytest.approx(70)
+        assert [task.id for task in tm.classify_tasks_eisenhower()["eliminate"]] == [2]
+
+    def test_scores_match_the_factor_model(self):
+        """Test that indexed urgency equals the factor model's score today"""
+        today = datetime.date.today()
+        tm = task_management.TaskManagement()
+        tm.tasks[1] = task_management.Task(1, "Root")
+        for task_id, days in ((2, 3), (3, 45), (4, -2)):
+            tm.tasks[task_id] = task_management.Task(task_id, "Leaf", parent_id=1, priority=task_id,
+                                                     deadline=today + datetime.timedelta(days=days))
+        index = tm.track_urgency()
+
+        for task in tm.tasks.values():
+            assert index.urgency(task.id) == pytest.approx(task.urgency)
+
+
+class TestCalculatorDeadlineScores:
+    """Test class for the deadline scores of the urgency calculators"""
+
+    def test_progress_calculator(self):
+        """Test that dynamic scores match calculate_dynamic_urgency/importance"""
+        now = datetime.datetime(2025, 3, 1, 9, 30)
+        calculator = ProgressCalculator()
+        task = {"id": "T1", "deadline": "2025-03-03T12:00:00", "status": "pending",
+                "dependencies": ["a", "b"], "priority": 6}
+
+        assert calculator.dynamic_urgency_score(task).value(now.timestamp()) == pytest.approx(
+            calculator.calculate_dynamic_urgency(task, now=now))
+        assert calculator.dynamic_importance_score(task).value(now.timestamp()) == pytest.approx(
+            calculator.calculate_dynamic_importance(task, now=now))
+
+        calculator.tasks = [task, {"id": "T2"}]
+        quadrants = calculator.build_urgency_index().quadrants(now.timestamp())
+        assert quadrants["delegate"] == ["T1"]
+
+    def test_importance_urgency_calculator(self):
+        """Test that the urgency score matches calculate_urgency"""
+        now = datetime.datetime(2025, 3, 1, 9, 30)
+        calculator = ImportanceUrgencyCalculator([])
+        task = {"id": "T1", "deadline": "2025-03-02T12:00:00", "risk_of_delay": 4}
+
+        assert calculator.urgency_score(task).value(now.timestamp()) == pytest.approx(
+            calculator.calculate_urgency(task, now=now), abs=0.005)
@@ -0,0 +1,130 @@
+"""
+Unit tests for autoprojectmanagement/main_modules/resource_management/utilization.py
+"""
+
+import datetime
+import sys
+from pathlib import Path
+
+# Add source to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from autoprojectmanagement.main_modules.resource_management.utilization import (
+    build_utilization_matrix, find_over_allocations
+)
+
+
+def allocation(task_id, resource_id, percent, start, end):
+    return {"task_id": task_id, "resource_id": resource_id, "allocation_percent": percent,
+            "start_date": start, "end_date": end}
+
+
+ALLOCATIONS = [
+    allocation("A", "alice", 100, "2025-03-03", "2025-03-07"),
+    allocation("B", "alice", 50, "2025-03-06", "2025-03-10"),
+    allocation("C", "bob", 40, "2025-03-01", "2025-03-02"),
+    allocation("D", "bob", 100, "2025-03-09", "2025-03-08"),
+    allocation("E", "carol", 100, "not a date", "2025-03-08"),
+]
+
+
+class TestUtilizationMatrix:
+    """Test class for build_utilization_matrix"""
+
+    def test_daily_loads(self):
+        """Test that every day carries the load of the allocations covering it"""
+        matrix = build_utilization_matrix(ALLOCATIONS)
+
+        assert matrix.resource_ids == ["alice", "bob"]
+        assert matrix.start_date == datetime.date(2025, 3, 1)
+        assert matrix.end_date == datetime.date(2025, 3, 10)
+        assert matrix.series("alice").tolist() == [0, 0, 1, 1, 1, 1.5, 1.5, 0.5, 0.5, 0.5]
+        assert matrix.series("bob").tolist() == [0.4, 0.4, 0, 0, 0, 0, 0, 0, 0, 0]
+        assert matrix.series("carol").tolist() == [0.0] * 10
+
+    def test_range_clips_allocations(self):
+        """Test that allocations are clipped to the requested dates"""
+        matrix = build_utilization_matrix(ALLOCATIONS, resource_ids=["alice"],
+                                          start_date=datetime.date(2025, 3, 7),
+                                          end_date=datetime.date(2025, 3, 12))
+
+        assert matrix.values.shape == (1, 6)
+        assert matrix.series("alice").tolist() == [1.5, 0.5, 0.5, 0.5, 0, 0]
+        assert matrix.load_on("alice", datetime.date(2025, 3, 1)) == 0.0
+
+    def test_summary(self):
+        """Test peak and average daily loads"""
+        summary = build_utilization_matrix(ALLOCATIONS).summary()
+        assert summary["alice"] == {"peak_daily_utilization": 1.5, "average_daily_utilization": 0.75}
+
+
+class TestFindOverAllocations:
+    """Test class for find_over_allocations"""
+
+    def test_overlap_beyond_capacity(self):
+        """Test that only the days above capacity are reported, with their tasks"""
+        assert find_over_allocations(ALLOCATIONS) == [{
+            "resource_id": "alice",
+            "start_date": "2025-03-06",
+            "end_date": "2025-03-07",
+            "peak_load": 1.5,
+            "capacity": 1.0,
+            "task_ids": ["A", "B"],
+        }]
+
+    def test_consecutive_segments_merge(self):
+        """Test that adjacent over-allocated segments form one period"""
+        allocations = [
+            allocation("A", "dev", 100, "2025-01-01", "2025-01-10"),
+            allocation("B", "dev", 50, "2025-01-03", "2025-01-05"),
+            allocation("C", "dev", 100, "2025-01-06", "2025-01-06"),
+            allocation("D", "dev", 50, "2025-01-09", "2025-01-09"),
+        ]
+        periods = find_over_allocations(allocations)
+
+        assert [(p["start_date"], p["end_date"], p["peak_load"], p["task_ids"]) for p in periods] == [
+            ("2025-01-03", "2025-01-06", 2.0, ["A", "B", "C"]),
+            ("2025-01-09", "2025-01-09", 1.5, ["A", "D"]),
+        ]
+
+    def test_capacities_and_rounding(self):
+        """Test per-resource capacities and tolerance for percentage rounding"""
+        allocations = [allocation(task, "team", 33.3333333, "2025-01-01", "2025-01-02") for task in "ABC"]
+        allocations.append(allocation("D", "team", 100, "2025-01-02", "2025-01-02"))
+
+        assert find_over_allocations(allocations[:3]) == []
+        periods = find_over_allocations(allocations, capacities={"team": 2})
+        assert periods == []
+        periods = find_over_allocations(allocations, capacity=1.5)
+        assert [(p["start_date"], p["end_date"]) for p in periods] == [("2025-01-02", "2025-01-02")]
+
+    def test_loads_of_other_resources_do_not_carry_over(self):
+        """Test that rounding errors of one resource's load do not reach the next"""
+        allocations = [allocation("big", "a", 1e13, "2025-01-01", "2025-01-02"),
+                       allocation("fraction", "a", 33.3, "2025-01-02", "2025-01-04"),
+                       allocation("over", "b", 100.0005, "2025-01-01", "2025-01-05")]
+
+        periods = find_over_allocations(allocations, capacities={"a": 1e12})
+        assert [(p["resource_id"], p["task_ids"]) for p in periods] == [("b", ["over"])]
+
+    def test_long_allocations_span_periods(self):
+        """Test that every period lists the allocations covering it, however long"""
+        allocations = [allocation("long", "dev", 60, "2025-01-01", "2025-01-31"),
+                       allocation("early", "dev", 60, "2025-01-03", "2025-01-04"),
+                       allocation("late", "dev", 60, "2025-01-20", "2025-01-20"),
+                       allocation("other", "ops", 100, "2025-01-01", "2025-01-31"),
+                       allocation("spike", "ops", 50, "2025-01-10", "2025-01-11"),
+                       allocation("short", "dev", 60, "2025-01-10", "2025-01-10")]
+
+        periods = find_over_allocations(allocations)
+        assert [(p["resource_id"], p["start_date"], p["end_date"], p["task_ids"]) for p in periods] == [
+            ("dev", "2025-01-03", "2025-01-04", ["long", "early"]),
+            ("dev", "2025-01-10", "2025-01-10", ["long", "short"]),
+            ("dev", "2025-01-20", "2025-01-20", ["long", "late"]),
+            ("ops", "2025-01-10", "2025-01-11", ["other", "spike"]),
+        ]
+
+    def test_empty(self):
+        """Test that no allocations means no over-allocations"""
+        assert find_over_allocations([]) == []
+        assert build_utilization_matrix([]).values.shape == (0, 1)
@@ -3,6 +3,7 @@ Auto-generated tests for autoprojectmanagement\main_modules\wbs_aggregator.py
 Generated by AutoProjectManagement testing framework
 """
 
+import json
 import pytest
 from unittest.mock import Mock, patch
 import sys
@@ -66,3 +67,97 @@ class TestWBSAggregator:
         """Test WBSAggregator methods"""
         # TODO: Implement method tests
         assert True
+
+
+class TestWBSAggregatorIncremental:
+    """Test class for incremental WBS aggregation"""
+
+    def write_part(self, path, part_id, name):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"id": part_id, "name": name, "subtasks": [{"id": f"{part_id}.1", "name": "Child"}]}))
+
+    def test_incremental_matches_full_aggregation(self, tmp_path):
+        """Test that incremental runs produce the same tree as a full run"""
+        parts = tmp_path / "parts"
+        for i in range(3):
+            self.write_part(parts / f"part{i}.json", f"p{i}", f"Part {i}")
+
+        aggregator = wbs_aggregator.WBSAggregator(str(parts), str(tmp_path / "inc.json"), incremental=True)
+        aggregator.aggregate()
+        assert aggregator.last_run_stats["parsed_parts"] == ["part0.json", "part1.json", "part2.json"]
+
+        aggregator.aggregate()
+        assert aggregator.last_run_stats["parsed_parts"] == []
+        assert aggregator.last_run_stats["renumbered_parts"] == 0
+
+        self.write_part(parts / "part1.json", "p1", "Part 1 edited")
+        (parts / "part0.json").unlink()
+        result = aggregator.aggregate()
+        assert aggregator.last_run_stats["parsed_parts"] == ["part1.json"]
+
+        full = wbs_aggregator.WBSAggregator(str(parts), str(tmp_path / "full.json")).aggregate()
+        assert result == full
+        assert json.loads((tmp_path / "inc.json").read_text()) == full
+        assert result["subtasks"][0]["wbs_number"] == "1"
+        assert result["subtasks"][1]["subtasks"][0]["wbs_number"] == "2.1"
+
+    def test_new_instance_reuses_manifest(self, tmp_path):
+        """Test that a fresh aggregator starts from the previous output"""
+        parts = tmp_path / "parts"
+        self.write_part(parts / "part0.json", "p0", "Part 0")
+        wbs_aggregator.WBSAggregator(str(parts), str(tmp_path / "out.json"), incremental=True).aggregate()
+
+        aggregator = wbs_aggregator.WBSAggregator(str(parts), str(tmp_path / "out.json"), incremental=True)
+        aggregator.aggregate()
+        assert aggregator.last_run_stats["parsed_parts"] == []
+
+        # An edited output file invalidates the cache
+        (tmp_path / "out.json").write_text(json.dumps({"id": "WBS-ROOT", "subtasks": []}))
+        aggregator.aggregate()
+        assert aggregator.last_run_stats["parsed_parts"] == ["part0.json"]
+
+    def test_changed_parts_are_read_once(self, tmp_path, monkeypatch):
+        """Test that a changed part is read once and a touched part is not parsed"""
+        import builtins
+        import os
+
+        parts = tmp_path / "parts"
+        for i in range(2):
+            self.write_part(parts / f"part{i}.json", f"p{i}", f"Part {i}")
+        aggregator = wbs_aggregator.WBSAggregator(str(parts), str(tmp_path / "out.json"), incremental=True)
+        aggregator.aggregate()
+
+        self.write_part(parts / "part0.json", "p0", "Part 0 edited")
+        stat = os.stat(parts / "part1.json")
+        os.utime(parts / "part1.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        reads = []
+        real_open = builtins.open
+        monkeypatch.setattr(builtins, "open", lambda file, *args, **kwargs: reads.append(
+            Path(file).name) or real_open(file, *args, **kwargs))
+
+        result = aggregator.aggregate()
+        assert sorted(name for name in reads if name.startswith("part")) == ["part0.json", "part1.json"]
+        assert aggregator.last_run_stats["parsed_parts"] == ["part0.json"]
+        assert list(aggregator.parse_timings) == ["part0.json"]
+        assert result["subtasks"][0]["name"] == "Part 0 edited"
+
+    def test_full_run_writes_no_manifest(self, tmp_path):
+        """Test that only incremental runs keep a manifest next to the output"""
+        parts = tmp_path / "parts"
+        self.write_part(parts / "part0.json", "p0", "Part 0")
+        wbs_aggregator.WBSAggregator(str(parts), str(tmp_path / "out.json")).aggregate()
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["out.json", "parts"]
+
+        wbs_aggregator.WBSAggregator(str(parts), str(tmp_path / "out.json"), incremental=True).aggregate()
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["out.json", "out_manifest.json", "parts"]
+
+    def test_workers_keep_part_order(self, tmp_path):
+        """Test that parallel parsing keeps the deterministic part order"""
+        parts = tmp_path / "parts"
+        for i in range(5):
+            self.write_part(parts / f"part{i}.json", f"p{i}", f"Part {i}")
+
+        aggregator = wbs_aggregator.WBSAggregator(str(parts), str(tmp_path / "out.json"), workers=2)
+        result = aggregator.aggregate()
+        assert [part["id"] for part in result["subtasks"]] == [f"p{i}" for i in range(5)]
+        assert sorted(aggregator.parse_timings) == [f"part{i}.json" for i in range(5)]
@@ -0,0 +1,118 @@
+"""
+Unit tests for autoprojectmanagement/main_modules/planning_estimation/wbs_diff.py
+"""
+
+import copy
+import json
+import sys
+from pathlib import Path
+
+# Add source to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from autoprojectmanagement.main_modules.planning_estimation.baseline_store import BaselineStore, WBSHashTree
+from autoprojectmanagement.main_modules.planning_estimation.wbs_diff import (
+    diff_wbs, iter_wbs_diff, summarize_diff, write_wbs_diff
+)
+
+BASELINE = {
+    "id": 0, "name": "Project", "subtasks": [
+        {"id": 1, "name": "Design", "subtasks": [
+            {"id": 3, "name": "Mockups", "estimated_duration": 2},
+            {"id": 4, "name": "Review", "estimated_duration": 1},
+        ]},
+        {"id": 2, "name": "Build", "subtasks": [
+            {"id": 5, "name": "Backend", "estimated_duration": 8},
+        ]},
+    ],
+}
+
+
+def by_type(differences, diff_type):
+    return [diff for diff in differences if diff["type"] == diff_type]
+
+
+class TestWBSDiff:
+    """Test class for iter_wbs_diff"""
+
+    def test_identical_trees_have_no_differences(self):
+        """Test that equal trees produce no differences"""
+        assert diff_wbs(BASELINE, copy.deepcopy(BASELINE)) == []
+
+    def test_field_change(self):
+        """Test that a changed field is reported with its task and path"""
+        current = copy.deepcopy(BASELINE)
+        current["subtasks"][0]["subtasks"][0]["estimated_duration"] = 3
+        assert diff_wbs(current, BASELINE) == [{
+            "type": "modified",
+            "path": "root.subtasks[1].subtasks[3].estimated_duration",
+            "task_id": 3,
+            "field": "estimated_duration",
+            "current_value": 3,
+            "baseline_value": 2,
+        }]
+
+    def test_added_and_removed_report_subtree_roots(self):
+        """Test that whole added or removed subtrees are reported once"""
+        current = copy.deepcopy(BASELINE)
+        current["subtasks"].pop(1)
+        current["subtasks"].append({"id": 6, "name": "Test", "subtasks": [{"id": 7, "name": "Unit"}]})
+        differences = diff_wbs(current, BASELINE)
+
+        assert [(d["task_id"], d["path"]) for d in by_type(differences, "added")] == [(6, "root.subtasks")]
+        assert [(d["task_id"], d["path"]) for d in by_type(differences, "removed")] == [(2, "root.subtasks")]
+        assert by_type(differences, "modified") == []
+
+    def test_move(self):
+        """Test that a task under a new parent is reported as moved, not removed and added"""
+        current = copy.deepcopy(BASELINE)
+        review = current["subtasks"][0]["subtasks"].pop(1)
+        current["subtasks"][1]["subtasks"].append(review)
+        differences = diff_wbs(current, BASELINE)
+
+        assert summarize_diff(differences) == {
+            "tasks_added": 0, "tasks_removed": 0, "tasks_modified": 0, "tasks_moved": 1}
+        moved = by_type(differences, "moved")[0]
+        assert moved["task_id"] == 4
+        assert (moved["from_parent"], moved["to_parent"]) == (1, 2)
+        assert moved["baseline_path"] == "root.subtasks[1].subtasks[4]"
+        assert moved["path"] == "root.subtasks[2].subtasks[4]"
+
+    def test_move_into_new_subtree(self):
+        """Test that a task moved under an added task is found"""
+        current = copy.deepcopy(BASELINE)
+        backend = current["subtasks"][1]["subtasks"].pop()
+        current["subtasks"].append({"id": 6, "name": "Services", "subtasks": [backend]})
+        differences = diff_wbs(current, BASELINE)
+
+        assert [d["task_id"] for d in by_type(differences, "added")] == [6]
+        assert [(d["task_id"], d["to_parent"]) for d in by_type(differences, "moved")] == [(5, 6)]
+
+    def test_unchanged_baseline_subtrees_are_not_read(self, tmp_path):
+        """Test that a stored baseline only reads the blobs on the changed path"""
+        wbs = {"id": 0, "name": "Root", "subtasks": [
+            {"id": i, "name": f"Phase {i}", "subtasks": [
+                {"id": f"{i}.{j}", "name": "Task"} for j in range(20)]}
+            for i in range(1, 21)]}
+        BaselineStore(tmp_path / "baselines.json").create("v1", "", wbs, [])
+
+        wbs["subtasks"][4]["subtasks"][7]["name"] = "Changed"
+        store = BaselineStore(tmp_path / "baselines.json")
+        differences = list(iter_wbs_diff(WBSHashTree(wbs), store.hash_tree("v1")))
+
+        assert [d["path"] for d in differences] == ["root.subtasks[5].subtasks[5.7].name"]
+        # Root, its 20 phases and the 20 tasks of phase 5 are read, nothing else
+        assert len(store._blob_cache) == 1 + 20 + 20
+
+    def test_write_streams_json_lines(self, tmp_path):
+        """Test that differences are written one JSON object per line"""
+        current = copy.deepcopy(BASELINE)
+        current["name"] = "Renamed"
+        current["subtasks"].pop(0)
+        output = tmp_path / "diff.jsonl"
+        summary = write_wbs_diff(iter_wbs_diff(WBSHashTree(current), WBSHashTree(BASELINE)), output)
+
+        lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+        assert summary["tasks_modified"] == 1
+        assert summary["tasks_removed"] == 1
+        assert len(lines) == 2
@@ -0,0 +1,111 @@
+"""
+Unit tests for autoprojectmanagement/main_modules/planning_estimation/wbs_index.py
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add source to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from autoprojectmanagement.main_modules.planning_estimation.wbs_index import WBSIndex
+
+
+class TestWBSIndex:
+    """Test class for WBSIndex"""
+
+    def setup_method(self):
+        """Setup for each test method"""
+        self.wbs = {
+            "id": "root",
+            "name": "Project",
+            "subtasks": [
+                {"id": "a", "name": "A", "subtasks": [
+                    {"id": "a1", "name": "A1"},
+                    {"id": "a2", "name": "A2", "subtasks": [{"id": "a2x", "name": "A2X"}]},
+                ]},
+                {"id": "b", "name": "B"},
+            ]
+        }
+        self.index = WBSIndex(self.wbs)
+
+    def test_build_lookup_tables(self):
+        """Test that ids, parents, depths and children are indexed"""
+        assert len(self.index) == 6
+        assert self.index.get("a2x")["name"] == "A2X"
+        assert self.index.parents["a2x"] == "a2"
+        assert self.index.get_depth("a2x") == 3
+        assert self.index.get_children("a") == ["a1", "a2"]
+        assert self.index.get_ancestors("a2x") == ["a2", "a", "root"]
+        assert self.index.get_parent("root") is None
+
+    def test_iter_subtree_preorder(self):
+        """Test pre-order iteration over a subtree"""
+        ids = [node["id"] for node in self.index.iter_subtree("a")]
+        assert ids == ["a", "a1", "a2", "a2x"]
+
+    def test_add_task_updates_tree_and_index(self):
+        """Test adding a task with its own subtree"""
+        new_task = {"id": "c", "name": "C", "subtasks": [{"id": "c1", "name": "C1"}]}
+        assert self.index.add_task("b", new_task)
+        assert self.wbs["subtasks"][1]["subtasks"] == [new_task]
+        assert self.index.get_depth("c1") == 3
+        assert self.index.get_children("b") == ["c"]
+        assert not self.index.add_task("missing", {"id": "d"})
+
+    def test_add_task_rejects_duplicate_ids(self):
+        """Test that adding an already indexed or repeated ID leaves the tree unchanged"""
+        with pytest.raises(ValueError):
+            self.index.add_task("b", {"id": "c", "subtasks": [{"id": "a1"}]})
+        with pytest.raises(ValueError):
+            self.index.add_task("b", {"id": "c", "subtasks": [{"id": "c"}]})
+        assert "subtasks" not in self.wbs["subtasks"][1]
+        assert "c" not in self.index and self.index.get("a1")["name"] == "A1"
+
+    def test_remove_task_drops_subtree(self):
+        """Test removing a task removes its descendants from the index"""
+        removed = self.index.remove_task("a2")
+        assert removed["id"] == "a2"
+        assert "a2" not in self.index
+        assert "a2x" not in self.index
+        assert [t["id"] for t in self.wbs["subtasks"][0]["subtasks"]] == ["a1"]
+        assert self.index.get_children("a") == ["a1"]
+        assert self.index.remove_task("root") is None
+
+    def test_modify_task_reindexes_on_id_change(self):
+        """Test that changing an id keeps sibling order and children"""
+        self.index.modify_task("a1", {"id": "a1-renamed"})
+        assert "a1" not in self.index
+        assert self.index.get("a1-renamed")["name"] == "A1"
+        assert self.index.get_children("a") == ["a1-renamed", "a2"]
+
+        self.index.modify_task("a2", {"subtasks": [{"id": "a2y", "name": "A2Y"}]})
+        assert "a2x" not in self.index
+        assert self.index.parents["a2y"] == "a2"
+
+    def test_duplicate_ids_first_occurrence_wins(self):
+        """Test that duplicate ids resolve to the first pre-order occurrence"""
+        wbs = {"id": "root", "subtasks": [
+            {"id": "x", "name": "first", "subtasks": [{"id": "dup", "name": "deep"}]},
+            {"id": "dup", "name": "shallow"},
+        ]}
+        index = WBSIndex(wbs)
+        assert index.get("dup")["name"] == "deep"
+
+    def test_deep_tree_does_not_recurse(self):
+        """Test that very deep trees are indexed without hitting the recursion limit"""
+        root = {"id": 0, "subtasks": []}
+        node = root
+        for i in range(1, sys.getrecursionlimit() + 100):
+            child = {"id": i, "subtasks": []}
+            node["subtasks"].append(child)
+            node = child
+        index = WBSIndex(root)
+        assert index.get_depth(i) == i
+
+    def test_empty_root(self):
+        """Test building from an empty tree"""
+        index = WBSIndex({})
+        assert len(index) == 0
+        assert index.get("anything") is None
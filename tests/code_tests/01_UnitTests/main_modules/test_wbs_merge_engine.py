@@ -0,0 +1,85 @@
+"""
+Unit tests for autoprojectmanagement/main_modules/planning_estimation/wbs_merge_engine.py
+"""
+
+import copy
+import pytest
+import sys
+from pathlib import Path
+
+# Add source to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from autoprojectmanagement.main_modules.planning_estimation.wbs_merge_engine import WBSMergeEngine
+
+
+class TestWBSMergeEngine:
+    """Test class for WBSMergeEngine"""
+
+    def setup_method(self):
+        """Setup for each test method"""
+        self.part_a = {"subtasks": [
+            {"id": "p", "name": "Phase", "owner": "ann", "tags": ["x"], "subtasks": [
+                {"id": "p1", "name": "First"},
+            ]},
+        ]}
+        self.part_b = {"subtasks": [
+            {"id": "p", "name": "Phase", "owner": "bob", "tags": ["y", "x"], "budget": 10, "subtasks": [
+                {"id": "p2", "name": "Second"},
+            ]},
+            {"id": "q", "name": "Other"},
+        ]}
+
+    def merge(self, policy):
+        engine = WBSMergeEngine(policy)
+        engine.merge_part(self.part_a, "a.json")
+        engine.merge_part(self.part_b, "b.json")
+        return engine
+
+    def test_last_wins(self):
+        """Test that later parts overwrite fields and children are combined"""
+        engine = self.merge("last_wins")
+        phase = engine.root["subtasks"][0]
+        assert phase["owner"] == "bob"
+        assert phase["tags"] == ["y", "x"]
+        assert phase["budget"] == 10
+        assert [t["id"] for t in phase["subtasks"]] == ["p1", "p2"]
+        assert [t["id"] for t in engine.root["subtasks"]] == ["p", "q"]
+
+    def test_first_wins(self):
+        """Test that earlier values are kept and only new fields are added"""
+        phase = self.merge("first_wins").root["subtasks"][0]
+        assert phase["owner"] == "ann"
+        assert phase["tags"] == ["x"]
+        assert phase["budget"] == 10
+
+    def test_field_merge(self):
+        """Test that lists are combined without duplicates"""
+        phase = self.merge("field_merge").root["subtasks"][0]
+        assert phase["owner"] == "bob"
+        assert phase["tags"] == ["x", "y"]
+
+    def test_report(self):
+        """Test the merge report counts and conflicts"""
+        report = self.merge("last_wins").report
+        assert report["parts_merged"] == 2
+        assert report["tasks_added"] == 4
+        assert report["tasks_merged"] == 1
+        assert sorted(c["field"] for c in report["conflicts"]) == ["owner", "tags"]
+        owner = next(c for c in report["conflicts"] if c["field"] == "owner")
+        assert owner == {"task_id": "p", "field": "owner", "existing": "ann", "incoming": "bob",
+                         "resolution": "replaced", "source": "b.json"}
+
+    def test_parts_are_not_modified(self):
+        """Test that merging never leaks changes back into the parts"""
+        before_a, before_b = copy.deepcopy(self.part_a), copy.deepcopy(self.part_b)
+        engine = self.merge("field_merge")
+        engine.merge_part({"subtasks": [{"id": "p", "subtasks": [{"id": "p1", "name": "Renamed"}]}]})
+        assert self.part_a == before_a
+        assert self.part_b == before_b
+        assert engine.root["subtasks"][0]["subtasks"][0]["name"] == "Renamed"
+
+    def test_unknown_policy(self):
+        """Test that an unknown policy is rejected"""
+        with pytest.raises(ValueError):
+            WBSMergeEngine("newest")
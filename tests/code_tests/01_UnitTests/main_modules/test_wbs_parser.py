@@ -126,3 +126,61 @@ class TestWBSParser:
         """Test WBSParser methods"""
         # TODO: Implement method tests
         assert True
+
+
+class TestTextWBSStreaming:
+    """Test class for streaming text WBS parsing"""
+
+    outline = [
+        "Planning\n",
+        "  Requirements\n",
+        "    Interviews\n",
+        "  Design\n",
+        "\n",
+        "Build\n",
+        "\tBackend\n",
+    ]
+
+    def test_ids_are_unique_and_stable(self):
+        """Test that ids follow document order and never collide"""
+        parser = wbs_parser.WBSParser()
+        tasks = list(parser.iter_text_wbs(self.outline))
+        assert [t["id"] for t in tasks] == [2, 3, 4, 5, 6, 7]
+        assert [t["parent_id"] for t in tasks] == [1, 2, 3, 2, 1, 6]
+        assert [t["level"] for t in tasks] == [1, 2, 3, 2, 1, 2]
+        assert list(parser.iter_text_wbs(self.outline)) == tasks
+
+    def test_parse_text_wbs_builds_hierarchy(self):
+        """Test that the in-memory tree follows the indentation"""
+        root = wbs_parser.WBSParser().parse_text_wbs("".join(self.outline))
+        planning, build = root["subtasks"]
+        assert [t["name"] for t in planning["subtasks"]] == ["Requirements", "Design"]
+        assert planning["subtasks"][0]["subtasks"][0]["name"] == "Interviews"
+        assert build["subtasks"][0]["name"] == "Backend"
+
+    def test_write_json_matches_tree(self, tmp_path):
+        """Test that streamed JSON equals the tree parse_text_wbs builds"""
+        import io
+        import json
+
+        parser = wbs_parser.WBSParser()
+        source = tmp_path / "outline.txt"
+        source.write_text("".join(self.outline) + 'Quote "me"\n', encoding="utf-8")
+
+        output = io.StringIO()
+        assert parser.write_text_wbs_json(source, output) == 7
+        assert json.loads(output.getvalue()) == parser.parse_text_wbs(source.read_text(encoding="utf-8"))
+
+        seen = []
+        assert parser.stream_text_wbs(str(source), seen.append) == 7
+        assert seen[-1]["name"] == 'Quote "me"'
+
+    def test_empty_outline(self):
+        """Test that an empty outline yields only the root"""
+        import io
+        import json
+
+        parser = wbs_parser.WBSParser()
+        output = io.StringIO()
+        assert parser.write_text_wbs_json([], output) == 0
+        assert json.loads(output.getvalue()) == parser.parse_text_wbs("")
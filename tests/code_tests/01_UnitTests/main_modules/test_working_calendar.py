@@ -0,0 +1,96 @@
+"""
+Unit tests for autoprojectmanagement/main_modules/utility_modules/working_calendar.py
+"""
+
+import datetime
+import pytest
+import sys
+from pathlib import Path
+
+# Add source to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from autoprojectmanagement.main_modules.utility_modules.working_calendar import (
+    OrdinalCalendar, ResourceCalendars, WorkCalendar, parse_date
+)
+
+D = datetime.date
+
+
+class TestWorkCalendar:
+    """Test class for WorkCalendar"""
+
+    def test_working_day_arithmetic(self):
+        """Test weekends and holidays are skipped"""
+        calendar = WorkCalendar(holidays=["2026-10-19"])
+        assert calendar.roll_forward("2026-10-17") == calendar.roll_forward("2026-10-20")
+        assert str(calendar.add_working_days("2026-10-16", 2)) == "2026-10-21"
+        assert calendar.working_days_between("2026-10-16", "2026-10-23") == 4
+        assert not calendar.is_working_day("2026-10-18")
+
+
+class TestOrdinalCalendar:
+    """Test class for OrdinalCalendar"""
+
+    def test_count_matches_day_by_day_walk(self):
+        """Test that ordinal counts equal a naive day-by-day count"""
+        calendar = OrdinalCalendar(holidays=["2026-12-25", "2027-01-01"])
+        start = D(2026, 12, 1)
+        for length in range(0, 60, 7):
+            end = start + datetime.timedelta(days=length)
+            naive = sum(1 for offset in range(length + 1)
+                        if calendar.is_working_day(start + datetime.timedelta(days=offset)))
+            assert calendar.count_working_days(start, end) == naive
+
+    def test_count_edge_cases(self):
+        """Test single days, weekends and reversed ranges"""
+        calendar = OrdinalCalendar()
+        assert calendar.count_working_days(D(2026, 10, 16), D(2026, 10, 16)) == 1
+        assert calendar.count_working_days(D(2026, 10, 17), D(2026, 10, 18)) == 0
+        assert calendar.count_working_days(D(2026, 10, 20), D(2026, 10, 16)) == 0
+
+    def test_table_grows_for_distant_dates(self):
+        """Test that dates far outside the first table range are handled"""
+        calendar = OrdinalCalendar()
+        assert calendar.count_working_days(D(2026, 10, 12), D(2026, 10, 16)) == 5
+        assert calendar.count_working_days(D(2040, 1, 2), D(2040, 1, 6)) == 5
+        assert calendar.count_working_days(D(2000, 1, 3), D(2000, 1, 7)) == 5
+
+    def test_shift_working_days(self):
+        """Test shifting across weekends and holidays"""
+        calendar = OrdinalCalendar(holidays=["2026-10-19"])
+        # Friday + 1 working day skips the weekend and the Monday holiday
+        assert calendar.shift_working_days(D(2026, 10, 16), 1) == D(2026, 10, 20)
+        # A Saturday rolls forward to the first working day
+        assert calendar.shift_working_days(D(2026, 10, 17), 0) == D(2026, 10, 20)
+        far = calendar.shift_working_days(D(2026, 10, 16), 600)
+        assert calendar.count_working_days(D(2026, 10, 16), far) == 601
+        with pytest.raises(ValueError):
+            calendar.shift_working_days(D(2026, 10, 16), -1)
+
+
+class TestResourceCalendars:
+    """Test class for ResourceCalendars"""
+
+    def test_from_config(self):
+        """Test that resources inherit default holidays and weekmask"""
+        calendars = ResourceCalendars.from_config({
+            "default": {"holidays": ["2026-10-16"]},
+            "resources": {"alice": {"weekmask": "Mon Tue Wed Thu"}, "bob": {"holidays": ["2026-10-15"]}},
+        })
+        week = (D(2026, 10, 12), D(2026, 10, 18))
+        assert calendars.default.count_working_days(*week) == 4
+        assert calendars.for_resource("alice").count_working_days(*week) == 4
+        assert calendars.for_resource("bob").count_working_days(*week) == 3
+        assert calendars.for_resource("carol") is calendars.default
+
+
+class TestParseDate:
+    """Test class for parse_date"""
+
+    def test_parse_date(self):
+        """Test valid, invalid and non-string values"""
+        assert parse_date("2026-10-16") == D(2026, 10, 16)
+        assert parse_date("16/10/2026") is None
+        assert parse_date(None) is None
+        assert parse_date(["2026-10-16"]) is None
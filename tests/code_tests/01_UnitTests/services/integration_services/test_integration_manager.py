@@ -1,3 +1,4 @@
+import json
 import pytest
 from src.autoprojectmanagement.services.integration_services.integration_manager import IntegrationManager
 
@@ -24,3 +25,53 @@ def test_integration_manager_service_failure():
         manager.handle_service_failure("nonexistent_service")
 
 # Additional tests for edge cases and integration can be added here
+
+MODULE_SCRIPT = """
+import json
+import sys
+from autoprojectmanagement.main_modules.utility_modules.data_store import get_data_store
+
+wbs = get_data_store().load_json('{input}')
+with open('{output}', 'w') as f:
+    json.dump({{'tasks': len(wbs['tasks']), 'argv': sys.argv[1:]}}, f)
+"""
+
+
+def test_integration_manager_parses_inputs_once(tmp_path):
+    # Modules run in process by default and share one parse of their inputs
+    # Imported like the modules import the store, so both see the same one
+    from autoprojectmanagement.services.integration_services.integration_manager import (
+        IntegrationManager as SharedStoreIntegrationManager
+    )
+    input_path = tmp_path / "detailed_wbs.json"
+    input_path.write_text('{"tasks": [1, 2, 3]}')
+    for name in ("first", "second"):
+        (tmp_path / f"{name}.py").write_text(MODULE_SCRIPT.format(
+            input=input_path.as_posix(), output=(tmp_path / f"{name}.json").as_posix()))
+
+    manager = SharedStoreIntegrationManager()
+    manager.config["modules_path"] = str(tmp_path)
+    manager.modules = ["first.py", "second.py"]
+    manager.data_store.invalidate(input_path)
+    misses = manager.data_store.misses
+
+    summary = manager.run_all()
+    assert summary["successful_modules"] == ["first.py", "second.py"]
+    assert manager.data_store.misses - misses == 1
+    for name in ("first", "second"):
+        assert json.loads((tmp_path / f"{name}.json").read_text()) == {"tasks": 3, "argv": []}
+
+
+def test_integration_manager_subprocess_mode(tmp_path):
+    # Subprocesses stay available as an opt-in
+    from autoprojectmanagement.services.integration_services.integration_manager import (
+        IntegrationManager as SharedStoreIntegrationManager
+    )
+    (tmp_path / "first.py").write_text("import sys\nprint('argv', sys.argv[1:])\nsys.exit(3)")
+
+    manager = SharedStoreIntegrationManager()
+    manager.config.update({"modules_path": str(tmp_path), "in_process": False})
+
+    assert not manager.run_module("first.py")
+    assert manager.execution_results["first.py"]["returncode"] == 3
+    assert manager.execution_results["first.py"]["stdout"] == "argv []\n"
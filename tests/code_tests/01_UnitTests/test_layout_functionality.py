@@ -9,9 +9,18 @@ import os
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add the project root to Python path
 sys.path.insert(0, '/home/gravitywaves/GravityProject/AutoProjectManagement')
 
+
+@pytest.fixture(autouse=True)
+def layouts_in_tmp_path(tmp_path, monkeypatch):
+    """Write layouts under a temporary directory instead of the repository"""
+    monkeypatch.chdir(tmp_path)
+    Path("JSonDataBase/OutPuts/dashboard_layouts").mkdir(parents=True)
+
 def test_layout_directory():
     """Test that the layout directory exists and is writable."""
     layouts_dir = Path("JSonDataBase/OutPuts/dashboard_layouts")
@@ -5,11 +5,23 @@ Test script to verify real auto-commit functionality
 
 import os
 import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
 from autoprojectmanagement.services.automation_services.auto_commit import UnifiedAutoCommit
 
-def test_real_commit():
+def test_real_commit(tmp_path, monkeypatch):
     """Test that real git operations are working"""
     print("Testing real auto-commit functionality...")
+
+    # Commit in a scratch repository, never in the checkout the tests run from
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    subprocess.run(["git", "init", "-q"], check=True)
+    subprocess.run(["git", "config", "user.name", "Test"], check=True)
+    subprocess.run(["git", "config", "user.email", "test@example.com"], check=True)
     
     # Create a test file
     test_file = "test_commit_file.txt"
@@ -41,4 +53,5 @@ def test_real_commit():
         os.remove(test_file)
 
 if __name__ == "__main__":
-    test_real_commit()
+    with tempfile.TemporaryDirectory() as directory, pytest.MonkeyPatch.context() as monkeypatch:
+        test_real_commit(Path(directory), monkeypatch)
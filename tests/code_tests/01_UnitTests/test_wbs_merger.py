@@ -0,0 +1,117 @@
+"""
+Unit tests for autoprojectmanagement/main_modules/planning_estimation/wbs_merger.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add source to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from autoprojectmanagement.main_modules.planning_estimation.wbs_merger import WBSMerger
+
+
+class TestWBSMergerIncremental:
+    """Test class for incremental WBS merging"""
+
+    def test_unchanged_parts_are_not_reparsed(self, tmp_path):
+        """Test that only changed parts are loaded again"""
+        parts = tmp_path / "parts"
+        parts.mkdir()
+        (parts / "a.json").write_text(json.dumps({"subtasks": [{"id": "t1", "name": "One"}]}))
+        (parts / "b.json").write_text(json.dumps({"subtasks": [{"id": "t1", "name": "Override"}]}))
+
+        merger = WBSMerger(str(parts), str(tmp_path / "out" / "wbs.json"), incremental=True)
+        first = merger.merge_all_parts()
+        assert first["subtasks"] == [{"id": "t1", "name": "Override"}]
+
+        assert list(merger.parse_timings) == ["a.json", "b.json"]
+
+        assert merger.merge_all_parts() == first
+        assert merger.parse_timings == {}
+
+        (parts / "b.json").write_text(json.dumps({"subtasks": [{"id": "t2", "name": "Two"}]}))
+        result = merger.merge_all_parts()
+        assert list(merger.parse_timings) == ["b.json"]
+        assert result["subtasks"] == [{"id": "t1", "name": "One"}, {"id": "t2", "name": "Two"}]
+
+    def test_changed_parts_are_read_once(self, tmp_path, monkeypatch):
+        """Test that a changed part is read once and a touched part is not parsed"""
+        import builtins
+        import os
+
+        parts = tmp_path / "parts"
+        parts.mkdir()
+        (parts / "a.json").write_text(json.dumps({"subtasks": [{"id": "t1", "name": "One"}]}))
+        (parts / "b.json").write_text(json.dumps({"subtasks": [{"id": "t2", "name": "Two"}]}))
+        merger = WBSMerger(str(parts), str(tmp_path / "out" / "wbs.json"), incremental=True)
+        merger.merge_all_parts()
+
+        (parts / "a.json").write_text(json.dumps({"subtasks": [{"id": "t1", "name": "Edited"}]}))
+        stat = os.stat(parts / "b.json")
+        os.utime(parts / "b.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        reads = []
+        real_open = builtins.open
+        monkeypatch.setattr(builtins, "open", lambda file, *args, **kwargs: reads.append(
+            Path(file).name) or real_open(file, *args, **kwargs))
+
+        result = merger.merge_all_parts()
+        assert sorted(name for name in reads if name in ("a.json", "b.json")) == ["a.json", "b.json"]
+        assert list(merger.parse_timings) == ["a.json"]
+        assert result["subtasks"] == [{"id": "t1", "name": "Edited"}, {"id": "t2", "name": "Two"}]
+
+        # Touching without edits leaves the merged file alone
+        stat = os.stat(parts / "b.json")
+        os.utime(parts / "b.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        output_mtime = os.stat(tmp_path / "out" / "wbs.json").st_mtime_ns
+        assert merger.merge_all_parts() == result
+        assert merger.parse_timings == {}
+        assert os.stat(tmp_path / "out" / "wbs.json").st_mtime_ns == output_mtime
+
+
+class TestWBSMergerWorkers:
+    """Test class for parsing WBS parts in a process pool"""
+
+    def test_parallel_merge_matches_serial(self, tmp_path):
+        """Test that worker processes give the same, deterministic result"""
+        parts = tmp_path / "parts"
+        parts.mkdir()
+        for i in range(6):
+            (parts / f"part{i}.json").write_text(json.dumps({"subtasks": [
+                {"id": "shared", "name": f"Shared {i}"},
+                {"id": f"t{i}", "name": f"Task {i}"},
+            ]}))
+        (parts / "broken.json").write_text("{not json")
+
+        serial = WBSMerger(str(parts), str(tmp_path / "serial" / "wbs.json")).merge_all_parts()
+        merger = WBSMerger(str(parts), str(tmp_path / "parallel" / "wbs.json"), workers=3)
+        parallel = merger.merge_all_parts()
+
+        assert parallel == serial
+        assert parallel["subtasks"][0]["name"] == "Shared 5"
+        assert [task["id"] for task in parallel["subtasks"]] == ["shared"] + [f"t{i}" for i in range(6)]
+        assert sorted(merger.parse_timings) == ["broken.json"] + [f"part{i}.json" for i in range(6)]
+
+
+class TestWBSMergerConflictPolicy:
+    """Test class for conflict policies in WBSMerger"""
+
+    def test_first_wins_and_report(self, tmp_path):
+        """Test that the merger applies the policy and keeps a report"""
+        parts = tmp_path / "parts"
+        parts.mkdir()
+        (parts / "a.json").write_text(json.dumps({"subtasks": [{"id": "t1", "name": "One"}]}))
+        (parts / "b.json").write_text(json.dumps({"subtasks": [{"id": "t1", "name": "Override"}]}))
+
+        merger = WBSMerger(str(parts), str(tmp_path / "out" / "wbs.json"), conflict_policy="first_wins")
+        result = merger.merge_all_parts()
+        assert result["subtasks"] == [{"id": "t1", "name": "One"}]
+        assert merger.last_merge_report["conflicts"][0]["source"] == "b.json"
+
+    def test_merge_subtasks_keeps_nested_children(self):
+        """Test that merging a task keeps its existing children"""
+        base = [{"id": "a", "subtasks": [{"id": "a1"}]}]
+        merged = WBSMerger().merge_subtasks(base, [{"id": "a", "subtasks": [{"id": "a2"}]}])
+        assert [t["id"] for t in merged[0]["subtasks"]] == ["a1", "a2"]
+        assert base == [{"id": "a", "subtasks": [{"id": "a1"}]}]